@@ -5,6 +5,7 @@ from sqlalchemy import engine_from_config, pool
 from alembic import context
 from app.base import Base
 from app.data.league import *
+from app.data.users import *
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
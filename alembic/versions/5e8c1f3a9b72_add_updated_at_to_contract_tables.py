@@ -0,0 +1,52 @@
+"""updated_at on the tables the contracts-for-ml export reads
+
+Revision ID: 5e8c1f3a9b72
+Revises: a6c3d9f1e284
+Create Date: 2026-10-19 16:02:41.518330
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8c1f3a9b72"
+down_revision: Union[str, Sequence[str], None] = "a6c3d9f1e284"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    "players",
+    "player_seasons",
+    "team_player_salaries",
+    "team_player_buyouts",
+    "contracts",
+    "awards",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # existing rows get the migration time, the first refresh after it is a
+    # full one anyway since nothing has been exported against updated_at yet
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "updated_at",
+                sa.DateTime(),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+        )
+        op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_index(f"ix_{table}_updated_at", table)
+        op.drop_column(table, "updated_at")
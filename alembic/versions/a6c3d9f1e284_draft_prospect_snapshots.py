@@ -0,0 +1,57 @@
+"""draft prospect snapshots: last_seen, content_hash, indexes, latest view
+
+Revision ID: a6c3d9f1e284
+Revises: f4a91c2e7b05
+Create Date: 2026-10-19 14:35:12.204117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.data.league.prospect import (
+    CREATE_LATEST_DRAFT_PROSPECTS,
+    DROP_LATEST_DRAFT_PROSPECTS,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "a6c3d9f1e284"
+down_revision: Union[str, Sequence[str], None] = "f4a91c2e7b05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("draft_prospects", sa.Column("last_seen", sa.DateTime()))
+    # existing rows were full snapshots, each only seen when it was uploaded.
+    # content_hash stays empty, so their next scrape writes a fresh row
+    op.execute("UPDATE draft_prospects SET last_seen = uploaded")
+    op.alter_column("draft_prospects", "last_seen", nullable=False)
+    op.add_column("draft_prospects", sa.Column("content_hash", sa.String(32)))
+
+    op.create_index(
+        "ix_draft_prospects_slug_uploaded",
+        "draft_prospects",
+        ["tankathon_slug", sa.text("uploaded DESC")],
+    )
+    op.create_index(
+        "ix_draft_prospects_uploaded_last_seen",
+        "draft_prospects",
+        ["uploaded", "last_seen"],
+    )
+    op.create_index("ix_draft_prospects_player_id", "draft_prospects", ["player_id"])
+    for statement in CREATE_LATEST_DRAFT_PROSPECTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(DROP_LATEST_DRAFT_PROSPECTS)
+    op.drop_index("ix_draft_prospects_player_id", "draft_prospects")
+    op.drop_index("ix_draft_prospects_uploaded_last_seen", "draft_prospects")
+    op.drop_index("ix_draft_prospects_slug_uploaded", "draft_prospects")
+    op.drop_column("draft_prospects", "content_hash")
+    op.drop_column("draft_prospects", "last_seen")
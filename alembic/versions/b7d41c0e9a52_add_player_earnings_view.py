@@ -0,0 +1,32 @@
+"""add player_earnings materialized view
+
+Revision ID: b7d41c0e9a52
+Revises: 2653826c8950
+Create Date: 2026-10-19 10:12:44.518203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.data.league.player.earnings import (
+    CREATE_PLAYER_EARNINGS,
+    DROP_PLAYER_EARNINGS,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d41c0e9a52"
+down_revision: Union[str, Sequence[str], None] = "2653826c8950"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in CREATE_PLAYER_EARNINGS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(DROP_PLAYER_EARNINGS)
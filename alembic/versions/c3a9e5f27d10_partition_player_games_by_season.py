@@ -0,0 +1,72 @@
+"""partition player_games by season_id
+
+Revision ID: c3a9e5f27d10
+Revises: b7d41c0e9a52
+Create Date: 2026-10-19 11:03:27.902114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.data.league.player.game import PlayerGame
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9e5f27d10"
+down_revision: Union[str, Sequence[str], None] = "b7d41c0e9a52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # player_games has never been loaded, so there is nothing to carry over
+    op.drop_table("player_games")
+    # creates the partitioned table and its default partition
+    PlayerGame.__table__.create(op.get_bind())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # LIKE copies the id default too, and that points at the partitioned
+    # table's sequence, which is dropped with it. The plain table gets its own
+    op.execute("CREATE TABLE player_games_plain (LIKE player_games INCLUDING DEFAULTS)")
+    op.execute("CREATE SEQUENCE player_games_plain_id_seq")
+    op.execute(
+        "ALTER TABLE player_games_plain "
+        "ALTER COLUMN id SET DEFAULT nextval('player_games_plain_id_seq')"
+    )
+    op.execute(
+        "ALTER SEQUENCE player_games_plain_id_seq OWNED BY player_games_plain.id"
+    )
+    op.execute("INSERT INTO player_games_plain SELECT * FROM player_games")
+    op.execute(
+        "SELECT setval('player_games_plain_id_seq', "
+        "(SELECT coalesce(max(id), 0) + 1 FROM player_games_plain), false)"
+    )
+    op.drop_table("player_games")
+    op.rename_table("player_games_plain", "player_games")
+    op.execute("ALTER SEQUENCE player_games_plain_id_seq RENAME TO player_games_id_seq")
+    op.create_primary_key("pk_player_games", "player_games", ["id"])
+    for column in ("game_id", "player_season_id", "team_id", "season_id", "game_date"):
+        op.create_index(f"ix_player_games_{column}", "player_games", [column])
+    op.create_index(
+        "ix_player_game_unique",
+        "player_games",
+        ["game_id", "player_season_id"],
+        unique=True,
+    )
+    for column, referred_table, ondelete in (
+        ("game_id", "games", None),
+        ("player_season_id", "player_seasons", None),
+        ("team_id", "teams", None),
+        ("season_id", "seasons", "CASCADE"),
+    ):
+        op.create_foreign_key(
+            f"fk_player_games_{column}_{referred_table}",
+            "player_games",
+            referred_table,
+            [column],
+            ["id"],
+            ondelete=ondelete,
+        )
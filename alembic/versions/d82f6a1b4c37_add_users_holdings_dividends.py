@@ -0,0 +1,93 @@
+"""add users, holdings and dividend_payments
+
+Revision ID: d82f6a1b4c37
+Revises: c3a9e5f27d10
+Create Date: 2026-10-19 11:48:05.331870
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d82f6a1b4c37"
+down_revision: Union[str, Sequence[str], None] = "c3a9e5f27d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("cash", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_users_name", "users", ["name"], unique=True)
+
+    op.create_table(
+        "holdings",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "player_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=False
+        ),
+        sa.Column("shares", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_holdings_user_id", "holdings", ["user_id"])
+    op.create_index("ix_holdings_player_id", "holdings", ["player_id"])
+    op.create_index(
+        "ix_holding_unique", "holdings", ["user_id", "player_id"], unique=True
+    )
+
+    op.create_table(
+        "dividend_payments",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("game_id", sa.Integer(), sa.ForeignKey("games.id"), nullable=False),
+        sa.Column(
+            "season_id",
+            sa.Integer(),
+            sa.ForeignKey("seasons.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "player_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=False
+        ),
+        sa.Column("shares", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+    )
+    op.create_index(
+        "ix_dividend_payments_season_id", "dividend_payments", ["season_id"]
+    )
+    op.create_index("ix_dividend_payments_user_id", "dividend_payments", ["user_id"])
+    op.create_index(
+        "ix_dividend_payments_player_id", "dividend_payments", ["player_id"]
+    )
+    op.create_index(
+        "ix_dividend_payment_unique",
+        "dividend_payments",
+        ["game_id", "user_id", "player_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("dividend_payments")
+    op.drop_table("holdings")
+    op.drop_table("users")
@@ -0,0 +1,59 @@
+"""add trades
+
+Revision ID: f4a91c2e7b05
+Revises: d82f6a1b4c37
+Create Date: 2026-10-19 14:02:41.918233
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a91c2e7b05"
+down_revision: Union[str, Sequence[str], None] = "d82f6a1b4c37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "trades",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("sequence", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "player_id", sa.Integer(), sa.ForeignKey("players.id"), nullable=False
+        ),
+        sa.Column(
+            "buyer_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "seller_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("buy_order_id", sa.BigInteger(), nullable=False),
+        sa.Column("sell_order_id", sa.BigInteger(), nullable=False),
+        sa.Column("price", sa.Float(), nullable=False),
+        sa.Column("shares", sa.Integer(), nullable=False),
+        sa.Column(
+            "traded_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+    )
+    op.create_index("ix_trades_sequence", "trades", ["sequence"], unique=True)
+    op.create_index("ix_trades_player_id", "trades", ["player_id"])
+    op.create_index("ix_trades_buyer_id", "trades", ["buyer_id"])
+    op.create_index("ix_trades_seller_id", "trades", ["seller_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("trades")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.data.users import Fill, Holding, MatchingEngine, Trade, User
+from app.data.users.matching_engine import CHECKPOINT_RECORDS
+
+
+def record_fills(session: Session, fills: list[Fill]) -> int:
+    """
+    write a batch of fills and apply them to cash and holdings, 3 statements no
+    matter the batch size. Fills whose sequence is already stored are skipped, so
+    retrying a batch never moves money twice. Returns how many were new.
+    """
+    if not fills:
+        return 0
+
+    inserted = set(
+        session.execute(
+            insert(Trade)
+            .values(
+                [
+                    {
+                        "sequence": fill.sequence,
+                        "player_id": fill.player_id,
+                        "buyer_id": fill.buyer_id,
+                        "seller_id": fill.seller_id,
+                        "buy_order_id": fill.buy_order_id,
+                        "sell_order_id": fill.sell_order_id,
+                        "price": fill.price / 100,
+                        "shares": fill.shares,
+                    }
+                    for fill in fills
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["sequence"])
+            .returning(Trade.sequence)
+        ).scalars()
+    )
+    fills = [fill for fill in fills if fill.sequence in inserted]
+    if not fills:
+        return 0
+
+    cash: defaultdict[int, int] = defaultdict(int)
+    shares: defaultdict[tuple[int, int], int] = defaultdict(int)
+    for fill in fills:
+        cost = fill.price * fill.shares
+        cash[fill.buyer_id] -= cost
+        cash[fill.seller_id] += cost
+        shares[fill.buyer_id, fill.player_id] += fill.shares
+        shares[fill.seller_id, fill.player_id] -= fill.shares
+
+    users = User.__table__
+    session.execute(
+        update(users)
+        .where(users.c.id == bindparam("user_id"))
+        .values(cash=users.c.cash + bindparam("delta")),
+        [{"user_id": user_id, "delta": cents / 100} for user_id, cents in cash.items()],
+    )
+    stmt = insert(Holding).values(
+        [
+            {"user_id": user_id, "player_id": player_id, "shares": delta}
+            for (user_id, player_id), delta in shares.items()
+        ]
+    )
+    session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["user_id", "player_id"],
+            set_={"shares": Holding.shares + stmt.excluded.shares},
+        )
+    )
+    return len(fills)
+
+
+def flush_fills(session: Session, engine: MatchingEngine) -> int:
+    """
+    persist everything the engine has matched since the last flush, and
+    compact its log once it's grown past CHECKPOINT_RECORDS commands
+    """
+    engine.sync_wal()
+    fills = list(engine.pending_fills)
+    new = record_fills(session, fills)
+    session.commit()
+    engine.acknowledge(len(fills))
+    if engine.wal_records >= CHECKPOINT_RECORDS:
+        engine.checkpoint()
+    return new
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from pandas import DataFrame
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.data.league import PlayerSeason, Season, TeamPlayerBuyout, TeamPlayerSalary
+
+CAREER_STAT_COLUMNS = [
+    "games_played",
+    "points_pg",
+    "rebounds_pg",
+    "assists_pg",
+    "steals_pg",
+    "blocks_pg",
+    "turnovers_pg",
+    "minutes_pg",
+    "field_goal_pct",
+    "three_point_pct",
+    "free_throw_pct",
+]
+
+
+def _zero(column: ColumnElement[Any]) -> ColumnElement[Any]:
+    return func.coalesce(column, 0)
+
+
+def _ratio(
+    numerator: ColumnElement[Any], denominator: ColumnElement[Any]
+) -> ColumnElement[Any]:
+    """numerator / denominator as a float, 0 when the denominator is 0"""
+    return case(
+        (denominator > 0, cast(numerator, Float) / denominator),
+        else_=literal(0.0),
+    )
+
+
+def _to_frame(
+    session: Session, stmt: Select, player_ids: list[int], columns: list[str]
+) -> DataFrame:
+    df = DataFrame(session.execute(stmt).mappings().all(), columns=columns)
+    df = df.set_index("player_id").reindex(player_ids, fill_value=0)
+    df.index.name = "player_id"
+    return df
+
+
+def _played_seasons(
+    player_ids: list[int], until: int | None
+) -> list[ColumnElement[bool]]:
+    conditions = [
+        PlayerSeason.player_id.in_(player_ids),
+        PlayerSeason.games_played > 0,
+    ]
+    if until is not None:
+        conditions.append(PlayerSeason.season_id <= until)
+    return conditions
+
+
+def get_career_relative_dollars(
+    session: Session, player_ids: Iterable[int]
+) -> DataFrame:
+    """bulk Player.career_relative_dollars, one grouped query for every player"""
+    player_ids = list(player_ids)
+    cap = func.coalesce(
+        func.nullif(Season.max_salary_cap, 0), func.nullif(Season.expected_cap, 0)
+    )
+    earnings = union_all(
+        select(
+            TeamPlayerSalary.player_id,
+            TeamPlayerSalary.season_id,
+            TeamPlayerSalary.salary,
+        ).where(TeamPlayerSalary.player_id.in_(player_ids)),
+        select(
+            TeamPlayerBuyout.player_id,
+            TeamPlayerBuyout.season_id,
+            TeamPlayerBuyout.salary,
+        ).where(TeamPlayerBuyout.player_id.in_(player_ids)),
+    ).subquery()
+    stmt = (
+        select(
+            earnings.c.player_id,
+            func.sum(cast(_zero(earnings.c.salary), Float) / cap).label(
+                "career_relative_dollars"
+            ),
+        )
+        .join(Season, Season.id == earnings.c.season_id)
+        .group_by(earnings.c.player_id)
+    )
+
+    return _to_frame(
+        session, stmt, player_ids, ["player_id", "career_relative_dollars"]
+    )
+
+
+def get_career_averages(
+    session: Session, player_ids: Iterable[int], until: int | None = None
+) -> DataFrame:
+    """
+    bulk Player.career_averages(until).to_scalar(), aggregated in postgres
+    """
+    player_ids = list(player_ids)
+    games = func.sum(PlayerSeason.games_played)
+
+    def per_game(column: ColumnElement[Any]) -> ColumnElement[Any]:
+        return _ratio(func.sum(_zero(column)), games)
+
+    stmt = (
+        select(
+            PlayerSeason.player_id,
+            games.label("games_played"),
+            per_game(PlayerSeason.points).label("points_pg"),
+            per_game(PlayerSeason.rebounds).label("rebounds_pg"),
+            per_game(PlayerSeason.assists).label("assists_pg"),
+            per_game(PlayerSeason.steals).label("steals_pg"),
+            per_game(PlayerSeason.blocks).label("blocks_pg"),
+            per_game(PlayerSeason.turnovers).label("turnovers_pg"),
+            per_game(PlayerSeason.minutes_per_game).label("minutes_pg"),
+            _ratio(
+                func.sum(_zero(PlayerSeason.field_goals_made)),
+                func.sum(_zero(PlayerSeason.field_goals_attempted)),
+            ).label("field_goal_pct"),
+            _ratio(
+                func.sum(_zero(PlayerSeason.three_pointers_made)),
+                func.sum(_zero(PlayerSeason.three_pointers_attempted)),
+            ).label("three_point_pct"),
+            _ratio(
+                func.sum(_zero(PlayerSeason.free_throws_made)),
+                func.sum(_zero(PlayerSeason.free_throws_attempted)),
+            ).label("free_throw_pct"),
+        )
+        .where(and_(*_played_seasons(player_ids, until)))
+        .group_by(PlayerSeason.player_id)
+    )
+
+    return _to_frame(session, stmt, player_ids, ["player_id", *CAREER_STAT_COLUMNS])
+
+
+def get_career_percentiles(
+    session: Session, player_ids: Iterable[int], percentile: float = 0.5
+) -> DataFrame:
+    """
+    bulk Player.career_percentile(percentile).to_scalar(), using percentile_cont
+    (same linear interpolation as the python version) over each player's seasons.
+    """
+    player_ids = list(player_ids)
+
+    def quantile(column: ColumnElement[Any]) -> ColumnElement[Any]:
+        return func.percentile_cont(percentile).within_group(_zero(column))
+
+    stmt = (
+        select(
+            PlayerSeason.player_id,
+            func.sum(PlayerSeason.games_played).label("games_played"),
+            quantile(PlayerSeason.points).label("points_pg"),
+            quantile(PlayerSeason.rebounds).label("rebounds_pg"),
+            quantile(PlayerSeason.assists).label("assists_pg"),
+            quantile(PlayerSeason.steals).label("steals_pg"),
+            quantile(PlayerSeason.blocks).label("blocks_pg"),
+            quantile(PlayerSeason.turnovers).label("turnovers_pg"),
+            quantile(PlayerSeason.minutes_per_game).label("minutes_pg"),
+            _ratio(
+                func.sum(_zero(PlayerSeason.field_goals_made)),
+                func.sum(_zero(PlayerSeason.field_goals_attempted)),
+            ).label("field_goal_pct"),
+            _ratio(
+                func.sum(_zero(PlayerSeason.three_pointers_made)),
+                func.sum(_zero(PlayerSeason.three_pointers_attempted)),
+            ).label("three_point_pct"),
+            _ratio(
+                func.sum(_zero(PlayerSeason.free_throws_made)),
+                func.sum(_zero(PlayerSeason.free_throws_attempted)),
+            ).label("free_throw_pct"),
+        )
+        .where(and_(*_played_seasons(player_ids, None)))
+        .group_by(PlayerSeason.player_id)
+    )
+
+    return _to_frame(session, stmt, player_ids, ["player_id", *CAREER_STAT_COLUMNS])
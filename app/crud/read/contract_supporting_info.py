@@ -1,20 +1,65 @@
-from collections.abc import Iterable
+import argparse
+import json
+import shutil
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import chain
+from pathlib import Path
 
-from pandas import DataFrame
-from sqlalchemy import and_, create_engine, exists, select
-from sqlalchemy.orm import Session, sessionmaker
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pandas import DataFrame, concat, read_parquet
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from pandas.util import hash_pandas_object
+from sqlalchemy import Select, and_, create_engine, exists, func, select, union
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 
 from app.base import Base
+from app.crud.read.contracts_for_ml import (
+    CONTRACTS_FOR_ML_PATH,
+    SEASON_PARTITIONING,
+    contracts_dataset,
+)
 from app.data.connection import get_session
-from app.data.league import Contract, Player, PlayerSeason, Season
+from app.data.league import (
+    Award,
+    Contract,
+    Player,
+    PlayerSeason,
+    TeamPlayerBuyout,
+    TeamPlayerSalary,
+)
 from app.data.league.player.supporting_contract_info import (
     ContractSupportingInformation,
 )
 
+# players per page of the streaming export
+CHUNK_SIZE = 1_000
+# never null, so they keep their integer type in the streamed file
+INTEGER_COLUMNS = {"season", "contract_number"}
 
-def get_all_contract_supporting_info(
-    session: Session,
-) -> Iterable[ContractSupportingInformation]:
+# next to the season partitions, the leading _ keeps them out of the dataset
+HASHES_FILE = "_hashes.parquet"
+MANIFEST_FILE = "_manifest.json"
+# everything supporting_contract_info reads, a change to any marks the player
+SOURCE_MODELS: list[type[Base]] = [
+    Player,
+    PlayerSeason,
+    TeamPlayerSalary,
+    TeamPlayerBuyout,
+    Contract,
+    Award,
+]
+# a transaction that started before the export can commit after it with an
+# older updated_at, so a refresh looks back this far past the last export
+REFRESH_OVERLAP = timedelta(hours=1)
+
+
+def contract_players(
+    players: Collection[int] | None = None,
+) -> Select[tuple[Player]]:
     # we don't actually have all the data we would need for 2011
     query = and_(
         Contract.player_id == Player.id,
@@ -23,24 +68,322 @@ def get_all_contract_supporting_info(
         Player.position != "",
     )
     stmt = select(Player).where(exists().where(query))
-    for player in session.scalars(stmt).all():
+    if players is not None:
+        stmt = stmt.where(Player.id.in_(players))
+
+    return stmt
+
+
+def get_all_contract_supporting_info(
+    session: Session,
+) -> Iterable[ContractSupportingInformation]:
+    for player in session.scalars(contract_players()).all():
         for csi in player.supporting_contract_info():
             yield csi
 
 
-if __name__ == "__main__":
+def iter_player_chunks(
+    session: Session,
+    chunk_size: int = CHUNK_SIZE,
+    players: Collection[int] | None = None,
+) -> Iterator[list[Player]]:
+    """
+    contract_players() `chunk_size` at a time by id, with everything
+    supporting_contract_info reads loaded up front. Each chunk is expunged
+    once the caller asks for the next, so the identity map never holds more
+    than one
+    """
+    stmt = (
+        contract_players(players)
+        .options(
+            selectinload(Player.seasons),
+            selectinload(Player.salaries),
+            selectinload(Player.buyouts),
+            selectinload(Player.contracts).joinedload(Contract.team),
+            selectinload(Player.awards),
+        )
+        .order_by(Player.id)
+        .limit(chunk_size)
+        .execution_options(yield_per=chunk_size)
+    )
+    last_id = 0
+    while players := session.scalars(stmt.where(Player.id > last_id)).all():
+        yield players
+        last_id = players[-1].id
+        # cascades to the seasons, salaries, contracts... loaded with them
+        for player in players:
+            session.expunge(player)
+
+
+def contracts_frame(contracts: Iterable[ContractSupportingInformation]) -> DataFrame:
+    """one to_scalar() row per contract, indexed by (player_id, season)"""
     expected_format: list[str] = []
-    with get_session() as session:
-        data: dict[tuple[int, int], dict] = {}
-        for contract in get_all_contract_supporting_info(session):
-            # check that columns match expected (besides order)
-            if not data:
-                expected_format = sorted(row := contract.to_scalar())
-            elif sorted(row := contract.to_scalar()) != expected_format:
-                raise Exception(", ".join(set(expected_format) - set(row)))
-            data[contract.player.id, contract.season_id] = row
+    data: dict[tuple[int, int], dict] = {}
+    for contract in contracts:
+        # check that columns match expected (besides order)
+        if not data:
+            expected_format = sorted(row := contract.to_scalar())
+        elif sorted(row := contract.to_scalar()) != expected_format:
+            raise Exception(", ".join(set(expected_format) - set(row)))
+        data[contract.player.id, contract.season_id] = row
 
     df = DataFrame.from_dict(data, orient="index")
     df = df.sort_index()
     df.index.names = ["player_id", "season"]
-    df.to_parquet("data/contracts-for-ml.parquet")
+    return df
+
+
+def write_contracts_dataset(
+    batches: Iterable[pa.RecordBatch], schema: pa.Schema, path: str | Path
+) -> None:
+    """replace `path` with a dataset partitioned by season (SEASON_PARTITIONING)"""
+    shutil.rmtree(path, ignore_errors=True)
+    ds.write_dataset(
+        batches,
+        path,
+        schema=schema,
+        format="parquet",
+        partitioning=SEASON_PARTITIONING,
+        basename_template="part-{i}.parquet",
+    )
+
+
+def export_contracts_for_ml(
+    session: Session, path: str = CONTRACTS_FOR_ML_PATH
+) -> DataFrame:
+    exported_at = database_now(session)
+    df = contracts_frame(get_all_contract_supporting_info(session))
+    table = pa.Table.from_pandas(df)
+    write_contracts_dataset(table.to_batches(), table.schema, path)
+    write_refresh_state(path, row_hashes(table), exported_at)
+    return df
+
+
+# ---- incremental refresh ----
+def database_now(session: Session) -> datetime:
+    """the database clock, the one updated_at is stamped with"""
+    return session.scalars(select(func.localtimestamp())).one()
+
+
+def row_hashes(table: pa.Table) -> DataFrame:
+    """
+    a content hash per (player_id, season) row. Numbers are hashed as floats
+    and columns in name order, so a row hashes the same whichever chunk (and
+    so whichever inferred types) it was exported with
+    """
+    df = table.to_pandas()
+    df = df[sorted(df.columns)]
+    numeric = [
+        column
+        for column, dtype in df.dtypes.items()
+        if is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+    ]
+    df[numeric] = df[numeric].astype("float64")
+    return hash_pandas_object(df, index=False).rename("hash").to_frame()
+
+
+def write_refresh_state(
+    path: str | Path, hashes: DataFrame, exported_at: datetime
+) -> None:
+    hashes.to_parquet(Path(path) / HASHES_FILE)
+    (Path(path) / MANIFEST_FILE).write_text(
+        json.dumps({"exported_at": exported_at.isoformat()})
+    )
+
+
+def read_refresh_state(path: str | Path) -> tuple[DataFrame, datetime]:
+    """the row hashes and export time written alongside the dataset"""
+    manifest = Path(path) / MANIFEST_FILE
+    if not manifest.exists():
+        raise Exception(f"{path} has no {MANIFEST_FILE}, export it in full first")
+    exported_at = datetime.fromisoformat(
+        json.loads(manifest.read_text())["exported_at"]
+    )
+    return read_parquet(Path(path) / HASHES_FILE), exported_at
+
+
+def changed_players(session: Session, since: datetime) -> set[int]:
+    """players with a row in any SOURCE_MODELS table updated at or after `since`"""
+    stmt = union(
+        *(
+            select(model.id if model is Player else model.player_id).where(
+                model.updated_at >= since
+            )
+            for model in SOURCE_MODELS
+        )
+    )
+    return {player_id for player_id in session.scalars(stmt) if player_id is not None}
+
+
+@dataclass
+class ContractsRefresh:
+    players: set[int]
+    # (player_id, season) rows added, removed or with different content
+    changed: set[tuple[int, int]]
+    seasons: set[int]
+
+
+def refresh_contracts_for_ml(
+    session: Session,
+    path: str = CONTRACTS_FOR_ML_PATH,
+    chunk_size: int = CHUNK_SIZE,
+) -> ContractsRefresh:
+    """
+    bring an exported dataset up to date without re-exporting the league:
+    the players changed since the last export get all their rows rebuilt
+    and only the season partitions those rows are in are rewritten. Deletes
+    leave no updated_at behind, a full export picks those up
+    """
+    hashes, exported_at = read_refresh_state(path)
+    refreshed_at = database_now(session)
+    players = changed_players(session, exported_at - REFRESH_OVERLAP)
+    if not players:
+        write_refresh_state(path, hashes, refreshed_at)
+        return ContractsRefresh(set(), set(), set())
+
+    dataset = contracts_dataset(path)
+    schema = dataset.schema
+    tables = []
+    for table in contract_tables(session, chunk_size, players):
+        if missing := set(schema.names) ^ set(table.column_names):
+            raise Exception(", ".join(missing))
+        try:
+            tables.append(table.select(schema.names).cast(schema))
+        except pa.ArrowInvalid as error:
+            raise Exception(
+                f"{error}, the export's types no longer fit, run it in full"
+            )
+    rows = pa.concat_tables(tables) if tables else schema.empty_table()
+
+    old = hashes[hashes.index.get_level_values("player_id").isin(players)]
+    new = row_hashes(rows)
+    # nullable, so rows only on one side don't turn the hashes into floats
+    compared = old.astype("UInt64").join(
+        new.astype("UInt64"), how="outer", lsuffix="_old", rsuffix="_new"
+    )
+    differs = (compared["hash_old"] != compared["hash_new"]).fillna(True)
+    changed = set(compared.index[differs])
+
+    seasons = {season for _, season in changed}
+    if seasons:
+        rewrite_seasons(dataset, path, rows, players, seasons)
+    hashes = concat([hashes.drop(old.index), new]).sort_index()
+    write_refresh_state(path, hashes, refreshed_at)
+
+    return ContractsRefresh(players, changed, seasons)
+
+
+def rewrite_seasons(
+    dataset: ds.Dataset,
+    path: str | Path,
+    rows: pa.Table,
+    players: set[int],
+    seasons: set[int],
+) -> None:
+    """replace `players`' rows in the `seasons` partitions with `rows`"""
+    in_seasons = pc.field("season").isin(list(seasons))
+    kept = dataset.to_table(
+        filter=in_seasons & ~pc.field("player_id").isin(list(players))
+    )
+    written = pa.concat_tables([kept, rows.filter(in_seasons)])
+    ds.write_dataset(
+        written,
+        path,
+        schema=dataset.schema,
+        format="parquet",
+        partitioning=SEASON_PARTITIONING,
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching",
+    )
+    # a season left with no rows isn't written, so its old files stay behind
+    for season in seasons - set(written["season"].to_pylist()):
+        shutil.rmtree(Path(path) / f"season={season}", ignore_errors=True)
+
+
+def contracts_schema(table: pa.Table) -> pa.Schema:
+    """
+    the first chunk's schema, with room for what later chunks can hold:
+    integers become floats (pandas does the same once a column has a null)
+    and all-null columns become floats
+    """
+    # the index levels, season is stored as __index_level_1__ next to its column
+    keep = INTEGER_COLUMNS | set(table.schema.pandas_metadata["index_columns"])
+    fields = []
+    for schema_field in table.schema:
+        if schema_field.name in keep:
+            pass
+        elif pa.types.is_integer(schema_field.type) or pa.types.is_null(
+            schema_field.type
+        ):
+            schema_field = schema_field.with_type(pa.float64())
+        fields.append(schema_field)
+    return pa.schema(fields, metadata=table.schema.metadata)
+
+
+def contract_tables(
+    session: Session,
+    chunk_size: int = CHUNK_SIZE,
+    players: Collection[int] | None = None,
+) -> Iterator[pa.Table]:
+    for chunk in iter_player_chunks(session, chunk_size, players):
+        df = contracts_frame(
+            info for player in chunk for info in player.supporting_contract_info()
+        )
+        if not df.empty:
+            yield pa.Table.from_pandas(df)
+
+
+def stream_contracts_for_ml(
+    session: Session,
+    path: str = CONTRACTS_FOR_ML_PATH,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    export_contracts_for_ml without holding the league in memory: each chunk
+    of players is appended to the season partitions as it's built. Returns
+    rows written
+    """
+    exported_at = database_now(session)
+    tables = contract_tables(session, chunk_size)
+    if (first := next(tables, None)) is None:
+        return 0
+    schema = contracts_schema(first)
+    rows = 0
+    hashes = []
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        nonlocal rows
+        for table in chain([first], tables):
+            if missing := set(schema.names) ^ set(table.column_names):
+                raise Exception(", ".join(missing))
+            rows += table.num_rows
+            table = table.select(schema.names).cast(schema)
+            hashes.append(row_hashes(table))
+            yield from table.to_batches()
+
+    write_contracts_dataset(batches(), schema, path)
+    write_refresh_state(path, concat(hashes).sort_index(), exported_at)
+
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", default=CONTRACTS_FOR_ML_PATH)
+    parser.add_argument(
+        "--stream", action="store_true", help="write chunk by chunk, flat memory"
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="only what changed since the last export"
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    with get_session() as session:
+        if args.refresh:
+            refresh = refresh_contracts_for_ml(session, args.path, args.chunk_size)
+            print(len(refresh.players), len(refresh.changed), sorted(refresh.seasons))
+        elif args.stream:
+            print(stream_contracts_for_ml(session, args.path, args.chunk_size))
+        else:
+            export_contracts_for_ml(session, args.path)
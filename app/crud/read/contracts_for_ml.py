@@ -1,22 +1,88 @@
+from collections.abc import Iterable
+from pathlib import Path
+
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 from pandas import DataFrame, read_csv, read_parquet
 
+# a hive-partitioned dataset, data/contracts-for-ml/season=2024/...
+CONTRACTS_FOR_ML_PATH = "data/contracts-for-ml"
+SEASON_PARTITIONING = ds.partitioning(
+    pa.schema([("season", pa.int64())]), flavor="hive"
+)
+# the signed contract itself, never a feature
+CONTRACT_COLUMNS = [
+    "cap_hit_percent",
+    "salary",
+    "apron_salary",
+    "luxury_tax",
+    "cash_total",
+    "cash_garunteed",
+]
+
 
-def contracts_for_ml() -> DataFrame:
-    df = read_parquet("data/contracts-for-ml.parquet")
-    df = df[(df["season"] < 2027) & (df["contract_number"] > 1)]
+def contracts_dataset(path: str | Path = CONTRACTS_FOR_ML_PATH) -> ds.Dataset:
+    """the partitioned dataset, or a single exported parquet file"""
+    return ds.dataset(
+        path,
+        format="parquet",
+        partitioning=SEASON_PARTITIONING if Path(path).is_dir() else None,
+    )
 
-    df["draft_round"] = df["draft_round"].replace({np.nan: 3})
-    df["draft_number"] = df["draft_number"].replace({np.nan: 61})
-    contract_columns = [
-        "cap_hit_percent",
-        "salary",
-        "apron_salary",
-        "luxury_tax",
-        "cash_total",
-        "cash_garunteed",
+
+def read_contracts(
+    path: str | Path = CONTRACTS_FOR_ML_PATH,
+    filter: pc.Expression | None = None,
+    columns: Iterable[str] | None = None,
+) -> DataFrame:
+    """
+    the exported frame, only the rows matching `filter` and only `columns`
+    (default all). Both are pushed down to the scan, so skipped seasons and
+    columns are never read. Indexed by (player_id, season) like the export
+    """
+    dataset = contracts_dataset(path)
+    metadata = dataset.schema.pandas_metadata
+    index_columns = metadata["index_columns"]
+    wanted = set(dataset.schema.names if columns is None else columns)
+    # in the order of the exported frame, the partition column comes last otherwise
+    order = [column["field_name"] for column in metadata["columns"]]
+    projection = [
+        name
+        for name in order
+        if name in index_columns or (name in wanted and name in dataset.schema.names)
     ]
-    df = df.drop(columns=contract_columns)
+    if missing := wanted - set(projection):
+        raise Exception(", ".join(sorted(missing)))
+
+    table = dataset.to_table(columns=projection, filter=filter)
+    # partitions come back season by season, the export is by player first
+    return table.sort_by([(name, "ascending") for name in index_columns]).to_pandas()
+
+
+def contracts_for_ml(
+    path: str | Path = CONTRACTS_FOR_ML_PATH,
+    seasons: Iterable[int] | None = None,
+    columns: Iterable[str] | None = None,
+    players: Iterable[int] | None = None,
+) -> DataFrame:
+    """the training rows, just `seasons`, `columns` and `players` if given"""
+    rows = (pc.field("season") < 2027) & (pc.field("contract_number") > 1)
+    if seasons is not None:
+        rows &= pc.field("season").isin(list(seasons))
+    if players is not None:
+        rows &= pc.field("player_id").isin(list(players))
+    if columns is None:
+        names = contracts_dataset(path).schema.names
+        columns = [name for name in names if name not in CONTRACT_COLUMNS]
+
+    df = read_contracts(path, rows, columns)
+
+    if "draft_round" in df:
+        df["draft_round"] = df["draft_round"].replace({np.nan: 3})
+    if "draft_number" in df:
+        df["draft_number"] = df["draft_number"].replace({np.nan: 61})
 
     return df
 
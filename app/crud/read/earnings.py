@@ -1,6 +1,7 @@
 from sqlalchemy import Select, or_, select
 
 from app.data.league import PlayerSeason, TeamPlayerBuyout, TeamPlayerSalary
+from app.data.league.player.earnings import player_earnings
 
 
 def get_all_earnings() -> Select[
@@ -27,3 +28,20 @@ def get_all_earnings() -> Select[
     )
 
     return stmt
+
+
+def get_earnings_by_age(
+    min_season: int = 2011,
+) -> Select[tuple[float, int, float, int]]:
+    """scalar rows from the player_earnings view, no ORM objects"""
+    stmt = select(
+        player_earnings.c.age,
+        player_earnings.c.dollars,
+        player_earnings.c.relative_dollars,
+        player_earnings.c.buyout_dollars,
+    ).where(
+        player_earnings.c.season_id >= min_season,
+        player_earnings.c.age.isnot(None),
+    )
+
+    return stmt
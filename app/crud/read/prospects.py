@@ -0,0 +1,147 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    cast,
+    extract,
+    func,
+    literal_column,
+    select,
+)
+
+from app.data.league.player.earnings import player_earnings
+from app.data.league.prospect import DraftProspect, latest_draft_prospect
+from app.modeling.payload_types.draft import PROSPECT_FEATURES
+
+# seasons of salary after the draft that make up a prospect's outcome
+ROOKIE_SEASONS = 4
+
+
+def get_last_scrape(as_of: datetime | None = None) -> Select[tuple[datetime]]:
+    """
+    the last scrape at or before `as_of` (the last one at all without it).
+    Every scrape leaves its time as some snapshot's last_seen
+    """
+    stmt = select(func.max(DraftProspect.last_seen))
+    if as_of is not None:
+        stmt = stmt.where(DraftProspect.last_seen <= as_of)
+
+    return stmt
+
+
+def get_big_board(as_of: datetime) -> Select[tuple[DraftProspect]]:
+    """
+    the prospects on the board at `as_of` (draft day for past classes), by
+    Tankathon rank: the board of the last scrape at or before it. Snapshots
+    cover uploaded..last_seen without overlapping, so once the scrape is
+    known this is one range scan on ix_draft_prospects_uploaded_last_seen
+    """
+    scraped = get_last_scrape(as_of).scalar_subquery()
+    stmt = (
+        select(DraftProspect)
+        .where(
+            DraftProspect.uploaded <= scraped,
+            DraftProspect.last_seen >= scraped,
+        )
+        .order_by(
+            DraftProspect.tankathon_big_board_rank.asc().nulls_last(),
+            DraftProspect.name,
+        )
+    )
+
+    return stmt
+
+
+def get_latest_prospects() -> Select[tuple[DraftProspect]]:
+    """every slug's newest snapshot, through the latest_draft_prospects view"""
+    latest = latest_draft_prospect()
+    stmt = select(latest).order_by(
+        latest.tankathon_big_board_rank.asc().nulls_last(), latest.name
+    )
+
+    return stmt
+
+
+def get_prospect_history(slug: str) -> Select[tuple[DraftProspect]]:
+    """a prospect's snapshots, newest first"""
+    stmt = (
+        select(DraftProspect)
+        .where(DraftProspect.tankathon_slug == slug)
+        .order_by(DraftProspect.uploaded.desc())
+    )
+
+    return stmt
+
+
+def draft_year(uploaded: ColumnElement[datetime]) -> ColumnElement[int]:
+    """the draft a snapshot looks ahead to, anything after June is next year's"""
+    return cast(
+        extract("year", uploaded + literal_column("interval '6 months'")), Integer
+    )
+
+
+def get_draft_snapshots() -> Select:
+    """each prospect's last snapshot before every draft they were on the board for"""
+    year = draft_year(DraftProspect.uploaded).label("draft_year")
+    stmt = (
+        select(
+            DraftProspect.id,
+            DraftProspect.tankathon_slug,
+            DraftProspect.name,
+            DraftProspect.player_id,
+            year,
+            *(getattr(DraftProspect, name) for name in PROSPECT_FEATURES),
+        )
+        .where(DraftProspect.tankathon_slug.isnot(None))
+        .distinct(DraftProspect.tankathon_slug, year)
+        .order_by(DraftProspect.tankathon_slug, year, DraftProspect.uploaded.desc())
+    )
+
+    return stmt
+
+
+def get_draft_training_rows(
+    last_season: int, rookie_seasons: int = ROOKIE_SEASONS
+) -> Select:
+    """
+    draft snapshots with their outcome: relative_dollars averaged over the
+    first `rookie_seasons` seasons after the draft, from player_earnings. A
+    season without salary counts as 0. Only drafts whose whole window is
+    done by `last_season` are included
+    """
+    snapshots = get_draft_snapshots().subquery()
+    outcome = (
+        select(
+            func.coalesce(func.sum(player_earnings.c.relative_dollars), 0.0)
+            / float(rookie_seasons)
+        )
+        .where(
+            player_earnings.c.player_id == snapshots.c.player_id,
+            player_earnings.c.season_id.between(
+                snapshots.c.draft_year + 1, snapshots.c.draft_year + rookie_seasons
+            ),
+        )
+        .scalar_subquery()
+    )
+    stmt = select(snapshots, outcome.label("relative_dollars")).where(
+        snapshots.c.draft_year + rookie_seasons <= last_season
+    )
+
+    return stmt
+
+
+def get_big_board_features(as_of: datetime) -> Select:
+    """get_big_board, as the feature columns the draft model scores"""
+    board = get_big_board(as_of).subquery()
+    stmt = select(
+        board.c.id,
+        board.c.tankathon_slug,
+        board.c.name,
+        board.c.player_id,
+        draft_year(board.c.uploaded).label("draft_year"),
+        *(board.c[name] for name in PROSPECT_FEATURES),
+    )
+
+    return stmt
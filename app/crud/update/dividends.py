@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.data.league import Game
+from app.data.league.salary_rules import GAMES_PER_SEASON
+from app.data.users import SHARES_PER_PLAYER
+
+# a holder of x% of a player earns x% of the player's salary for that game.
+# New ledger rows are the only ones credited, so settling a game twice is a no-op.
+SETTLE_DIVIDENDS = text("""
+WITH game_salaries AS (
+    SELECT
+        pg.game_id,
+        pg.season_id,
+        ps.player_id,
+        tps.salary::float / :games_per_season AS game_salary
+    FROM player_games pg
+    JOIN games g ON g.id = pg.game_id AND g.game_type = 'Regular'
+    JOIN player_seasons ps ON ps.id = pg.player_season_id
+    JOIN team_player_salaries tps
+        ON tps.player_id = ps.player_id
+        AND tps.season_id = pg.season_id
+        AND tps.team_id = pg.team_id
+    WHERE pg.season_id = ANY(:season_ids)
+        AND pg.game_id = ANY(:game_ids)
+        AND tps.salary IS NOT NULL
+),
+paid AS (
+    INSERT INTO dividend_payments (game_id, season_id, user_id, player_id, shares, amount)
+    SELECT
+        gs.game_id,
+        gs.season_id,
+        h.user_id,
+        h.player_id,
+        h.shares,
+        gs.game_salary * h.shares / :shares_per_player
+    FROM game_salaries gs
+    JOIN holdings h ON h.player_id = gs.player_id AND h.shares > 0
+    ON CONFLICT (game_id, user_id, player_id) DO NOTHING
+    RETURNING user_id, amount
+),
+credited AS (
+    SELECT user_id, SUM(amount) AS amount FROM paid GROUP BY user_id
+)
+UPDATE users
+SET cash = users.cash + credited.amount
+FROM credited
+WHERE users.id = credited.user_id
+RETURNING credited.amount
+""")
+
+REVERSE_SEASON_DIVIDENDS = text("""
+WITH removed AS (
+    DELETE FROM dividend_payments
+    WHERE season_id = :season_id
+    RETURNING user_id, amount
+),
+debited AS (
+    SELECT user_id, SUM(amount) AS amount FROM removed GROUP BY user_id
+)
+UPDATE users
+SET cash = users.cash - debited.amount
+FROM debited
+WHERE users.id = debited.user_id
+""")
+
+
+def settle_game_dividends(session: Session, game_ids: Iterable[int]) -> float:
+    """credit every holding for the given games in one statement, returns the total paid"""
+    game_ids = list(game_ids)
+    season_ids = (
+        session.execute(select(Game.season_id).where(Game.id.in_(game_ids)).distinct())
+        .scalars()
+        .all()
+    )
+    paid = session.execute(
+        SETTLE_DIVIDENDS,
+        {
+            "game_ids": game_ids,
+            "season_ids": list(season_ids),
+            "games_per_season": GAMES_PER_SEASON,
+            "shares_per_player": SHARES_PER_PLAYER,
+        },
+    ).scalars()
+    total = sum(paid)
+    session.commit()
+    return total
+
+
+def settle_dividends(session: Session, game_date: date) -> float:
+    """settle a day's slate of games"""
+    game_ids = session.execute(select(Game.id).where(Game.date == game_date)).scalars()
+    return settle_game_dividends(session, game_ids)
+
+
+def replay_season_dividends(session: Session, season_id: int) -> float:
+    """
+    reverse a season's payments and settle every game again.
+    Uses current holdings, since holdings aren't versioned over time.
+    """
+    session.execute(REVERSE_SEASON_DIVIDENDS, {"season_id": season_id})
+    game_ids = session.execute(
+        select(Game.id).where(Game.season_id == season_id)
+    ).scalars()
+    return settle_game_dividends(session, game_ids)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import re
+from collections import Counter, defaultdict
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+# every block that's currently tracking, innermost last
+_ACTIVE: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "active_query_stats", default=()
+)
+
+_LITERALS = [
+    (re.compile(r"::\w+(?:\[\])?"), ""),  # casts
+    (re.compile(r"'(?:[^']|'')*'"), "?"),  # strings
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),  # numbers
+    (re.compile(r"%\(\w+\)s|%s|\$\d+|:\w+"), "?"),  # bind parameters
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?)"),  # IN lists / VALUES rows
+    (re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+"), "(?)"),  # multi-row VALUES
+    (re.compile(r"\s+"), " "),
+]
+
+_SAVEPOINT = re.compile(r"\s*(?:RELEASE |ROLLBACK TO )?SAVEPOINT\b", re.IGNORECASE)
+
+
+def fingerprint(statement: str) -> str:
+    """the statement's shape, with literals, parameters and IN lists collapsed"""
+    for pattern, replacement in _LITERALS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+@dataclass
+class QueryStats:
+    """statements run inside one track_queries block"""
+
+    statements: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+    fingerprint_seconds: defaultdict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def record(self, statement: str, seconds: float) -> None:
+        shape = fingerprint(statement)
+        self.statements.append(statement)
+        self.seconds += seconds
+        self.fingerprints[shape] += 1
+        self.fingerprint_seconds[shape] += seconds
+
+    def repeated(self, threshold: int = 5) -> list[tuple[str, int, float]]:
+        """(fingerprint, times, seconds) for shapes run at least `threshold` times"""
+        return [
+            (shape, times, self.fingerprint_seconds[shape])
+            for shape, times in self.fingerprints.most_common()
+            if times >= threshold
+        ]
+
+    def report(self, threshold: int = 5) -> str:
+        lines = [
+            f"{self.count} statements ({len(self.fingerprints)} distinct) "
+            f"in {self.seconds * 1000:.1f} ms"
+        ]
+        for shape, times, seconds in self.repeated(threshold):
+            shape = shape if len(shape) <= 200 else shape[:197] + "..."
+            lines.append(f"  possible N+1: {times}x, {seconds * 1000:.1f} ms  {shape}")
+        return "\n".join(lines)
+
+
+def _before_cursor_execute(conn: Any, *_: Any) -> None:
+    if _ACTIVE.get():
+        conn.info.setdefault("query_start", []).append(perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+    if not (active := _ACTIVE.get()):
+        return
+    starts = conn.info.get("query_start")
+    seconds = perf_counter() - starts.pop() if starts else 0.0
+    # session bookkeeping (nested transactions), not queries the code asked for
+    if _SAVEPOINT.match(statement):
+        return
+    for stats in active:
+        stats.record(statement, seconds)
+
+
+def instrument(engine: Engine) -> Engine:
+    """
+    add the listeners to an engine. They do nothing (one contextvar lookup)
+    unless a track_queries block is open, so this is safe to leave on.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+@contextmanager
+def track_queries() -> Generator[QueryStats, None, None]:
+    """count and time every statement an instrumented engine runs in the block"""
+    stats = QueryStats()
+    token = _ACTIVE.set((*_ACTIVE.get(), stats))
+    try:
+        yield stats
+    finally:
+        _ACTIVE.reset(token)
+
+
+@contextmanager
+def assert_max_queries(
+    n: int, repeated_threshold: int | None = None
+) -> Generator[QueryStats, None, None]:
+    """
+    fail if the block runs more than `n` statements, or (optionally) repeats
+    one statement shape `repeated_threshold` or more times
+    """
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count > n:
+        raise AssertionError(
+            f"expected at most {n} statements\n" + stats.report(repeated_threshold or 2)
+        )
+    if repeated_threshold is not None and stats.repeated(repeated_threshold):
+        raise AssertionError(
+            "repeated statement shapes\n" + stats.report(repeated_threshold)
+        )
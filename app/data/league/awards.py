@@ -5,14 +5,14 @@ from typing import TYPE_CHECKING
 from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.base import Base
+from app.base import Base, UpdatedAtMixin
 
 if TYPE_CHECKING:
     from app.data.league import Player
     from app.data.league.season import Season
 
 
-class Award(Base):
+class Award(UpdatedAtMixin, Base):
     __tablename__ = "awards"
 
     # ---- identifiers ----
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.data.league.team.core import Team
 
-from ...base import Base
+from ...base import Base, UpdatedAtMixin
 from .player import Player
 
 
@@ -15,7 +15,7 @@ class ContractOption(PyEnum):
     Team = "Team"
 
 
-class Contract(Base):
+class Contract(UpdatedAtMixin, Base):
     __tablename__ = "contracts"
 
     # ---- identifiers ----
@@ -1,4 +1,5 @@
 from app.data.league.player.core import Player
+from app.data.league.player.earnings import player_earnings
 from app.data.league.player.game import PlayerGame
 from app.data.league.player.season import PlayerSeason
 
@@ -6,4 +7,5 @@ __all__ = [
     "Player",
     "PlayerGame",
     "PlayerSeason",
+    "player_earnings",
 ]
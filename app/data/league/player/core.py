@@ -5,9 +5,9 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from sqlalchemy import Index, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, object_session, relationship
 
-from app.base import Base
+from app.base import Base, UpdatedAtMixin
 from app.custom_types import MLSafe
 from app.data.league.player.career_averages import CareerStats
 from app.data.league.player.player_bio import PlayerBio
@@ -15,6 +15,7 @@ from app.data.league.player.supporting_contract_info import (
     ContractSupportingInformation,
 )
 from app.data.league.salary_rules import MAX_SALARIES, MIN_SALARIES
+from app.data.league.season_caps import get_season_caps
 from app.utils.voided_contracts import VOIDED_CONTRACTS_MANAGER
 
 T = TypeVar("T")
@@ -25,7 +26,7 @@ if TYPE_CHECKING:
     from app.data.league.team.payroll import TeamPlayerBuyout, TeamPlayerSalary
 
 
-class Player(Base):
+class Player(UpdatedAtMixin, Base):
     __tablename__ = "players"
     __allow_unmapped__ = True
 
@@ -136,12 +137,22 @@ class Player(Base):
 
     @property
     def career_relative_dollars(self) -> float:
-        return sum(
-            s.relative_dollars for s in self.salaries if s.relative_dollars is not None
-        ) + sum(s.relative_dollars for s in self.buyouts)
+        earnings = [*self.salaries, *self.buyouts]
+        if not earnings:
+            return 0.0
+        caps = get_season_caps(object_session(self))
+        if caps is None:
+            # outside a session, each salary's loaded season has the cap
+            return float(sum(e.relative_dollars or 0.0 for e in earnings))
+        return float(
+            caps.relative_dollars(
+                [e.salary for e in earnings], [e.season_id for e in earnings]
+            ).sum()
+        )
 
     def career_averages(self, until: int | None = None) -> CareerStats:
         career = CareerStats()
+        field_goals_made = field_goals_attempted = 0
 
         for s in self.seasons:
             if not s.games_played or s.games_played <= 0:
@@ -161,10 +172,8 @@ class Player(Base):
             career.minutes_per_game += s.minutes_per_game or 0
 
             # accumulate makes/attempts for percentages
-            career.field_goal_pct += s.field_goals_made or 0
-            career.field_goal_pct += -(
-                s.field_goals_attempted or 0
-            )  # temporarily store attempts as negative
+            field_goals_made += s.field_goals_made or 0
+            field_goals_attempted += s.field_goals_attempted or 0
             career.three_point_made += s.three_pointers_made or 0
             career.three_point_attempted += s.three_pointers_attempted or 0
 
@@ -184,6 +193,8 @@ class Player(Base):
             def compute_pct(made: float, attempted: float) -> float:
                 return made / attempted if attempted > 0 else 0
 
+            career.field_goal_pct = compute_pct(field_goals_made, field_goals_attempted)
+
             career.three_point_pct = compute_pct(
                 career.three_point_made, career.three_point_attempted
             )
@@ -258,6 +269,7 @@ class Player(Base):
             attempted = sum(attempted_list)
             return made / attempted if attempted > 0 else 0
 
+        career.field_goal_pct = compute_pct(fg_made, fg_attempted)
         career.three_point_pct = compute_pct(tp_made, tp_attempted)
         career.free_throw_pct = compute_pct(ft_made, ft_attempted)
 
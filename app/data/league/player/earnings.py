@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, Float, Integer, column, event, table, text
+from sqlalchemy.orm import Session
+
+from app.base import Base
+
+# one row per (player_id, season_id) with any salary or buyout money.
+# dollars and relative_dollars include buyouts, buyout_dollars is that share.
+PLAYER_EARNINGS_SELECT = """
+WITH salaries AS (
+    SELECT player_id, season_id, SUM(COALESCE(salary, 0)) AS dollars
+    FROM team_player_salaries
+    GROUP BY player_id, season_id
+),
+buyouts AS (
+    SELECT player_id, season_id, SUM(COALESCE(salary, 0)) AS dollars
+    FROM team_player_buyouts
+    GROUP BY player_id, season_id
+),
+ages AS (
+    SELECT player_id, season_id, MAX(age) AS age
+    FROM player_seasons
+    GROUP BY player_id, season_id
+)
+SELECT
+    ages.player_id,
+    ages.season_id,
+    ages.age,
+    COALESCE(s.dollars, 0) + COALESCE(b.dollars, 0) AS dollars,
+    (COALESCE(s.dollars, 0) + COALESCE(b.dollars, 0))::float
+        / COALESCE(NULLIF(seasons.max_salary_cap, 0), NULLIF(seasons.expected_cap, 0))
+        AS relative_dollars,
+    COALESCE(b.dollars, 0) AS buyout_dollars
+FROM ages
+JOIN seasons ON seasons.id = ages.season_id
+LEFT JOIN salaries s
+    ON s.player_id = ages.player_id AND s.season_id = ages.season_id
+LEFT JOIN buyouts b
+    ON b.player_id = ages.player_id AND b.season_id = ages.season_id
+WHERE s.player_id IS NOT NULL OR b.player_id IS NOT NULL
+"""
+
+CREATE_PLAYER_EARNINGS = [
+    f"CREATE MATERIALIZED VIEW IF NOT EXISTS player_earnings AS {PLAYER_EARNINGS_SELECT}",
+    # unique index is required for REFRESH ... CONCURRENTLY
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_player_earnings_player_season "
+    "ON player_earnings (player_id, season_id) "
+    "INCLUDE (age, dollars, relative_dollars, buyout_dollars)",
+    "CREATE INDEX IF NOT EXISTS ix_player_earnings_age "
+    "ON player_earnings (age) "
+    "INCLUDE (season_id, dollars, relative_dollars, buyout_dollars)",
+    "CREATE INDEX IF NOT EXISTS ix_player_earnings_season "
+    "ON player_earnings (season_id) "
+    "INCLUDE (player_id, age, dollars, relative_dollars, buyout_dollars)",
+]
+
+DROP_PLAYER_EARNINGS = "DROP MATERIALIZED VIEW IF EXISTS player_earnings"
+
+# not part of Base.metadata (create_all would make it a table), only for selects
+player_earnings = table(
+    "player_earnings",
+    column("player_id", Integer),
+    column("season_id", Integer),
+    column("age", Float),
+    column("dollars", Integer),
+    column("relative_dollars", Float),
+    column("buyout_dollars", Integer),
+)
+
+for statement in CREATE_PLAYER_EARNINGS:
+    event.listen(
+        Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL(DROP_PLAYER_EARNINGS).execute_if(dialect="postgresql"),
+)
+
+
+def refresh_player_earnings(session: Session, concurrently: bool = True) -> None:
+    """rebuild the view, run after payrolls (or seasons/player seasons) change"""
+    session.execute(
+        text(
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY player_earnings"
+            if concurrently
+            else "REFRESH MATERIALIZED VIEW player_earnings"
+        )
+    )
+    session.commit()
@@ -1,5 +1,16 @@
-from sqlalchemy import Boolean, Date, Float, ForeignKey, Index, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Date,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    event,
+    text,
+)
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.base import Base
 from app.data.league.season import Season
@@ -9,7 +20,8 @@ class PlayerGame(Base):
     __tablename__ = "player_games"
 
     # ---- identifiers ----
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # range partitioned by season_id, so the partition key has to be in the pk
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     game_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("games.id"), index=True, nullable=False
     )
@@ -22,8 +34,7 @@ class PlayerGame(Base):
     season_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("seasons.id", ondelete="CASCADE"),  # foreign key
-        index=True,
-        nullable=False,  # or True if some games might not have a season
+        primary_key=True,
     )
 
     game_date: Mapped[Date] = mapped_column(Date, index=True)
@@ -60,7 +71,9 @@ class PlayerGame(Base):
 
     # ---- lineup ----
     starting_position: Mapped[str | None] = mapped_column(String, nullable=True)
-    started: Mapped[bool] = mapped_column(Boolean)
+    started: Mapped[bool | None] = mapped_column(
+        Boolean, nullable=True
+    )  # not in the season-wide game logs
 
     # ---- advanced stats (cannot be derived from traditional box score) ----
     offensive_rating: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -87,19 +100,17 @@ class PlayerGame(Base):
     # ---- relationships ----
     season: Mapped[Season] = relationship("Season")
     game = relationship("Game", back_populates="player_games")
-    # foreign key linking to PlayerSeason
-    player_season_id: Mapped[int] = mapped_column(
-        ForeignKey("player_seasons.id"), index=True
-    )
 
-    # relationship back to PlayerSeason
     __table_args__ = (
+        # unique indexes on a partitioned table must include the partition key
         Index(
             "ix_player_game_unique",
+            "season_id",
             "game_id",
             "player_season_id",
             unique=True,
         ),
+        {"postgresql_partition_by": "RANGE (season_id)"},
     )
 
     # ---- helper constructor from advanced boxscore row ----
@@ -110,7 +121,7 @@ class PlayerGame(Base):
         game_id: int,
         player_season_id: int,
         team_id: int,
-        season: str,
+        season: int,
         game_date: str,
         is_home_game: bool,
     ):
@@ -128,7 +139,7 @@ class PlayerGame(Base):
             game_id=game_id,
             player_season_id=player_season_id,
             team_id=team_id,
-            season=season,
+            season_id=season,
             game_date=game_date,
             is_home_game=is_home_game,
             minutes_played=minutes,
@@ -165,3 +176,30 @@ class PlayerGame(Base):
             pace=row.get("PACE"),
             pie=row.get("PIE"),
         )
+
+
+# rows for seasons without their own partition land here instead of failing
+event.listen(
+    PlayerGame.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS player_games_default "
+        "PARTITION OF player_games DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+def player_games_partition(season_id: int) -> str:
+    return f"player_games_{season_id}"
+
+
+def create_player_games_partition(session: Session, season_id: int) -> str:
+    """one partition per season, so per-season queries scan a single table"""
+    partition = player_games_partition(season_id)
+    session.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {partition} PARTITION OF player_games "
+            f"FOR VALUES FROM ({season_id}) TO ({season_id + 1})"
+        )
+    )
+    return partition
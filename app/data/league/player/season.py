@@ -1,22 +1,28 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from operator import attrgetter, itemgetter
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from sqlalchemy import Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.base import Base
-from app.custom_types import MLSafe
+from app.base import Base, UpdatedAtMixin
 from app.data.league.player.core import Player
 from app.data.league.season import Season
 from app.data.league.team.core import Team
-from app.modeling.payload_types.seasonal import SeasonalMLPayload
+from app.modeling.payload_types.seasonal import (
+    FIELDS,
+    SeasonalMLPayload,
+    no_colinearity_matrix,
+)
 
 if TYPE_CHECKING:
     from app.data.league import TeamPlayerBuyout, TeamPlayerSalary
 
 
-class PlayerSeason(Base):
+class PlayerSeason(UpdatedAtMixin, Base):
     __tablename__ = "player_seasons"
 
     # ---- identifiers ----
@@ -328,117 +334,38 @@ class PlayerSeason(Base):
 
     # ---- helper method to return ML payload ----
     def ml_data(self) -> SeasonalMLPayload:
-        res: dict[str, MLSafe | None] = {
-            # identifiers
-            "team_id": self.team_id,
-            "season_id": self.season_id,
-            # basic context
-            "age": self.age,
-            "games_played": self.games_played,
-            "minutes_pg": self.minutes_per_game,
-            # ratings
-            "offensive_rating": self.offensive_rating,
-            "defensive_rating": self.defensive_rating,
-            "net_rating": self.net_rating,
-            "estimated_offensive_rating": self.estimated_offensive_rating,
-            "estimated_defensive_rating": self.estimated_defensive_rating,
-            "estimated_net_rating": self.estimated_net_rating,
-            # percentages
-            "assist_percentage": self.assist_percentage,
-            "assist_to_turnover": self.assist_to_turnover,
-            "assist_ratio": self.assist_ratio,
-            "offensive_rebound_pct": self.offensive_rebound_pct,
-            "defensive_rebound_pct": self.defensive_rebound_pct,
-            "rebound_pct": self.rebound_pct,
-            "turnover_pct": self.turnover_pct,
-            "effective_fg_pct": self.effective_fg_pct,
-            "true_shooting_pct": self.true_shooting_pct,
-            "usage_pct": self.usage_pct,
-            # pace & impact
-            "pace": self.pace,
-            "pace_per_40": self.pace_per_40,
-            "estimated_pace": self.estimated_pace,
-            "possessions": self.possessions,
-            "pie": self.pie,
-            # shooting volume
-            "field_goals_made": self.field_goals_made,
-            "field_goals_attempted": self.field_goals_attempted,
-            "field_goal_pct": self.field_goal_pct,
-            "field_goals_made_pg": self.field_goals_made_pg,
-            "field_goals_attempted_pg": self.field_goals_attempted_pg,
-            # scoring
-            "points": self.points,
-            "points_pg": self.points_pg,
-            # rebounds
-            "rebounds": self.rebounds,
-            "rebounds_pg": self.rebounds_pg,
-            "offensive_rebounds": self.offensive_rebounds,
-            "defensive_rebounds": self.defensive_rebounds,
-            # playmaking
-            "assists": self.assists,
-            "assists_pg": self.assists_pg,
-            "turnovers": self.turnovers,
-            "turnovers_pg": self.turnovers_pg,
-            # defense
-            "steals": self.steals,
-            "steals_pg": self.steals_pg,
-            "blocks": self.blocks,
-            "blocks_pg": self.blocks_pg,
-            # fouls
-            "personal_fouls": self.personal_fouls,
-            "personal_fouls_pg": self.personal_fouls_pg,
-            # 3PT shooting
-            "three_pointers_made": self.three_pointers_made,
-            "three_pointers_attempted": self.three_pointers_attempted,
-            "three_point_pct": self.three_point_pct,
-            "three_pointers_made_pg": self.three_pointers_made_pg,
-            "three_pointers_attempted_pg": self.three_pointers_attempted_pg,
-            # 2PT shooting
-            "two_pointers_made": self.two_pointers_made,
-            "two_pointers_attempted": self.two_pointers_attempted,
-            "two_point_pct": self.two_point_pct,
-            "two_pointers_made_pg": self.two_pointers_made_pg,
-            "two_pointers_attempted_pg": self.two_pointers_attempted_pg,
-            # free throws
-            "free_throws_made": self.free_throws_made,
-            "free_throws_attempted": self.free_throws_attempted,
-            "free_throw_pct": self.free_throw_pct,
-            "free_throws_made_pg": self.free_throws_made_pg,
-            "free_throws_attempted_pg": self.free_throws_attempted_pg,
-            # plus/minus & milestones
-            "plus_minus": self.plus_minus,
-            "plus_minus_pg": self.plus_minus_pg,
-            "double_doubles": self.double_doubles,
-            "triple_doubles": self.triple_doubles,
-            # ML-friendly scoring context
-            "pts_off_tov": self.pts_off_tov,
-            "pts_2nd_chance": self.pts_2nd_chance,
-            "pts_fb": self.pts_fb,
-            "pts_paint": self.pts_paint,
-            "opp_pts_off_tov": self.opp_pts_off_tov,
-            "opp_pts_2nd_chance": self.opp_pts_2nd_chance,
-            "opp_pts_fb": self.opp_pts_fb,
-            "opp_pts_paint": self.opp_pts_paint,
-            # % of team contributions
-            "pct_fgm": self.pct_fgm,
-            "pct_fga": self.pct_fga,
-            "pct_fg3m": self.pct_fg3m,
-            "pct_fg3a": self.pct_fg3a,
-            "pct_ftm": self.pct_ftm,
-            "pct_fta": self.pct_fta,
-            "pct_oreb": self.pct_oreb,
-            "pct_dreb": self.pct_dreb,
-            "pct_reb": self.pct_reb,
-            "pct_ast": self.pct_ast,
-            "pct_tov": self.pct_tov,
-            "pct_stl": self.pct_stl,
-            "pct_blk": self.pct_blk,
-            "pct_blka": self.pct_blka,
-            "pct_pf": self.pct_pf,
-            "pct_pfd": self.pct_pfd,
-            "pct_pts": self.pct_pts,
-        }
-        for key, value in res.items():
-            if value is None:
-                raise Exception(f"{key} is missing")
-        return SeasonalMLPayload(**res)  # type: ignore[invalid-argument-type]
+        values = _ml_values(self)
+        if None in values:
+            raise Exception(f"{FIELDS[values.index(None)]} is missing")
+        return SeasonalMLPayload(*values)
+
+    @staticmethod
+    def ml_matrix(seasons: Iterable[PlayerSeason]) -> np.ndarray:
+        """ml_data for many seasons as one (n, len(FIELDS)) float array"""
+        rows = [_ml_values(season) for season in seasons]
+        for row in rows:
+            if None in row:
+                raise Exception(f"{FIELDS[row.index(None)]} is missing")
+        return np.array(rows, dtype=float).reshape(-1, len(FIELDS))
+
+    @staticmethod
+    def no_colinearity_matrix(seasons: Iterable[PlayerSeason]) -> np.ndarray:
+        """ml_data().no_colinearity() for many seasons, columns in NO_COLINEARITY order"""
+        return no_colinearity_matrix(PlayerSeason.ml_matrix(seasons))
+
+
+# SeasonalMLPayload fields as PlayerSeason attributes, in FIELDS order
+_ML_ATTRIBUTES = tuple(
+    "minutes_per_game" if name == "minutes_pg" else name for name in FIELDS
+)
+_loaded_ml_values = itemgetter(*_ML_ATTRIBUTES)
+_ml_attribute_values = attrgetter(*_ML_ATTRIBUTES)
+
+
+def _ml_values(season: PlayerSeason) -> tuple[Any, ...]:
+    # loaded columns sit in the instance dict, skipping the instrumented
+    # descriptors is most of the cost. Expired or deferred ones go the slow way
+    try:
+        return _loaded_ml_values(season.__dict__)
+    except KeyError:
+        return _ml_attribute_values(season)
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 
 from app.custom_types import MLSafe
+from app.modeling.payload_types.seasonal import prefixed
 
 if TYPE_CHECKING:
     from app.data.league import (
@@ -71,24 +72,8 @@ class ContractSupportingInformation:
                 else self.contract.to_scalar()
             )
             | self.salary_scalar
-            | (
-                {
-                    "contract_season_" + k: v
-                    for k, v in (
-                        self.contract_season.ml_data().no_colinearity()
-                        if self.contract_season is not None
-                        else blank_season_ml_data()
-                    ).items()
-                }
-            )
-            | {
-                "previous_season_" + k: v
-                for k, v in (
-                    self.previous_season.ml_data().no_colinearity()
-                    if self.previous_season is not None
-                    else blank_season_ml_data()
-                ).items()
-            }
+            | season_scalar("contract_season_", self.contract_season)
+            | season_scalar("previous_season_", self.previous_season)
             | {
                 "career_" + k: v
                 for k, v in (
@@ -167,53 +152,9 @@ def blank_salary_scalar() -> dict[str, float | None]:
     }
 
 
-def blank_season_ml_data() -> dict[str, Literal[0]]:
-    return {
-        key: 0
-        for key in [
-            "games_played",
-            "minutes_pg",
-            "points_pg",
-            "rebounds_pg",
-            "assists_pg",
-            "steals_pg",
-            "blocks_pg",
-            "turnovers_pg",
-            "personal_fouls_pg",
-            "field_goals_made_pg",
-            "field_goals_attempted_pg",
-            "three_pointers_made_pg",
-            "three_pointers_attempted_pg",
-            "two_pointers_made_pg",
-            "two_pointers_attempted_pg",
-            "free_throws_made_pg",
-            "free_throws_attempted_pg",
-            "field_goal_pct",
-            "three_point_pct",
-            "two_point_pct",
-            "free_throw_pct",
-            "assist_percentage",
-            "assist_to_turnover",
-            "assist_ratio",
-            "offensive_rebound_pct",
-            "defensive_rebound_pct",
-            "rebound_pct",
-            "turnover_pct",
-            "usage_pct",
-            "offensive_rating",
-            "defensive_rating",
-            "net_rating",
-            "estimated_offensive_rating",
-            "estimated_defensive_rating",
-            "estimated_net_rating",
-            "estimated_pace",
-            "possessions_pg",
-            "pts_off_tov_pg",
-            "pts_fb_pg",
-            "pts_paint_pg",
-            "opp_pts_off_tov_pg",
-            "opp_pts_fb_pg",
-            "opp_pts_paint_pg",
-            "plus_minus_pg",
-        ]
-    }
+def season_scalar(prefix: str, season: PlayerSeason | None) -> dict[str, MLSafe]:
+    keys = prefixed(prefix)
+    if season is None:
+        return dict.fromkeys(keys, 0)
+    return dict(zip(keys, season.ml_data().no_colinearity_values()))
+
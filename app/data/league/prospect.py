@@ -1,22 +1,34 @@
 from __future__ import annotations
 
+import hashlib
 import re
-from collections.abc import Callable
-from datetime import date, datetime, timezone
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import cache
 from typing import Any
 
 import bs4
+import lxml.html
 from bs4 import BeautifulSoup
+from lxml import etree
 from sqlalchemy import (
+    DDL,
+    Column,
     Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    MetaData,
     String,
+    Table,
     UniqueConstraint,
+    event,
+    text,
 )
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, aliased, mapped_column
 
 from app.base import Base
 
@@ -67,11 +79,205 @@ def parse_measurements(text: str) -> tuple[float | None, float | None]:
     return height_in_total, wingspan_in_total
 
 
+# -------------------------------------------------
+# Page extraction
+# -------------------------------------------------
+def has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_NAME = etree.XPath("(//h1)[1]")
+_BIO = etree.XPath(f"(//div[{has_class('player-info')}])[1]")
+_BIO_CELLS = etree.XPath(f".//div[{has_class('label')} or {has_class('data')}]")
+_STATS_HEADERS = etree.XPath(f"//div[{has_class('stats-header')}]")
+_STATS = etree.XPath(f"following-sibling::div[{has_class('stats')}][1]")
+_STAT_CELLS = etree.XPath(
+    f".//div[{has_class('stat-label')} or {has_class('stat-data')}]"
+)
+
+
+def pair_cells(cells: Iterable[tuple[str, bool]]) -> dict[str, str]:
+    """(text, is a label) cells in page order -> label: value"""
+    labels: list[str] = []
+    values: list[str] = []
+    for text, is_label in cells:
+        (labels if is_label else values).append(text)
+    return dict(zip(labels, values))
+
+
+def soup_cells(tag: bs4.element.Tag, label: str, value: str) -> dict[str, str]:
+    return pair_cells(
+        (cell.text, label in cell["class"])
+        for cell in tag.find_all("div", class_=[label, value])
+    )
+
+
+def lxml_cells(
+    element: etree._Element, query: etree.XPath, label: str
+) -> dict[str, str]:
+    return pair_cells(
+        (cell.text_content(), label in cell.get("class", "").split())
+        for cell in query(element)
+    )
+
+
+@dataclass
+class ProspectPage:
+    """the parts of a Tankathon player page DraftProspect reads, in one pass"""
+
+    name: str | None
+    bio: dict[str, str] | None
+    # stats header text -> label: value
+    tables: dict[str, dict[str, str]]
+
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup) -> ProspectPage:
+        label = soup.find("h1")
+        bio = soup.find("div", class_="player-info")
+        tables = {}
+        for header in soup.find_all("div", class_="stats-header"):
+            stats = header.find_next_sibling("div", class_="stats")
+            if stats is not None:
+                tables[header.text] = soup_cells(stats, "stat-label", "stat-data")
+        return cls(
+            name=label.get_text(strip=True) if label is not None else None,
+            bio=soup_cells(bio, "label", "data") if bio is not None else None,
+            tables=tables,
+        )
+
+    @classmethod
+    def from_html(cls, html: str | bytes) -> ProspectPage:
+        root = lxml.html.fromstring(html)
+        labels = _NAME(root)
+        bios = _BIO(root)
+        tables = {}
+        for header in _STATS_HEADERS(root):
+            for stats in _STATS(header):
+                tables[header.text_content()] = lxml_cells(
+                    stats, _STAT_CELLS, "stat-label"
+                )
+        return cls(
+            name=(
+                "".join(text.strip() for text in labels[0].itertext())
+                if labels
+                else None
+            ),
+            bio=lxml_cells(bios[0], _BIO_CELLS, "label") if bios else None,
+            tables=tables,
+        )
+
+
+# -------------------------------------------------
+# Stats tables
+# -------------------------------------------------
+# (attribute, parser for the cell text)
+Field = tuple[str, Callable[[str | None], Any]]
+
+
+@dataclass(frozen=True)
+class StatTable:
+    # label -> field
+    fields: dict[str, Field]
+    # "made-attempted" label -> (made attribute, attempted attribute)
+    pairs: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # missing labels raise instead of leaving the attribute empty
+    required: bool = False
+
+
+def counting_stats(prefix: str = "") -> dict[str, Field]:
+    return {
+        label: (prefix + attribute, safe_untyped_float)
+        for label, attribute in {
+            "REB": "rebounds",
+            "AST": "assists",
+            "BLK": "blocks",
+            "STL": "steals",
+            "TO": "turnovers",
+            "PF": "fouls",
+            "PTS": "points",
+        }.items()
+    }
+
+
+PER_GAME = StatTable(
+    fields={
+        "G": ("games", safe_untyped_int),
+        "MP": ("minutes_per_game", safe_untyped_float),
+        "FG%": ("fg_pct", safe_untyped_float),
+        "3P%": ("three_pct", safe_untyped_float),
+        "FT%": ("ft_pct", safe_untyped_float),
+    }
+    | counting_stats(),
+    pairs={
+        "FGM-FGA": ("fgm", "fga"),
+        "3PM-3PA": ("tpm", "tpa"),
+        "FTM-FTA": ("ftm", "fta"),
+    },
+    required=True,
+)
+PER_36 = StatTable(
+    fields=counting_stats("p36_"),
+    pairs={
+        "FGM-FGA": ("p36_fgm", "p36_fga"),
+        "3PM-3PA": ("p36_tpm", "p36_tpa"),
+        "FTM-FTA": ("p36_ftm", "p36_fta"),
+    },
+    required=True,
+)
+ADVANCED_I = StatTable(
+    fields={
+        label: (attribute, safe_untyped_float)
+        for label, attribute in {
+            "True Shooting %TS%": "true_shooting_pct",
+            "Effective FG%EFG%": "effective_fg_pct",
+            "3PA Rate3PAR": "three_pa_rate",
+            "FTA RateFTAR": "ft_rate",
+            "Proj NBA 3P%NBA 3P%": "proj_nba_3p_pct",
+            "USG%": "usage_pct",
+            "AST/USG": "ast_to_usg",
+            "AST/TO": "ast_to_to",
+        }.items()
+    }
+)
+ADVANCED_II = StatTable(
+    fields={
+        label: (attribute, safe_untyped_float)
+        for label, attribute in {
+            "PER": "per_game_performance_rating",
+            "OWS/40": "ows_per_40",
+            "DWS/40": "dws_per_40",
+            "WS/40": "ws_per_40",
+            "ORTG": "offensive_rating",
+            "DRTG": "defensive_rating",
+            "OBPM": "offensive_bpm",
+            "DBPM": "defensive_bpm",
+            "BPM": "bpm",
+        }.items()
+    }
+)
+
+
+def stat_tables(year: int) -> dict[str, StatTable]:
+    """the stats header text on the page -> how to read that table"""
+    return {
+        f"20{year % 2000 - 1}-{year % 2000} PER GAME AVERAGES": PER_GAME,
+        "PER 36 MINUTES": PER_36,
+        "ADVANCED STATS I HOVER FOR DESCRIPTION TAP LABEL FOR DESCRIPTION": ADVANCED_I,
+        "ADVANCED STATS II HOVER FOR DESCRIPTION TAP LABEL FOR DESCRIPTION": ADVANCED_II,
+    }
+
+
 class DraftProspect(Base):
     __tablename__ = "draft_prospects"
 
     __table_args__ = (
         UniqueConstraint("name", "uploaded", name="uq_draft_prospect_name_uploaded"),
+        # a slug's snapshots newest first, the latest one is the first entry
+        Index(
+            "ix_draft_prospects_slug_uploaded", "tankathon_slug", text("uploaded DESC")
+        ),
+        # the snapshots on the board at a given time
+        Index("ix_draft_prospects_uploaded_last_seen", "uploaded", "last_seen"),
     )
 
     # -------------------------------------------------
@@ -83,12 +289,20 @@ class DraftProspect(Base):
     # Metadata
     # -------------------------------------------------
     uploaded: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # scrapes only write a new row when the prospect changed, otherwise the
+    # latest row's last_seen moves up. A row holds from uploaded to last_seen
+    last_seen: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda context: context.get_current_parameters()["uploaded"],
+    )
+    content_hash: Mapped[str | None] = mapped_column(String(32))
 
     # -------------------------------------------------
     # Profile / Identity
     # -------------------------------------------------
     name: Mapped[str] = mapped_column(String(128), nullable=False)
-    player_id: Mapped[int] = mapped_column(ForeignKey("players.id"))
+    player_id: Mapped[int] = mapped_column(ForeignKey("players.id"), index=True)
     tankathon_slug: Mapped[str | None] = mapped_column(String(128))
     primary_position: Mapped[str | None] = mapped_column(String(2))
     secondary_position: Mapped[str | None] = mapped_column(String(2))
@@ -171,6 +385,11 @@ class DraftProspect(Base):
     defensive_bpm: Mapped[Float | None] = mapped_column(Float)
     bpm: Mapped[Float | None] = mapped_column(Float)
 
+    def snapshot_hash(self) -> str:
+        """hash of the SNAPSHOT_COLUMNS, equal hashes mean nothing changed"""
+        values = repr(tuple(getattr(self, name) for name in SNAPSHOT_COLUMNS))
+        return hashlib.blake2b(values.encode(), digest_size=16).hexdigest()
+
     @classmethod
     def from_beautiful_soup(
         cls,
@@ -180,48 +399,68 @@ class DraftProspect(Base):
         tankathon_slug: str | None = None,
         year: int = 2026,
         player_id: int | None = None,
+    ) -> DraftProspect:
+        return cls.from_page(
+            uploaded,
+            ProspectPage.from_soup(soup),
+            tankathon_slug=tankathon_slug,
+            year=year,
+            player_id=player_id,
+        )
+
+    @classmethod
+    def from_html(
+        cls,
+        uploaded: datetime,
+        html: str | bytes,
+        *,
+        tankathon_slug: str | None = None,
+        year: int = 2026,
+        player_id: int | None = None,
+    ) -> DraftProspect:
+        """from_beautiful_soup straight from the page source, through lxml"""
+        return cls.from_page(
+            uploaded,
+            ProspectPage.from_html(html),
+            tankathon_slug=tankathon_slug,
+            year=year,
+            player_id=player_id,
+        )
+
+    @classmethod
+    def from_page(
+        cls,
+        uploaded: datetime,
+        page: ProspectPage,
+        *,
+        tankathon_slug: str | None = None,
+        year: int = 2026,
+        player_id: int | None = None,
     ) -> DraftProspect:
         data = cls(uploaded=uploaded, player_id=player_id)
 
         if tankathon_slug is not None:
             data.tankathon_slug = tankathon_slug
 
-        label = soup.find("h1")
-        if label:
-            data.name = label.get_text(strip=True)
-
-        data.update_summary_data(soup)
-
-        table_methods: dict[str, Callable[[bs4.element.Tag], None]] = {
-            f"20{year % 2000 - 1}-{year % 2000} PER GAME AVERAGES": data.parse_per_game_averages,
-            "PER 36 MINUTES": data.parse_per_36_averages,
-            "ADVANCED STATS I HOVER FOR DESCRIPTION TAP LABEL FOR DESCRIPTION": data.parse_advanced_stats_i,
-            "ADVANCED STATS II HOVER FOR DESCRIPTION TAP LABEL FOR DESCRIPTION": data.parse_advanced_stats_ii,
-        }
-
-        for table, method in table_methods.items():
-            for header_tag in soup.find_all(
-                "div",
-                class_="stats-header",
-            ):
-                sibling = header_tag.find_next_sibling("div", class_="stats")  # pyright: ignore[reportArgumentType]
-                table_methods.get(header_tag.text, print)(sibling)  # pyright: ignore[reportArgumentType]
+        if page.name is not None:
+            data.name = page.name
+
+        data.update_summary(page.bio)
+
+        tables = stat_tables(year)
+        for header, stats in page.tables.items():
+            if header in tables:
+                data.update_stats(stats, tables[header])
 
         return data
 
     def update_summary_data(self, soup: bs4.BeautifulSoup) -> None:
-        bio_table = soup.find("div", class_="player-info")
-        if bio_table is None:
+        self.update_summary(ProspectPage.from_soup(soup).bio)
+
+    def update_summary(self, data: dict[str, str] | None) -> None:
+        if data is None:
             print(f"No bio info for {self.name}!")
             return
-        player_info_labels = bio_table.find_all("div", class_="label")
-        player_info_values = bio_table.find_all("div", class_="data")
-        data = dict(
-            zip(
-                (div.text for div in player_info_labels),
-                (div.text for div in player_info_values),
-            )
-        )
         years = ["Freshman", "Sophomore", "Junior", "Senior"]
         self.team = data["Team"]
         self.high_school = data.get("High School")
@@ -236,71 +475,70 @@ class DraftProspect(Base):
         )
         self.hometown = data.get("Hometown")
         self.nation = data["Nation"].strip() if "Nation" in data else None
-        self.birthdate = date.strptime(data["Birthdate"], "%b %d, %Y")  # type: ignore
+        self.birthdate = datetime.strptime(data["Birthdate"], "%b %d, %Y").date()  # type: ignore
         self.age_at_draft = safe_untyped_float(data["Age at Draft"][:-4])
         self.tankathon_big_board_rank = safe_untyped_int(data.get("Big Board"))
         self.espn_big_board_rank = safe_untyped_int(
             data.get("ESPN 100", "").split(" |")[0][1:]
         )
 
-    def parse_per_game_averages(self, tag: bs4.element.Tag) -> None:
-        stat_labels = [div.text for div in tag.find_all("div", class_="stat-label")]
-        stat_data = [div.text for div in tag.find_all("div", class_="stat-data")]
-        data = dict(zip(stat_labels, stat_data))
-        self.games = safe_untyped_int(data["G"])
-        self.minutes_per_game = safe_untyped_float(data["MP"])
-        self.fgm, self.fga = map(safe_untyped_float, data["FGM-FGA"].split("-"))
-        self.fg_pct = safe_untyped_float(data["FG%"])
-        self.tpm, self.tpa = map(safe_untyped_float, data["3PM-3PA"].split("-"))
-        self.three_pct = safe_untyped_float(data["3P%"])
-        self.ftm, self.fta = map(safe_untyped_float, data["FTM-FTA"].split("-"))
-        self.ft_pct = safe_untyped_float(data["FT%"])
-        self.rebounds = safe_untyped_float(data["REB"])
-        self.assists = safe_untyped_float(data["AST"])
-        self.blocks = safe_untyped_float(data["BLK"])
-        self.steals = safe_untyped_float(data["STL"])
-        self.turnovers = safe_untyped_float(data["TO"])
-        self.fouls = safe_untyped_float(data["PF"])
-        self.points = safe_untyped_float(data["PTS"])
-
-    def parse_per_36_averages(self, tag: bs4.element.Tag) -> None:
-        stat_labels = [div.text for div in tag.find_all("div", class_="stat-label")]
-        stat_data = [div.text for div in tag.find_all("div", class_="stat-data")]
-        data = dict(zip(stat_labels, stat_data))
-        self.p36_fgm, self.p36_fga = map(safe_untyped_float, data["FGM-FGA"].split("-"))
-        self.p36_tpm, self.p36_tpa = map(safe_untyped_float, data["3PM-3PA"].split("-"))
-        self.p36_ftm, self.p36_fta = map(safe_untyped_float, data["FTM-FTA"].split("-"))
-        self.p36_rebounds = safe_untyped_float(data["REB"])
-        self.p36_assists = safe_untyped_float(data["AST"])
-        self.p36_blocks = safe_untyped_float(data["BLK"])
-        self.p36_steals = safe_untyped_float(data["STL"])
-        self.p36_turnovers = safe_untyped_float(data["TO"])
-        self.p36_fouls = safe_untyped_float(data["PF"])
-        self.p36_points = safe_untyped_float(data["PTS"])
-
-    def parse_advanced_stats_i(self, tag: bs4.element.Tag) -> None:
-        stat_labels = [div.text for div in tag.find_all("div", class_="stat-label")]
-        stat_data = [div.text for div in tag.find_all("div", class_="stat-data")]
-        data = dict(zip(stat_labels, stat_data))
-        self.true_shooting_pct = safe_untyped_float(data.get("True Shooting %TS%"))
-        self.effective_fg_pct = safe_untyped_float(data.get(r"Effective FG%EFG%"))
-        self.three_pa_rate = safe_untyped_float(data.get("3PA Rate3PAR"))
-        self.ft_rate = safe_untyped_float(data.get("FTA RateFTAR"))
-        self.proj_nba_3p_pct = safe_untyped_float(data.get("Proj NBA 3P%NBA 3P%"))
-        self.usage_pct = safe_untyped_float(data.get("USG%"))
-        self.ast_to_usg = safe_untyped_float(data.get("AST/USG"))
-        self.ast_to_to = safe_untyped_float(data.get("AST/TO"))
-
-    def parse_advanced_stats_ii(self, tag: bs4.element.Tag) -> None:
-        stat_labels = [div.text for div in tag.find_all("div", class_="stat-label")]
-        stat_data = [div.text for div in tag.find_all("div", class_="stat-data")]
-        data = dict(zip(stat_labels, stat_data))
-        self.per_game_performance_rating = safe_untyped_float(data.get("PER"))
-        self.ows_per_40 = safe_untyped_float(data.get("OWS/40"))
-        self.dws_per_40 = safe_untyped_float(data.get("DWS/40"))
-        self.ws_per_40 = safe_untyped_float(data.get("WS/40"))
-        self.offensive_rating = safe_untyped_float(data.get("ORTG"))
-        self.defensive_rating = safe_untyped_float(data.get("DRTG"))
-        self.offensive_bpm = safe_untyped_float(data.get("OBPM"))
-        self.defensive_bpm = safe_untyped_float(data.get("DBPM"))
-        self.bpm = safe_untyped_float(data.get("BPM"))
+    def update_stats(self, data: dict[str, str], table: StatTable) -> None:
+        read = data.__getitem__ if table.required else data.get
+        for label, (attribute, parse) in table.fields.items():
+            setattr(self, attribute, parse(read(label)))
+        for label, (made, attempted) in table.pairs.items():
+            made_value, attempted_value = map(
+                safe_untyped_float, read(label).split("-")
+            )
+            setattr(self, made, made_value)
+            setattr(self, attempted, attempted_value)
+
+
+# what a scrape compares, everything but the bookkeeping
+SNAPSHOT_COLUMNS: tuple[str, ...] = tuple(
+    column.key
+    for column in DraftProspect.__table__.columns
+    if column.key not in {"id", "uploaded", "last_seen", "content_hash", "player_id"}
+)
+
+# -------------------------------------------------
+# Latest snapshot per slug
+# -------------------------------------------------
+CREATE_LATEST_DRAFT_PROSPECTS = [
+    "CREATE OR REPLACE VIEW latest_draft_prospects AS "
+    "SELECT DISTINCT ON (tankathon_slug) * FROM draft_prospects "
+    "WHERE tankathon_slug IS NOT NULL "
+    "ORDER BY tankathon_slug, uploaded DESC"
+]
+
+DROP_LATEST_DRAFT_PROSPECTS = "DROP VIEW IF EXISTS latest_draft_prospects"
+
+# not part of Base.metadata (create_all would make it a table)
+latest_draft_prospects = Table(
+    "latest_draft_prospects",
+    MetaData(),
+    *(
+        Column(column.name, column.type, primary_key=column.primary_key)
+        for column in DraftProspect.__table__.columns
+    ),
+)
+
+
+@cache
+def latest_draft_prospect() -> type[DraftProspect]:
+    """
+    DraftProspect over the view, so selects come back as DraftProspect objects.
+    Built on first use, aliasing configures every mapper
+    """
+    return aliased(DraftProspect, latest_draft_prospects, adapt_on_names=True)  # type: ignore[return-value]
+
+
+for statement in CREATE_LATEST_DRAFT_PROSPECTS:
+    event.listen(
+        Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL(DROP_LATEST_DRAFT_PROSPECTS).execute_if(dialect="postgresql"),
+)
@@ -72,3 +72,6 @@ class MaxSalaries:
 
 MAX_SALARIES = MaxSalaries()
 MIN_SALARIES = MinSalaries()
+
+# salaries are paid out evenly over the regular season
+GAMES_PER_SEASON = 82
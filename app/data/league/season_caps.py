@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.data.league.season import Season
+
+
+class SeasonCaps:
+    """read-only season_id -> cap array, mirroring Season.cap"""
+
+    def __init__(self, rows: Iterable[tuple[int, int | None, int | None]]) -> None:
+        rows = list(rows)
+        if not rows:
+            raise Exception("No seasons to build a cap lookup from")
+
+        self.first_season = min(season_id for season_id, _, _ in rows)
+        last_season = max(season_id for season_id, _, _ in rows)
+
+        caps = np.full(last_season - self.first_season + 1, np.nan)
+        for season_id, max_salary_cap, expected_cap in rows:
+            # same precedence as Season.cap: falsy caps fall through
+            if cap := max_salary_cap or expected_cap:
+                caps[season_id - self.first_season] = cap
+        caps.flags.writeable = False
+        self.caps = caps
+
+    @classmethod
+    def from_session(cls, session: Session) -> SeasonCaps:
+        stmt = select(Season.id, Season.max_salary_cap, Season.expected_cap)
+        return cls(session.execute(stmt).tuples().all())
+
+    def cap(self, season_id: int) -> float:
+        index = season_id - self.first_season
+        if not 0 <= index < len(self.caps) or np.isnan(cap := self.caps[index]):
+            raise Exception(f"No cap data for season {season_id}")
+        return float(cap)
+
+    def caps_for(self, season_ids: ArrayLike) -> NDArray[np.float64]:
+        indices = np.asarray(season_ids, dtype=np.int64) - self.first_season
+        in_range = (indices >= 0) & (indices < len(self.caps))
+        if not in_range.all():
+            missing = np.unique(np.asarray(season_ids)[~in_range])
+            raise Exception(f"No cap data for seasons {missing.tolist()}")
+
+        caps = self.caps[indices]
+        if np.isnan(caps).any():
+            missing = np.unique(np.asarray(season_ids)[np.isnan(caps)])
+            raise Exception(f"No cap data for seasons {missing.tolist()}")
+        return caps
+
+    def relative_dollars(
+        self, salaries: ArrayLike, season_ids: ArrayLike
+    ) -> NDArray[np.float64]:
+        # missing salaries (two-ways, blank rows) count as 0, like the ORM properties
+        salaries = np.nan_to_num(np.asarray(salaries, dtype=np.float64), nan=0.0)
+        return salaries / self.caps_for(season_ids)
+
+
+# where a session keeps the caps it has read
+SESSION_KEY = "season_caps"
+# set by use_season_caps, takes over from every session
+_SEASON_CAPS: SeasonCaps | None = None
+
+
+def get_season_caps(session: Session | None) -> SeasonCaps | None:
+    """
+    read from `session` once and kept on it, so a new session (every ETL task,
+    every request) sees the seasons table as it is now. Seasons written later
+    in the same session need reset_season_caps(session) first. Without a
+    session (detached or transient objects) it's None unless use_season_caps
+    """
+    if _SEASON_CAPS is not None:
+        return _SEASON_CAPS
+    if session is None:
+        return None
+    caps = session.info.get(SESSION_KEY)
+    if caps is None:
+        caps = session.info[SESSION_KEY] = SeasonCaps.from_session(session)
+    return caps
+
+
+def use_season_caps(caps: SeasonCaps) -> None:
+    """skip the database, e.g. for synthetic benchmark data"""
+    global _SEASON_CAPS
+    _SEASON_CAPS = caps
+
+
+def reset_season_caps(session: Session | None = None) -> None:
+    """
+    drop the use_season_caps override, and what `session` has read. Call
+    after changing the seasons table in a session that's used again
+    """
+    global _SEASON_CAPS
+    _SEASON_CAPS = None
+    if session is not None:
+        session.info.pop(SESSION_KEY, None)
+
+
+def relative_dollars(
+    salary_array: ArrayLike,
+    season_array: ArrayLike,
+    session: Session | None,
+) -> NDArray[np.float64]:
+    caps = get_season_caps(session)
+    if caps is None:
+        raise Exception("Season caps are read through a session, there isn't one")
+    return caps.relative_dollars(salary_array, season_array)
@@ -3,16 +3,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Float, ForeignKey, Index, Integer, Sequence, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, object_session, relationship
 
-from app.base import Base
+from app.base import Base, UpdatedAtMixin
+from app.data.league.season_caps import get_season_caps
 
 if TYPE_CHECKING:
     from app.data.league.player import Player
     from app.data.league.season import Season
 
 
-class TeamPlayerSalary(Base):
+class TeamPlayerSalary(UpdatedAtMixin, Base):
     __tablename__ = "team_player_salaries"
 
     id: Mapped[int] = mapped_column(
@@ -67,6 +68,9 @@ class TeamPlayerSalary(Base):
     def relative_dollars(self) -> float | None:
         if self.salary is None:
             return 0.0
+        # cached cap lookup instead of lazy-loading self.season for every row
+        if caps := get_season_caps(object_session(self)):
+            return self.salary / caps.cap(self.season_id)
         return self.salary / self.season.cap
 
     def to_scalar(self) -> dict[str, float | int | bool | None]:
@@ -83,7 +87,7 @@ class TeamPlayerSalary(Base):
         }
 
 
-class TeamPlayerBuyout(Base):
+class TeamPlayerBuyout(UpdatedAtMixin, Base):
     __tablename__ = "team_player_buyouts"
 
     # ---- primary key ----
@@ -129,6 +133,8 @@ class TeamPlayerBuyout(Base):
     def relative_dollars(self) -> float:
         if self.salary is None:
             return 0.0
+        if caps := get_season_caps(object_session(self)):
+            return self.salary / caps.cap(self.season_id)
         return self.salary / self.season.cap
 
     def to_scalar(self) -> dict[str, float | int | bool | None]:
@@ -0,0 +1,719 @@
+"""
+a synthetic league at any scale, for load tests and benchmarks.
+
+    python -m app.data.synthetic --players 100000 --parquet data/synthetic
+    python -m app.data.synthetic --players 100000 --copy   # into the dev database
+
+Players get a latent skill that drives minutes, usage and efficiency, so the
+stats hang together (totals are per-game times games, points are 2s + 3s +
+free throws, ratings track skill). Contracts, salaries and awards follow from
+the same skill. Every id is assigned here, so foreign keys line up without
+touching the database, and the same seed (and chunk size) gives the same rows.
+That's also why --copy only fills empty tables.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from faker import Faker
+from sqlalchemy import Sequence as SqlSequence
+from sqlalchemy import exists, select, text
+from sqlalchemy.orm import Session
+
+from app.base import Base
+from app.data.connection import get_session
+from app.data.league import (
+    Award,
+    Contract,
+    Player,
+    PlayerSeason,
+    Season,
+    Team,
+    TeamPlayerBuyout,
+    TeamPlayerSalary,
+)
+from app.data.to_python_syntax import arrow_schema
+
+LeagueChunk = dict[type[Base], pa.Table]
+
+POSITIONS = [
+    "Guard",
+    "Forward",
+    "Center",
+    "Guard-Forward",
+    "Forward-Center",
+    "Center-Forward",
+    "Forward-Guard",
+]
+# share of threes, rebounds and assists per 36 minutes, by position
+POSITION_PROFILES = {
+    "Guard": (0.45, 4.5, 6.0),
+    "Forward": (0.35, 7.0, 3.0),
+    "Center": (0.08, 10.5, 2.0),
+    "Guard-Forward": (0.40, 5.5, 4.0),
+    "Forward-Center": (0.20, 9.0, 2.5),
+    "Center-Forward": (0.15, 9.5, 2.2),
+    "Forward-Guard": (0.38, 6.0, 3.5),
+}
+COUNTRIES = ["Canada", "France", "Australia", "Serbia", "Germany", "Nigeria"]
+
+FIRST_SEASON = 2000
+LAST_SEASON = 2026
+CAP_2011 = 58_044_000
+CAP_GROWTH = 1.06
+# session.info key for the models copy_league moved the id sequences of
+COPIED_MODELS = "synthetic_copied_models"
+
+# each race ranks player-seasons by one score, then hands out awards in order
+AWARD_RACES: dict[str, dict[str, int]] = {
+    "offense": {
+        "Most Valuable Player": 1,
+        "1st Team All-NBA": 5,
+        "2nd Team All-NBA": 5,
+        "3rd Team All-NBA": 5,
+    },
+    "defense": {"Defensive Player of the Year": 1},
+}
+
+
+def cap_for(season: int) -> int:
+    return round(CAP_2011 * CAP_GROWTH ** (season - 2011))
+
+
+def to_table(model: type[Base], columns: dict[str, Any]) -> pa.Table:
+    """
+    the model's full schema, columns not given are null. Columns the database
+    fills (server defaults like updated_at) are left out unless given
+    """
+    table_columns = model.__table__.c
+    schema = pa.schema(
+        field
+        for field in arrow_schema(model)
+        if field.name in columns or table_columns[field.name].server_default is None
+    )
+    n_rows = len(next(iter(columns.values())))
+    arrays = []
+    for field in schema:
+        values = columns.get(field.name)
+        arrays.append(
+            pa.nulls(n_rows, field.type)
+            if values is None
+            else pa.array(values, type=field.type, from_pandas=True)
+        )
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+# ---- reference tables ----
+def generate_seasons(first_season: int, last_season: int) -> pa.Table:
+    seasons = np.arange(first_season, last_season + 1)
+    caps = np.array([cap_for(season) for season in seasons])
+    return to_table(
+        Season,
+        {
+            "id": seasons,
+            "max_salary_cap": caps,
+            "inflation_adjusted_cap": caps,
+            "luxury_tax_threshold": (caps * 1.215).round().astype(np.int64),
+            "first_apron": (caps * 1.27).round().astype(np.int64),
+            "second_apron": (caps * 1.35).round().astype(np.int64),
+            "expected_cap": caps,
+        },
+    )
+
+
+def generate_teams(fake: Faker, n_teams: int = 30) -> pa.Table:
+    cities = [fake.unique.city() for _ in range(n_teams)]
+    nicknames = [fake.unique.last_name() + "s" for _ in range(n_teams)]
+    return to_table(
+        Team,
+        {
+            "id": range(1, n_teams + 1),
+            "city": cities,
+            "name": [f"{c} {n}" for c, n in zip(cities, nicknames)],
+            "nickname": nicknames,
+            "abbreviation": [f"T{id:02d}" for id in range(1, n_teams + 1)],
+            "conference": [
+                "East" if id <= n_teams // 2 else "West" for id in range(1, n_teams + 1)
+            ],
+            "division": [
+                f"Division {(id - 1) // 5 + 1}" for id in range(1, n_teams + 1)
+            ],
+        },
+    )
+
+
+# ---- player-level tables ----
+def season_stats(
+    rng: np.random.Generator,
+    skill: np.ndarray,
+    age: np.ndarray,
+    positions: list[str],
+) -> dict[str, np.ndarray]:
+    """every PlayerSeason stat column for one row per (skill, age, position)"""
+    n = len(skill)
+    three_share, rebounds_36, assists_36 = (
+        np.array([POSITION_PROFILES[p][i] for p in positions]) for i in range(3)
+    )
+    # a career arc that peaks around 27
+    form = skill - 0.015 * (age - 27) ** 2 + rng.normal(0, 0.3, n)
+
+    def noise(scale: float) -> np.ndarray:
+        return rng.normal(0, scale, n)
+
+    games = np.clip(rng.binomial(82, np.clip(0.72 + 0.06 * form, 0.1, 0.98)), 1, 82)
+    minutes = np.clip(20 + 7 * form + noise(3), 3, 40)
+    per_36 = minutes / 36
+    wins = rng.binomial(games, np.clip(0.5 + 0.04 * form, 0.15, 0.85))
+
+    fga_pg = np.clip(per_36 * (13 + 3 * form + noise(1.5)), 0.3, None)
+    fg3a_pg = fga_pg * np.clip(three_share + noise(0.08), 0, 0.9)
+    fg2a_pg = fga_pg - fg3a_pg
+    fg3_pct = np.clip(0.35 + 0.01 * form + noise(0.04), 0.1, 0.5)
+    fg2_pct = np.clip(0.51 + 0.015 * form + noise(0.04), 0.3, 0.7)
+    fta_pg = fga_pg * np.clip(0.25 + 0.03 * form + noise(0.07), 0.05, 0.7)
+    ft_pct = np.clip(0.77 + noise(0.07), 0.4, 0.95)
+
+    fg3a = np.round(fg3a_pg * games).astype(np.int64)
+    fg2a = np.round(fg2a_pg * games).astype(np.int64)
+    fta = np.round(fta_pg * games).astype(np.int64)
+    fg3m = rng.binomial(fg3a, fg3_pct)
+    fg2m = rng.binomial(fg2a, fg2_pct)
+    ftm = rng.binomial(fta, ft_pct)
+    fga, fgm = fg2a + fg3a, fg2m + fg3m
+    points = 2 * fg2m + 3 * fg3m + ftm
+
+    rebounds = np.round(
+        np.clip(per_36 * (rebounds_36 + 0.8 * form + noise(1)), 0, None) * games
+    ).astype(np.int64)
+    offensive_rebounds = rng.binomial(rebounds, 0.25)
+    assists = np.round(
+        np.clip(per_36 * (assists_36 + 0.8 * form + noise(0.8)), 0, None) * games
+    ).astype(np.int64)
+    turnovers = np.round(
+        np.clip(per_36 * (2 + 0.3 * form + noise(0.4)), 0, None) * games
+    ).astype(np.int64)
+    steals = np.round(
+        np.clip(per_36 * (1.1 + 0.2 * form + noise(0.25)), 0, None) * games
+    ).astype(np.int64)
+    blocks = np.round(
+        np.clip(per_36 * (0.4 + 0.3 * (rebounds_36 / 7) + noise(0.2)), 0, None) * games
+    ).astype(np.int64)
+    fouls = np.round(np.clip(per_36 * (3 + noise(0.5)), 0, None) * games).astype(
+        np.int64
+    )
+    plus_minus = np.round((2 * form + noise(3)) * games).astype(np.int64)
+
+    def per_game(total: np.ndarray) -> np.ndarray:
+        return total / games
+
+    def ratio(made: np.ndarray, attempted: np.ndarray) -> np.ndarray:
+        return np.divide(made, attempted, out=np.zeros(n), where=attempted > 0)
+
+    pace = 99 + noise(3)
+    possessions = np.round(pace * minutes / 48 * games).astype(np.int64)
+    offensive_rating = 110 + 3 * form + noise(4)
+    defensive_rating = 112 - 1.5 * form + noise(3)
+    points_pg = per_game(points)
+    rebounds_pg = per_game(rebounds)
+    assists_pg = per_game(assists)
+
+    def share(total_pg: np.ndarray, team_pg: float) -> np.ndarray:
+        return np.clip(total_pg / team_pg + noise(0.01), 0, 1)
+
+    def scoring_context(fraction: float) -> np.ndarray:
+        return np.round(points * np.clip(fraction + noise(fraction / 4), 0, 1)).astype(
+            np.int64
+        )
+
+    return {
+        "age": age.astype(float),
+        "games_played": games,
+        "wins": wins,
+        "losses": games - wins,
+        "win_pct": wins / games,
+        # the real column holds the season's total minutes, not per game
+        "minutes_per_game": minutes * games,
+        "offensive_rating": offensive_rating,
+        "defensive_rating": defensive_rating,
+        "net_rating": offensive_rating - defensive_rating,
+        "estimated_offensive_rating": offensive_rating + noise(1),
+        "estimated_defensive_rating": defensive_rating + noise(1),
+        "estimated_net_rating": offensive_rating - defensive_rating + noise(1),
+        "assist_percentage": share(assists_pg / per_36, 25),
+        "assist_to_turnover": ratio(assists, turnovers),
+        "assist_ratio": 100 * ratio(assists, fga + 0.44 * fta + assists + turnovers),
+        "offensive_rebound_pct": share(per_game(offensive_rebounds) / per_36, 12),
+        "defensive_rebound_pct": share(
+            per_game(rebounds - offensive_rebounds) / per_36, 35
+        ),
+        "rebound_pct": share(rebounds_pg / per_36, 45),
+        "turnover_pct": ratio(turnovers, fga + 0.44 * fta + turnovers),
+        "effective_fg_pct": ratio(fgm + 0.5 * fg3m, fga),
+        "true_shooting_pct": ratio(points, 2 * (fga + 0.44 * fta)),
+        "usage_pct": np.clip(0.19 + 0.03 * form + noise(0.02), 0.05, 0.4),
+        "pace": pace,
+        "pace_per_40": pace * 40 / 48,
+        "estimated_pace": pace + noise(1),
+        "possessions": possessions,
+        "pie": np.clip(0.09 + 0.03 * form + noise(0.01), -0.05, 0.3),
+        "field_goals_made": fgm,
+        "field_goals_attempted": fga,
+        "field_goal_pct": ratio(fgm, fga),
+        "field_goals_made_pg": per_game(fgm),
+        "field_goals_attempted_pg": per_game(fga),
+        "points": points,
+        "points_pg": points_pg,
+        "rebounds": rebounds,
+        "rebounds_pg": rebounds_pg,
+        "offensive_rebounds": offensive_rebounds,
+        "defensive_rebounds": rebounds - offensive_rebounds,
+        "assists": assists,
+        "assists_pg": assists_pg,
+        "turnovers": turnovers,
+        "turnovers_pg": per_game(turnovers),
+        "steals": steals,
+        "steals_pg": per_game(steals),
+        "blocks": blocks,
+        "blocks_pg": per_game(blocks),
+        "personal_fouls": fouls,
+        "personal_fouls_pg": per_game(fouls),
+        "three_pointers_made": fg3m,
+        "three_pointers_attempted": fg3a,
+        "three_point_pct": ratio(fg3m, fg3a),
+        "three_pointers_made_pg": per_game(fg3m),
+        "three_pointers_attempted_pg": per_game(fg3a),
+        "two_pointers_made": fg2m,
+        "two_pointers_attempted": fg2a,
+        "two_point_pct": ratio(fg2m, fg2a),
+        "two_pointers_made_pg": per_game(fg2m),
+        "two_pointers_attempted_pg": per_game(fg2a),
+        "free_throws_made": ftm,
+        "free_throws_attempted": fta,
+        "free_throw_pct": ratio(ftm, fta),
+        "free_throws_made_pg": per_game(ftm),
+        "free_throws_attempted_pg": per_game(fta),
+        "plus_minus": plus_minus,
+        "plus_minus_pg": per_game(plus_minus),
+        "double_doubles": np.round(
+            games
+            * np.clip((points_pg - 8) / 20, 0, 1)
+            * np.clip((np.maximum(rebounds_pg, assists_pg) - 5) / 8, 0, 1)
+        ).astype(np.int64),
+        "triple_doubles": np.round(
+            games
+            * np.clip((rebounds_pg - 7) / 20, 0, 1)
+            * np.clip((assists_pg - 7) / 20, 0, 1)
+        ).astype(np.int64),
+        "pts_off_tov": scoring_context(0.15),
+        "pts_2nd_chance": scoring_context(0.12),
+        "pts_fb": scoring_context(0.12),
+        "pts_paint": scoring_context(0.45),
+        "opp_pts_off_tov": scoring_context(0.15),
+        "opp_pts_2nd_chance": scoring_context(0.12),
+        "opp_pts_fb": scoring_context(0.12),
+        "opp_pts_paint": scoring_context(0.45),
+        "pct_fgm": share(per_game(fgm), 41),
+        "pct_fga": share(per_game(fga), 88),
+        "pct_fg3m": share(per_game(fg3m), 12),
+        "pct_fg3a": share(per_game(fg3a), 34),
+        "pct_ftm": share(per_game(ftm), 17),
+        "pct_fta": share(per_game(fta), 22),
+        "pct_oreb": share(per_game(offensive_rebounds), 10),
+        "pct_dreb": share(per_game(rebounds - offensive_rebounds), 34),
+        "pct_reb": share(rebounds_pg, 44),
+        "pct_ast": share(assists_pg, 25),
+        "pct_tov": share(per_game(turnovers), 14),
+        "pct_stl": share(per_game(steals), 7.5),
+        "pct_blk": share(per_game(blocks), 5),
+        "pct_blka": share(per_game(blocks), 5),
+        "pct_pf": share(per_game(fouls), 20),
+        "pct_pfd": share(per_game(fouls), 20),
+        "pct_pts": share(points_pg, 112),
+    }
+
+
+class _Ids:
+    """running ids, so chunks never collide"""
+
+    def __init__(self) -> None:
+        self.next: defaultdict[type[Base], int] = defaultdict(lambda: 1)
+
+    def take(self, model: type[Base], n: int) -> range:
+        start = self.next[model]
+        self.next[model] += n
+        return range(start, start + n)
+
+
+def generate_players(
+    fake: Faker,
+    rng: np.random.Generator,
+    ids: _Ids,
+    n_players: int,
+    n_teams: int,
+    first_season: int,
+    last_season: int,
+) -> tuple[LeagueChunk, np.ndarray]:
+    """one chunk of players with their careers, plus each season row's award score"""
+    player_ids = ids.take(Player, n_players)
+    skill = rng.normal(0, 1, n_players)
+    draft_years = rng.integers(first_season - 1, last_season - 1, n_players)
+    birth_years = draft_years - rng.integers(19, 23, n_players)
+    # better players get drafted higher and stay longer
+    drafted = rng.random(n_players) < np.clip(0.75 + 0.1 * skill, 0.2, 0.98)
+    draft_numbers = np.clip(
+        np.round(30 - 12 * skill + rng.normal(0, 8, n_players)), 1, 60
+    ).astype(int)
+    career_lengths = np.clip(
+        np.round(6 + 3 * skill + rng.normal(0, 3, n_players)), 1, 20
+    ).astype(int)
+    positions = [POSITIONS[i] for i in rng.integers(len(POSITIONS), size=n_players)]
+
+    # python-level career walk, the stats are vectorized afterwards
+    seasons: defaultdict[str, list[Any]] = defaultdict(list)
+    contracts: defaultdict[str, list[Any]] = defaultdict(list)
+    salaries: defaultdict[str, list[Any]] = defaultdict(list)
+    buyouts: defaultdict[str, list[Any]] = defaultdict(list)
+    season_positions: list[str] = []
+    for i, player_id in enumerate(player_ids):
+        team_id = int(rng.integers(1, n_teams + 1))
+        contract_end = 0
+        salary = 0
+        start = int(draft_years[i]) + 1
+        for season in range(
+            max(start, first_season), min(start + career_lengths[i], last_season + 1)
+        ):
+            if season >= contract_end:
+                if contract_end and rng.random() < 0.4:
+                    team_id = int(rng.integers(1, n_teams + 1))
+                duration = int(rng.integers(1, 6)) if contract_end else 4
+                share = float(
+                    np.clip(0.08 + 0.07 * skill[i] + rng.normal(0, 0.04), 0.015, 0.35)
+                )
+                salary = round(cap_for(season) * share)
+                contracts["player_id"].append(player_id)
+                contracts["team_id"].append(team_id)
+                contracts["value"].append(salary * duration)
+                contracts["start_year"].append(season)
+                contracts["duration"].append(duration)
+                contracts["voided"].append(False)
+                contract_end = season + duration
+
+            seasons["player_id"].append(player_id)
+            seasons["team_id"].append(team_id)
+            seasons["season_id"].append(season)
+            seasons["skill"].append(skill[i])
+            seasons["age"].append(season - int(birth_years[i]))
+            season_positions.append(positions[i])
+
+            earnings = buyouts if rng.random() < 0.03 else salaries
+            earnings["player_id"].append(player_id)
+            earnings["team_id"].append(team_id)
+            earnings["season_id"].append(season)
+            if earnings is buyouts:
+                earnings["salary"].append(salary // 2)
+                contract_end = season + 1
+            else:
+                earnings["salary"].append(salary)
+                earnings["cap_hit_percent"].append(
+                    round(salary / cap_for(season) * 100, 2)
+                )
+                for column in (
+                    "apron_salary",
+                    "luxury_tax",
+                    "cash_total",
+                    "cash_garunteed",
+                ):
+                    earnings[column].append(salary)
+
+    stats = season_stats(
+        rng,
+        np.array(seasons.pop("skill"), dtype=float),
+        np.array(seasons["age"], dtype=float),
+        season_positions,
+    )
+    del seasons["age"]
+    first_names = [fake.first_name() for _ in player_ids]
+    last_names = [fake.last_name() for _ in player_ids]
+    birth_dates = [
+        fake.date_between_dates(
+            fake.date_object().replace(year=int(year), month=1, day=1),
+            fake.date_object().replace(year=int(year), month=12, day=28),
+        ).isoformat()
+        for year in birth_years
+    ]
+
+    chunk: LeagueChunk = {
+        Player: to_table(
+            Player,
+            {
+                "id": player_ids,
+                "name": [f"{f} {l}" for f, l in zip(first_names, last_names)],
+                "first_name": first_names,
+                "last_name": last_names,
+                "height_inches": np.clip(
+                    np.round(rng.normal(78, 3.3, n_players)), 68, 91
+                ),
+                "weight_pounds": np.clip(
+                    np.round(rng.normal(217, 24, n_players)), 160, 320
+                ),
+                "birth_date": birth_dates,
+                "country": [
+                    "USA" if r < 0.75 else COUNTRIES[int(r * 1000) % len(COUNTRIES)]
+                    for r in rng.random(n_players)
+                ],
+                "school": [fake.city() + " University" for _ in player_ids],
+                "position": positions,
+                "draft_year": draft_years,
+                "draft_round": np.where(drafted, 1 + (draft_numbers > 30), None),
+                "draft_number": np.where(drafted, draft_numbers, None),
+                "roster_status": (draft_years + career_lengths >= last_season).astype(
+                    int
+                ),
+                "is_gleague_player": np.zeros(n_players, dtype=int),
+            },
+        ),
+        Contract: to_table(
+            Contract,
+            {"id": ids.take(Contract, len(contracts["player_id"])), **contracts},
+        ),
+        TeamPlayerSalary: to_table(
+            TeamPlayerSalary,
+            {"id": ids.take(TeamPlayerSalary, len(salaries["player_id"])), **salaries},
+        ),
+        PlayerSeason: to_table(
+            PlayerSeason,
+            {
+                "id": ids.take(PlayerSeason, len(seasons["player_id"])),
+                **seasons,
+                **stats,
+            },
+        ),
+    }
+    if buyouts:
+        chunk[TeamPlayerBuyout] = to_table(
+            TeamPlayerBuyout,
+            {"id": ids.take(TeamPlayerBuyout, len(buyouts["player_id"])), **buyouts},
+        )
+    return chunk, stats
+
+
+class _AwardRaces:
+    """the best player-seasons so far, per race and season, across chunks"""
+
+    def __init__(self) -> None:
+        self.leaders: defaultdict[tuple[str, int], list[tuple[float, int]]]
+        self.leaders = defaultdict(list)
+
+    def add(self, race: str, scores: np.ndarray, seasons: pa.Table) -> None:
+        slots = sum(AWARD_RACES[race].values())
+        for score, player_id, season in zip(
+            scores.tolist(),
+            seasons["player_id"].to_pylist(),
+            seasons["season_id"].to_pylist(),
+        ):
+            heap = self.leaders[race, season]
+            if len(heap) < slots:
+                heapq.heappush(heap, (score, player_id))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, player_id))
+
+    def rows(self) -> dict[str, list[Any]]:
+        columns: defaultdict[str, list[Any]] = defaultdict(list)
+        for (race, season), heap in sorted(self.leaders.items()):
+            ranked = [player_id for _, player_id in sorted(heap, reverse=True)]
+            for name, count in AWARD_RACES[race].items():
+                for player_id in ranked[:count]:
+                    columns["name"].append(name)
+                    columns["season_id"].append(season)
+                    columns["player_id"].append(player_id)
+                ranked = ranked[count:]
+        return columns
+
+
+def generate_league(
+    n_players: int,
+    seed: int = 0,
+    chunk_size: int = 20_000,
+    n_teams: int = 30,
+    first_season: int = FIRST_SEASON,
+    last_season: int = LAST_SEASON,
+) -> Iterator[LeagueChunk]:
+    """
+    arrow tables in insert order: seasons and teams first, then players (with
+    contracts, salaries and seasons) `chunk_size` at a time, then awards
+    """
+    fake = Faker()
+    fake.seed_instance(seed)
+    ids = _Ids()
+    yield {
+        Season: generate_seasons(first_season, last_season),
+        Team: generate_teams(fake, n_teams),
+    }
+
+    races = _AwardRaces()
+    for chunk_index, start in enumerate(range(0, n_players, chunk_size)):
+        # each chunk gets its own stream, so chunks don't depend on each other
+        rng = np.random.default_rng([seed, chunk_index])
+        chunk, stats = generate_players(
+            fake,
+            rng,
+            ids,
+            min(chunk_size, n_players - start),
+            n_teams,
+            first_season,
+            last_season,
+        )
+        seasons = chunk[PlayerSeason]
+        races.add(
+            "offense",
+            stats["points_pg"] + 0.7 * stats["rebounds_pg"] + stats["assists_pg"],
+            seasons,
+        )
+        races.add(
+            "defense",
+            20 * stats["defensive_rebound_pct"]
+            + stats["steals_pg"]
+            + 1.5 * stats["blocks_pg"],
+            seasons,
+        )
+        yield chunk
+
+    awards = races.rows()
+    if awards:
+        yield {
+            Award: to_table(
+                Award, {"id": ids.take(Award, len(awards["name"])), **awards}
+            )
+        }
+
+
+def collect_league(chunks: Iterable[LeagueChunk]) -> LeagueChunk:
+    """all chunks as one table per model, for scales that fit in memory"""
+    tables: defaultdict[type[Base], list[pa.Table]] = defaultdict(list)
+    for chunk in chunks:
+        for model, table in chunk.items():
+            tables[model].append(table)
+    return {model: pa.concat_tables(parts) for model, parts in tables.items()}
+
+
+# ---- writers ----
+def write_league_parquet(
+    chunks: Iterable[LeagueChunk], directory: str | Path
+) -> list[Path]:
+    """
+    <directory>/<Model>.parquet, one row group per chunk. Same layout as
+    export_seed_data, so load_seed_data reads it back.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    writers: dict[type[Base], pq.ParquetWriter] = {}
+    try:
+        for chunk in chunks:
+            for model, table in chunk.items():
+                if model not in writers:
+                    writers[model] = pq.ParquetWriter(
+                        directory / f"{model.__name__}.parquet",
+                        table.schema,
+                        compression="zstd",
+                    )
+                writers[model].write_table(table)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return [directory / f"{model.__name__}.parquet" for model in writers]
+
+
+def copy_table(session: Session, model: type[Base], table: pa.Table) -> None:
+    """COPY an arrow table into the model's table, nulls as empty fields"""
+    columns = ", ".join(table.column_names)
+    options = pa_csv.WriteOptions(include_header=False, quoting_style="needed")
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(table, sink, options)
+
+    cursor = session.connection().connection.driver_connection.cursor()
+    with cursor.copy(
+        f"COPY {model.__tablename__} ({columns}) FROM STDIN WITH (FORMAT csv)"
+    ) as copy:
+        copy.write(sink.getvalue().to_pybytes())
+
+
+def reset_id_sequences(session: Session, models: Iterable[type[Base]]) -> None:
+    """move the id sequences past the copied ids, so later inserts don't collide"""
+    for model in models:
+        table = model.__tablename__
+        id_column = model.__table__.c.id
+        sequence = (
+            f"'{id_column.default.name}'"
+            if isinstance(id_column.default, SqlSequence)
+            else f"pg_get_serial_sequence('{table}', 'id')"
+        )
+        session.execute(
+            text(
+                f"SELECT setval({sequence}, (SELECT coalesce(max(id), 0) + 1 FROM {table}), false)"
+            )
+        )
+
+
+def copy_league(
+    session: Session,
+    chunks: Iterable[LeagueChunk],
+    models: Iterable[type[Base]] | None = None,
+) -> dict[str, int]:
+    """
+    COPY every chunk into postgres (only `models`, if given), returns rows per
+    table. The ids are fixed (teams 1-30, players 1..n), so every table has to
+    be empty. Doesn't commit. setval isn't rolled back with the transaction,
+    the copied models are listed in session.info[COPIED_MODELS] for whoever
+    has to put the sequences back
+    """
+    keep = None if models is None else set(models)
+    counts: defaultdict[str, int] = defaultdict(int)
+    copied: set[type[Base]] = set()
+    for chunk in chunks:
+        for model, table in chunk.items():
+            if keep is not None and model not in keep:
+                continue
+            if model not in copied and session.scalar(
+                select(exists().select_from(model.__table__))
+            ):
+                raise Exception(
+                    f"{model.__tablename__} already has rows, the synthetic ids "
+                    "would collide with them"
+                )
+            copy_table(session, model, table)
+            counts[model.__tablename__] += table.num_rows
+            copied.add(model)
+    reset_id_sequences(session, copied)
+    session.info.setdefault(COPIED_MODELS, set()).update(copied)
+    return dict(counts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=20_000)
+    parser.add_argument("--parquet", type=Path, default=None)
+    parser.add_argument("--copy", action="store_true")
+    args = parser.parse_args()
+
+    chunks = generate_league(args.players, args.seed, args.chunk_size)
+    if args.parquet is not None:
+        for path in write_league_parquet(chunks, args.parquet):
+            print(path)
+    elif args.copy:
+        with get_session() as session:
+            print(copy_league(session, chunks))
+            session.commit()
+    else:
+        parser.error("pass --parquet DIR or --copy")
@@ -1,18 +1,73 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from enum import Enum
-from typing import Any
-
+from functools import cache
+from pathlib import Path
+from typing import Any, Literal
+
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from sqlalchemy import Column, ColumnElement
+from sqlalchemy import Enum as SqlEnum
+from sqlalchemy import Numeric, select, union
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import DeclarativeMeta, Session
 
 from app.base import Base
 from app.data.connection import get_session
-from app.data.league import Season
-from app.data.league.player import Player
+from app.data.league import (
+    Contract,
+    Player,
+    PlayerSeason,
+    Season,
+    Team,
+    TeamPlayerSalary,
+)
+
+
+def serialize_value(value: object) -> object:
+    """
+    Convert non-JSON-safe Python values into a stable Python representation
+    (still valid as a Python literal).
+    """
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, datetime):
+        return {
+            "__type__": "datetime",
+            "year": value.year,
+            "month": value.month,
+            "day": value.day,
+            "hour": value.hour,
+            "minute": value.minute,
+            "second": value.second,
+            "microsecond": value.microsecond,
+        }
+
+    if isinstance(value, date):
+        return {
+            "__type__": "date",
+            "year": value.year,
+            "month": value.month,
+            "day": value.day,
+        }
+
+    if isinstance(value, time):
+        return {
+            "__type__": "time",
+            "hour": value.hour,
+            "minute": value.minute,
+            "second": value.second,
+            "microsecond": value.microsecond,
+        }
+
+    return value
 
 
 def sqlalchemy_to_dicts(objects: Iterable[Base]) -> list[dict[str, Any]]:
@@ -20,46 +75,6 @@ def sqlalchemy_to_dicts(objects: Iterable[Base]) -> list[dict[str, Any]]:
     Convert an iterable of SQLAlchemy model instances into a list of dictionaries
     that can be safely used as seed data across multiple sessions.
     """
-
-    def serialize_value(value: object) -> object:
-        """
-        Convert non-JSON-safe Python values into a stable Python representation
-        (still valid as a Python literal).
-        """
-        if isinstance(value, Enum):
-            return value.value
-
-        if isinstance(value, datetime):
-            return {
-                "__type__": "datetime",
-                "year": value.year,
-                "month": value.month,
-                "day": value.day,
-                "hour": value.hour,
-                "minute": value.minute,
-                "second": value.second,
-                "microsecond": value.microsecond,
-            }
-
-        if isinstance(value, date):
-            return {
-                "__type__": "date",
-                "year": value.year,
-                "month": value.month,
-                "day": value.day,
-            }
-
-        if isinstance(value, time):
-            return {
-                "__type__": "time",
-                "hour": value.hour,
-                "minute": value.minute,
-                "second": value.second,
-                "microsecond": value.microsecond,
-            }
-
-        return value
-
     rows: list[dict[str, Any]] = []
 
     for obj in objects:
@@ -80,6 +95,131 @@ def sqlalchemy_to_dicts(objects: Iterable[Base]) -> list[dict[str, Any]]:
     return rows
 
 
+@cache
+def mapper_columns(model: type[Base]) -> tuple[tuple[str, ...], tuple[Column, ...]]:
+    """(attribute keys, columns) of a model, looked up once per mapper"""
+    columns = tuple(model.__mapper__.columns)
+    return tuple(column.key for column in columns), columns
+
+
+def rows_to_dicts(
+    model: type[Base], rows: Iterable[Sequence[Any]]
+) -> list[dict[str, Any]]:
+    """sqlalchemy_to_dicts for plain row tuples from select_rows, no ORM objects"""
+    keys, _ = mapper_columns(model)
+    name = model.__name__
+    return [
+        {"model": name, "values": dict(zip(keys, map(serialize_value, row)))}
+        for row in rows
+    ]
+
+
+def select_rows(
+    session: Session, model: type[Base], *where: ColumnElement[bool]
+) -> list[dict[str, Any]]:
+    """every column of the matching rows as seed dicts, in primary key order"""
+    _, columns = mapper_columns(model)
+    stmt = select(*columns).where(*where).order_by(*model.__table__.primary_key)
+    return rows_to_dicts(model, session.execute(stmt))
+
+
+SeedFormat = Literal["parquet", "arrow"]
+
+ARROW_TYPES: dict[type, pa.DataType] = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    date: pa.date32(),
+    datetime: pa.timestamp("us"),
+    time: pa.time64("us"),
+}
+
+
+def deserialize_value(value: object) -> object:
+    """undo sqlalchemy_to_dicts' {"__type__": ...} encoding"""
+    if not isinstance(value, dict) or "__type__" not in value:
+        return value
+    kind, fields = value["__type__"], {
+        k: v for k, v in value.items() if k != "__type__"
+    }
+    return {"datetime": datetime, "date": date, "time": time}[kind](**fields)
+
+
+def arrow_schema(model: type[Base]) -> pa.Schema:
+    """the model's columns as arrow types, so dates and nulls round-trip natively"""
+    fields = []
+    for column in model.__mapper__.columns:
+        if isinstance(column.type, SqlEnum):
+            arrow_type = pa.string()  # stored by name, like the database does
+        elif isinstance(column.type, Numeric) and column.type.asdecimal:
+            arrow_type = pa.decimal128(
+                column.type.precision or 38, column.type.scale or 10
+            )
+        else:
+            arrow_type = ARROW_TYPES[column.type.python_type]
+        fields.append(pa.field(column.key, arrow_type))
+    return pa.schema(fields)
+
+
+def seed_data_to_tables(seed_data: Iterable[dict[str, Any]]) -> dict[str, pa.Table]:
+    """{"model", "values"} rows -> one arrow table per model"""
+    grouped: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in seed_data:
+        grouped[row["model"]].append(
+            {
+                key: value.name if isinstance(value, Enum) else deserialize_value(value)
+                for key, value in row["values"].items()
+            }
+        )
+
+    return {
+        model_name: pa.Table.from_pylist(
+            rows, schema=arrow_schema(Base.registry._class_registry[model_name])  # type: ignore[arg-type]
+        )
+        for model_name, rows in grouped.items()
+    }
+
+
+def export_seed_data(
+    seed_data: Iterable[dict[str, Any]],
+    directory: str | Path,
+    format: SeedFormat = "parquet",
+) -> list[Path]:
+    """
+    write seed data as <directory>/<Model>.parquet (or .arrow, uncompressed IPC
+    for memory-mapped reads). Replaces the old python-literal seed files.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    for model_name, table in seed_data_to_tables(seed_data).items():
+        path = directory / f"{model_name}.{format}"
+        if format == "parquet":
+            pq.write_table(table, path, compression="zstd")
+        else:
+            feather.write_feather(table, path, compression="uncompressed")
+        paths.append(path)
+    return paths
+
+
+def load_seed_data(directory: str | Path) -> list[dict[str, Any]]:
+    """read export_seed_data's files back as {"model", "values"} rows"""
+    rows: list[dict[str, Any]] = []
+    for path in sorted(Path(directory).iterdir()):
+        if path.suffix == ".parquet":
+            table = pq.read_table(path)
+        elif path.suffix == ".arrow":
+            table = feather.read_table(path, memory_map=True)
+        else:
+            continue
+        rows.extend(
+            {"model": path.stem, "values": values} for values in table.to_pylist()
+        )
+    return rows
+
+
 def export_rows_as_dict_seed_data(
     session: Session,
     model: type[DeclarativeMeta],
@@ -114,35 +254,49 @@ def get_player_dicts(
     include_salaries: bool = True,
     include_seasons: bool = True,
 ) -> list[dict[str, Any]]:
-    teams: set[int] = set()
+    """
+    seed dicts for the players and their related rows, one IN (...) query per
+    model no matter how many players. Rows come out grouped by model: teams,
+    players, contracts, salaries, seasons.
+    """
     res: list[dict[str, Any]] = []
 
-    for player_id in player_ids:
-        player = session.query(Player).where(Player.id == player_id).one()
-
-        if include_teams:
-            for season in player.seasons:
-                if season.team.id not in teams:
-                    res.extend(sqlalchemy_to_dicts([season.team]))
-                    teams.add(season.team.id)
-
-            for contract in player.contracts:
-                if contract.team.id not in teams:
-                    res.extend(sqlalchemy_to_dicts([contract.team]))
-                    teams.add(contract.team.id)
+    if include_teams:
+        # teams the players played for or signed with
+        team_ids = union(
+            select(PlayerSeason.team_id).where(PlayerSeason.player_id.in_(player_ids)),
+            select(Contract.team_id).where(Contract.player_id.in_(player_ids)),
+        ).scalar_subquery()
+        res.extend(select_rows(session, Team, Team.id.in_(team_ids)))
+
+    players = select_rows(session, Player, Player.id.in_(player_ids))
+    if missing := set(player_ids) - {row["values"]["id"] for row in players}:
+        raise Exception(f"No players with ids {sorted(missing)}")
+    res.extend(players)
+
+    if include_contracts:
+        res.extend(select_rows(session, Contract, Contract.player_id.in_(player_ids)))
+
+    if include_salaries:
+        res.extend(
+            select_rows(
+                session, TeamPlayerSalary, TeamPlayerSalary.player_id.in_(player_ids)
+            )
+        )
 
-        res.extend(sqlalchemy_to_dicts([player]))
+    if include_seasons:
+        res.extend(
+            select_rows(session, PlayerSeason, PlayerSeason.player_id.in_(player_ids))
+        )
 
-        if include_contracts:
-            res.extend(sqlalchemy_to_dicts(player.contracts))
+    return res
 
-        if include_salaries:
-            res.extend(sqlalchemy_to_dicts(player.salaries))
 
-        if include_seasons:
-            res.extend(sqlalchemy_to_dicts(player.seasons))
+def save_as_parquet(player_group: PlayerGroup) -> None:
+    with get_session() as session:
+        seed_data = get_player_dicts(session, player_group.player_ids)
 
-    return res
+    export_seed_data(seed_data, f"tests/data/parquet/{player_group.lower}")
 
 
 def save_as_python(player_group: PlayerGroup) -> None:
@@ -156,12 +310,8 @@ def save_as_python(player_group: PlayerGroup) -> None:
 
 def save_seasons() -> None:
     with get_session() as session:
-        code = export_rows_as_dict_seed_data(session, Season)  # ty:ignore[invalid-argument-type]
-
-    with open("tests/data/seasons.py", "w") as f:
-        f.write("from __future__ import annotations\n\n")
-        f.write(code)
-        f.write("\n")
+        seasons = session.query(Season).all()
+        export_seed_data(sqlalchemy_to_dicts(seasons), "tests/data/parquet/seasons")
 
 
 @dataclass
@@ -184,4 +334,4 @@ if __name__ == "__main__":
         PlayerGroup([1641708, 1641709, 78326, 202691, 202684], "Thompson"),
     ]
     for datum in data:
-        save_as_python(datum)
+        save_as_parquet(datum)
@@ -0,0 +1,19 @@
+from app.data.users.dividend import DividendPayment
+from app.data.users.holding import SHARES_PER_PLAYER, Holding
+from app.data.users.matching_engine import MatchingEngine
+from app.data.users.order_book import Fill, Order, OrderBook, Side
+from app.data.users.trade import Trade
+from app.data.users.user import User
+
+__all__ = [
+    "DividendPayment",
+    "Fill",
+    "Holding",
+    "MatchingEngine",
+    "Order",
+    "OrderBook",
+    "SHARES_PER_PLAYER",
+    "Side",
+    "Trade",
+    "User",
+]
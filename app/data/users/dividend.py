@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from sqlalchemy import Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.base import Base
+
+
+class DividendPayment(Base):
+    """one row per (game, user, player), the ledger that makes settling idempotent"""
+
+    __tablename__ = "dividend_payments"
+
+    # ---- identifiers ----
+    id: Mapped[int] = mapped_column(primary_key=True)
+    game_id: Mapped[int] = mapped_column(ForeignKey("games.id"), nullable=False)
+    season_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("seasons.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    player_id: Mapped[int] = mapped_column(ForeignKey("players.id"), index=True)
+
+    # ---- payment ----
+    shares: Mapped[int] = mapped_column(Integer)
+    amount: Mapped[float] = mapped_column(Float)
+
+    __table_args__ = (
+        Index(
+            "ix_dividend_payment_unique",
+            "game_id",
+            "user_id",
+            "player_id",
+            unique=True,
+        ),
+    )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.base import Base
+
+if TYPE_CHECKING:
+    from app.data.league import Player
+    from app.data.users.user import User
+
+# every player is split into the same number of shares, so 100 shares = 1%
+SHARES_PER_PLAYER = 10_000
+
+
+class Holding(Base):
+    __tablename__ = "holdings"
+
+    # ---- identifiers ----
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    player_id: Mapped[int] = mapped_column(ForeignKey("players.id"), index=True)
+
+    # ---- position ----
+    shares: Mapped[int] = mapped_column(Integer, default=0)
+
+    # ---- relationships ----
+    user: Mapped[User] = relationship("User", back_populates="holdings")
+    player: Mapped[Player] = relationship("Player")
+
+    __table_args__ = (Index("ix_holding_unique", "user_id", "player_id", unique=True),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<Holding(user_id={self.user_id}, player_id={self.player_id}, "
+            f"shares={self.shares})>"
+        )
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import defaultdict
+from itertools import count
+from pathlib import Path
+from typing import IO
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.data.users.holding import Holding
+from app.data.users.order_book import Fill, Order, OrderBook, Side
+from app.data.users.trade import Trade
+from app.data.users.user import User
+
+# commands logged since the last checkpoint before flush_fills compacts the log
+CHECKPOINT_RECORDS = 10_000
+
+
+def to_cents(dollars: float) -> int:
+    return round(dollars * 100)
+
+
+def encode(record: dict) -> str:
+    """one log line"""
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+class MatchingEngine:
+    """
+    in-memory order books for every player, with cash and share balances checked
+    before an order is accepted. Accepted commands go to a write-ahead log first,
+    fills queue up in `pending_fills` until they're flushed to postgres in a batch
+    (see app.crud.create.trades.flush_fills). Once they are, `checkpoint` rewrites
+    the log as just the orders still resting.
+    """
+
+    def __init__(
+        self,
+        cash: dict[int, int],
+        shares: dict[tuple[int, int], int],
+        wal_path: str | Path | None = None,
+        fsync: bool = False,
+        first_sequence: int = 1,
+        first_order_id: int = 1,
+        persisted_sequence: int = 0,
+    ) -> None:
+        # settled balances plus unflushed fills, cash in cents
+        self.cash: defaultdict[int, int] = defaultdict(int, cash)
+        self.shares: defaultdict[tuple[int, int], int] = defaultdict(int, shares)
+        # held back by resting orders
+        self.reserved_cash: defaultdict[int, int] = defaultdict(int)
+        self.reserved_shares: defaultdict[tuple[int, int], int] = defaultdict(int)
+
+        self.books: dict[int, OrderBook] = {}
+        self.orders: dict[int, Order] = {}
+        self.pending_fills: list[Fill] = []
+
+        self._sequence = count(first_sequence)
+        self._order_ids = count(first_order_id)
+        # fills up to here are already in postgres (only matters when replaying)
+        self._persisted_sequence = persisted_sequence
+
+        self._fsync = fsync
+        self._wal: IO[str] | None = None
+        self._wal_path: Path | None = None
+        # commands in the log, recover replays all of them
+        self.wal_records = 0
+        if wal_path is not None:
+            self._open_wal(Path(wal_path), first_sequence, first_order_id)
+
+    # ---- construction ----
+    @classmethod
+    def from_session(
+        cls, session: Session, wal_path: str | Path | None = None, fsync: bool = False
+    ) -> MatchingEngine:
+        cash = {
+            user_id: to_cents(dollars)
+            for user_id, dollars in session.execute(select(User.id, User.cash))
+        }
+        shares = {
+            (user_id, player_id): n
+            for user_id, player_id, n in session.execute(
+                select(Holding.user_id, Holding.player_id, Holding.shares)
+            )
+        }
+        last_sequence = session.execute(
+            select(func.coalesce(func.max(Trade.sequence), 0))
+        ).scalar_one()
+        return cls(
+            cash,
+            shares,
+            wal_path=wal_path,
+            fsync=fsync,
+            first_sequence=last_sequence + 1,
+            persisted_sequence=last_sequence,
+        )
+
+    @classmethod
+    def recover(
+        cls, session: Session, wal_path: str | Path, fsync: bool = False
+    ) -> MatchingEngine:
+        """
+        rebuild the books after a restart by replaying the log against the
+        balances in postgres. Fills that were already flushed only release their
+        reservations, the rest are queued up again.
+        """
+        engine = cls.from_session(session)
+        with open(wal_path) as wal:
+            header = json.loads(next(wal))
+            engine._sequence = count(header["sequence"])
+            last_order_id = header["order_id"] - 1
+            for line in wal:
+                record = json.loads(line)
+                if record["op"] == "submit":
+                    order = Order(
+                        record["id"],
+                        record["user_id"],
+                        record["player_id"],
+                        Side(record["side"]),
+                        record["price"],
+                        record["shares"],
+                    )
+                    engine._accept(order)
+                    last_order_id = max(last_order_id, order.id)
+                else:
+                    engine._cancel(engine.orders[record["id"]])
+                engine.wal_records += 1
+
+        engine._order_ids = count(last_order_id + 1)
+        engine._fsync = fsync
+        engine._wal_path = Path(wal_path)
+        engine._wal = open(wal_path, "a")
+        return engine
+
+    # ---- commands ----
+    def submit(
+        self, user_id: int, player_id: int, side: Side, price: int, shares: int
+    ) -> tuple[Order, list[Fill]]:
+        """limit order at `price` cents per share, returns the order and its fills"""
+        if price <= 0 or shares <= 0:
+            raise Exception(f"Invalid order: {shares} shares at {price} cents")
+        if side is Side.Buy:
+            if self.cash[user_id] - self.reserved_cash[user_id] < price * shares:
+                raise Exception(f"User {user_id} doesn't have enough cash")
+        elif (
+            self.shares[user_id, player_id] - self.reserved_shares[user_id, player_id]
+            < shares
+        ):
+            raise Exception(f"User {user_id} doesn't have {shares} shares to sell")
+
+        order = Order(next(self._order_ids), user_id, player_id, side, price, shares)
+        self._log(self._submit_record(order))
+        self.wal_records += 1
+        return order, self._accept(order)
+
+    def cancel(self, order_id: int) -> Order:
+        order = self.orders.get(order_id)
+        if order is None:
+            raise Exception(f"Order {order_id} isn't resting on any book")
+        self._log({"op": "cancel", "id": order_id})
+        self.wal_records += 1
+        self._cancel(order)
+        return order
+
+    def book(self, player_id: int) -> OrderBook:
+        book = self.books.get(player_id)
+        if book is None:
+            book = self.books[player_id] = OrderBook(player_id, self._sequence)
+        return book
+
+    def acknowledge(self, n_fills: int) -> None:
+        """drop the first `n_fills` pending fills once they're in postgres"""
+        if n_fills:
+            self._persisted_sequence = self.pending_fills[n_fills - 1].sequence
+            del self.pending_fills[:n_fills]
+
+    def sync_wal(self) -> None:
+        """group commit, call before fills are flushed or orders are acknowledged"""
+        if self._wal is not None:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+
+    def checkpoint(self) -> None:
+        """
+        compact the log to a header and the orders still resting, oldest first
+        so replaying them keeps time priority. Everything matched has to be in
+        postgres already, recover takes balances from there
+        """
+        if self._wal is None or self._wal_path is None:
+            return
+        if self.pending_fills:
+            raise Exception(
+                f"{len(self.pending_fills)} fills aren't flushed, flush_fills first"
+            )
+        order_id = next(self._order_ids)
+        self._order_ids = count(order_id)
+
+        records = [
+            {"sequence": self._persisted_sequence + 1, "order_id": order_id},
+            *(
+                self._submit_record(order)
+                for order in sorted(self.orders.values(), key=lambda order: order.id)
+            ),
+        ]
+        compacted = self._wal_path.with_name(f"{self._wal_path.name}.checkpoint")
+        with open(compacted, "w") as wal:
+            wal.writelines(encode(record) for record in records)
+            wal.flush()
+            os.fsync(wal.fileno())
+        # the old log stays whole until the new one replaces it in one rename
+        self._wal.close()
+        os.replace(compacted, self._wal_path)
+        self._wal = open(self._wal_path, "a")
+        self.wal_records = len(self.orders)
+
+    def close(self) -> None:
+        if self._wal is not None:
+            self.sync_wal()
+            self._wal.close()
+            self._wal = None
+
+    # ---- internals ----
+    def _accept(self, order: Order) -> list[Fill]:
+        if order.side is Side.Buy:
+            self.reserved_cash[order.user_id] += order.price * order.shares
+        else:
+            self.reserved_shares[order.user_id, order.player_id] += order.shares
+
+        fills = self.book(order.player_id).submit(order)
+        for fill in fills:
+            self._settle(fill, order)
+        if order.shares:
+            self.orders[order.id] = order
+        return fills
+
+    def _settle(self, fill: Fill, incoming: Order) -> None:
+        buy, sell = (
+            (incoming, self.orders[fill.sell_order_id])
+            if incoming.side is Side.Buy
+            else (self.orders[fill.buy_order_id], incoming)
+        )
+        buyer, seller, player = fill.buyer_id, fill.seller_id, fill.player_id
+        # the buyer reserved their limit price, a better fill gives the rest back
+        self.reserved_cash[buyer] -= buy.price * fill.shares
+        self.reserved_shares[seller, player] -= fill.shares
+
+        if fill.sequence > self._persisted_sequence:
+            cost = fill.price * fill.shares
+            self.cash[buyer] -= cost
+            self.cash[seller] += cost
+            self.shares[buyer, player] += fill.shares
+            self.shares[seller, player] -= fill.shares
+            self.pending_fills.append(fill)
+
+        resting = sell if incoming is buy else buy
+        if not resting.shares:
+            del self.orders[resting.id]
+
+    def _cancel(self, order: Order) -> None:
+        self.books[order.player_id].cancel(order)
+        del self.orders[order.id]
+        if order.side is Side.Buy:
+            self.reserved_cash[order.user_id] -= order.price * order.shares
+        else:
+            self.reserved_shares[order.user_id, order.player_id] -= order.shares
+
+    def _open_wal(self, path: Path, first_sequence: int, first_order_id: int) -> None:
+        # a fresh engine starts a new log, one with orders in it is recover's
+        if path.exists() and path.stat().st_size:
+            raise Exception(f"{path} already has orders, use MatchingEngine.recover")
+        self._wal_path = path
+        self._wal = open(path, "w")
+        self._log({"sequence": first_sequence, "order_id": first_order_id})
+
+    @staticmethod
+    def _submit_record(order: Order) -> dict:
+        return {
+            "op": "submit",
+            "id": order.id,
+            "user_id": order.user_id,
+            "player_id": order.player_id,
+            "side": order.side.value,
+            "price": order.price,
+            "shares": order.shares,
+        }
+
+    def _log(self, record: dict) -> None:
+        if self._wal is None:
+            return
+        self._wal.write(encode(record))
+        if self._fsync:
+            self.sync_wal()
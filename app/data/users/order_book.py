@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import Enum as PyEnum
+from heapq import heappop, heappush
+
+
+class Side(PyEnum):
+    Buy = "buy"
+    Sell = "sell"
+
+
+@dataclass(slots=True, eq=False)  # identity equality, for deque.remove
+class Order:
+    id: int
+    user_id: int
+    player_id: int
+    side: Side
+    price: int  # cents per share, integer so price levels compare exactly
+    shares: int  # remaining, decremented as the order fills
+
+
+@dataclass(slots=True, frozen=True)
+class Fill:
+    sequence: int
+    player_id: int
+    buy_order_id: int
+    sell_order_id: int
+    buyer_id: int
+    seller_id: int
+    price: int  # cents per share, always the resting order's price
+    shares: int
+
+
+class OrderBook:
+    """price-time priority limit order book for one player's shares"""
+
+    def __init__(self, player_id: int, sequence: Iterator[int]) -> None:
+        self.player_id = player_id
+        self._sequence = sequence
+        # price -> FIFO queue of resting orders
+        self._bids: dict[int, deque[Order]] = {}
+        self._asks: dict[int, deque[Order]] = {}
+        # heaps of level prices (bids negated), emptied levels are dropped lazily
+        self._bid_prices: list[int] = []
+        self._ask_prices: list[int] = []
+
+    def best_bid(self) -> int | None:
+        while self._bid_prices and -self._bid_prices[0] not in self._bids:
+            heappop(self._bid_prices)
+        return -self._bid_prices[0] if self._bid_prices else None
+
+    def best_ask(self) -> int | None:
+        while self._ask_prices and self._ask_prices[0] not in self._asks:
+            heappop(self._ask_prices)
+        return self._ask_prices[0] if self._ask_prices else None
+
+    def depth(
+        self, levels: int = 5
+    ) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """(bids, asks) as (price, shares) pairs, best price first"""
+        bids = sorted(self._bids.items(), reverse=True)[:levels]
+        asks = sorted(self._asks.items())[:levels]
+        return (
+            [(price, sum(o.shares for o in queue)) for price, queue in bids],
+            [(price, sum(o.shares for o in queue)) for price, queue in asks],
+        )
+
+    def submit(self, order: Order) -> list[Fill]:
+        """match against the other side, then rest whatever is left"""
+        if order.side is Side.Buy:
+            fills = self._match(
+                order, self._asks, self.best_ask, lambda p: p <= order.price
+            )
+            if order.shares:
+                self._rest(order, self._bids, self._bid_prices, -order.price)
+        else:
+            fills = self._match(
+                order, self._bids, self.best_bid, lambda p: p >= order.price
+            )
+            if order.shares:
+                self._rest(order, self._asks, self._ask_prices, order.price)
+        return fills
+
+    def cancel(self, order: Order) -> None:
+        levels = self._bids if order.side is Side.Buy else self._asks
+        queue = levels[order.price]
+        queue.remove(order)
+        if not queue:
+            del levels[order.price]
+
+    def _rest(
+        self, order: Order, levels: dict[int, deque[Order]], prices: list[int], key: int
+    ) -> None:
+        queue = levels.get(order.price)
+        if queue is None:
+            queue = levels[order.price] = deque()
+            heappush(prices, key)
+        queue.append(order)
+
+    def _match(
+        self,
+        order: Order,
+        levels: dict[int, deque[Order]],
+        best: Callable[[], int | None],
+        crosses: Callable[[int], bool],
+    ) -> list[Fill]:
+        fills = []
+        buying = order.side is Side.Buy
+        while order.shares and (price := best()) is not None and crosses(price):
+            queue = levels[price]
+            while order.shares and queue:
+                resting = queue[0]
+                shares = min(order.shares, resting.shares)
+                order.shares -= shares
+                resting.shares -= shares
+                buy, sell = (order, resting) if buying else (resting, order)
+                fills.append(
+                    Fill(
+                        next(self._sequence),
+                        self.player_id,
+                        buy.id,
+                        sell.id,
+                        buy.user_id,
+                        sell.user_id,
+                        price,
+                        shares,
+                    )
+                )
+                if not resting.shares:
+                    queue.popleft()
+            if not queue:
+                del levels[price]
+        return fills
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.base import Base
+
+
+class Trade(Base):
+    """a fill from the matching engine, written in batches"""
+
+    __tablename__ = "trades"
+
+    # ---- identifiers ----
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # engine-assigned, unique so re-flushing a batch after a crash is a no-op
+    sequence: Mapped[int] = mapped_column(BigInteger, unique=True, index=True)
+    player_id: Mapped[int] = mapped_column(ForeignKey("players.id"), index=True)
+    buyer_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    seller_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    buy_order_id: Mapped[int] = mapped_column(BigInteger)
+    sell_order_id: Mapped[int] = mapped_column(BigInteger)
+
+    # ---- execution ----
+    price: Mapped[float] = mapped_column(Float)  # dollars per share
+    shares: Mapped[int] = mapped_column(Integer)
+    traded_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Trade(sequence={self.sequence}, player_id={self.player_id}, "
+            f"price={self.price}, shares={self.shares})>"
+        )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Float, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.base import Base
+
+if TYPE_CHECKING:
+    from app.data.users.holding import Holding
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    # ---- identifiers ----
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String, unique=True, index=True)
+
+    # ---- account ----
+    cash: Mapped[float] = mapped_column(Float, default=0.0)  # fake money
+
+    # ---- relationships ----
+    holdings: Mapped[list[Holding]] = relationship(
+        "Holding",
+        back_populates="user",
+        cascade="all, delete-orphan",
+    )
+
+    def __repr__(self) -> str:
+        return f"<User(id={self.id}, name={self.name!r}, cash={self.cash})>"
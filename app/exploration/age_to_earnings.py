@@ -3,30 +3,18 @@ from collections.abc import Iterable
 
 from matplotlib import pyplot as plt
 
-from app.data.league import PlayerSeason, TeamPlayerBuyout, TeamPlayerSalary
+from app.crud.read.earnings import get_earnings_by_age
+from app.data.connection import get_session
 
 
 def save_age_to_earnings_boxplot(
-    rows: Iterable[tuple[PlayerSeason, TeamPlayerSalary, TeamPlayerBuyout]],
+    rows: Iterable[tuple[float, int, float, int]],
 ) -> None:
-    ages = sorted({int(ps.age) for ps, _, _ in rows if ps.age is not None})
-    dollars: dict[int, list[int]] = {age: [] for age in ages}
-    relative_dollars: dict[int, list[float]] = {age: [] for age in ages}
-
-    for ps, tps, tpb in rows:
-        if ps.season_id < 2011:
-            continue
-        if (age := ps.age) is None:
-            print(f"missing age for {ps.player.name}")
-            continue
-        dollars[int(age)].append(0)
-        relative_dollars[int(age)].append(0)
-        if tps:
-            dollars[int(age)][-1] += tps.dollars
-            relative_dollars[int(age)][-1] += tps.relative_dollars
-        if tpb:
-            dollars[int(age)][-1] += tpb.dollars
-            relative_dollars[int(age)][-1] += tpb.relative_dollars
+    """rows are (age, dollars, relative_dollars, buyout_dollars), see get_earnings_by_age"""
+    relative_dollars: dict[int, list[float]] = {}
+
+    for age, _, relative, _ in rows:
+        relative_dollars.setdefault(int(age), []).append(relative)
 
     # Convert dict to list of lists for boxplot
     ages = sorted(relative_dollars.keys())
@@ -41,3 +29,8 @@ def save_age_to_earnings_boxplot(
     plt.xticks(rotation=45)
     plt.grid(axis="y", linestyle="--", alpha=0.7)
     plt.savefig("documentation/images/relative_earnings_by_age.png")
+
+
+if __name__ == "__main__":
+    with get_session() as session:
+        save_age_to_earnings_boxplot(session.execute(get_earnings_by_age()).tuples())
@@ -90,8 +90,17 @@ def add_lag_features(df: DataFrame) -> DataFrame:
     return working
 
 
-def add_engineered_features(df: DataFrame) -> DataFrame:
+def add_engineered_features(
+    df: DataFrame, reference: DataFrame | None = None
+) -> DataFrame:
+    """
+    `reference` (default `df` itself) supplies the league-wide statistics,
+    the season median and the fallback means, so a subset of the rows gets
+    the same features it would have as part of the whole
+    """
     working = df.copy()
+    if reference is None:
+        reference = df
 
     new_features = {}
 
@@ -100,7 +109,7 @@ def add_engineered_features(df: DataFrame) -> DataFrame:
         working["weight_pounds"], (working["height_inches"] ** 2)
     )
 
-    new_features["season_centered"] = working["season"] - working["season"].median()
+    new_features["season_centered"] = working["season"] - reference["season"].median()
     new_features["season_squared"] = new_features["season_centered"] ** 2
 
     working["locale"] = working.pop("country").map(narrow_locales)
@@ -148,7 +157,7 @@ def add_engineered_features(df: DataFrame) -> DataFrame:
             career_values = working.get(career_col, None)
 
             if career_values is None:
-                career_values = working[col].mean()
+                career_values = reference[col].mean()
 
             new_features[f"{col}_shrunk"] = (
                 alpha * working[col] + (1 - alpha) * career_values
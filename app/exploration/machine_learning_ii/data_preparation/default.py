@@ -1,10 +1,16 @@
+from collections.abc import Iterable
+
 from pandas import DataFrame, Series
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder, RobustScaler
 
-from app.crud.read.contracts_for_ml import contracts_for_ml, drop_leakage_columns
+from app.crud.read.contracts_for_ml import (
+    CONTRACTS_FOR_ML_PATH,
+    contracts_for_ml,
+    drop_leakage_columns,
+)
 from app.exploration.machine_learning_ii.data_preparation.add_engineered_features import (
     add_engineered_features,
     add_lag_features,
@@ -15,6 +21,10 @@ from app.exploration.machine_learning_ii.data_preparation.basic import (
     PreparedPipelineData,
     get_numeric_and_categorical_columns,
 )
+from app.exploration.machine_learning_ii.data_preparation.dtypes import (
+    NativeCategoricals,
+    optimize_feature_dtypes,
+)
 from app.exploration.machine_learning_ii.data_preparation.position_labeling_helper import (
     PcaPrismTransformer,
 )
@@ -23,13 +33,43 @@ from app.exploration.machine_learning_ii.data_preparation.transformation import
 )
 
 
-def default_feature_builder() -> DataFrame:
-    working = contracts_for_ml()
+def default_feature_builder(path: str = CONTRACTS_FOR_ML_PATH) -> DataFrame:
+    working = contracts_for_ml(path)
     working = add_engineered_features(working)
     working = add_lag_features(working)
     working = add_position_ordinal(working)
     working = add_season_deltas(working)
-    return drop_leakage_columns(working)
+    return optimize_feature_dtypes(drop_leakage_columns(working))
+
+
+def incremental_feature_builder(
+    changed: Iterable[tuple[int, int]], path: str = CONTRACTS_FOR_ML_PATH
+) -> DataFrame:
+    """
+    default_feature_builder's rows for the changed (player_id, season) rows
+    and the later seasons of the same players, whose lag features read them.
+    The league-wide statistics still come from every row
+    """
+    first_changed: dict[int, int] = {}
+    for player_id, season in changed:
+        first_changed[player_id] = min(season, first_changed.get(player_id, season))
+    if not first_changed:
+        return DataFrame()
+
+    reference = contracts_for_ml(path)
+    # the lags shift within a player, so each player's whole history goes in
+    working = reference[
+        reference.index.get_level_values("player_id").isin(list(first_changed))
+    ]
+    working = add_engineered_features(working, reference)
+    working = add_lag_features(working)
+    working = add_position_ordinal(working)
+    working = add_season_deltas(working)
+
+    player_ids = working.index.get_level_values("player_id")
+    since = player_ids.map(first_changed).to_numpy()
+    working = working[working["season"].to_numpy() >= since]
+    return optimize_feature_dtypes(drop_leakage_columns(working))
 
 
 def build_default_preprocessor(
@@ -89,6 +129,25 @@ def build_default_preprocessor(
     ).set_output(transform="pandas")
 
 
+def build_categorical_preprocessor(
+    features: DataFrame,
+    numeric_columns: list[str],
+) -> NativeCategoricals:
+    """
+    build_default_preprocessor for XGBoost: the same columns, but the
+    categoricals are handed over as categoricals instead of one-hot
+    """
+    return NativeCategoricals(
+        numeric_columns,
+        [column for column in features.columns if column not in numeric_columns],
+        [
+            column
+            for column in ("validation", "contract_type")
+            if column in features.columns
+        ],
+    )
+
+
 def prepare_data(df: DataFrame) -> PreparedPipelineData:
     df = df.copy()
 
@@ -0,0 +1,42 @@
+import numpy as np
+from pandas import DataFrame, concat, to_numeric
+
+from app.exploration.machine_learning_ii.data_preparation.add_engineered_features import (
+    safe_divide,
+)
+
+# the rank given to prospects off a board, just past the end of it
+UNRANKED = 101
+POSITIONS = {"PG": 1, "G": 1.5, "SG": 2, "GF": 2.5, "SF": 3, "F": 3.5, "PF": 4, "C": 5}
+IDENTIFIER_COLUMNS = ["id", "tankathon_slug", "name", "player_id"]
+
+
+def draft_feature_builder(snapshots: DataFrame) -> DataFrame:
+    """
+    features for draft snapshots (get_draft_training_rows or
+    get_big_board_features rows), all columns at once. Keeps draft_year and
+    relative_dollars when they're there
+    """
+    working = snapshots.drop(columns=IDENTIFIER_COLUMNS, errors="ignore")
+    primary = working.pop("primary_position").map(POSITIONS)
+    secondary = working.pop("secondary_position").map(POSITIONS)
+    # rows come from the database as objects when a column is all null
+    working = working.apply(to_numeric, errors="coerce").astype(float)
+
+    new_features = {
+        "position_ordinal": primary,
+        "position_span": (secondary - primary).fillna(0),
+        "wingspan_advantage": working["wingspan"] - working["height"],
+        "estimated_strength": safe_divide(working["weight"], working["height"] ** 2),
+        "free_throw_rate": safe_divide(working["fta"], working["fga"]),
+        "three_point_rate": safe_divide(working["tpa"], working["fga"]),
+        "total_minutes": working["games"] * working["minutes_per_game"],
+        "p36_stocks": working["p36_steals"] + working["p36_blocks"],
+        "p36_creation": working["p36_assists"] - working["p36_turnovers"],
+    }
+    for rank in ("tankathon_big_board_rank", "espn_big_board_rank"):
+        new_features[f"{rank}_missing"] = working[rank].isna().astype(float)
+        # pick value falls off quickly, so the log rank is closer to linear
+        new_features[f"{rank}_log"] = np.log(working.pop(rank).fillna(UNRANKED))
+
+    return concat([working, DataFrame(new_features, index=working.index)], axis=1)
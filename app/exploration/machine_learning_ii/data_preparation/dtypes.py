@@ -0,0 +1,127 @@
+"""
+the compact feature schema: strings as categoricals, float32 stats and the
+smallest nullable int that holds each whole-number column. XGBoost reads the
+categoricals natively (enable_categorical), so nothing is one-hot encoded.
+"""
+
+import numpy as np
+from pandas import CategoricalDtype, DataFrame, Series, concat
+from pandas.api.types import is_bool_dtype, is_float_dtype, is_numeric_dtype
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted
+
+# the target and what it's compared against stay at full precision
+FLOAT64_COLUMNS = {"relative_dollars", "min_eligibility", "max_eligibility"}
+NULLABLE_INTS = ("Int8", "Int16", "Int32")
+
+
+def smallest_ints(block: np.ndarray) -> list[str | None]:
+    """
+    per column of a 2d float block, the smallest nullable int that holds it
+    when every value is a whole number (nan aside), otherwise None
+    """
+    missing = np.isnan(block)
+    whole = ((block == np.round(block)) | missing).all(axis=0) & ~missing.all(axis=0)
+    filled = np.where(missing, 0, block)
+    low, high = filled.min(axis=0, initial=0), filled.max(axis=0, initial=0)
+
+    dtypes: list[str | None] = []
+    for is_whole, column_low, column_high in zip(whole, low, high):
+        dtypes.append(
+            next(
+                (
+                    dtype
+                    for dtype in NULLABLE_INTS
+                    if np.iinfo(dtype.lower()).min <= column_low
+                    and column_high <= np.iinfo(dtype.lower()).max
+                ),
+                None,
+            )
+            if is_whole
+            else None
+        )
+    return dtypes
+
+
+def optimize_feature_dtypes(df: DataFrame) -> DataFrame:
+    """df with the compact schema, the values (and the index) are unchanged"""
+    dtypes: dict[str, str] = {}
+    numeric = []
+    for column, dtype in df.dtypes.items():
+        if is_bool_dtype(dtype):
+            continue
+        if not is_numeric_dtype(dtype):
+            dtypes[column] = "category"
+        elif column in FLOAT64_COLUMNS:
+            dtypes[column] = "float64"
+        else:
+            numeric.append(column)
+
+    # one pass over every numeric column at once, not a scan per column
+    block = df[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+    singles = []
+    for index, (column, small) in enumerate(zip(numeric, smallest_ints(block))):
+        if small is not None:
+            dtypes[column] = small
+        elif is_float_dtype(df.dtypes[column]):
+            singles.append(index)
+
+    # the float32 columns are most of the frame, cast them as one block
+    float32 = DataFrame(
+        block[:, singles].astype(np.float32),
+        index=df.index,
+        columns=[numeric[index] for index in singles],
+    )
+    rest = df.drop(columns=float32.columns).astype(dtypes)
+    return concat([rest, float32], axis=1)[df.columns]
+
+
+class NativeCategoricals(BaseEstimator, TransformerMixin):
+    """
+    selects the model's columns and fixes each categorical's categories to the
+    ones seen in fit, so the codes XGBoost splits on mean the same thing at
+    predict time. Unseen values become missing. A passthrough column that is
+    also a feature is emitted twice, the feature as <name>_category
+    """
+
+    def __init__(
+        self,
+        numeric_columns: list[str],
+        categorical_columns: list[str],
+        passthrough: list[str],
+    ) -> None:
+        self.numeric_columns = numeric_columns
+        self.categorical_columns = categorical_columns
+        self.passthrough = passthrough
+
+    def feature_name(self, column: str) -> str:
+        return f"{column}_category" if column in self.passthrough else column
+
+    def fit(self, X: DataFrame, y: Series | None = None) -> "NativeCategoricals":
+        self.categories_ = {
+            self.feature_name(column): CategoricalDtype(
+                X[column].astype("category").cat.categories.sort_values()
+            )
+            for column in self.categorical_columns
+            if not is_bool_dtype(X[column])
+        }
+        return self
+
+    def transform(self, X: DataFrame) -> DataFrame:
+        check_is_fitted(self, "categories_")
+        working = concat(
+            [
+                X[self.numeric_columns],
+                X[self.categorical_columns].rename(columns=self.feature_name),
+                X[[column for column in self.passthrough if column in X.columns]],
+            ],
+            axis=1,
+        )
+        return working.astype(self.categories_)
+
+    def get_feature_names_out(self, input_features: list[str] | None = None) -> list:
+        return (
+            self.numeric_columns
+            + [self.feature_name(column) for column in self.categorical_columns]
+            + self.passthrough
+        )
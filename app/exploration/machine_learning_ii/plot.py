@@ -1,12 +1,21 @@
+import argparse
 import os
+from collections.abc import Callable
 from pathlib import Path
 from re import sub
+from typing import Any
 
 import matplotlib.pyplot as plt
 import numpy as np
 from pandas import DataFrame, Series, read_csv
 
 from app.crud.read.contracts_for_ml import contracts_for_ml
+from app.exploration.machine_learning_ii import utils
+from app.exploration.machine_learning_ii.plot_jobs import (
+    PlotJob,
+    PlotRun,
+    run_plot_jobs,
+)
 from app.exploration.machine_learning_ii.plotting_utils import (
     THEME,
     bar_plot,
@@ -14,10 +23,12 @@ from app.exploration.machine_learning_ii.plotting_utils import (
     line_plot_with_predictions,
     line_show_save_clustered,
     scatter_plot,
+    thin_scatter,
+)
+from app.exploration.machine_learning_ii.report_cube import (
+    box_stats,
+    build_report_cube,
 )
-
-# Load your data
-df = contracts_for_ml()
 
 # for filename in os.listdir("documentation/report/plots"):
 #     os.remove(f"documentation/report/plots/{filename}")
@@ -34,6 +45,15 @@ def to_filename(title: str) -> str:
     return f"{cleaned}.png"
 
 
+def report_path(title: str) -> Path:
+    return PLOTS_DIR / to_filename(title)
+
+
+def utils_report_path(title: str) -> Path:
+    """where the plotting_utils plots save `title`, savefig adds the .png"""
+    return PLOTS_DIR / f"{utils.to_filename(title)}.png"
+
+
 def save_figure(fig: plt.Figure, title: str) -> None:  # pyright: ignore[reportPrivateImportUsage]
     save_path = Path("documentation/report/plots") / to_filename(title)
     fig.savefig(save_path, dpi=300, bbox_inches="tight")
@@ -64,12 +84,13 @@ def _make_scatter_plot(
     working = df[[x_column, y_column]].dropna()
     if working.empty:
         return
+    working, density = thin_scatter(working, x_column, y_column)
 
     fig, ax = plt.subplots()
     ax.scatter(
         working[x_column],
         working[y_column],
-        alpha=0.65,
+        alpha=0.65 * density.to_numpy(),
         s=55,
         edgecolors=THEME["blue"],
         linewidths=1.2,
@@ -156,47 +177,26 @@ def plot_target_distribution(df: DataFrame) -> None:
     save_figure(fig, "Log Relative Dollars Distribution")
 
 
-def plot_average_relative_dollars_over_time(df: DataFrame) -> None:
-    required_columns = {"season", "relative_dollars"}
-    if not required_columns.issubset(df.columns):
-        return
-
-    grouped = (
-        df[["relative_dollars"]]
-        .dropna()
-        .groupby("season", as_index=False)
-        .agg(mean_relative_dollars=("relative_dollars", "mean"))
-        .sort_index()
-    )
-
-    if grouped.empty:
+def plot_average_relative_dollars_over_time(cells: DataFrame) -> None:
+    """cells is ReportCube.slice(["season"])"""
+    if cells.empty:
         return
 
     fig, ax = plt.subplots(figsize=(12, 7))
-    ax.plot(grouped.index, grouped["mean_relative_dollars"], linewidth=3)
+    ax.plot(cells.index, cells[("relative_dollars", "mean")], linewidth=3)
     ax.set_title("Average Relative Value Over Time")
     ax.set_xlabel("season")
     ax.set_ylabel("mean(relative_dollars)")
     save_figure(fig, "Average Relative Value Over Time")
 
 
-def plot_relative_dollars_by_season_boxplot(df: DataFrame) -> None:
-    required_columns = {"season", "relative_dollars"}
-    if not required_columns.issubset(df.columns):
+def plot_relative_dollars_by_season_boxplot(cells: DataFrame) -> None:
+    """cells is ReportCube.slice(["season"])"""
+    if cells.empty:
         return
 
-    working = df[["season", "relative_dollars"]].dropna()
-    if working.empty:
-        return
-
-    seasons = sorted(working["season"].unique())
-    grouped_values = [
-        working.loc[working["season"] == season, "relative_dollars"].values
-        for season in seasons
-    ]
-
     fig, ax = plt.subplots(figsize=(14, 7))
-    ax.boxplot(grouped_values, labels=seasons, showfliers=False)  # ty:ignore[unknown-argument, invalid-argument-type]
+    ax.bxp(box_stats(cells), showfliers=False)
     ax.set_title("Relative Dollars By Season")
     ax.set_xlabel("season")
     ax.set_ylabel("relative_dollars")
@@ -204,23 +204,13 @@ def plot_relative_dollars_by_season_boxplot(df: DataFrame) -> None:
     save_figure(fig, "Relative Dollars By Season")
 
 
-def plot_position_boxplot(df: DataFrame) -> None:
-    required_columns = {"position", "relative_dollars"}
-    if not required_columns.issubset(df.columns):
-        return
-
-    working = df[["position", "relative_dollars"]].dropna()
-    if working.empty:
+def plot_position_boxplot(cells: DataFrame) -> None:
+    """cells is ReportCube.slice(["season", "position"])"""
+    if cells.empty:
         return
 
-    grouped = (
-        working.groupby([df.index.get_level_values(1), "position"])["relative_dollars"]
-        .apply(list)
-        .sort_index()
-    )
-
     fig, ax = plt.subplots(figsize=(12, 7))
-    ax.boxplot(grouped.tolist(), labels=grouped.index, showfliers=False)  # ty:ignore[unknown-argument]
+    ax.bxp(box_stats(cells), showfliers=False)
     ax.set_title("Relative Dollars By Position")
     ax.set_xlabel("position")
     ax.set_ylabel("relative_dollars")
@@ -228,29 +218,18 @@ def plot_position_boxplot(df: DataFrame) -> None:
     save_figure(fig, "Relative Dollars By Position")
 
 
-def plot_clustered_position_trends(df: DataFrame) -> None:
-    required_columns = {"position", "relative_dollars"}
-    if not required_columns.issubset(df.columns):
+def plot_clustered_position_trends(cells: DataFrame) -> None:
+    """cells is ReportCube.slice(["season", "position"])"""
+    if cells.empty:
         return
 
-    working = df[["position", "relative_dollars"]].dropna()
-    if working.empty:
-        return
-
-    grouped = (
-        df.groupby([df.index.get_level_values(1), "position"])
-        .agg(mean_relative_dollars=("relative_dollars", "mean"))
-        .reset_index()
-        .rename(columns={"level_1": "season"})
-        .sort_values(["season", "position"])
-    )
+    means = cells[("relative_dollars", "mean")].unstack("position")
 
     fig, ax = plt.subplots(figsize=(14, 8))
-    for position in sorted(grouped["position"].unique()):
-        position_data = grouped[grouped["position"] == position]
+    for position in means.columns:
         ax.plot(
-            position_data.index,
-            position_data["mean_relative_dollars"],
+            means.index,
+            means[position],
             linewidth=2.5,
             label=position,
         )
@@ -308,56 +287,78 @@ def plot_missing_values(df: DataFrame) -> None:
     save_figure(fig, "Top Missing Value Counts")
 
 
-def plot_feature_vs_target_suite(df: DataFrame) -> None:
-    candidate_columns = [
-        "points_pg",
-        "assists_pg",
-        "rebounds_pg",
-        "minutes_pg",
-        "age",
-        "draft_number",
-        "games_played",
-        "field_goal_pct",
-        "three_point_pct",
-        "free_throw_pct",
-        "contract_season_points_pg",
-        "contract_season_assists_pg",
-        "contract_season_rebounds_pg",
-        "contract_season_minutes_pg",
-        "contract_season_usage_pct",
-        "contract_season_net_rating",
-        "previous_season_points_pg",
-        "previous_season_assists_pg",
-        "previous_season_rebounds_pg",
-        "previous_season_minutes_pg",
-        "previous_season_usage_pct",
-        "previous_season_net_rating",
-    ]
+FEATURE_COLUMNS = [
+    "points_pg",
+    "assists_pg",
+    "rebounds_pg",
+    "minutes_pg",
+    "age",
+    "draft_number",
+    "games_played",
+    "field_goal_pct",
+    "three_point_pct",
+    "free_throw_pct",
+    "contract_season_points_pg",
+    "contract_season_assists_pg",
+    "contract_season_rebounds_pg",
+    "contract_season_minutes_pg",
+    "contract_season_usage_pct",
+    "contract_season_net_rating",
+    "previous_season_points_pg",
+    "previous_season_assists_pg",
+    "previous_season_rebounds_pg",
+    "previous_season_minutes_pg",
+    "previous_season_usage_pct",
+    "previous_season_net_rating",
+]
+
+
+def target_scatter_job(df: DataFrame, column: str) -> PlotJob:
+    title = f"Relative Dollars By {column}"
+    return PlotJob(
+        _make_scatter_plot,
+        df[[column, "relative_dollars"]],
+        (report_path(title),),
+        {"x_column": column, "y_column": "relative_dollars", "title": title},
+    )
+
+
+def feature_vs_target_jobs(df: DataFrame) -> list[PlotJob]:
+    if "relative_dollars" not in df.columns:
+        return []
 
-    for column in candidate_columns:
+    jobs = []
+    for column in FEATURE_COLUMNS:
         if column not in df.columns:
             continue
 
-        _make_scatter_plot(
-            df=df,
-            x_column=column,
-            y_column="relative_dollars",
-            title=f"Relative Dollars By {column}",
+        title = f"Average Relative Dollars Across {column}"
+        jobs.append(target_scatter_job(df, column))
+        jobs.append(
+            PlotJob(
+                _make_binned_line_plot,
+                df[[column, "relative_dollars"]],
+                (report_path(title),),
+                {
+                    "x_column": column,
+                    "y_column": "relative_dollars",
+                    "bins": 20,
+                    "title": title,
+                },
+            )
         )
+    return jobs
 
-        _make_binned_line_plot(
-            df=df,
-            x_column=column,
-            y_column="relative_dollars",
-            bins=20,
-            title=f"Average Relative Dollars Across {column}",
-        )
 
+def plot_feature_vs_target_suite(df: DataFrame) -> None:
+    for job in feature_vs_target_jobs(df):
+        job()
 
-def plot_top_numeric_target_relationships(df: DataFrame, top_n: int = 8) -> None:
+
+def top_numeric_target_jobs(df: DataFrame, top_n: int = 8) -> list[PlotJob]:
     numeric_columns = _valid_numeric_columns(df, exclude={"relative_dollars", "season"})
     if "relative_dollars" not in df.columns:
-        return
+        return []
 
     correlations = []
     for column in numeric_columns:
@@ -371,67 +372,120 @@ def plot_top_numeric_target_relationships(df: DataFrame, top_n: int = 8) -> None
 
     correlations.sort(key=lambda item: item[1], reverse=True)
 
-    for column, _ in correlations[:top_n]:
-        _make_scatter_plot(
-            df=df,
-            x_column=column,
-            y_column="relative_dollars",
-            title=f"Relative Dollars By {column}",
-        )
+    return [target_scatter_job(df, column) for column, _ in correlations[:top_n]]
 
 
-def main() -> None:
-    df = contracts_for_ml()
-
-    # 2. Relative Value Trends Over Time
-    line_plot(
-        df,
-        x_col="season",
-        y_col="relative_dollars",
-        group_cols=None,
-        title="Average Relative Value Over Time",
-    )
+def plot_top_numeric_target_relationships(df: DataFrame, top_n: int = 8) -> None:
+    for job in top_numeric_target_jobs(df, top_n):
+        job()
+
+
+def report_jobs(df: DataFrame) -> list[PlotJob]:
+    """
+    every figure main draws. The grouped ones draw a slice of one ReportCube
+    built here, the rest get only the columns they read. Jobs are in the
+    order main used to draw them, and a later job writing the same file
+    replaces the earlier one, the serial run overwrote it the same way
+    """
+    cube = build_report_cube(df)
+    by_season = cube.slice(["season"])
+    by_season_position = cube.slice(["season", "position"])
+
+    def utils_job(
+        render: Callable[..., object], data: DataFrame, **options: Any
+    ) -> PlotJob:
+        return PlotJob(render, data, (utils_report_path(options["title"]),), options)
+
+    target = ["relative_dollars"]
+    jobs = [
+        # 2. Relative Value Trends Over Time
+        utils_job(
+            line_plot,
+            by_season,
+            x_col="season",
+            y_col="relative_dollars",
+            group_cols=None,
+            title="Average Relative Value Over Time",
+        ),
+        utils_job(
+            line_show_save_clustered,
+            by_season_position,
+            x_col="season",
+            y_col="relative_dollars",
+            group_cols=["position"],
+            title="Clustered Relative Value Trends",
+        ),
+        # 6. Feature Exploration vs Target
+        *(
+            utils_job(
+                scatter_plot,
+                df[[f"contract_season_{stat}_pg", *target]],
+                x_col=f"contract_season_{stat}_pg",
+                y_col="relative_dollars",
+                title=f"Relative Dollars By {name}",
+            )
+            for stat, name in (
+                ("points", "Points"),
+                ("assists", "Assists"),
+                ("rebounds", "Rebounds"),
+            )
+        ),
+        PlotJob(
+            plot_target_distribution,
+            df[target],
+            tuple(
+                report_path(title)
+                for title in (
+                    "Relative Dollars Distribution",
+                    "Relative Dollars Boxplot",
+                    "Log Relative Dollars Distribution",
+                )
+            ),
+        ),
+        PlotJob(
+            plot_average_relative_dollars_over_time,
+            by_season,
+            (report_path("Average Relative Value Over Time"),),
+        ),
+        PlotJob(
+            plot_relative_dollars_by_season_boxplot,
+            by_season,
+            (report_path("Relative Dollars By Season"),),
+        ),
+        PlotJob(
+            plot_position_boxplot,
+            by_season_position,
+            (report_path("Relative Dollars By Position"),),
+        ),
+        PlotJob(
+            plot_clustered_position_trends,
+            by_season_position,
+            (report_path("Clustered Relative Value Trends"),),
+        ),
+        PlotJob(
+            plot_correlation_heatmap,
+            df[_valid_numeric_columns(df)],
+            (report_path("Top Correlations With Relative Dollars"),),
+        ),
+        PlotJob(plot_missing_values, df, (report_path("Top Missing Value Counts"),)),
+        *feature_vs_target_jobs(df),
+        *top_numeric_target_jobs(df, top_n=8),
+    ]
+    return list({job.outputs: job for job in jobs}.values())
 
-    line_show_save_clustered(
-        df,
-        x_col="season",
-        y_col="relative_dollars",
-        group_cols=["position"],
-        title="Clustered Relative Value Trends",
-    )
 
-    # 6. Feature Exploration vs Target
-    scatter_plot(
-        df,
-        "contract_season_points_pg",
-        "relative_dollars",
-        title="Relative Dollars By Points",
-    )
+def main(workers: int | None = None, force: bool = False) -> PlotRun:
+    df = contracts_for_ml()
+    return run_plot_jobs(report_jobs(df), workers, force=force)
 
-    scatter_plot(
-        df,
-        "contract_season_assists_pg",
-        "relative_dollars",
-        title="Relative Dollars By Assists",
-    )
 
-    scatter_plot(
-        df,
-        "contract_season_rebounds_pg",
-        "relative_dollars",
-        title="Relative Dollars By Rebounds",
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--force", action="store_true", help="redraw figures whose data is unchanged"
     )
+    args = parser.parse_args()
 
-    plot_target_distribution(df)
-    plot_average_relative_dollars_over_time(df)
-    plot_relative_dollars_by_season_boxplot(df)
-    plot_position_boxplot(df)
-    plot_clustered_position_trends(df)
-    plot_correlation_heatmap(df)
-    plot_missing_values(df)
-    plot_feature_vs_target_suite(df)
-    plot_top_numeric_target_relationships(df, top_n=8)
-
-
-if __name__ == "__main__":
-    main()
+    run = main(args.workers, args.force)
+    print(f"{len(run.rendered)} rendered, {len(run.skipped)} unchanged")
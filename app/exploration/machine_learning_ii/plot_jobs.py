@@ -0,0 +1,133 @@
+"""
+renders independent report figures in worker processes and skips the ones
+whose inputs haven't changed since they were last drawn.
+
+A job is a module-level render function, the slice of the data it draws and
+the files it writes. Its key hashes all three (and the render function's
+code), so only the jobs whose key moved are drawn again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import matplotlib
+from pandas import DataFrame
+from pandas.util import hash_pandas_object
+
+from app.exploration.machine_learning_ii.data_preparation.constants import OUTPUT_DIR
+
+# what was drawn last time, output path -> job key
+PLOT_CACHE = OUTPUT_DIR / ".plot-cache.json"
+
+
+@dataclass(frozen=True, eq=False)
+class PlotJob:
+    """`render(data, **options)` draws and saves `outputs`"""
+
+    render: Callable[..., object]
+    data: DataFrame
+    outputs: tuple[Path, ...]
+    options: dict[str, Any] = field(default_factory=dict)
+
+    def __call__(self) -> None:
+        self.render(self.data, **self.options)
+
+    @property
+    def name(self) -> str:
+        return str(self.outputs[0])
+
+    def key(self) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.render.__module__}.{self.render.__qualname__}".encode())
+        # an edited render function redraws, anything it calls needs force=True
+        if (code := getattr(self.render, "__code__", None)) is not None:
+            digest.update(code.co_code)
+        digest.update(repr(sorted(self.options.items())).encode())
+        digest.update(repr(list(self.outputs)).encode())
+        digest.update(repr(self.data.dtypes.to_dict()).encode())
+        digest.update(hash_pandas_object(self.data, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+
+@dataclass
+class PlotRun:
+    rendered: list[str]
+    skipped: list[str]
+
+
+def use_agg_backend() -> None:
+    """workers never show anything, and Agg is the fastest backend to save from"""
+    matplotlib.use("Agg")
+
+
+def read_plot_cache(path: Path) -> dict[str, str]:
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def run_plot_jobs(
+    jobs: Iterable[PlotJob],
+    workers: int | None = None,
+    cache_path: Path = PLOT_CACHE,
+    force: bool = False,
+) -> PlotRun:
+    """
+    render every job whose key changed (or whose outputs are gone), `workers`
+    processes at a time (default one per cpu). A single job, or workers=1,
+    renders in this process
+    """
+    jobs = list(jobs)
+    outputs = [output for job in jobs for output in job.outputs]
+    if duplicated := {str(output) for output in outputs if outputs.count(output) > 1}:
+        raise Exception(
+            f"Written by more than one job: {', '.join(sorted(duplicated))}"
+        )
+
+    cache = {} if force else read_plot_cache(cache_path)
+    keys = {job.name: job.key() for job in jobs}
+    pending = [
+        job
+        for job in jobs
+        if cache.get(job.name) != keys[job.name]
+        or not all(output.exists() for output in job.outputs)
+    ]
+    pending_names = {job.name for job in pending}
+    skipped = [job.name for job in jobs if job.name not in pending_names]
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    rendered: list[str] = []
+    failed: dict[str, BaseException] = {}
+    if workers <= 1:
+        for job in pending:
+            try:
+                job()
+            except Exception as error:
+                failed[job.name] = error
+            else:
+                rendered.append(job.name)
+    else:
+        with ProcessPoolExecutor(workers, initializer=use_agg_backend) as pool:
+            futures = {pool.submit(job): job for job in pending}
+            for future in as_completed(futures):
+                job = futures[future]
+                if (error := future.exception()) is not None:
+                    failed[job.name] = error
+                else:
+                    rendered.append(job.name)
+
+    # what did render stays cached even if others failed
+    cache.update({name: keys[name] for name in rendered})
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    if failed:
+        name, error = next(iter(failed.items()))
+        raise Exception(f"{len(failed)} plots failed, {name}: {error}") from error
+
+    return PlotRun(rendered, skipped)
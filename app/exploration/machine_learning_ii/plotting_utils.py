@@ -1,16 +1,24 @@
+from __future__ import annotations
+
 import math
-from collections.abc import Callable, Iterable
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
 import numpy as np
-import plotly.express as px
 from pandas import DataFrame, Series, concat, to_datetime
-from sklearn.metrics import confusion_matrix
 
-from app.exploration.machine_learning_ii.training.helper_classes import PreparedData
+from app.exploration.machine_learning_ii.plot_jobs import PlotJob, run_plot_jobs
 from app.exploration.machine_learning_ii.utils import to_filename
 
+if TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
+
+    from app.exploration.machine_learning_ii.training.helper_classes import (
+        PreparedData,
+    )
+
 THEME = {
     # Core NBA colors
     "blue": "#17408B",  # NBA blue
@@ -30,6 +38,9 @@ THEME = {
     "brown": "#8C564B",  # earthy tone
     "lime": "#BCBD22",  # yellow-green
 }
+# past this a scatter is a blob anyway, more points only cost render time
+SCATTER_POINTS = 5_000
+DOWNLOADS_DIR = Path.home() / "Downloads"
 
 plt.rcParams.update(
     {
@@ -50,40 +61,59 @@ plt.rcParams.update(
 )
 
 
+def group_list(group_cols: str | Iterable[str] | None) -> list[str]:
+    if group_cols is None:
+        return []
+    return [group_cols] if isinstance(group_cols, str) else list(group_cols)
+
+
+def series_label(name: object) -> str:
+    return " | ".join(map(str, name)) if isinstance(name, tuple) else str(name)
+
+
+def wide_statistic(
+    cells: DataFrame, value: str, statistic: str, group_cols: list[str]
+) -> DataFrame:
+    """one column per group, the cells' first index level down the rows"""
+    column = cells[(value, statistic)]
+    if not group_cols:
+        return column.to_frame("all")
+    return column.unstack(group_cols).sort_index()
+
+
 def bar_plot(
-    df: DataFrame,
+    cells: DataFrame,
     x_col: str,
     y_col: str,
     *,
     show: bool = False,
     color_col: str | None = None,
-    agg: Callable[[Series], float] = Series.mean,
+    statistic: str = "mean",
     title: str,
     figsize: tuple[float, float] = (8, 5),
     sort_by_index: bool = False,  # NEW
     ascending: bool = True,  # NEW
 ) -> Path:
-    working = df[[x_col, y_col] + ([color_col] if color_col else [])].copy()
-
-    # Replace missing category values with "None"
-    working[x_col] = (
-        working[x_col]
-        .astype("object")
-        .where(working[x_col].notna(), "None")
-        .replace("", "None")
-    )
-
+    """
+    cells is ReportCube.slice([x_col]), or [x_col, color_col] to colour each
+    bar by its most common color_col
+    """
     if color_col:
-        working[color_col] = (
-            working[color_col]
-            .astype("object")
-            .where(working[color_col].notna(), "None")
-            .replace("", "None")
-        )
+        counts = cells[(y_col, "count")]
+        totals = counts.groupby(level=x_col).sum()
+        if statistic == "count":
+            grouped = totals
+        elif statistic == "mean":
+            sums = cells[(y_col, "mean")] * counts
+            grouped = sums.groupby(level=x_col).sum() / totals
+        else:
+            raise Exception(
+                f"Can't roll {statistic} up over {color_col}, slice by {x_col} alone"
+            )
+        modal = counts.groupby(level=x_col).idxmax().map(lambda key: key[1])
+    else:
+        grouped = cells[(y_col, statistic)]
 
-    grouped = (
-        working.dropna(subset=[y_col]).groupby(x_col, observed=True)[y_col].apply(agg)
-    )
     if sort_by_index:
         grouped = grouped.sort_index(ascending=ascending)
     else:
@@ -103,25 +133,16 @@ def bar_plot(
 
     # Color by feature (consistent palette cycling)
     else:
-        # Map each category to a color
-        categories = working[[x_col, color_col]].drop_duplicates()
-        color_map = {}
         palette = list(THEME.values())
-
-        for i, value in enumerate(
-            working.groupby(x_col)[color_col].agg(lambda s: s.mode().iloc[0])
-        ):
-            color_map[value] = palette[i % len(palette)]
-
-        colors = [
-            color_map[working.loc[working[x_col] == idx, color_col].mode().iloc[0]]
-            for idx in grouped.index
-        ]
+        color_map = {
+            value: palette[i % len(palette)]
+            for i, value in enumerate(dict.fromkeys(modal))
+        }
 
         ax.barh(
             grouped.index.astype(str),
             grouped.values,  # ty:ignore[invalid-argument-type]
-            color=colors,
+            color=[color_map[modal[idx]] for idx in grouped.index],
             edgecolor=THEME["gray"],
             alpha=0.9,
         )
@@ -133,7 +154,7 @@ def bar_plot(
     ax.spines["right"].set_visible(False)
 
     ax.set_ylabel(x_col)
-    ax.set_xlabel(f"{agg.__name__}({y_col})")  # type: ignore
+    ax.set_xlabel(f"{statistic}({y_col})")
 
     if title:
         ax.set_title(title)
@@ -151,51 +172,22 @@ def bar_plot(
 
 
 def line_plot_with_predictions(
-    df: DataFrame,
+    cells: DataFrame,
     x_col: str,
     y_col: str,
     group_cols: str | Iterable[str] | None,
     pred_col: str,
     *,
     show: bool = False,
-    agg: Callable[[Series], float] = Series.mean,
+    statistic: str = "mean",
     title: str,
     linear_scale: bool = True,
     figsize: tuple[float, float] = (8, 5),
 ) -> Path:
-    if group_cols is None:
-        group_cols_list: list[str] = []
-    elif isinstance(group_cols, str):
-        group_cols_list = [group_cols]
-    else:
-        group_cols_list = list(group_cols)
-
-    required_cols = [x_col, y_col] + group_cols_list
-    required_cols.append(pred_col)
-
-    missing = [col for col in required_cols if col not in df.columns]
-    if missing:
-        raise KeyError(f"Missing columns in DataFrame: {missing}")
-
-    working = df[required_cols].copy()
-
-    for col in group_cols_list + [x_col]:
-        working[col] = (
-            working[col]
-            .astype("object")
-            .where(working[col].notna(), "None")
-            .replace("", "None")
-        )
-
-    group_keys = [x_col] + group_cols_list
-
-    grouped_actual = (
-        working.groupby(group_keys, observed=True)[y_col].apply(agg).reset_index()
-    )
-
-    grouped_pred = (
-        working.groupby(group_keys, observed=True)[pred_col].apply(agg).reset_index()
-    )
+    """cells is ReportCube.slice([x_col, *group_cols]) over y_col and pred_col"""
+    group_cols_list = group_list(group_cols)
+    actual = wide_statistic(cells, y_col, statistic, group_cols_list)
+    predicted = wide_statistic(cells, pred_col, statistic, group_cols_list)
 
     fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
 
@@ -203,24 +195,18 @@ def line_plot_with_predictions(
         ax.set_yscale("log")
 
     if group_cols_list:
-        for name, sub_actual in grouped_actual.groupby(group_cols_list):
-            label_base = name if isinstance(name, str) else " | ".join(map(str, name))
-            sub_actual = sub_actual.sort_values(x_col)
-
+        for name in actual.columns:
+            label_base = series_label(name)
             ax.plot(
-                sub_actual[x_col],
-                sub_actual[y_col],
+                actual.index,
+                actual[name],
                 linewidth=2,
                 alpha=0.9,
                 label=f"{label_base} (Actual)",
             )
-
-            sub_pred = grouped_pred[grouped_pred[group_cols_list] == name]
-            sub_pred = sub_pred.sort_values(x_col)
-
             ax.plot(
-                sub_pred[x_col],
-                sub_pred[pred_col],
+                predicted.index,
+                predicted[name],
                 linestyle="--",
                 linewidth=2,
                 alpha=0.9,
@@ -230,20 +216,10 @@ def line_plot_with_predictions(
         ax.legend(frameon=False)
 
     else:
-        grouped_actual = grouped_actual.sort_values(x_col)
-
+        ax.plot(actual.index, actual["all"], linewidth=2, label="Actual")
         ax.plot(
-            grouped_actual[x_col],
-            grouped_actual[y_col],
-            linewidth=2,
-            label="Actual",
-        )
-
-        grouped_pred = grouped_pred.sort_values(x_col)
-
-        ax.plot(
-            grouped_pred[x_col],
-            grouped_pred[pred_col],
+            predicted.index,
+            predicted["all"],
             linestyle="--",
             linewidth=2,
             label="Predicted",
@@ -256,7 +232,7 @@ def line_plot_with_predictions(
     ax.grid(False)
 
     ax.set_xlabel(x_col)
-    ax.set_ylabel(f"{agg.__name__}({y_col})")  # ty:ignore[unresolved-attribute]
+    ax.set_ylabel(f"{statistic}({y_col})")
 
     if title:
         ax.set_title(title)
@@ -275,44 +251,20 @@ def line_plot_with_predictions(
 
 
 def line_plot(
-    df: DataFrame,
+    cells: DataFrame,
     x_col: str,
     y_col: str,
     group_cols: str | Iterable[str] | None,
     *,
     show: bool = False,
-    agg: Callable[[Series], float] = Series.mean,
+    statistic: str = "mean",
     title: str,
     linear_scale: bool = True,
     figsize: tuple[float, float] = (8, 5),
 ) -> Path:
-    if group_cols is None:
-        group_cols_list: list[str] = []
-    elif isinstance(group_cols, str):
-        group_cols_list = [group_cols]
-    else:
-        group_cols_list = list(group_cols)
-
-    required_cols = [x_col, y_col] + group_cols_list
-
-    # Only select columns that actually exist
-    missing = [col for col in required_cols if col not in df.columns]
-    if missing:
-        raise KeyError(f"Missing columns in DataFrame: {missing}")
-
-    working = df[required_cols].copy()
-
-    # Replace missing values in grouping + x columns
-    for col in group_cols_list + [x_col]:
-        working[col] = (
-            working[col]
-            .astype("object")
-            .where(
-                working[col].notna(),
-                "None",
-            )
-            .replace("", "None")
-        )
+    """cells is ReportCube.slice([x_col, *group_cols])"""
+    group_cols_list = group_list(group_cols)
+    wide = wide_statistic(cells, y_col, statistic, group_cols_list)
 
     fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
 
@@ -320,21 +272,19 @@ def line_plot(
         ax.set_yscale("log")
 
     if group_cols_list:
-        for name, sub in df.groupby(group_cols_list):
-            label = name if isinstance(name, str) else " | ".join(map(str, name))
+        for name in wide.columns:
             ax.plot(
-                sub[x_col],
-                sub[y_col],
-                label=label,
+                wide.index,
+                wide[name],
+                label=series_label(name),
                 linewidth=2,
                 alpha=0.9,
             )
         ax.legend(frameon=False)
     else:
-        grouped = df.sort_index(level="season")
         ax.plot(
-            grouped[x_col],
-            grouped[y_col],
+            wide.index,
+            wide["all"],
             color=THEME["blue"],
             linewidth=2,
         )
@@ -344,7 +294,7 @@ def line_plot(
     ax.grid(False)
 
     ax.set_xlabel(x_col)
-    ax.set_ylabel(f"{agg.__name__}({y_col})")  # type: ignore
+    ax.set_ylabel(f"{statistic}({y_col})")
 
     if title:
         ax.set_title(title)
@@ -362,60 +312,21 @@ def line_plot(
 
 
 def line_show_save_clustered(
-    df: DataFrame,
+    cells: DataFrame,
     x_col: str,
     y_col: str,
     group_cols: str | Iterable[str] | None,
     *,
-    agg: Callable[[Series], float] = Series.mean,
-    corr_threshold: float = 0.8,
+    statistic: str = "mean",
     title: str,
     figsize: tuple[float, float] = (12, 8),
     linear_scale: bool = True,
     show: bool = False,
     smooth_window: int = 5,  # NEW: smoothing window
 ) -> Path:
-    if group_cols is None:
-        group_cols_list: list[str] = []
-    elif isinstance(group_cols, str):
-        group_cols_list = [group_cols]
-    else:
-        group_cols_list = list(group_cols)
-
-    required_cols = [x_col, y_col] + group_cols_list
-    missing = [col for col in required_cols if col not in df.columns]
-    if missing:
-        raise KeyError(f"Missing columns in DataFrame: {missing}")
-
-    working = df[required_cols].copy()
-
-    # Clean values
-    for col in group_cols_list + [x_col]:
-        working[col] = (
-            working[col]
-            .astype("object")
-            .where(working[col].notna(), "None")
-            .replace("", "None")
-        )
-
-    # Combine group columns into a single series identifier
-    if group_cols_list:
-        working["_series"] = (
-            working[group_cols_list].astype(str).agg(" | ".join, axis=1)
-        )
-    else:
-        working["_series"] = "all"
-
-    wide = (
-        working.drop(columns=["season"])
-        .pivot_table(
-            index=x_col,
-            columns="_series",
-            values=y_col,
-            aggfunc=agg,
-        )
-        .sort_index()
-    )
+    """cells is ReportCube.slice([x_col, *group_cols])"""
+    wide = wide_statistic(cells, y_col, statistic, group_list(group_cols))
+    wide.columns = [series_label(name) for name in wide.columns]
 
     # --- COLOR MAP ---
     palette = [
@@ -427,9 +338,6 @@ def line_show_save_clustered(
 
     color_map = {col: palette[i % len(palette)] for i, col in enumerate(wide.columns)}
 
-    # --- CORRELATION (optional grouping, but no subplots now) ---
-    corr = wide.corr().abs()
-
     # --- PLOT ---
     fig, ax = plt.subplots(figsize=figsize)
 
@@ -458,7 +366,7 @@ def line_show_save_clustered(
     ax.grid(False)
 
     ax.set_xlabel(x_col)
-    ax.set_ylabel(f"{agg.__name__}({y_col})")  # type: ignore
+    ax.set_ylabel(f"{statistic}({y_col})")
 
     if title:
         ax.set_title(title)
@@ -481,6 +389,8 @@ def line_show_save_clustered(
 def compute_density_alpha(x: Series, y: Series, bins: int = 30) -> Series:
     # Remove NaNs
     mask = x.notna() & y.notna()
+    if not mask.any():
+        return Series(1.0, index=x.index)
     x_vals = x[mask].to_numpy()
     y_vals = y[mask].to_numpy()
 
@@ -508,6 +418,22 @@ def compute_density_alpha(x: Series, y: Series, bins: int = 30) -> Series:
     return result
 
 
+def thin_scatter(
+    df: DataFrame,
+    x_col: str,
+    y_col: str,
+    max_points: int = SCATTER_POINTS,
+    bins: int = 30,
+) -> tuple[DataFrame, Series]:
+    """
+    at most `max_points` of df's rows, a seeded sample so redraws match, and
+    compute_density_alpha for them
+    """
+    if len(df) > max_points:
+        df = df.sample(max_points, random_state=0)
+    return df, compute_density_alpha(df[x_col], df[y_col], bins)
+
+
 def scatter_plot(
     df: DataFrame,
     x_col: str,
@@ -551,6 +477,9 @@ def scatter_plot(
                 .replace("", "None")
             )
 
+    working, density = thin_scatter(working, x_col, y_col)
+    point_alpha = alpha * density.to_numpy()
+
     fig, ax = plt.subplots(figsize=figsize)
 
     if not linear_scale:
@@ -566,7 +495,7 @@ def scatter_plot(
             ax.scatter(
                 working[x_col],
                 working[y_col],
-                alpha=alpha,
+                alpha=point_alpha,
                 color=THEME["blue"],
                 edgecolors=None,
             )
@@ -577,7 +506,7 @@ def scatter_plot(
         scatter_kwargs = {
             "x": working[x_col],
             "y": working[y_col],
-            "alpha": alpha,
+            "alpha": point_alpha,
             "color": THEME["blue"],
             "edgecolors": None,
         }
@@ -614,12 +543,7 @@ def scatter_plot(
     return save_path
 
 
-def plot_residuals_to_downloads(
-    *,
-    pipeline,
-    prepared_data: PreparedData,
-    file_name: str = "regression_residuals.png",
-) -> None:
+def residual_frame(*, pipeline: Pipeline, prepared_data: PreparedData) -> DataFrame:
     # Predict on each split (adjust attribute names if your PreparedData differs)
     y_train_true, X_train = prepared_data.y_train, prepared_data.X_train
     y_val_true, X_val = prepared_data.y_validation, prepared_data.X_validation
@@ -629,7 +553,7 @@ def plot_residuals_to_downloads(
     y_val_pred = pipeline.predict(X_val)
     y_test_pred = pipeline.predict(X_test)
 
-    data = concat(
+    return concat(
         [
             DataFrame(
                 {
@@ -655,24 +579,62 @@ def plot_residuals_to_downloads(
         ]
     )
 
-    plt.figure()
+
+def render_residuals(data: DataFrame, path: Path) -> None:
+    fig, ax = plt.subplots()
 
     for split_name in ["train", "validation", "test"]:
-        subset = data[data["split"] == split_name].sort_values("predicted")
+        subset, density = thin_scatter(
+            data[data["split"] == split_name], "predicted", "residual"
+        )
 
-        plt.scatter(
+        ax.scatter(
             subset["predicted"],
             subset["residual"],
             label=split_name,
             s=10,
-            alpha=0.6,
+            alpha=0.6 * density.to_numpy(),
         )
 
-    plt.axhline(0)
-    plt.xlabel("Predicted value")
-    plt.ylabel("Residual (actual - predicted)")
-    plt.title("Residuals vs Predicted Value")
-    plt.legend()
+    ax.axhline(0)
+    ax.set_xlabel("Predicted value")
+    ax.set_ylabel("Residual (actual - predicted)")
+    ax.set_title("Residuals vs Predicted Value")
+    ax.legend()
+
+    fig.savefig(path, dpi=300, bbox_inches="tight")
+    plt.close(fig)
+
+
+def plot_residuals_to_downloads(
+    *,
+    pipeline,
+    prepared_data: PreparedData,
+    file_name: str = "regression_residuals.png",
+) -> Path:
+    DOWNLOADS_DIR.mkdir(exist_ok=True)
+    path = DOWNLOADS_DIR / file_name
+    data = residual_frame(pipeline=pipeline, prepared_data=prepared_data)
+    run_plot_jobs([PlotJob(render_residuals, data, (path,), {"path": path})])
+    return path
+
+
+def render_confusion_matrix(data: DataFrame, path: Path) -> None:
+    cm = data.to_numpy()
+    fig, ax = plt.subplots(figsize=(5, 4))
+    im = ax.imshow(cm)
+
+    ax.set_title("Test Confusion Matrix")
+    ax.set_xlabel("Predicted")
+    ax.set_ylabel("True")
+
+    for i in range(cm.shape[0]):
+        for j in range(cm.shape[1]):
+            ax.text(j, i, str(cm[i, j]), ha="center", va="center")
+
+    fig.tight_layout()
+    fig.savefig(path, bbox_inches="tight")
+    plt.close(fig)
 
 
 def save_multiclass_confusion_matrices(
@@ -683,6 +645,9 @@ def save_multiclass_confusion_matrices(
     file_name: str = "confusion_matrices.csv",
     plot_name: str = "confusion_matrices.png",
 ) -> None:
+    # here, not at the top: the plot workers import this module and never need it
+    from sklearn.metrics import confusion_matrix
+
     splits = {
         "train": (
             pipeline.predict(prepared_data.X_train),
@@ -698,7 +663,7 @@ def save_multiclass_confusion_matrices(
         ),
     }
 
-    downloads_path = Path.home() / "Downloads"
+    downloads_path = DOWNLOADS_DIR
     downloads_path.mkdir(exist_ok=True)
 
     all_rows = []
@@ -730,17 +695,7 @@ def save_multiclass_confusion_matrices(
     DataFrame(all_rows).to_csv(downloads_path / file_name, index=False)
 
     # ---- Plot ----
-    fig, ax = plt.subplots(figsize=(5, 4))
-    im = ax.imshow(cm)
-
-    ax.set_title("Test Confusion Matrix")
-    ax.set_xlabel("Predicted")
-    ax.set_ylabel("True")
-
-    for i in range(cm.shape[0]):
-        for j in range(cm.shape[1]):
-            ax.text(j, i, str(cm[i, j]), ha="center", va="center")
-
-    plt.tight_layout()
-    plt.savefig(downloads_path / plot_name, bbox_inches="tight")
-    plt.close()
+    path = downloads_path / plot_name
+    run_plot_jobs(
+        [PlotJob(render_confusion_matrix, DataFrame(cm), (path,), {"path": path})]
+    )
@@ -0,0 +1,185 @@
+"""
+the report's grouped statistics, computed once. Every combination of the
+dimensions (a GROUP BY CUBE) gets count, mean, the quartiles and the boxplot
+whiskers of each value column, so the grouped plots draw from a slice of it
+instead of regrouping the contracts frame each.
+
+Each dimension is factorized to integer codes once and a grouping is the
+codes raveled into one key, so a grouping set is a single sort, not a
+pandas groupby.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import combinations
+
+import numpy as np
+from numpy.typing import NDArray
+from pandas import DataFrame, Index, MultiIndex, Series, concat, factorize
+from pandas.api.types import is_numeric_dtype
+
+from app.exploration.machine_learning_ii.data_preparation.add_engineered_features import (
+    narrow_locales,
+)
+
+CUBE_DIMENSIONS = ("season", "position", "contract_type", "locale")
+CUBE_STATISTICS = ("count", "mean", "q1", "median", "q3", "whislo", "whishi")
+# how the plots have always labelled a missing category
+MISSING = "None"
+# matplotlib's default whisker reach, in IQRs past the quartiles
+WHISKER_REACH = 1.5
+
+
+def dimension_codes(column: Series) -> tuple[NDArray[np.int64], Index]:
+    """column as codes into its sorted labels, missing values get their own"""
+    if not is_numeric_dtype(column):
+        column = column.astype(object).where(column.notna(), MISSING)
+        column = column.replace("", MISSING)
+    codes, labels = factorize(column, sort=True)
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(labels), codes)
+        labels = labels.append(Index([np.nan]))
+    return codes.astype(np.int64), labels
+
+
+def group_statistics(keys: NDArray[np.int64], values: NDArray[np.float64]) -> DataFrame:
+    """
+    CUBE_STATISTICS of `values` per key, missing values left out. Quartiles
+    interpolate like numpy.percentile, whiskers follow matplotlib.boxplot
+    """
+    present = ~np.isnan(values)
+    keys, values = keys[present], values[present]
+    order = np.lexsort((values, keys))
+    keys, values = keys[order], values[order]
+    unique, starts, counts = np.unique(keys, return_index=True, return_counts=True)
+    if not len(unique):
+        return DataFrame(columns=list(CUBE_STATISTICS), dtype=float)
+
+    def quantile(q: float) -> NDArray[np.float64]:
+        position = q * (counts - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, counts - 1)
+        low, high = values[starts + lower], values[starts + upper]
+        return low + (position - lower) * (high - low)
+
+    q1, median, q3 = quantile(0.25), quantile(0.5), quantile(0.75)
+    reach = WHISKER_REACH * (q3 - q1)
+    # within each key the values are sorted, so a masked min/max per run
+    lowest = np.where(values >= np.repeat(q1 - reach, counts), values, np.inf)
+    highest = np.where(values <= np.repeat(q3 + reach, counts), values, -np.inf)
+
+    return DataFrame(
+        {
+            "count": counts,
+            "mean": np.add.reduceat(values, starts) / counts,
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "whislo": np.minimum(np.minimum.reduceat(lowest, starts), q1),
+            "whishi": np.maximum(np.maximum.reduceat(highest, starts), q3),
+        },
+        index=unique,
+    )
+
+
+@dataclass
+class ReportCube:
+    dimensions: tuple[str, ...]
+    values: tuple[str, ...]
+    # one frame per grouping set, keyed by its dimensions in cube order
+    cells: dict[tuple[str, ...], DataFrame]
+
+    def slice(
+        self, by: Iterable[str] = (), values: Iterable[str] | None = None
+    ) -> DataFrame:
+        """
+        the statistics grouped by `by` (in that order), columns are
+        (value, statistic). Empty `by` is the whole frame as one row
+        """
+        by = list(by)
+        if unknown := set(by) - set(self.dimensions):
+            raise Exception(f"Not a cube dimension: {', '.join(sorted(unknown))}")
+        cell = self.cells[tuple(d for d in self.dimensions if d in by)]
+        if len(by) > 1:
+            cell = cell.reorder_levels(by).sort_index()
+        return cell if values is None else cell[list(values)]
+
+
+def locale_column(df: DataFrame) -> Series:
+    return df["locale"] if "locale" in df else df["country"].map(narrow_locales)
+
+
+def build_report_cube(
+    df: DataFrame,
+    values: Iterable[str] = ("relative_dollars",),
+    dimensions: Iterable[str] = CUBE_DIMENSIONS,
+) -> ReportCube:
+    """the cube over a contracts_for_ml frame, locale comes from country"""
+    dimensions, values = tuple(dimensions), tuple(values)
+    codes: dict[str, NDArray[np.int64]] = {}
+    labels: dict[str, Index] = {}
+    for dimension in dimensions:
+        column = locale_column(df) if dimension == "locale" else df[dimension]
+        codes[dimension], labels[dimension] = dimension_codes(column)
+    block = {
+        value: df[value].to_numpy(dtype=np.float64, na_value=np.nan) for value in values
+    }
+
+    cells = {}
+    for size in range(len(dimensions) + 1):
+        for grouping in combinations(dimensions, size):
+            shape = [len(labels[dimension]) for dimension in grouping]
+            keys = (
+                np.ravel_multi_index([codes[d] for d in grouping], shape)
+                if grouping
+                else np.zeros(len(df), dtype=np.int64)
+            )
+            cell = concat(
+                {value: group_statistics(keys, block[value]) for value in values},
+                axis=1,
+            )
+            cells[grouping] = cell.set_axis(
+                group_index(cell.index.to_numpy(), grouping, shape, labels)
+            )
+
+    return ReportCube(dimensions, values, cells)
+
+
+def group_index(
+    keys: NDArray[np.int64],
+    grouping: tuple[str, ...],
+    shape: list[int],
+    labels: dict[str, Index],
+) -> Index:
+    if not grouping:
+        return Index(["all"] * len(keys))
+    arrays = [
+        labels[dimension].take(level)
+        for dimension, level in zip(grouping, np.unravel_index(keys, shape))
+    ]
+    if len(grouping) == 1:
+        return arrays[0].rename(grouping[0])
+    return MultiIndex.from_arrays(arrays, names=list(grouping))
+
+
+def box_label(label: object) -> str:
+    return " ".join(map(str, label)) if isinstance(label, tuple) else str(label)
+
+
+def box_stats(cells: DataFrame, value: str = "relative_dollars") -> list[dict]:
+    """a slice's boxes in the form Axes.bxp draws, one per row"""
+    boxes = cells[value]
+    return [
+        {
+            "label": box_label(label),
+            "med": row.median,
+            "q1": row.q1,
+            "q3": row.q3,
+            "whislo": row.whislo,
+            "whishi": row.whishi,
+            "fliers": [],
+        }
+        for label, row in zip(boxes.index, boxes.itertuples())
+    ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import warnings
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any, Literal
 
 import optuna
@@ -13,8 +14,13 @@ from sklearn.exceptions import ConvergenceWarning
 from sklearn.metrics import mean_squared_error, r2_score
 
 import app.exploration.machine_learning_ii.training.regression_models as regression
-from app.exploration.machine_learning_ii.custom_types import ModelBuilder
+from app.exploration.machine_learning_ii.custom_types import (
+    ModelBuilder,
+    PreprocessorBuilder,
+)
 from app.exploration.machine_learning_ii.data_preparation.default import (
+    build_categorical_preprocessor,
+    build_default_preprocessor,
     default_feature_builder,
 )
 from app.exploration.machine_learning_ii.plotting_utils import (
@@ -28,10 +34,12 @@ from app.exploration.machine_learning_ii.training.helper_classes import (
     RegressionResults,
 )
 from app.exploration.machine_learning_ii.training.hybrid_models import XGBHybridModel
+from app.exploration.machine_learning_ii.training.incremental import save_pipeline
 from app.exploration.machine_learning_ii.training.table_results import (
     build_feature_importance_dataframe,
     build_performance_dataframe,
 )
+from app.utils.tracing import stage, trace
 
 
 def regression_pipeline(
@@ -47,31 +55,37 @@ def regression_pipeline(
 
     study: optuna.Study | None = None
 
-    prepared_data = PreparedData(df, test_season, "hybrid")
+    with stage("split"):
+        prepared_data = PreparedData(df, test_season, "hybrid")
 
     if n_trials > 1:
-        study = find_best_hybrid_hyperparameters(
-            n_trials, prepared_data, model_builder="hybrid"
-        )
+        with stage("optuna_search"):
+            study = find_best_hybrid_hyperparameters(
+                n_trials, prepared_data, model_builder="hybrid"
+            )
     pipeline = prepared_data.build_training_pipeline(
         hybrid_models.build_hybrid_model,
+        build_categorical_preprocessor,
         trial=None if study is None else study.best_trial,  # ty:ignore[invalid-argument-type]
     )
 
-    evaluation: RegressionResults = prepared_data.score_validated_pipeline(pipeline)
+    # the pipeline is fit inside score_validated_pipeline
+    with stage("fit_and_score"):
+        evaluation: RegressionResults = prepared_data.score_validated_pipeline(pipeline)
 
-    plot_residuals_to_downloads(
-        pipeline=pipeline,
-        prepared_data=prepared_data,
-    )
-
-    if get_feature_importance:
-        print("evaluating feature importance...")
-        feature_importance = prepared_data.get_permutation_feature_importance(
+    with stage("residual_plots"):
+        plot_residuals_to_downloads(
             pipeline=pipeline,
-            scoring_function=scoring_function,
+            prepared_data=prepared_data,
         )
 
+    if get_feature_importance:
+        with stage("permutation_importance"):
+            feature_importance = prepared_data.get_permutation_feature_importance(
+                pipeline=pipeline,
+                scoring_function=scoring_function,
+            )
+
     return {
         "best_params": None if study is None else study.best_params,
         "best_value": None if study is None else study.best_value,
@@ -127,15 +141,19 @@ def find_best_hybrid_hyperparameters(
     prepared_data: PreparedData,
     model_builder: ModelBuilder | Literal["hybrid"],
 ) -> optuna.Study:
+    preprocessor_builder: PreprocessorBuilder = build_default_preprocessor
     if model_builder == "hybrid":
         model_builder = hybrid_models.build_hybrid_model
+        preprocessor_builder = build_categorical_preprocessor
         score_pipeline = prepared_data.score_validated_pipeline
     else:
         score_pipeline = prepared_data.score_pipeline
 
     def objective(trial: optuna.Trial) -> float:
         pipeline = prepared_data.build_training_pipeline(
-            trial=trial, model_builder=model_builder
+            trial=trial,
+            model_builder=model_builder,
+            preprocessor_builder=preprocessor_builder,
         )
 
         evaluation = score_pipeline(pipeline)
@@ -159,18 +177,29 @@ def find_best_hybrid_hyperparameters(
     return study
 
 
-def main(n_trials: int = 100, feature_importance: bool = True) -> None:
+def main(
+    n_trials: int = 100,
+    feature_importance: bool = True,
+    trace_path: str = "documentation/report/traces/xgboost_hybrid.json",
+) -> None:
     res: dict[int, dict] = {}
-    df_original = default_feature_builder()
-    for year in range(2026, 2027):
-        df = df_original.copy()
-        res[year] = regression_pipeline(
-            test_season=year,
-            n_trials=n_trials,
-            df=df,
-            get_feature_importance=feature_importance,
-        )
-        print(res[year]["test_rmse"])
+    with trace("xgboost_hybrid", profile_dir=Path(trace_path).parent) as run:
+        with stage("feature_building"):
+            df_original = default_feature_builder()
+        for year in range(2026, 2027):
+            df = df_original.copy()
+            with stage(f"regression_pipeline_{year}"):
+                res[year] = regression_pipeline(
+                    test_season=year,
+                    n_trials=n_trials,
+                    df=df,
+                    get_feature_importance=feature_importance,
+                )
+            print(res[year]["test_rmse"])
+    # the starting point refresh_contract_model keeps boosting
+    save_pipeline(res[max(res)]["pipeline"])
+    run.write(trace_path)
+    print(run.summary())
 
     tables_names: list[tuple[DataFrame, str]] = [
         (build_performance_dataframe(res), "performance")  # ty:ignore[invalid-argument-type]
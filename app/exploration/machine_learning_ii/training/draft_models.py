@@ -0,0 +1,265 @@
+"""
+the pre-draft valuation model: an XGBoost regressor from a prospect's draft
+snapshot to the relative dollars of their first seasons in the league.
+"""
+
+from __future__ import annotations
+
+import os
+import warnings
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import optuna
+import xgboost as xgb
+from numpy.typing import NDArray
+from pandas import DataFrame, Series
+
+import app.exploration.machine_learning_ii.training.regression_models as regression
+from app.exploration.machine_learning_ii.data_preparation.draft import (
+    draft_feature_builder,
+)
+from app.exploration.machine_learning_ii.data_preparation.transformation import (
+    inverse_transform_target,
+    transform_target,
+)
+from app.exploration.machine_learning_ii.training.helper_classes import (
+    RegressionResult,
+    RegressionResults,
+)
+from app.utils.tracing import stage, trace
+
+NUM_BOOST_ROUND = 1_000
+EARLY_STOPPING_ROUNDS = 50
+# what score_board returns, best prospect first
+SCORED_COLUMNS = ["id", "tankathon_slug", "name", "draft_year", "relative_dollars"]
+
+
+@dataclass
+class DraftSplit:
+    """
+    drafts before the validation draft train, the draft before `test_year`
+    validates and `test_year` tests. The DMatrices are built once here and
+    shared by every trial of a search
+    """
+
+    features: DataFrame
+    test_year: int
+    columns: list[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        features = self.features.copy()
+        years = features.pop("draft_year")
+        target = transform_target(features.pop("relative_dollars"))
+        self.columns = features.columns.to_list()
+        self.validation_year = self.test_year - 1
+
+        masks = {
+            "train": years < self.validation_year,
+            "validation": years == self.validation_year,
+            "test": years == self.test_year,
+        }
+        self.y = {name: target[mask] for name, mask in masks.items()}
+        self.dmatrices = {
+            name: xgb.DMatrix(features[mask], label=target[mask])
+            for name, mask in masks.items()
+        }
+        # the final model also learns from the validation draft
+        self.dtrain_validation = xgb.DMatrix(
+            features[~masks["test"] & (years <= self.validation_year)],
+            label=target[~masks["test"] & (years <= self.validation_year)],
+        )
+
+
+def draft_model_params(trial: optuna.Trial | None, threads: int = -1) -> dict[str, Any]:
+    """the contract regressor's search space, with its own thread count"""
+    params = regression.build_xgboost_model_params(trial)
+    params["n_jobs"] = threads
+    return params
+
+
+def train_booster(
+    params: dict[str, Any],
+    dtrain: xgb.DMatrix,
+    dvalidation: xgb.DMatrix | None = None,
+    num_boost_round: int = NUM_BOOST_ROUND,
+) -> xgb.Booster:
+    return xgb.train(
+        params,
+        dtrain,
+        num_boost_round=num_boost_round,
+        evals=[] if dvalidation is None else [(dvalidation, "validation")],
+        early_stopping_rounds=None if dvalidation is None else EARLY_STOPPING_ROUNDS,
+        verbose_eval=False,
+    )
+
+
+def find_best_draft_hyperparameters(
+    split: DraftSplit, n_trials: int, n_jobs: int = 4
+) -> optuna.Study:
+    """
+    `n_jobs` trials at a time, each with an equal share of the cores, all
+    training on the same cached DMatrices
+    """
+    threads = max(1, (os.cpu_count() or 1) // n_jobs)
+
+    def objective(trial: optuna.Trial) -> float:
+        booster = train_booster(
+            draft_model_params(trial, threads),
+            split.dmatrices["train"],
+            split.dmatrices["validation"],
+        )
+        trial.set_user_attr("best_iteration", booster.best_iteration)
+        predictions = booster.predict(
+            split.dmatrices["validation"],
+            iteration_range=(0, booster.best_iteration + 1),
+        )
+        return RegressionResult(
+            Series(predictions, index=split.y["validation"].index),
+            split.y["validation"],
+        ).mse
+
+    with warnings.catch_warnings():
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        study = optuna.create_study(direction="minimize")
+        study.optimize(objective, n_trials=n_trials, n_jobs=n_jobs)
+
+    return study
+
+
+@dataclass
+class DraftModel:
+    booster: xgb.Booster
+    columns: list[str]
+
+    @classmethod
+    def fit(
+        cls, split: DraftSplit, trial: optuna.Trial | optuna.FrozenTrial | None = None
+    ) -> DraftModel:
+        if trial is None:
+            # no search, so let early stopping on the validation draft pick the size
+            rounds = train_booster(
+                draft_model_params(None),
+                split.dmatrices["train"],
+                split.dmatrices["validation"],
+            ).best_iteration
+        else:
+            rounds = trial.user_attrs["best_iteration"]
+        booster = train_booster(
+            draft_model_params(trial),
+            split.dtrain_validation,
+            num_boost_round=rounds + 1,
+        )
+        return cls(booster, split.columns)
+
+    def predict(self, features: DataFrame) -> NDArray:
+        """relative dollars for every row, one DMatrix for the lot"""
+        dmatrix = xgb.DMatrix(features.reindex(columns=self.columns))
+        return inverse_transform_target(self.booster.predict(dmatrix)).to_numpy()
+
+    def score(self, split: DraftSplit) -> RegressionResults:
+        def result(name: str) -> RegressionResult:
+            return RegressionResult(
+                Series(
+                    self.booster.predict(split.dmatrices[name]),
+                    index=split.y[name].index,
+                ),
+                split.y[name],
+            )
+
+        return RegressionResults(result("train"), result("validation"), result("test"))
+
+    def score_board(self, board: DataFrame) -> DataFrame:
+        """get_big_board_features rows with their predicted relative_dollars"""
+        if board.empty:
+            return DataFrame(columns=SCORED_COLUMNS)
+        scored = board[SCORED_COLUMNS[:-1]].copy()
+        scored["relative_dollars"] = self.predict(draft_feature_builder(board))
+        return scored.sort_values("relative_dollars", ascending=False)
+
+
+def feature_importance(model: DraftModel) -> list[tuple[float, str]]:
+    gains = model.booster.get_score(importance_type="total_gain")
+    return sorted(
+        ((float(gains.get(column, 0.0)), column) for column in model.columns),
+        reverse=True,
+    )
+
+
+def draft_pipeline(
+    *, features: DataFrame, test_year: int, n_trials: int = 1, n_jobs: int = 4
+) -> dict[str, Any]:
+    if n_trials < 1:
+        raise ValueError("n_trials must be >= 1")
+
+    study: optuna.Study | None = None
+    with stage("split"):
+        split = DraftSplit(features, test_year)
+
+    if n_trials > 1:
+        with stage("optuna_search"):
+            study = find_best_draft_hyperparameters(split, n_trials, n_jobs)
+
+    with stage("fit_and_score"):
+        model = DraftModel.fit(split, None if study is None else study.best_trial)
+        evaluation = model.score(split)
+
+    return {
+        "best_params": None if study is None else study.best_params,
+        "best_value": None if study is None else study.best_value,
+        "validation_year": split.validation_year,
+        "test_year": test_year,
+        "train_mae": evaluation.train.mae,
+        "validation_mae": evaluation.validation.mae,
+        "test_mae": evaluation.test.mae,
+        "train_rmse": evaluation.train.rmse,
+        "validation_rmse": evaluation.validation.rmse,
+        "test_rmse": evaluation.test.rmse,
+        "train_r2": evaluation.train.r2,
+        "validation_r2": evaluation.validation.r2,
+        "test_r2": evaluation.test.r2,
+        "feature_importance": feature_importance(model),
+        "model": model,
+        "study": study,
+    }
+
+
+def main(n_trials: int = 100, n_jobs: int = 4) -> None:
+    from datetime import datetime
+
+    from app.crud.read.prospects import (
+        get_big_board_features,
+        get_draft_training_rows,
+        get_last_scrape,
+    )
+    from app.data.connection import get_session
+
+    with trace("draft_model") as run, get_session() as session:
+        with stage("feature_building"):
+            rows = DataFrame(
+                session.execute(get_draft_training_rows(datetime.now().year)).mappings()
+            )
+            features = draft_feature_builder(rows)
+        results = draft_pipeline(
+            features=features,
+            test_year=int(features["draft_year"].max()),
+            n_trials=n_trials,
+            n_jobs=n_jobs,
+        )
+        with stage("score_board"):
+            # the current board is the last scrape's, there may be none yet
+            scraped = session.scalar(get_last_scrape())
+            board = DataFrame(
+                []
+                if scraped is None
+                else session.execute(get_big_board_features(scraped)).mappings()
+            )
+            scored = results["model"].score_board(board)
+    print(run.summary())
+    print(results["test_rmse"])
+    print(scored.head(30).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
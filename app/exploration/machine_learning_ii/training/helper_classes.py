@@ -49,6 +49,13 @@ from app.exploration.machine_learning_ii.training.regression_models import (
 )
 
 
+def encode_contract_labels(y: Series) -> Series:
+    """contract_type as the hybrid classifier's classes, anything else is 2"""
+    to_numeric = {"unsigned": 0, "rookie": 0, "minimum": 1, "maximum": 3}
+    # a categorical maps to a categorical, the labels need to be ints
+    return y.astype(object).apply(lambda c: to_numeric.get(c, 2))
+
+
 class PreparedData:
     def __init__(
         self,
@@ -98,8 +105,7 @@ class PreparedData:
         return self.X_test, self.y_test
 
     def encode_labels(self, y: Series) -> Series:
-        to_numeric = {"unsigned": 0, "rookie": 0, "minimum": 1, "maximum": 3}
-        return y.apply(lambda c: to_numeric.get(c, 2))
+        return encode_contract_labels(y)
 
     def decode_labels(self, y: Series) -> Series:
         to_string = {0: "unsigned", 1: "minimum", 2: "between", 3: "maximum"}
@@ -72,12 +72,15 @@ class XGBHybridModel(BaseEstimator, RegressorMixin):
 
         cls_params = self.classifier_builder(self.trial)
         reg_params = self.regressor_builder(self.trial)
+        # kept so update() continues with the same parameters
+        self.classifier_params_ = cls_params
+        self.regressor_params_ = reg_params
 
-        dtrain_cls = xgb.DMatrix(X_train, label=y_cls_train)
-        dval_cls = xgb.DMatrix(X_val, label=y_cls_val)
+        dtrain_cls = xgb.DMatrix(X_train, label=y_cls_train, enable_categorical=True)
+        dval_cls = xgb.DMatrix(X_val, label=y_cls_val, enable_categorical=True)
 
-        dtrain_reg = xgb.DMatrix(X_train, label=y_reg_train)
-        dval_reg = xgb.DMatrix(X_val, label=y_reg_val)
+        dtrain_reg = xgb.DMatrix(X_train, label=y_reg_train, enable_categorical=True)
+        dval_reg = xgb.DMatrix(X_val, label=y_reg_val, enable_categorical=True)
 
         self.classifier = xgb.train(
             cls_params,
@@ -96,6 +99,40 @@ class XGBHybridModel(BaseEstimator, RegressorMixin):
         self.is_fitted_ = True  # 👈 mark fitted
         return self
 
+    def update(
+        self,
+        X: DataFrame,
+        relative_dollars: Series,
+        num_boost_round: int = 10,
+    ) -> "XGBHybridModel":
+        """
+        `num_boost_round` more trees on both boosters, fit to (X, relative_dollars)
+        on top of the ones they already have. X carries contract_type like in
+        fit, all of it is trained on
+        """
+        check_is_fitted(self, ["classifier", "regressor"])
+        X = X.drop(columns=["validation"], errors="ignore")
+        labels = X.pop("contract_type")
+
+        dtrain_cls = xgb.DMatrix(X, label=labels, enable_categorical=True)
+        dtrain_reg = xgb.DMatrix(X, label=relative_dollars, enable_categorical=True)
+
+        self.classifier = xgb.train(
+            self.classifier_params_,
+            dtrain_cls,
+            num_boost_round=num_boost_round,
+            xgb_model=self.classifier,
+            verbose_eval=False,
+        )
+        self.regressor = xgb.train(
+            self.regressor_params_,
+            dtrain_reg,
+            num_boost_round=num_boost_round,
+            xgb_model=self.regressor,
+            verbose_eval=False,
+        )
+        return self
+
     def predict(self, X: DataFrame) -> NDArray:
         if "validation" in X.columns:
             del X["validation"]
@@ -103,7 +140,7 @@ class XGBHybridModel(BaseEstimator, RegressorMixin):
             del X["contract_type"]
         check_is_fitted(self, ["classifier", "regressor"])
 
-        dmatrix = xgb.DMatrix(X)
+        dmatrix = xgb.DMatrix(X, enable_categorical=True)
 
         # ---- Classification ----
         class_proba: NDArray = self.classifier.predict(dmatrix)
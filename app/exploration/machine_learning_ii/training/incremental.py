@@ -0,0 +1,107 @@
+"""
+keeps the saved contract model current between full retrains: the export is
+refreshed for the players whose rows changed (see refresh_contracts_for_ml),
+their feature rows are rebuilt, and the saved boosters keep boosting on them
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+import joblib
+from pandas import DataFrame, Series
+from sklearn.pipeline import Pipeline
+from sqlalchemy.orm import Session
+
+from app.crud.read.contract_supporting_info import (
+    ContractsRefresh,
+    refresh_contracts_for_ml,
+)
+from app.crud.read.contracts_for_ml import CONTRACTS_FOR_ML_PATH
+from app.data.connection import get_session
+from app.exploration.machine_learning_ii.data_preparation.default import (
+    incremental_feature_builder,
+)
+from app.exploration.machine_learning_ii.data_preparation.transformation import (
+    transform_target,
+)
+from app.exploration.machine_learning_ii.training.helper_classes import (
+    encode_contract_labels,
+)
+
+MODEL_PATH = Path("pickles/models/xgboost_hybrid.joblib")
+# trees added per refresh, small next to a full fit so one refresh can't swamp it
+NUM_BOOST_ROUND = 10
+
+
+def save_pipeline(pipeline: Pipeline, path: str | Path = MODEL_PATH) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(pipeline, path)
+    return path
+
+
+def load_pipeline(path: str | Path = MODEL_PATH) -> Pipeline:
+    if not Path(path).exists():
+        raise Exception(f"No saved model at {path}, train and save_pipeline one first")
+    return joblib.load(path)
+
+
+@dataclass
+class ModelRefresh:
+    contracts: ContractsRefresh
+    # feature rows boosted on, the changed ones and their lag dependents
+    rows: int
+    boosted_rounds: int
+
+
+def pipeline_inputs(features: DataFrame) -> tuple[DataFrame, Series]:
+    """feature rows shaped the way PreparedData hands them to the pipeline"""
+    X = features.copy()
+    y = transform_target(X.pop("relative_dollars"))
+    X["validation"] = False
+    X["contract_type"] = encode_contract_labels(X["contract_type"])
+    return X, y
+
+
+def update_pipeline(
+    pipeline: Pipeline, features: DataFrame, num_boost_round: int = NUM_BOOST_ROUND
+) -> Pipeline:
+    """boost the pipeline's XGBHybridModel on incremental_feature_builder rows"""
+    X, y = pipeline_inputs(features)
+    preprocessor = pipeline.named_steps["preprocessor"]
+    pipeline.named_steps["model"].update(preprocessor.transform(X), y, num_boost_round)
+    return pipeline
+
+
+def refresh_contract_model(
+    session: Session,
+    path: str = CONTRACTS_FOR_ML_PATH,
+    model_path: str | Path = MODEL_PATH,
+    num_boost_round: int = NUM_BOOST_ROUND,
+) -> ModelRefresh:
+    """refresh the export, then the saved model with whatever rows changed"""
+    pipeline = load_pipeline(model_path)
+    contracts = refresh_contracts_for_ml(session, path)
+    features = incremental_feature_builder(contracts.changed, path)
+    if not features.empty:
+        save_pipeline(update_pipeline(pipeline, features, num_boost_round), model_path)
+
+    return ModelRefresh(
+        contracts,
+        len(features),
+        pipeline.named_steps["model"].regressor.num_boosted_rounds(),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", default=CONTRACTS_FOR_ML_PATH)
+    parser.add_argument("--model-path", default=str(MODEL_PATH))
+    parser.add_argument("--rounds", type=int, default=NUM_BOOST_ROUND)
+    args = parser.parse_args()
+
+    with get_session() as session:
+        print(refresh_contract_model(session, args.path, args.model_path, args.rounds))
@@ -168,6 +168,7 @@ def build_xgboost_model(
     if trial is None:
         return XGBRegressor(
             objective="reg:squarederror",
+            enable_categorical=True,
             n_jobs=-1,
             random_state=42,
         )
@@ -197,6 +198,7 @@ def build_xgboost_model(
     return XGBRegressor(
         **params,
         objective="reg:squarederror",
+        enable_categorical=True,
         n_jobs=-1,
         early_stopping_rounds=50,
         random_state=42,
@@ -11,7 +11,7 @@ from urllib3.util.retry import Retry
 
 from app.data.connection import get_session
 from app.data.league.awards import Award
-from app.utils.name_matcher import NameMatchFinder
+from app.utils.name_matcher import NameMatchFinder, process_name_finder
 
 AWARD_PAGES: dict[str, str] = {
     "Most Valuable Player": "https://www.basketball-reference.com/awards/mvp.html",
@@ -83,68 +83,79 @@ def parse_season(season_str: str) -> int:
         raise ValueError(f"Could not parse season: {season_str}")
 
 
-def get_all_award_objects() -> Iterable[Award]:
-    name_finder = NameMatchFinder()
+def get_award_objects(award_name: str, name_finder: NameMatchFinder) -> Iterable[Award]:
+    """every award from one basketball-reference page, the unit of work for workers"""
+    if award_name in ALL_NBA_PAGES:
+        yield from get_all_nba_objects(award_name, name_finder)
+        return
+
+    for row in get_award_rows(AWARD_PAGES[award_name]):
+        if row.get("class") and "thead" in row["class"]:
+            continue
 
-    for award_name, url in AWARD_PAGES.items():
-        for row in get_award_rows(url):
-            if row.get("class") and "thead" in row["class"]:
-                continue
+        season_cell = row.find("th")
+        if not season_cell:
+            continue
 
-            season_cell = row.find("th")
-            if not season_cell:
-                continue
+        season = parse_season(season_cell.text.strip())
 
-            season = parse_season(season_cell.text.strip())
+        player_link = row.find("a")
+        if not player_link:
+            continue
 
-            player_link = row.find("a")
-            if not player_link:
-                continue
+        player_name: str = row.find_all("a")[2].string  # type: ignore
 
-            player_name: str = row.find_all("a")[2].string  # type: ignore
+        player_id = name_finder.get_player_id(
+            player_name,
+            season,
+            None,
+        )
 
+        if player_id is None:
+            continue
+
+        yield Award(
+            name=award_name,
+            season=season,
+            player_id=player_id,
+        )
+
+
+def get_all_nba_objects(
+    award_name: str, name_finder: NameMatchFinder
+) -> Iterable[Award]:
+    for row in get_award_rows(ALL_NBA_PAGES[award_name]):
+        if row.get("class") and "thead" in row["class"]:
+            continue
+
+        season_cell = row.find("th")
+        if not season_cell:
+            continue
+
+        if row.find_all("a")[1].text != "NBA":
+            continue
+
+        season = parse_season(season_cell.text.strip())
+        team_n = row.find_all()[4].text
+        for name in row.find_all("a")[3:8]:
             player_id = name_finder.get_player_id(
-                player_name,
+                name.text,
                 season,
                 None,
+                assume_match_exists=True,
             )
-
-            if player_id is None:
-                continue
-
+            assert player_id
             yield Award(
-                name=award_name,
+                name=f"{team_n} Team {award_name}",
                 season=season,
                 player_id=player_id,
             )
 
-    for award_name, url in ALL_NBA_PAGES.items():
-        for row in get_award_rows(url):
-            if row.get("class") and "thead" in row["class"]:
-                continue
-
-            season_cell = row.find("th")
-            if not season_cell:
-                continue
-
-            if row.find_all("a")[1].text != "NBA":
-                continue
-
-            season = parse_season(season_cell.text.strip())
-            team_n = row.find_all()[4].text
-            for name in row.find_all("a")[3:8]:
-                player_id = name_finder.get_player_id(
-                    name.text,
-                    season,
-                    None,
-                    assume_match_exists=True,
-                )
-                assert player_id
-                yield Award(
-                    name=f"{team_n} Team {award_name}",
-                    season=season,
-                    player_id=player_id,
-                )
+
+def get_all_award_objects() -> Iterable[Award]:
+    name_finder = NameMatchFinder()
+    for award_name in [*AWARD_PAGES, *ALL_NBA_PAGES]:
+        yield from get_award_objects(award_name, name_finder)
 
 
 def award_exists(session: Session, award: Award) -> bool:
@@ -160,14 +171,22 @@ def award_exists(session: Session, award: Award) -> bool:
     return res is not None
 
 
-def upload_awards(session: Session) -> None:
-    for award in get_all_award_objects():
+def upload_award_objects(session: Session, awards: Iterable[Award]) -> None:
+    for award in awards:
         if award_exists(session, award):
             continue
         session.add(award)
         session.commit()
 
 
+def upload_award_page(session: Session, award_name: str) -> None:
+    upload_award_objects(session, get_award_objects(award_name, process_name_finder()))
+
+
+def upload_awards(session: Session) -> None:
+    upload_award_objects(session, get_all_award_objects())
+
+
 if __name__ == "__main__":
     with get_session() as session:
         upload_awards(session)
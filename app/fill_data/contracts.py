@@ -11,7 +11,7 @@ from sqlalchemy.orm import Session
 from app.data.connection import get_session
 from app.data.league.contract import Contract
 from app.fill_data.payrolls import salary_exists
-from app.utils.name_matcher import NameMatchFinder
+from app.utils.name_matcher import NameMatchFinder, process_name_finder
 
 
 def get_options_table() -> _SomeTags:
@@ -66,7 +66,12 @@ def get_options() -> dict[int, tuple[int, int]]:
     return res
 
 
-def get_all_contract_objects() -> Iterable[Contract]:
+CONTRACTS_DIR = "data/contracts"
+
+
+def get_contract_objects(
+    path: str, name_finder: NameMatchFinder, options: dict[int, tuple[int, int]]
+) -> Iterable[Contract]:
     def parse_dollars(value: str | None) -> int | None:
         if not value or value.strip() in {"'-", ""}:
             return None
@@ -74,41 +79,44 @@ def get_all_contract_objects() -> Iterable[Contract]:
             return None
         return int(value.replace("$", "").replace(",", ""))
 
+    df = read_csv(path)
+    for _, row in df.iterrows():
+        if row["Yrs"] != row["Yrs"]:
+            continue
+        year = int(row["Start"])
+        age = row["Age                     At Signing"]
+        player_id = name_finder.get_player_id(
+            row["Player"], year, age=int(age) if age == age else None
+        )
+        if player_id is None:
+            continue
+        player_options, team_options = options.get(player_id, (0, 0))
+        option_1, option_2 = None, None
+        if player_options > 0:
+            option_1 = "Player"
+        if player_options == 2:
+            option_2 = "Player"
+        if team_options > 0:
+            option_1 = "Team"
+        if team_options == 2:
+            option_2 = "Team"
+        team = row["Team                     Signed With"][:3]
+        yield Contract(
+            player_id=player_id,
+            team_id=name_finder.get_team(team),
+            value=parse_dollars(row["Value"]) if row["Value"] == row["Value"] else None,
+            start_year=year + 1,
+            duration=int(row["Yrs"]),
+            option_1=option_1,
+            option_2=option_2,
+        )
+
+
+def get_all_contract_objects() -> Iterable[Contract]:
     name_finder = NameMatchFinder()
     options = get_options()
-    for df in map(read_csv, listpathdir("data/contracts")):
-        for _, row in df.iterrows():
-            if row["Yrs"] != row["Yrs"]:
-                continue
-            year = int(row["Start"])
-            age = row["Age                     At Signing"]
-            player_id = name_finder.get_player_id(
-                row["Player"], year, age=int(age) if age == age else None
-            )
-            if player_id is None:
-                continue
-            player_options, team_options = options.get(player_id, (0, 0))
-            option_1, option_2 = None, None
-            if player_options > 0:
-                option_1 = "Player"
-            if player_options == 2:
-                option_2 = "Player"
-            if team_options > 0:
-                option_1 = "Team"
-            if team_options == 2:
-                option_2 = "Team"
-            team = row["Team                     Signed With"][:3]
-            yield Contract(
-                player_id=player_id,
-                team_id=name_finder.get_team(team),
-                value=parse_dollars(row["Value"])
-                if row["Value"] == row["Value"]
-                else None,
-                start_year=year + 1,
-                duration=int(row["Yrs"]),
-                option_1=option_1,
-                option_2=option_2,
-            )
+    for path in listpathdir(CONTRACTS_DIR):
+        yield from get_contract_objects(path, name_finder, options)
 
 
 def contract_exists(session: Session, obj: Contract) -> bool:
@@ -124,15 +132,25 @@ def contract_exists(session: Session, obj: Contract) -> bool:
     return len(res) > 0
 
 
-def upload_contracts(session: Session) -> None:
-    # session.query(Player).delete()
-    for i, contract in enumerate(get_all_contract_objects()):
+def upload_contract_objects(session: Session, contracts: Iterable[Contract]) -> None:
+    for contract in contracts:
         if contract_exists(session, contract):
             continue
         session.add(contract)
         session.commit()
 
 
+def upload_contract_file(session: Session, path: str) -> None:
+    upload_contract_objects(
+        session, get_contract_objects(path, process_name_finder(), get_options())
+    )
+
+
+def upload_contracts(session: Session) -> None:
+    # session.query(Player).delete()
+    upload_contract_objects(session, get_all_contract_objects())
+
+
 if __name__ == "__main__":
     with get_session() as session:
         upload_contracts(session)
@@ -4,6 +4,7 @@ from sqlalchemy import select
 
 from app.data.connection import get_session
 from app.data.league import Season
+from app.data.league.season_caps import reset_season_caps
 
 if __name__ == "__main__":
     with get_session() as session:
@@ -25,3 +26,4 @@ if __name__ == "__main__":
                 )
                 season.expected_cap = round(this_cap * interest)
                 session.commit()
+        reset_season_caps(session)
@@ -9,8 +9,9 @@ from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.data.connection import get_session
 from app.data.league.contract import Contract
+from app.data.league.player.earnings import refresh_player_earnings
 from app.data.league.team.payroll import TeamPlayerBuyout, TeamPlayerSalary
-from app.utils.name_matcher import NameMatchFinder
+from app.utils.name_matcher import NameMatchFinder, process_name_finder
 
 
 def get_salary_object(
@@ -72,9 +73,17 @@ def add_to_existed_list(name: str) -> None:
         res = json.dump(sorted(res), f, indent=4)
 
 
-def get_all_salary_objects() -> Iterable[TeamPlayerSalary | TeamPlayerBuyout]:
-    name_finder = NameMatchFinder()
+PAYROLL_DIR = "data/payroll-team-year"
+
+
+def payroll_files() -> list[str]:
+    """one csv per team-year (plus a dead-money copy), the unit of work for workers"""
+    return sorted(os.listdir(PAYROLL_DIR))
+
 
+def get_salary_objects(
+    file: str, name_finder: NameMatchFinder, directory: str = PAYROLL_DIR
+) -> Iterable[TeamPlayerSalary | TeamPlayerBuyout]:
     def get_player_id(year: int, player_col: str, row: Series) -> int | None:
         if (
             row[player_col] == "Incomplete Roster Charge"
@@ -93,25 +102,30 @@ def get_all_salary_objects() -> Iterable[TeamPlayerSalary | TeamPlayerBuyout]:
             return None
         return player_id
 
-    for file in sorted(os.listdir("data/payroll-team-year")):
-        path = f"data/payroll-team-year/{file}"
-        year = int(file[-10:-6])
-        copy = file[-5]
-        team = file[:-11]
-        df = read_csv(path)
-        if copy == "0":
-            buyout = False
-        elif " " in df.columns[1:]:
-            continue
-        else:
-            buyout = True
+    path = f"{directory}/{file}"
+    year = int(file[-10:-6])
+    copy = file[-5]
+    team = file[:-11]
+    df = read_csv(path)
+    if copy == "0":
+        buyout = False
+    elif " " in df.columns[1:]:
+        return
+    else:
+        buyout = True
+
+    player_col: str = next(col for col in df if "Player" in col)  # type: ignore
+    for _, row in df.iterrows():
+        if player_id := get_player_id(year, player_col, row):
+            yield get_salary_object(
+                row, name_finder.get_team(team), player_id, year, buyout
+            )
 
-        player_col: str = next(col for col in df if "Player" in col)  # type: ignore
-        for _, row in df.iterrows():
-            if player_id := get_player_id(year, player_col, row):
-                yield get_salary_object(
-                    row, name_finder.get_team(team), player_id, year, buyout
-                )
+
+def get_all_salary_objects() -> Iterable[TeamPlayerSalary | TeamPlayerBuyout]:
+    name_finder = NameMatchFinder()
+    for file in payroll_files():
+        yield from get_salary_objects(file, name_finder)
 
 
 def salary_exists(session: Session, obj: TeamPlayerSalary) -> bool:
@@ -140,9 +154,10 @@ def buyout_exists(session: Session, obj: TeamPlayerBuyout) -> bool:
     return len(res) > 0
 
 
-def upload_payrolls(session: Session) -> None:
-    # session.query(Player).delete()
-    for i, player in enumerate(get_all_salary_objects()):
+def upload_salary_objects(
+    session: Session, objects: Iterable[TeamPlayerSalary | TeamPlayerBuyout]
+) -> None:
+    for player in objects:
         if isinstance(player, TeamPlayerSalary) and salary_exists(session, player):
             continue
         if isinstance(player, TeamPlayerBuyout) and buyout_exists(session, player):
@@ -151,6 +166,16 @@ def upload_payrolls(session: Session) -> None:
         session.commit()
 
 
+def upload_payroll_file(session: Session, file: str) -> None:
+    upload_salary_objects(session, get_salary_objects(file, process_name_finder()))
+
+
+def upload_payrolls(session: Session) -> None:
+    # session.query(Player).delete()
+    upload_salary_objects(session, get_all_salary_objects())
+    refresh_player_earnings(session)
+
+
 if __name__ == "__main__":
     with get_session() as session:
         upload_payrolls(session)
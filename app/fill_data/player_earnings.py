@@ -0,0 +1,6 @@
+from app.data.connection import get_session
+from app.data.league.player.earnings import refresh_player_earnings
+
+if __name__ == "__main__":
+    with get_session() as session:
+        refresh_player_earnings(session)
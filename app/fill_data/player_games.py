@@ -0,0 +1,189 @@
+from collections.abc import Iterable
+from typing import Literal
+
+from nba_api.stats.endpoints import leaguegamelog
+from pandas import DataFrame, Series, concat, merge, to_datetime
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.data.connection import get_session
+from app.data.league.game import Game
+from app.data.league.player import PlayerSeason
+from app.data.league.player.game import create_player_games_partition
+from app.fill_data.team_seasons import season_str_from_year
+from app.fill_data.teams import team_id_map
+from app.utils.math_utils import delay_seconds
+
+SeasonType = Literal["Regular Season", "Playoffs"]
+
+# league game log columns -> player_games columns, in COPY order
+PLAYER_GAME_COLUMNS = {
+    "GAME_ID": "game_id",
+    "PLAYER_SEASON_ID": "player_season_id",
+    "TEAM_ID": "team_id",
+    "SEASON_ID": "season_id",
+    "GAME_DATE": "game_date",
+    "IS_HOME_GAME": "is_home_game",
+    "MIN": "minutes_played",
+    "PTS": "points",
+    "FGM": "field_goals_made",
+    "FGA": "field_goals_attempted",
+    "FG3M": "three_pointers_made",
+    "FG3A": "three_pointers_attempted",
+    "FTM": "free_throws_made",
+    "FTA": "free_throws_attempted",
+    "OREB": "offensive_rebounds",
+    "DREB": "defensive_rebounds",
+    "REB": "total_rebounds",
+    "AST": "assists",
+    "STL": "steals",
+    "BLK": "blocks",
+    "TOV": "turnovers",
+    "PF": "personal_fouls",
+    "PLUS_MINUS": "plus_minus",
+}
+COUNTING_STATS = list(PLAYER_GAME_COLUMNS)[7:]
+
+
+def fetch_league_game_log(
+    season: int,
+    player_or_team: Literal["P", "T"],
+    season_type: SeasonType = "Regular Season",
+) -> DataFrame:
+    """every player (or team) row of every game in a season, in one call"""
+    return leaguegamelog.LeagueGameLog(
+        season=season_str_from_year(season),
+        player_or_team_abbreviation=player_or_team,
+        season_type_all_star=season_type,
+        timeout=100,
+    ).get_data_frames()[0]
+
+
+def parse_minutes(minutes: Series) -> Series:
+    """older logs report "MM:SS" strings, newer ones plain minutes"""
+    as_text = minutes.astype(str)
+    if not as_text.str.contains(":").any():
+        return minutes.astype(float)
+    parts = as_text.str.split(":", expand=True).astype(float).fillna(0)
+    return parts[0] + parts[1] / 60
+
+
+def parse_games(team_log: DataFrame, season: int, season_type: SeasonType) -> DataFrame:
+    team_log = team_log.assign(
+        GAME_ID=team_log["GAME_ID"].astype(int),
+        TEAM_ID=team_log["TEAM_ID"].map(team_id_map),
+        IS_HOME_GAME=team_log["MATCHUP"].str.contains(" vs. ", regex=False),
+    )
+    home = team_log[team_log["IS_HOME_GAME"]]
+    away = team_log[~team_log["IS_HOME_GAME"]]
+    games = merge(
+        home[["GAME_ID", "GAME_DATE", "TEAM_ID", "PTS", "WL"]],
+        away[["GAME_ID", "TEAM_ID", "PTS"]],
+        on="GAME_ID",
+        suffixes=("_HOME", "_AWAY"),
+    )
+
+    return DataFrame(
+        {
+            "id": games["GAME_ID"],
+            "date": to_datetime(games["GAME_DATE"]).dt.date,
+            "season_id": season,
+            "home_team_id": games["TEAM_ID_HOME"],
+            "away_team_id": games["TEAM_ID_AWAY"],
+            "home_team_score": games["PTS_HOME"],
+            "away_team_score": games["PTS_AWAY"],
+            "winning_team_id": games["TEAM_ID_HOME"].where(
+                games["WL"] == "W", games["TEAM_ID_AWAY"]
+            ),
+            "game_type": "Regular" if season_type == "Regular Season" else season_type,
+        }
+    )
+
+
+def parse_player_games(
+    player_log: DataFrame,
+    season: int,
+    player_season_ids: dict[tuple[int, int], int],
+) -> DataFrame:
+    """vectorized PlayerGame.from_advanced_boxscore for a whole season log"""
+    player_log = player_log.assign(
+        PLAYER_SEASON_ID=[
+            player_season_ids.get((player_id, season))
+            for player_id in player_log["PLAYER_ID"]
+        ],
+        SEASON_ID=season,
+        GAME_ID=player_log["GAME_ID"].astype(int),
+        TEAM_ID=player_log["TEAM_ID"].map(team_id_map),
+        GAME_DATE=to_datetime(player_log["GAME_DATE"]).dt.date,
+        IS_HOME_GAME=player_log["MATCHUP"].str.contains(" vs. ", regex=False),
+        MIN=parse_minutes(player_log["MIN"].fillna(0)),
+    )
+    # only players we track (the ones with a player_seasons row)
+    player_log = player_log.dropna(subset=["PLAYER_SEASON_ID", "TEAM_ID"])
+    player_log[COUNTING_STATS] = player_log[COUNTING_STATS].fillna(0).astype(int)
+
+    return (
+        player_log[list(PLAYER_GAME_COLUMNS)]
+        .astype({"PLAYER_SEASON_ID": int, "TEAM_ID": int})
+        .rename(columns=PLAYER_GAME_COLUMNS)
+    )
+
+
+def get_player_season_ids(session: Session, season: int) -> dict[tuple[int, int], int]:
+    stmt = select(
+        PlayerSeason.player_id, PlayerSeason.season_id, PlayerSeason.id
+    ).where(PlayerSeason.season_id == season)
+    return {
+        (player_id, season_id): id
+        for player_id, season_id, id in session.execute(stmt).tuples()
+    }
+
+
+def upload_games(session: Session, games: DataFrame) -> None:
+    if games.empty:
+        return
+    session.execute(
+        insert(Game).values(games.to_dict("records")).on_conflict_do_nothing()
+    )
+
+
+def copy_player_games(session: Session, season: int, player_games: DataFrame) -> None:
+    """replace a season's partition with a single COPY, so reruns are idempotent"""
+    partition = create_player_games_partition(session, season)
+    session.execute(text(f"TRUNCATE {partition}"))
+
+    columns = ", ".join(player_games.columns)
+    cursor = session.connection().connection.driver_connection.cursor()
+    with cursor.copy(
+        f"COPY {partition} ({columns}) FROM STDIN WITH (FORMAT csv)"
+    ) as copy:
+        copy.write(player_games.to_csv(index=False, header=False))
+
+
+def upload_season_player_games(session: Session, season: int) -> None:
+    """4 requests per season instead of one per box score"""
+    player_season_ids = get_player_season_ids(session, season)
+    games, player_games = [], []
+    for season_type in ("Regular Season", "Playoffs"):
+        team_log = fetch_league_game_log(season, "T", season_type)
+        player_log = fetch_league_game_log(season, "P", season_type)
+        games.append(parse_games(team_log, season, season_type))
+        player_games.append(parse_player_games(player_log, season, player_season_ids))
+
+    upload_games(session, concat(games))
+    copy_player_games(session, season, concat(player_games))
+    session.commit()
+
+
+def upload_player_games(
+    session: Session, seasons: Iterable[int] = range(2005, 2027)
+) -> None:
+    for season in seasons:
+        upload_season_player_games(session, season)
+        delay_seconds(5, 1)
+
+
+if __name__ == "__main__":
+    with get_session() as session:
+        upload_player_games(session)
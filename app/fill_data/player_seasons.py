@@ -98,25 +98,35 @@ def player_season_ids(session: Session) -> set[tuple[int, int]]:
     )
 
 
-def upload_player_seasons(session: Session) -> None:
-    player_season: set[tuple[int, int]] = player_season_ids(session)
+def upload_season_player_seasons(
+    session: Session,
+    season: int,
+    player_season: set[tuple[int, int]] | None = None,
+) -> None:
+    if player_season is None:
+        player_season = player_season_ids(session)
 
-    for season in range(2004, 2027):  # up to 2025-26
-        stats = fetch_player_season_stats(season)
-        for player_id in set(stats).intersection(player_ids_to_get(session)):
-            data = stats[player_id]
-            if (player_id, season) in player_season:
-                continue
+    stats = fetch_player_season_stats(season)
+    for player_id in set(stats).intersection(player_ids_to_get(session)):
+        data = stats[player_id]
+        if (player_id, season) in player_season:
+            continue
 
-            # Map NBA API stats to your model fields
+        # Map NBA API stats to your model fields
 
-            ps = PlayerSeason.from_nba_api_json(
-                player_id, get_team_id(data["TEAM_ID"]), season, data
-            )
+        ps = PlayerSeason.from_nba_api_json(
+            player_id, get_team_id(data["TEAM_ID"]), season, data
+        )
 
-            session.add(ps)
-            session.commit()
+        session.add(ps)
+        session.commit()
 
+
+def upload_player_seasons(session: Session) -> None:
+    player_season: set[tuple[int, int]] = player_season_ids(session)
+
+    for season in range(2004, 2027):  # up to 2025-26
+        upload_season_player_seasons(session, season, player_season)
         delay_seconds(5, 5)
 
 
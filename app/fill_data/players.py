@@ -84,8 +84,8 @@ def get_all_player_ids(active_only: bool = False) -> list[int]:
     return [p["id"] for p in all_players]
 
 
-def get_all_players() -> Iterable[Player]:
-    for player_id in get_all_player_ids():
+def get_all_players(player_ids: Iterable[int] | None = None) -> Iterable[Player]:
+    for player_id in get_all_player_ids() if player_ids is None else player_ids:
         attempt = 0
         while True:  # keep retrying until successful
             try:
@@ -106,9 +106,11 @@ def get_all_players() -> Iterable[Player]:
         time.sleep(5)
 
 
-def upload_players(session: Session) -> None:
+def upload_players(session: Session, player_ids: Iterable[int] | None = None) -> None:
     # session.query(Player).delete()
-    for i, player in enumerate(get_all_players()):
+    for i, player in enumerate(get_all_players(player_ids)):
+        if session.get(Player, player.id) is not None:
+            continue
         session.add(player)
         session.commit()
 
@@ -1,11 +1,15 @@
+from __future__ import annotations
+
 import pickle
 import re
+import threading
 import unicodedata
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, time
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
 from typing import Any
 
 import joblib
@@ -13,13 +17,13 @@ import requests
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry  # type: ignore[unreolved-import]
-from sqlalchemy import and_, select
+from sqlalchemy import func, select, update
 from sqlalchemy.orm.session import Session
 
 from app.data.connection import get_session
 from app.data.league.player import Player
 from app.data.league.prospect import DraftProspect
-from app.utils.math_utils import delay_seconds
+from app.utils.math_utils import delay_seconds_count
 from app.utils.name_matcher import NameMatchFinder
 
 
@@ -59,7 +63,11 @@ def parse_tankathon_past_draft(
     slugs = set(get_slugs(soup))
 
     if collect_only_missing:
-        stmt = select(DraftProspect.tankathon_slug)
+        stmt = (
+            select(DraftProspect.tankathon_slug)
+            .where(DraftProspect.tankathon_slug.in_(slugs))
+            .distinct()
+        )
         ignore_players = set(s[0] for s in session.execute(stmt).all())
     else:
         ignore_players = set()
@@ -87,10 +95,18 @@ def parse_big_board(soup: BeautifulSoup) -> tuple[datetime, list[str]]:
     return datetime.fromisoformat(dt_tag["datetime"]), list(players)
 
 
-def fetch_player_page(slug: str) -> BeautifulSoup:
-    url = f"https://www.tankathon.com/players/{slug}"
+# -----------------------
+# requests session setup
+# -----------------------
+
+# one request every 5 seconds on average, shared by every worker
+REQUESTS_PER_MINUTE = 12
+WORKERS = 4
+CHECKPOINT_DIR = Path("pickles/checkpoints")
 
-    # Set up session with retries
+
+def tankathon_session(pool_size: int = WORKERS) -> requests.Session:
+    """a pooled session, so workers reuse connections instead of reconnecting"""
     session = requests.Session()
     retry_strategy = Retry(
         total=3,  # Number of retries
@@ -98,12 +114,92 @@ def fetch_player_page(slug: str) -> BeautifulSoup:
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["GET"],
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=1,
+        pool_maxsize=pool_size,
+    )
     session.mount("https://", adapter)
+    return session
+
+
+SESSION = tankathon_session()
 
+
+def fetch_player_html(slug: str, session: requests.Session = SESSION) -> str:
+    url = f"https://www.tankathon.com/players/{slug}"
     response = session.get(url, timeout=120)
     response.raise_for_status()
-    return BeautifulSoup(response.text, "lxml")
+    return response.text
+
+
+def fetch_player_page(slug: str, session: requests.Session = SESSION) -> BeautifulSoup:
+    return BeautifulSoup(fetch_player_html(slug, session), "lxml")
+
+
+class RateLimiter:
+    """
+    spaces out request starts across threads: `per_minute` on average, each
+    gap drawn from a gamma distribution so the requests don't look scripted
+    """
+
+    def __init__(
+        self,
+        per_minute: float = REQUESTS_PER_MINUTE,
+        *,
+        jitter: bool = True,
+        clock: Callable[[], float] = monotonic,
+        sleep: Callable[[float], None] = sleep,
+    ) -> None:
+        self.interval = 60 / per_minute
+        self.jitter = jitter
+        self.clock = clock
+        self.sleep = sleep
+        self.next_slot = clock()
+        self.lock = threading.Lock()
+
+    def gap(self) -> float:
+        if not self.jitter:
+            return self.interval
+        # shape 5 keeps the gaps near the mean
+        return delay_seconds_count(5.0, self.interval / 5)
+
+    def wait(self) -> None:
+        with self.lock:
+            now = self.clock()
+            start = max(now, self.next_slot)
+            self.next_slot = start + self.gap()
+        if start > now:
+            self.sleep(start - now)
+
+
+@dataclass
+class Checkpoint:
+    """the slugs a job has stored, one per line, appended as batches commit"""
+
+    path: Path
+    done: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        if self.path.exists():
+            self.done = set(self.path.read_text().split())
+
+    @classmethod
+    def for_job(cls, name: str, directory: Path = CHECKPOINT_DIR) -> Checkpoint:
+        return cls(directory / f"{name}.txt")
+
+    def add(self, slugs: Iterable[str]) -> None:
+        new = [slug for slug in slugs if slug not in self.done]
+        if not new:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as file:
+            file.write("".join(f"{slug}\n" for slug in new))
+        self.done.update(new)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self.done.clear()
 
 
 def normalize_latin_letters(text: str) -> str:
@@ -143,15 +239,176 @@ def get_player_ids_from_slugs(session: Session, slugs: list[str]) -> list[int |
     return res
 
 
-def get_prospect_from_tankathon(dt: datetime, player_slug: str) -> DraftProspect:
-    return DraftProspect.from_beautiful_soup(
+def get_prospect_from_tankathon(
+    dt: datetime, player_slug: str, session: requests.Session = SESSION
+) -> DraftProspect:
+    return DraftProspect.from_html(
         dt,
-        fetch_player_page(player_slug),
+        fetch_player_html(player_slug, session),
         tankathon_slug=player_slug,
         year=dt.year,
     )
 
 
+@dataclass
+class IngestionResult:
+    inserted: int = 0
+    # fetched, but the same as the latest snapshot
+    unchanged: int = 0
+    skipped: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+def fetch_prospects(
+    dt: datetime,
+    slugs: Iterable[str],
+    *,
+    workers: int = WORKERS,
+    limiter: RateLimiter | None = None,
+    fetch: Callable[[datetime, str], DraftProspect] = get_prospect_from_tankathon,
+) -> Iterator[tuple[str, DraftProspect | Exception]]:
+    """
+    (slug, prospect or the error fetching it), in completion order. At most
+    `workers` pages are in flight, and every request waits on `limiter`
+    """
+    limiter = limiter or RateLimiter()
+
+    def polite_fetch(slug: str) -> DraftProspect:
+        limiter.wait()
+        return fetch(dt, slug)
+
+    pending = iter(slugs)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight: dict[Future[DraftProspect], str] = {}
+        while True:
+            # top up to `workers`, so slugs aren't all queued up front
+            for slug in pending:
+                in_flight[pool.submit(polite_fetch, slug)] = slug
+                if len(in_flight) >= workers:
+                    break
+            if not in_flight:
+                return
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                slug = in_flight.pop(future)
+                error = future.exception()
+                yield slug, future.result() if error is None else error
+
+
+def stored_slugs(session: Session, dt: datetime, slugs: Iterable[str]) -> set[str]:
+    """the slugs with a snapshot covering `dt`"""
+    return set(
+        session.scalars(
+            select(DraftProspect.tankathon_slug).where(
+                DraftProspect.tankathon_slug.in_(list(slugs)),
+                DraftProspect.uploaded <= dt,
+                DraftProspect.last_seen >= dt,
+            )
+        )
+    )
+
+
+def record_snapshots(
+    session: Session, dt: datetime, prospects: list[DraftProspect]
+) -> int:
+    """
+    adds the prospects that changed since their latest snapshot before `dt`
+    and extends the unchanged snapshots' last_seen to `dt` instead. Returns
+    how many rows were added
+    """
+    previous = {
+        slug: (snapshot_id, content_hash)
+        for slug, snapshot_id, content_hash in session.execute(
+            select(
+                DraftProspect.tankathon_slug,
+                DraftProspect.id,
+                DraftProspect.content_hash,
+            )
+            .where(
+                DraftProspect.tankathon_slug.in_(
+                    [prospect.tankathon_slug for prospect in prospects]
+                ),
+                DraftProspect.uploaded <= dt,
+            )
+            .distinct(DraftProspect.tankathon_slug)
+            .order_by(DraftProspect.tankathon_slug, DraftProspect.uploaded.desc())
+        )
+    }
+    unchanged = []
+    added = 0
+    for prospect in prospects:
+        prospect.content_hash = prospect.snapshot_hash()
+        snapshot_id, content_hash = previous.get(prospect.tankathon_slug, (None, None))
+        if snapshot_id is not None and content_hash == prospect.content_hash:
+            unchanged.append(snapshot_id)
+            continue
+        prospect.last_seen = dt
+        session.add(prospect)
+        added += 1
+    if unchanged:
+        session.execute(
+            update(DraftProspect)
+            .where(DraftProspect.id.in_(unchanged))
+            .values(last_seen=func.greatest(DraftProspect.last_seen, dt))
+        )
+    return added
+
+
+def ingest_prospects(
+    session: Session,
+    dt: datetime,
+    slugs: Iterable[str],
+    *,
+    checkpoint: Checkpoint | None = None,
+    batch_size: int = 25,
+    prepare: Callable[[DraftProspect], None] | None = None,
+    **fetch_options: Any,
+) -> IngestionResult:
+    """
+    fetches every slug not already stored for `dt` (or in the checkpoint) and
+    records them `batch_size` at a time, see record_snapshots. Each committed batch is added to the
+    checkpoint, so an interrupted job picks up where it stopped. `prepare`
+    runs on each prospect before it's added (e.g. to match a player id)
+    """
+    slugs = list(dict.fromkeys(slugs))
+    done = stored_slugs(session, dt, slugs) | (checkpoint.done if checkpoint else set())
+    todo = [slug for slug in slugs if slug not in done]
+    result = IngestionResult(skipped=len(slugs) - len(todo))
+    if checkpoint is not None:
+        # rows committed before the checkpoint was written last time
+        checkpoint.add(slug for slug in slugs if slug in done)
+
+    batch: list[DraftProspect] = []
+
+    def flush() -> None:
+        if not batch:
+            return
+        added = record_snapshots(session, dt, batch)
+        session.commit()
+        if checkpoint is not None:
+            checkpoint.add(prospect.tankathon_slug for prospect in batch)  # type: ignore[misc]
+        result.inserted += added
+        result.unchanged += len(batch) - added
+        print(
+            f"Stored {result.inserted + result.unchanged}/{len(todo)} prospects, "
+            f"{result.unchanged} unchanged"
+        )
+        batch.clear()
+
+    for slug, prospect in fetch_prospects(dt, todo, **fetch_options):
+        if isinstance(prospect, Exception):
+            print(f"Failed to fetch {slug}: {prospect!r}")
+            result.failed[slug] = repr(prospect)
+            continue
+        if prepare is not None:
+            prepare(prospect)
+        batch.append(prospect)
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return result
+
+
 def get_previous_year_params(
     session: Session, year: int, collect_only_missing: bool = True
 ) -> tuple[datetime, list[str]]:
@@ -162,46 +419,70 @@ def get_previous_year_params(
     )
 
 
-def upload_current_big_board() -> None:
+def upload_current_big_board(**options: Any) -> IngestionResult:
     dt, big_board = parse_big_board(get_soup(use_cache=False))
 
     with get_session() as session:
-        for slug in big_board:
-            if prospect_at_date_exists(session, dt, slug):
-                continue
-            session.add(get_prospect_from_tankathon(dt, slug))
-            session.commit()
-            delay_seconds(5, 12)
+        return ingest_prospects(
+            session,
+            dt,
+            big_board,
+            checkpoint=Checkpoint.for_job(f"big-board-{dt:%Y%m%dT%H%M}"),
+            **options,
+        )
 
 
 def prospect_at_date_exists(session: Session, dt: datetime, slug: str) -> bool:
-    return bool(
-        session.execute(
-            select(DraftProspect).where(
-                and_(
-                    DraftProspect.uploaded == dt,
-                    DraftProspect.tankathon_slug == slug,
-                )
-            )
-        ).one_or_none()
-    )
+    return bool(stored_slugs(session, dt, [slug]))
+
+
+def past_draft_checkpoint(
+    year: int, *, collect_only_missing: bool = True, directory: Path = CHECKPOINT_DIR
+) -> Checkpoint:
+    """
+    the draft class' checkpoint, emptied first for a full re-scrape so slugs
+    stored by an earlier run are fetched again
+    """
+    checkpoint = Checkpoint.for_job(f"past-draft-{year}", directory)
+    if not collect_only_missing:
+        checkpoint.clear()
+    return checkpoint
 
 
-def upload_previous_draft(year: int, *, collect_only_missing: bool = True) -> bool:
+def upload_previous_draft(
+    year: int, *, collect_only_missing: bool = True, **options: Any
+) -> bool:
     name_finder = NameMatchFinder()
-    any_uploaded = False
+
+    def match_player(dp: DraftProspect) -> None:
+        dp.player_id = name_finder.get_player_id(dp.name, year, dp.age_at_draft)  # type: ignore
+
     with get_session() as session:
         dt, slugs = get_previous_year_params(
             session, year, collect_only_missing=collect_only_missing
         )
-        for slug in slugs:
-            any_uploaded = True
-            dp = get_prospect_from_tankathon(dt, slug)
-            dp.player_id = name_finder.get_player_id(dp.name, year, dp.age_at_draft)  # type: ignore
-            session.add(dp)
-            session.commit()
-            delay_seconds(5, 12)
-    return any_uploaded
+        ingest_prospects(
+            session,
+            dt,
+            slugs,
+            checkpoint=past_draft_checkpoint(
+                year, collect_only_missing=collect_only_missing
+            ),
+            prepare=match_player,
+            **options,
+        )
+    return bool(slugs)
+
+
+def backfill_previous_drafts(
+    years: Iterable[int], *, collect_only_missing: bool = True, **options: Any
+) -> None:
+    """one draft class after another, all sharing the same politeness limit"""
+    options.setdefault("limiter", RateLimiter())
+    for year in years:
+        upload_previous_draft(
+            year, collect_only_missing=collect_only_missing, **options
+        )
 
 
 def add_missing_player_ids() -> None:
@@ -227,6 +508,5 @@ def add_missing_player_ids() -> None:
 
 if __name__ == "__main__":
     # add_missing_player_ids()
-    # for year in range(2020, 2026):
-    #     upload_previous_draft(year, collect_only_missing=True)
+    # backfill_previous_drafts(range(2020, 2026))
     upload_current_big_board()
@@ -1,44 +1,54 @@
 from pandas import read_csv
 from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
 
 from app.data.connection import get_session
 from app.data.league.season import Season
+from app.data.league.season_caps import reset_season_caps
 
 
 def parse_dollars(value: str) -> int:
     return int(value.replace("$", "").replace(",", ""))
 
 
-if __name__ == "__main__":
-    with get_session() as session:
-        for year, cap, inflation_adjusted in read_csv(
-            filepath_or_buffer="data/cap-by-year.csv", index_col=0
-        ).itertuples():
-            if (
-                session.execute(
-                    select(Season).where(Season.id == year)
-                ).scalar_one_or_none()
-                is not None
-            ):
-                continue
-            session.add(
-                Season(
-                    id=year,
-                    max_salary_cap=parse_dollars(cap) if cap == cap else None,
-                    inflation_adjusted_cap=parse_dollars(inflation_adjusted)
+def upload_seasons(session: Session) -> None:
+    for year, cap, inflation_adjusted in read_csv(
+        filepath_or_buffer="data/cap-by-year.csv", index_col=0
+    ).itertuples():
+        if (
+            session.execute(
+                select(Season).where(Season.id == year)
+            ).scalar_one_or_none()
+            is not None
+        ):
+            continue
+        session.add(
+            Season(
+                id=year,
+                max_salary_cap=parse_dollars(cap) if cap == cap else None,
+                inflation_adjusted_cap=(
+                    parse_dollars(inflation_adjusted)
                     if inflation_adjusted == inflation_adjusted
-                    else None,
-                )
+                    else None
+                ),
             )
-            session.commit()
-
-        for year in range(1950, 2099):
-            if (
-                session.execute(
-                    select(Season).where(Season.id == year)
-                ).scalar_one_or_none()
-                is not None
-            ):
-                continue
-            session.add(Season(id=year))
-            session.commit()
+        )
+        session.commit()
+
+    for year in range(1950, 2099):
+        if (
+            session.execute(
+                select(Season).where(Season.id == year)
+            ).scalar_one_or_none()
+            is not None
+        ):
+            continue
+        session.add(Season(id=year))
+        session.commit()
+
+    reset_season_caps(session)
+
+
+if __name__ == "__main__":
+    with get_session() as session:
+        upload_seasons(session)
@@ -46,11 +46,15 @@ def create_team_seasons(
         yield TeamSeason.from_league_standings_row(team.id, season, row)
 
 
+def upload_season_team_seasons(session: Session, year: int) -> None:
+    for team_season in create_team_seasons(session, year):
+        session.add(team_season)
+        session.commit()
+
+
 def upload_team_seasons(session: Session) -> None:
     for year in range(2000, 2026):
-        for team_season in create_team_seasons(session, year):
-            session.add(team_season)
-            session.commit()
+        upload_season_team_seasons(session, year)
         delay_seconds(0.5, 2)
 
 
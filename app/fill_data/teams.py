@@ -58,10 +58,9 @@ def team_from_row(id: int, row: Series) -> Team:
 
 def upload_teams(session: Session) -> None:
     df = read_csv("data/teams.csv")
-    with get_session() as session:
-        for team in map(lambda row: team_from_row(*row), df.iterrows()):
-            session.add(team)
-        session.commit()
+    for team in map(lambda row: team_from_row(*row), df.iterrows()):
+        session.merge(team)  # by primary key, so reruns don't duplicate
+    session.commit()
 
 
 if __name__ == "__main__":
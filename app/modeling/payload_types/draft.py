@@ -1,7 +1,81 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 from app.modeling.payload_types.core import MLPayload
 
 
 @dataclass
-class DraftMLPayload(MLPayload): ...
+class DraftMLPayload(MLPayload):
+    # ---- identifiers ----
+    draft_year: int
+
+    # ---- profile ----
+    primary_position: str | None
+    secondary_position: str | None
+    height: float | None
+    wingspan: float | None
+    weight: int | None
+    age_at_draft: float | None
+    year: int | None
+    tankathon_big_board_rank: int | None
+    espn_big_board_rank: int | None
+
+    # ---- per game ----
+    games: int | None
+    minutes_per_game: float | None
+    fgm: float | None
+    fga: float | None
+    fg_pct: float | None
+    tpm: float | None
+    tpa: float | None
+    three_pct: float | None
+    ftm: float | None
+    fta: float | None
+    ft_pct: float | None
+    rebounds: float | None
+    assists: float | None
+    steals: float | None
+    blocks: float | None
+    turnovers: float | None
+    fouls: float | None
+    points: float | None
+
+    # ---- per 36 minutes ----
+    p36_fgm: float | None
+    p36_fga: float | None
+    p36_tpm: float | None
+    p36_tpa: float | None
+    p36_ftm: float | None
+    p36_fta: float | None
+    p36_rebounds: float | None
+    p36_assists: float | None
+    p36_steals: float | None
+    p36_blocks: float | None
+    p36_turnovers: float | None
+    p36_fouls: float | None
+    p36_points: float | None
+
+    # ---- advanced ----
+    # BPM and its halves are left out on purpose, they're too collinear
+    # with everything else (see todo.md)
+    true_shooting_pct: float | None
+    effective_fg_pct: float | None
+    three_pa_rate: float | None
+    ft_rate: float | None
+    proj_nba_3p_pct: float | None
+    usage_pct: float | None
+    ast_to_usg: float | None
+    ast_to_to: float | None
+    per_game_performance_rating: float | None
+    ows_per_40: float | None
+    dws_per_40: float | None
+    ws_per_40: float | None
+    offensive_rating: float | None
+    defensive_rating: float | None
+
+
+# the DraftProspect columns the draft model reads, in payload order
+PROSPECT_FEATURES: tuple[str, ...] = tuple(
+    field.name
+    for field in fields(DraftMLPayload)
+    if field.name not in {"relative_dollars", "draft_year"}
+)
@@ -1,9 +1,17 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+from functools import cache
+from operator import attrgetter
+
+import numpy as np
 
 from app.custom_types import MLSafe
 
 
-@dataclass
+@dataclass(slots=True)
 class SeasonalMLPayload:
     # ---- identifiers ----
     team_id: int
@@ -132,61 +140,106 @@ class SeasonalMLPayload:
     pct_pts: float
 
     def no_colinearity(self) -> dict[str, MLSafe]:
-        return {
-            "games_played": self.games_played,
-            "minutes_pg": self.minutes_pg,
-            "points_pg": self.points_pg,
-            "rebounds_pg": self.rebounds_pg,
-            "assists_pg": self.assists_pg,
-            "steals_pg": self.steals_pg,
-            "blocks_pg": self.blocks_pg,
-            "turnovers_pg": self.turnovers_pg,
-            "personal_fouls_pg": self.personal_fouls_pg,
-            "field_goals_made_pg": self.field_goals_made_pg,
-            "field_goals_attempted_pg": self.field_goals_attempted_pg,
-            "three_pointers_made_pg": self.three_pointers_made_pg,
-            "three_pointers_attempted_pg": self.three_pointers_attempted_pg,
-            "two_pointers_made_pg": self.two_pointers_made_pg,
-            "two_pointers_attempted_pg": self.two_pointers_attempted_pg,
-            "free_throws_made_pg": self.free_throws_made_pg,
-            "free_throws_attempted_pg": self.free_throws_attempted_pg,
-            "field_goal_pct": self.field_goal_pct,
-            "three_point_pct": self.three_point_pct,
-            "two_point_pct": self.two_point_pct,
-            "free_throw_pct": self.free_throw_pct,
-            "assist_percentage": self.assist_percentage,
-            "assist_to_turnover": self.assist_to_turnover,
-            "assist_ratio": self.assist_ratio,
-            "offensive_rebound_pct": self.offensive_rebound_pct,
-            "defensive_rebound_pct": self.defensive_rebound_pct,
-            "rebound_pct": self.rebound_pct,
-            "turnover_pct": self.turnover_pct,
-            "usage_pct": self.usage_pct,
-            "offensive_rating": self.offensive_rating,
-            "defensive_rating": self.defensive_rating,
-            "net_rating": self.net_rating,
-            "estimated_offensive_rating": self.estimated_offensive_rating,
-            "estimated_defensive_rating": self.estimated_defensive_rating,
-            "estimated_net_rating": self.estimated_net_rating,
-            "estimated_pace": self.estimated_pace,
-            "pts_off_tov_pg": self.pts_off_tov / self.games_played
-            if self.games_played
-            else 0.0,
-            "possessions_pg": self.possessions / self.games_played
-            if self.games_played
-            else 0.0,
-            "pts_fb_pg": self.pts_fb / self.games_played if self.games_played else 0.0,
-            "pts_paint_pg": self.pts_paint / self.games_played
-            if self.games_played
-            else 0.0,
-            "opp_pts_off_tov_pg": self.opp_pts_off_tov / self.games_played
-            if self.games_played
-            else 0.0,
-            "opp_pts_fb_pg": self.opp_pts_fb / self.games_played
-            if self.games_played
-            else 0.0,
-            "opp_pts_paint_pg": self.opp_pts_paint / self.games_played
-            if self.games_played
-            else 0.0,
-            "plus_minus_pg": self.plus_minus_pg,
-        }
+        return dict(zip(NO_COLINEARITY, self.no_colinearity_values()))
+
+    def no_colinearity_values(self) -> list[MLSafe]:
+        """no_colinearity without the keys, in NO_COLINEARITY order"""
+        games = self.games_played
+        return [
+            (value / games if games else 0.0) if per_game else value
+            for value, per_game in zip(_no_colinearity_sources(self), _PER_GAME)
+        ]
+
+
+# ---- precomputed layout ----
+FIELDS: tuple[str, ...] = tuple(field.name for field in fields(SeasonalMLPayload))
+FIELD_INDEX: dict[str, int] = {name: index for index, name in enumerate(FIELDS)}
+
+# (key, source field, divided by games_played)
+_NO_COLINEARITY: tuple[tuple[str, str, bool], ...] = (
+    *(
+        (name, name, False)
+        for name in (
+            "games_played",
+            "minutes_pg",
+            "points_pg",
+            "rebounds_pg",
+            "assists_pg",
+            "steals_pg",
+            "blocks_pg",
+            "turnovers_pg",
+            "personal_fouls_pg",
+            "field_goals_made_pg",
+            "field_goals_attempted_pg",
+            "three_pointers_made_pg",
+            "three_pointers_attempted_pg",
+            "two_pointers_made_pg",
+            "two_pointers_attempted_pg",
+            "free_throws_made_pg",
+            "free_throws_attempted_pg",
+            "field_goal_pct",
+            "three_point_pct",
+            "two_point_pct",
+            "free_throw_pct",
+            "assist_percentage",
+            "assist_to_turnover",
+            "assist_ratio",
+            "offensive_rebound_pct",
+            "defensive_rebound_pct",
+            "rebound_pct",
+            "turnover_pct",
+            "usage_pct",
+            "offensive_rating",
+            "defensive_rating",
+            "net_rating",
+            "estimated_offensive_rating",
+            "estimated_defensive_rating",
+            "estimated_net_rating",
+            "estimated_pace",
+        )
+    ),
+    ("pts_off_tov_pg", "pts_off_tov", True),
+    ("possessions_pg", "possessions", True),
+    ("pts_fb_pg", "pts_fb", True),
+    ("pts_paint_pg", "pts_paint", True),
+    ("opp_pts_off_tov_pg", "opp_pts_off_tov", True),
+    ("opp_pts_fb_pg", "opp_pts_fb", True),
+    ("opp_pts_paint_pg", "opp_pts_paint", True),
+    ("plus_minus_pg", "plus_minus_pg", False),
+)
+NO_COLINEARITY: tuple[str, ...] = tuple(key for key, _, _ in _NO_COLINEARITY)
+# column indexes into a FIELDS-ordered matrix
+NO_COLINEARITY_INDEX = np.array(
+    [FIELD_INDEX[source] for _, source, _ in _NO_COLINEARITY]
+)
+_PER_GAME = tuple(per_game for _, _, per_game in _NO_COLINEARITY)
+_no_colinearity_sources = attrgetter(*(source for _, source, _ in _NO_COLINEARITY))
+
+
+@cache
+def prefixed(prefix: str) -> tuple[str, ...]:
+    """NO_COLINEARITY keys with `prefix` in front, built once per prefix"""
+    return tuple(sys.intern(prefix + key) for key in NO_COLINEARITY)
+
+
+# ---- batches ----
+def payload_matrix(payloads: Iterable[SeasonalMLPayload]) -> np.ndarray:
+    """(n, len(FIELDS)) float array, one row per payload"""
+    values = attrgetter(*FIELDS)
+    return np.array([values(payload) for payload in payloads], dtype=float).reshape(
+        -1, len(FIELDS)
+    )
+
+
+def no_colinearity_matrix(matrix: np.ndarray) -> np.ndarray:
+    """no_colinearity for every row of a FIELDS-ordered matrix at once"""
+    projected = matrix[:, NO_COLINEARITY_INDEX]
+    games = matrix[:, [FIELD_INDEX["games_played"]]]
+    per_game = np.array(_PER_GAME)
+    projected[:, per_game] = np.divide(
+        projected[:, per_game],
+        games,
+        out=np.zeros((len(matrix), int(per_game.sum()))),
+        where=games != 0,
+    )
+    return projected
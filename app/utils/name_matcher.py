@@ -1,9 +1,12 @@
+from __future__ import annotations
+
 import atexit
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from contextlib import _GeneratorContextManager
 from datetime import datetime
 from difflib import get_close_matches
+from functools import cache
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -12,30 +15,70 @@ from app.data.connection import get_session as get_dev_session
 from app.data.league.player import Player
 from app.data.league.team.core import Team
 
+NAME_MAP_PATH = "data/name-map.json"
+
 
 class NameMatchFinder:
     def __init__(
         self,
-        get_session: Callable[..., _GeneratorContextManager[Session, None, None]]
-        | None = None,
+        get_session: (
+            Callable[..., _GeneratorContextManager[Session, None, None]] | None
+        ) = None,
+        *,
+        players: Iterable[tuple[int, str, str]] | None = None,
+        teams: Iterable[tuple[str, str, int]] | None = None,
+        data: dict[str, int | None] | None = None,
+        path: str | None = NAME_MAP_PATH,
     ) -> None:
-        if get_session is None:
-            get_session = get_dev_session
+        """
+        (id, birth_date, name) players and (name, abbreviation, id) teams are
+        read from the database unless given. Matches start from `data`, else
+        the map at `path`, and are saved back there at exit (never without one)
+        """
+        if players is None or teams is None:
+            players, teams = self.load_league(get_session or get_dev_session)
+        self.ids, bdays, self.names = tuple(zip(*players))
+        self.bdays = list(map(datetime.fromisoformat, bdays))
+        teams = list(teams)
+        self.team_map: dict[str, int] = {name: id for name, _, id in teams}
+        self.team_abbr_map: dict[str, int] = {
+            abbreviation: id for _, abbreviation, id in teams
+        }
+
+        self.path = path
+        if data is None and path is not None:
+            with open(path) as f:
+                data = json.load(f)
+        self.data: dict[str, int | None] = {} if data is None else data
+
+        if path is not None:
+            atexit.register(self.save)
+
+    @staticmethod
+    def load_league(
+        get_session: Callable[..., _GeneratorContextManager[Session, None, None]],
+    ) -> tuple[list[tuple[int, str, str]], list[tuple[str, str, int]]]:
         with get_session() as session:
-            get = select(Player.id, Player.birth_date, Player.name)
-            self.ids, self.bdays, self.names = tuple(zip(*session.execute(get).all()))
-            self.bdays = list(map(datetime.fromisoformat, self.bdays))
-            get = select(Team.name, Team.id)
-            self.team_map: dict[str, int] = dict(session.execute(get).all())  # type: ignore
-            get = select(Team.abbreviation, Team.id)
-            self.team_abbr_map: dict[str, int] = dict(session.execute(get).all())  # type: ignore
-        with open("data/name-map.json") as f:
-            self.data: dict[str, int | None] = json.load(f)
-
-        atexit.register(self.save)
+            players = session.execute(
+                select(Player.id, Player.birth_date, Player.name)
+            ).all()
+            teams = session.execute(select(Team.name, Team.abbreviation, Team.id)).all()
+        return [tuple(row) for row in players], [tuple(row) for row in teams]
+
+    @classmethod
+    def in_memory(
+        cls,
+        players: Iterable[tuple[int, str, str]],
+        teams: Iterable[tuple[str, str, int]],
+        data: dict[str, int | None] | None = None,
+    ) -> NameMatchFinder:
+        """without the database or name-map.json, matches aren't saved"""
+        return cls(players=players, teams=teams, data=data, path=None)
 
     def save(self) -> None:
-        with open("data/name-map.json", "w") as f:
+        if self.path is None:
+            return
+        with open(self.path, "w") as f:
             json.dump(dict(sorted(self.data.items())), f, indent=4)
 
     def get_team(self, name: str) -> int:
@@ -98,3 +141,12 @@ class NameMatchFinder:
 
         self.save()
         return self.data[name]
+
+
+@cache
+def process_name_finder() -> NameMatchFinder:
+    """
+    one finder per process, for tasks that each match a single file: the
+    league is loaded once and only one finder saves the map at exit
+    """
+    return NameMatchFinder()
@@ -0,0 +1,228 @@
+"""
+stage timings for long running scripts (the ML pipeline mostly).
+
+    with trace("train_models") as run:
+        with stage("feature_building"):
+            ...
+    run.write("trace.json")
+
+Each stage records wall time, CPU time and peak RSS. Outside a trace block
+stage() does nothing, so it can stay in library code.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import resource
+import sys
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Any, Literal, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+Profiler = Literal["cprofile", "pyinstrument"]
+
+_ACTIVE: ContextVar[Trace | None] = ContextVar("active_trace", default=None)
+
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+_STATUS = Path("/proc/self/status")
+
+
+def _high_water_mark_mb() -> float:
+    """peak RSS since the last reset (linux) or since the process started"""
+    try:
+        for line in _STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macos
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _reset_high_water_mark() -> None:
+    """
+    start measuring the peak from the current RSS. Linux only, elsewhere every
+    stage reports the process-wide peak
+    """
+    try:
+        _CLEAR_REFS.write_text("5")
+    except OSError:
+        pass
+
+
+@dataclass
+class StageTiming:
+    name: str
+    parent: str | None
+    started_at: float  # seconds after the trace started
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0  # every thread of the process, so can exceed wall
+    peak_rss_mb: float = 0.0
+    profile: str | None = None  # path of the saved profile, if one was taken
+
+
+@dataclass
+class Trace:
+    name: str
+    stages: list[StageTiming] = field(default_factory=list)
+    profile_stages: set[str] = field(default_factory=set)
+    profiler: Profiler = "cprofile"
+    profile_dir: Path = Path(".")
+    wall_seconds: float = 0.0  # set when the trace block exits
+    # the peak is reset when a stage starts, so stages that are still open
+    # keep the highest value seen before each reset
+    _open: list[StageTiming] = field(default_factory=list, repr=False)
+    _started: float = field(default_factory=perf_counter, repr=False)
+
+    @contextmanager
+    def stage(self, name: str) -> Generator[StageTiming, None, None]:
+        timing = StageTiming(
+            name,
+            parent=self._open[-1].name if self._open else None,
+            started_at=perf_counter() - self._started,
+        )
+        self._fold_peak()
+        _reset_high_water_mark()
+        self._open.append(timing)
+        self.stages.append(timing)
+
+        wall, cpu = perf_counter(), process_time()
+        try:
+            if name in self.profile_stages:
+                with self._profile(timing):
+                    yield timing
+            else:
+                yield timing
+        finally:
+            timing.wall_seconds = perf_counter() - wall
+            timing.cpu_seconds = process_time() - cpu
+            self._fold_peak()
+            self._open.pop()
+
+    def _fold_peak(self) -> None:
+        peak = _high_water_mark_mb()
+        for timing in self._open:
+            timing.peak_rss_mb = max(timing.peak_rss_mb, peak)
+
+    @contextmanager
+    def _profile(self, timing: StageTiming) -> Generator[None, None, None]:
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        if self.profiler == "pyinstrument":
+            try:
+                from pyinstrument import Profiler as Pyinstrument
+            except ImportError:
+                raise Exception("pyinstrument isn't installed, use profiler='cprofile'")
+            path = self.profile_dir / f"{self.name}.{timing.name}.html"
+            profiler = Pyinstrument()
+            profiler.start()
+            try:
+                yield
+            finally:
+                profiler.stop()
+                path.write_text(profiler.output_html())
+        else:
+            path = self.profile_dir / f"{self.name}.{timing.name}.prof"
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                profiler.dump_stats(path)
+        timing.profile = str(path)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall_seconds": self.wall_seconds or perf_counter() - self._started,
+            "stages": [asdict(timing) for timing in self.stages],
+        }
+
+    def write(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return path
+
+    def summary(self) -> str:
+        lines = [f"{'stage':<32} {'wall s':>9} {'cpu s':>9} {'peak MB':>9}"]
+        depth: dict[str | None, int] = {None: -1}
+        for timing in self.stages:
+            depth[timing.name] = depth.get(timing.parent, -1) + 1
+            label = "  " * depth[timing.name] + timing.name
+            lines.append(
+                f"{label:<32} {timing.wall_seconds:>9.2f} "
+                f"{timing.cpu_seconds:>9.2f} {timing.peak_rss_mb:>9.0f}"
+            )
+        return "\n".join(lines)
+
+
+def profile_stages_from_env() -> set[str]:
+    """TRACE_PROFILE=optuna_search,fit_and_score"""
+    names = os.environ.get("TRACE_PROFILE", "")
+    return {name.strip() for name in names.split(",") if name.strip()}
+
+
+@contextmanager
+def trace(
+    name: str,
+    profile_stages: Iterable[str] | None = None,
+    profiler: Profiler = "cprofile",
+    profile_dir: str | Path = ".",
+) -> Generator[Trace, None, None]:
+    """
+    collect every stage() run in the block. Stages named in `profile_stages`
+    (default: the TRACE_PROFILE environment variable) are also profiled
+    """
+    run = Trace(
+        name,
+        profile_stages=set(
+            profile_stages_from_env() if profile_stages is None else profile_stages
+        ),
+        profiler=profiler,
+        profile_dir=Path(profile_dir),
+    )
+    token = _ACTIVE.set(run)
+    try:
+        yield run
+    finally:
+        run.wall_seconds = perf_counter() - run._started
+        _ACTIVE.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Generator[StageTiming | None, None, None]:
+    """time the block as part of the active trace, a no-op without one"""
+    run = _ACTIVE.get()
+    if run is None:
+        yield None
+        return
+    with run.stage(name) as timing:
+        yield timing
+
+
+def traced(name: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """decorator version of stage(), named after the function by default"""
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        stage_name = name or function.__name__
+
+        @wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with stage(stage_name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
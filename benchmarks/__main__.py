@@ -0,0 +1,95 @@
+"""
+    python -m benchmarks --scale 10000                 # run and print
+    python -m benchmarks --scale 10000 --save-baseline # store as the baseline
+    python -m benchmarks --scale 10000 --compare       # fail on >10% regressions
+
+Results go to .benchmarks/<timestamp>.json, the baseline to
+.benchmarks/baseline.json (pass a path to --compare to use another run). Only
+runs at the same --scale are compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+import benchmarks.hot_paths  # noqa: F401 (registers the benchmarks)
+from benchmarks.fixtures import League
+from benchmarks.harness import (
+    BASELINE_PATH,
+    BENCHMARKS,
+    RESULTS_DIR,
+    compare,
+    format_comparison,
+    format_result,
+    load_context,
+    load_results,
+    run,
+    save_results,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--scale", type=int, default=1_000, help="players to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=None)
+    parser.add_argument("-k", dest="names", nargs="*", choices=sorted(BENCHMARKS))
+    parser.add_argument("--save", type=Path, default=None)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--compare", type=Path, nargs="?", const=BASELINE_PATH, default=None
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 = 10%%"
+    )
+    args = parser.parse_args(argv)
+
+    start = perf_counter()
+    league = League(args.scale, args.seed)
+    print(f"{args.scale:,} players, {len(league.seasons):,} seasons", end=" ")
+    print(f"built in {perf_counter() - start:.1f}s")
+
+    results = run(
+        league, args.names, args.rounds, report=lambda r: print(format_result(r))
+    )
+
+    context = {"scale": args.scale, "seed": args.seed}
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = save_results(
+        results, args.save or RESULTS_DIR / f"{timestamp}.json", **context
+    )
+    print(f"saved {path}")
+    if args.save_baseline:
+        print(f"saved {save_results(results, BASELINE_PATH, **context)}")
+
+    if args.compare is None:
+        return 0
+    if not args.compare.exists():
+        print(f"no baseline at {args.compare}, run with --save-baseline first")
+        return 1
+    comparisons, regressions = compare(
+        results,
+        load_results(args.compare),
+        args.threshold,
+        context=context,
+        baseline_context=load_context(args.compare),
+    )
+    print(f"\ncompared with {args.compare}")
+    for comparison in comparisons:
+        print(format_comparison(comparison))
+    if regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) more than {args.threshold:.0%} slower:"
+        )
+        for comparison in regressions:
+            print("  " + format_comparison(comparison))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
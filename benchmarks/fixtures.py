@@ -0,0 +1,305 @@
+"""
+the synthetic league (app.data.synthetic) as transient ORM objects, no postgres
+or network. Players have their seasons, salaries, contracts and awards
+attached, so the model methods run exactly as they do on loaded rows.
+"""
+
+from __future__ import annotations
+
+import csv
+import tempfile
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+from pandas import DataFrame, Series
+
+from app.base import Base
+from app.crud.read.contract_supporting_info import (
+    contracts_frame,
+    write_contracts_dataset,
+)
+from app.data.league import (
+    Award,
+    Contract,
+    Player,
+    PlayerSeason,
+    Season,
+    Team,
+    TeamPlayerBuyout,
+    TeamPlayerSalary,
+)
+from app.data.league.season_caps import SeasonCaps, use_season_caps
+from app.data.synthetic import LAST_SEASON, collect_league, generate_league
+from app.utils.name_matcher import NameMatchFinder
+
+# same headers as the scraped payroll csvs
+PAYROLL_HEADER = [
+    " ",
+    "Player (15)",
+    "Pos",
+    "Age",
+    "Cap Hit",
+    "Cap Hit Pct                         League Cap",
+    "Apron Salary",
+    "Luxury Tax",
+    "Cash                         Total",
+    "Cash                         Guaranteed",
+    "Free Agent                         Year",
+]
+CONTRACT_CLASSES = {"unsigned": 0, "rookie": 0, "minimum": 1, "maximum": 3}
+PROSPECT_PAGES = 100
+PROSPECT_COUNTING_STATS = ["REB", "AST", "BLK", "STL", "TO", "PF", "PTS"]
+ADVANCED_HEADER = (
+    "{}<span> HOVER FOR DESCRIPTION</span><span> TAP LABEL FOR DESCRIPTION</span>"
+)
+
+
+def stats_block(header: str, stats: dict[str, str]) -> str:
+    cells = "".join(
+        f'<div class="stat"><div class="stat-label">{label}</div>'
+        f'<div class="stat-data">{value}</div></div>'
+        for label, value in stats.items()
+    )
+    return f'<div class="stats-header">{header}</div><div class="stats">{cells}</div>'
+
+
+def prospect_page_html(
+    rng: np.random.Generator, name: str, year: int, others: list[str]
+) -> str:
+    """a Tankathon player page, same structure the DraftProspect parser reads"""
+    shots = rng.uniform(2, 8, 3).round(1)
+    made = (shots * rng.uniform(0.3, 0.8, 3)).round(1)
+    per_game = {
+        "G": str(rng.integers(10, 40)),
+        "MP": f"{rng.uniform(15, 36):.1f}",
+        "FGM-FGA": f"{made[0]}-{shots[0]}",
+        "FG%": f"{made[0] / shots[0]:.1%}",
+        "3PM-3PA": f"{made[1]}-{shots[1]}",
+        "3P%": f"{made[1] / shots[1]:.1%}",
+        "FTM-FTA": f"{made[2]}-{shots[2]}",
+        "FT%": f"{made[2] / shots[2]:.1%}",
+    } | {stat: f"{rng.uniform(0, 9):.1f}" for stat in PROSPECT_COUNTING_STATS}
+    per_36 = {
+        key: value
+        for key, value in per_game.items()
+        if "-" in key or key in PROSPECT_COUNTING_STATS
+    }
+    advanced_i = {
+        label: f"{rng.uniform(0, 60):.1f}"
+        for label in [
+            "True Shooting %<span>TS%</span>",
+            "Effective FG%<span>EFG%</span>",
+            "3PA Rate<span>3PAR</span>",
+            "FTA Rate<span>FTAR</span>",
+            "Proj NBA 3P%<span>NBA 3P%</span>",
+            "USG%",
+            "AST/USG",
+            "AST/TO",
+        ]
+    }
+    advanced_ii = {
+        label: f"{rng.normal(5, 5):.1f}"
+        for label in ["PER", "OWS/40", "DWS/40", "WS/40", "ORTG", "DRTG", "OBPM"]
+        + ["DBPM", "BPM"]
+    }
+    bio = {
+        "Team": "Duke",
+        "Year": ["Freshman", "Sophomore", "Junior", "Senior", "Intl"][rng.integers(5)],
+        "Position": ["PG", "SG/SF", "SF/PF", "C"][rng.integers(4)],
+        "Height": f"6'{rng.integers(0, 11)}.5\" (7'{rng.integers(0, 4)}\" wingspan)",
+        "Weight": f"{rng.integers(170, 260)} lbs",
+        "Hometown": "Castine, ME",
+        "Nation": " USA",
+        "Birthdate": f"Dec {rng.integers(1, 28)}, {year - 19}",
+        "Age at Draft": f"{rng.uniform(18, 23):.1f} yrs",
+        "Big Board": str(rng.integers(1, 100)),
+        "ESPN 100": f"#{rng.integers(1, 100)} | Top 100",
+    }
+    bio_rows = "".join(
+        f'<div class="row"><div class="label">{label}</div>'
+        f'<div class="data">{value}</div></div>'
+        for label, value in bio.items()
+    )
+    # the board links around the player make up most of a real page
+    links = "".join(
+        f'<a class="primary-hover" href="/players/{other}">{other}</a>'
+        for other in others
+    )
+    return (
+        f"<html><head><title>{name}</title></head><body>"
+        f'<div class="nav">{links}</div>'
+        f'<div class="player-page"><h1>{name}</h1>'
+        f'<div class="player-info">{bio_rows}</div>'
+        + stats_block(f"20{year % 2000 - 1}-{year % 2000} PER GAME AVERAGES", per_game)
+        + stats_block(
+            f"20{year % 2000 - 2}-{year % 2000 - 1} PER GAME AVERAGES", per_game
+        )
+        + stats_block("PER 36 MINUTES", per_36)
+        + stats_block(ADVANCED_HEADER.format("ADVANCED STATS I"), advanced_i)
+        + stats_block(ADVANCED_HEADER.format("ADVANCED STATS II"), advanced_ii)
+        + f'</div><div class="footer">{links}</div></body></html>'
+    )
+
+
+def by_player(model: type[Base], rows: list[dict]) -> defaultdict[int, list]:
+    grouped: defaultdict[int, list] = defaultdict(list)
+    for row in rows:
+        grouped[row["player_id"]].append(model(**row))
+    return grouped
+
+
+@dataclass
+class League:
+    """`scale` players and everything derived from them, built lazily"""
+
+    scale: int
+    seed: int = 0
+    workdir: Path = field(default_factory=lambda: Path(tempfile.mkdtemp()))
+
+    def __post_init__(self) -> None:
+        self.rng = np.random.default_rng(self.seed)
+        self.tables = collect_league(generate_league(self.scale, self.seed))
+        self.caps = SeasonCaps(
+            (row["id"], row["max_salary_cap"], row["expected_cap"])
+            for row in self.tables[Season].to_pylist()
+        )
+        # the salary properties look caps up through the process-wide cache
+        use_season_caps(self.caps)
+
+    @cached_property
+    def teams(self) -> list[Team]:
+        return [Team(**row) for row in self.tables[Team].to_pylist()]
+
+    @cached_property
+    def players(self) -> list[Player]:
+        teams = {team.id: team for team in self.teams}
+        contracts: defaultdict[int, list[Contract]] = defaultdict(list)
+        for row in self.tables[Contract].to_pylist():
+            contracts[row["player_id"]].append(
+                Contract(**row, team=teams[row["team_id"]])
+            )
+        seasons, salaries, buyouts, awards = (
+            by_player(
+                model, self.tables[model].to_pylist() if model in self.tables else []
+            )
+            for model in (PlayerSeason, TeamPlayerSalary, TeamPlayerBuyout, Award)
+        )
+        return [
+            Player(
+                **row,
+                seasons=seasons[row["id"]],
+                salaries=salaries[row["id"]],
+                buyouts=buyouts[row["id"]],
+                contracts=contracts[row["id"]],
+                awards=awards[row["id"]],
+            )
+            for row in self.tables[Player].to_pylist()
+        ]
+
+    @cached_property
+    def seasons(self) -> list[PlayerSeason]:
+        return [season for player in self.players for season in player.seasons]
+
+    @cached_property
+    def contracts(self) -> DataFrame:
+        """what export_contracts_for_ml would write for this league"""
+        return contracts_frame(
+            info
+            for player in self.players
+            for info in player.supporting_contract_info()
+        )
+
+    @cached_property
+    def contracts_path(self) -> str:
+        path = self.workdir / "contracts-for-ml"
+        table = pa.Table.from_pandas(self.contracts)
+        write_contracts_dataset(table.to_batches(), table.schema, path)
+        return str(path)
+
+    def name_finder(self) -> NameMatchFinder:
+        return NameMatchFinder.in_memory(
+            ((player.id, player.birth_date, player.name) for player in self.players),
+            ((team.name, team.abbreviation, team.id) for team in self.teams),
+        )
+
+    @cached_property
+    def payroll_dir(self) -> Path:
+        """one scraped-style payroll csv per team for the last season"""
+        directory = self.workdir / "payroll-team-year"
+        directory.mkdir(exist_ok=True)
+        season = LAST_SEASON
+        rosters: dict[int, list[tuple[Player, TeamPlayerSalary]]] = {}
+        for player in self.players:
+            for salary in player.salaries:
+                if salary.season_id == season:
+                    rosters.setdefault(salary.team_id, []).append((player, salary))
+
+        cap = self.caps.cap(season)
+        for team in self.teams:
+            file = (
+                directory / f"{team.name.lower().replace(' ', '-')}-{season - 1}-0.csv"
+            )
+            with open(file, "w", newline="") as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+                writer.writerow(PAYROLL_HEADER)
+                for rank, (player, salary) in enumerate(rosters.get(team.id, []), 1):
+                    age = season - int(player.birth_date[:4])
+                    dollars = f"${salary.salary:,}"
+                    writer.writerow(
+                        [
+                            rank,
+                            f"{player.last_name}                     {player.name}",
+                            player.position[0],
+                            age,
+                            dollars,
+                            f"{salary.salary / cap:.2%}",
+                            dollars,
+                            dollars,
+                            dollars,
+                            "'-",
+                            season + 2,
+                        ]
+                    )
+        return directory
+
+    @cached_property
+    def prospect_pages(self) -> list[Path]:
+        """cached Tankathon pages for PROSPECT_PAGES of the players"""
+        directory = self.workdir / "prospect-pages"
+        directory.mkdir(exist_ok=True)
+        slugs = [
+            player.name.lower().replace(" ", "-")
+            for player in self.players[:PROSPECT_PAGES]
+        ]
+        paths = []
+        for slug, player in zip(slugs, self.players):
+            path = directory / f"{slug}.html"
+            path.write_text(
+                prospect_page_html(self.rng, player.name, LAST_SEASON, slugs)
+            )
+            paths.append(path)
+        return paths
+
+    @cached_property
+    def hybrid_training_frame(self) -> tuple[DataFrame, Series]:
+        """
+        numeric features plus the validation / contract_type columns
+        XGBHybridModel.fit expects, and the target
+        """
+        from app.exploration.machine_learning_ii.data_preparation.default import (
+            default_feature_builder,
+        )
+
+        features = default_feature_builder(self.contracts_path)
+        target = features.pop("relative_dollars")
+        labels = (
+            features.pop("contract_type").astype(object).map(CONTRACT_CLASSES)
+        ).fillna(2)
+        X = features.select_dtypes("number").astype(float)
+        X["validation"] = self.rng.random(len(X)) < 0.2
+        X["contract_type"] = labels.astype(int)
+        return X, target
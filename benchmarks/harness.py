@@ -0,0 +1,204 @@
+"""
+a small pytest-benchmark style runner: registered benchmarks are timed over a
+few rounds, saved as JSON, and compared against a stored baseline.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Generic, TypeVar
+
+F = TypeVar("F")
+
+RESULTS_DIR = Path(".benchmarks")
+BASELINE_PATH = RESULTS_DIR / "baseline.json"
+
+
+@dataclass
+class Benchmark(Generic[F]):
+    name: str
+    # builds the timed callable from the fixtures, so setup isn't measured
+    setup: Callable[[F], Callable[[], object]]
+    rounds: int
+    warmup: int
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    rounds: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+
+    @property
+    def ops(self) -> float:
+        return 1 / self.mean if self.mean else float("inf")
+
+
+BENCHMARKS: dict[str, Benchmark[Any]] = {}
+
+
+def benchmark(
+    name: str | None = None, rounds: int = 5, warmup: int = 1
+) -> Callable[
+    [Callable[[F], Callable[[], object]]], Callable[[F], Callable[[], object]]
+]:
+    """register a setup function, it returns the zero-argument callable to time"""
+
+    def decorator(
+        setup: Callable[[F], Callable[[], object]],
+    ) -> Callable[[F], Callable[[], object]]:
+        benchmark_name = name or setup.__name__
+        if benchmark_name in BENCHMARKS:
+            raise Exception(f"Benchmark {benchmark_name} is already registered")
+        BENCHMARKS[benchmark_name] = Benchmark(benchmark_name, setup, rounds, warmup)
+        return setup
+
+    return decorator
+
+
+def measure(
+    function: Callable[[], object], rounds: int = 5, warmup: int = 1, name: str = ""
+) -> BenchmarkResult:
+    for _ in range(warmup):
+        function()
+    timings = []
+    for _ in range(rounds):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+
+    return BenchmarkResult(
+        name=name,
+        rounds=rounds,
+        min=min(timings),
+        max=max(timings),
+        mean=statistics.fmean(timings),
+        median=statistics.median(timings),
+        stddev=statistics.stdev(timings) if rounds > 1 else 0.0,
+    )
+
+
+def run(
+    fixtures: F,
+    names: list[str] | None = None,
+    rounds: int | None = None,
+    report: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """every registered benchmark (or just `names`), `rounds` overrides each default"""
+    results = []
+    for name, bench in BENCHMARKS.items():
+        if names is not None and name not in names:
+            continue
+        result = measure(
+            bench.setup(fixtures),
+            rounds=bench.rounds if rounds is None else rounds,
+            warmup=bench.warmup if rounds is None else min(bench.warmup, rounds),
+            name=name,
+        )
+        if report is not None:
+            report(result)
+        results.append(result)
+    return results
+
+
+def machine_info() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def save_results(
+    results: list[BenchmarkResult], path: str | Path, **context: Any
+) -> Path:
+    """`context` (scale, seed...) is stored alongside, so runs can be matched up"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "machine_info": machine_info(),
+        "context": context,
+        "benchmarks": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2))
+    return path
+
+
+def load_results(path: str | Path) -> dict[str, BenchmarkResult]:
+    document = json.loads(Path(path).read_text())
+    return {
+        result["name"]: BenchmarkResult(**result) for result in document["benchmarks"]
+    }
+
+
+def load_context(path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text()).get("context", {})
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """relative change of the median, positive is slower"""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: dict[str, BenchmarkResult],
+    threshold: float = 0.1,
+    context: dict[str, Any] | None = None,
+    baseline_context: dict[str, Any] | None = None,
+) -> tuple[list[Comparison], list[Comparison]]:
+    """
+    (every comparison, the ones more than `threshold` slower). Medians are
+    compared, benchmarks missing from the baseline are skipped. Runs at
+    different scales aren't comparable, given both contexts that's an error
+    """
+    if context is not None and baseline_context is not None:
+        scale, baseline_scale = context.get("scale"), baseline_context.get("scale")
+        if scale != baseline_scale:
+            raise Exception(
+                f"Baseline was run at scale {baseline_scale}, this run is at "
+                f"scale {scale}, compare runs of the same size"
+            )
+    comparisons = [
+        Comparison(result.name, baseline[result.name].median, result.median)
+        for result in results
+        if result.name in baseline
+    ]
+    return comparisons, [c for c in comparisons if c.change > threshold]
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return (
+        f"{result.name:<40} median {result.median * 1000:>10.2f} ms  "
+        f"min {result.min * 1000:>10.2f} ms  "
+        f"stddev {result.stddev * 1000:>8.2f} ms  "
+        f"{result.ops:>10.1f} ops/s"
+    )
+
+
+def format_comparison(comparison: Comparison) -> str:
+    return (
+        f"{comparison.name:<40} {comparison.baseline * 1000:>10.2f} ms -> "
+        f"{comparison.current * 1000:>10.2f} ms  ({comparison.change:+.1%})"
+    )
@@ -0,0 +1,148 @@
+"""
+the code paths the contract model spends its time in, timed on a synthetic
+League (see benchmarks.fixtures). Importing this module registers them.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from datetime import datetime
+
+from app.data.synthetic import LAST_SEASON
+from benchmarks.fixtures import League
+from benchmarks.harness import benchmark
+
+# the name matcher scans every player per guess, so it gets a fixed workload
+NAME_LOOKUPS = 200
+PROSPECT_UPLOADED = datetime(LAST_SEASON, 6, 22, 19)
+
+
+@benchmark("player.supporting_contract_info")
+def supporting_contract_info(league: League) -> Callable[[], object]:
+    players = league.players
+
+    def run() -> int:
+        return sum(1 for player in players for _ in player.supporting_contract_info())
+
+    return run
+
+
+@benchmark("contract_supporting_information.to_scalar")
+def contract_to_scalar(league: League) -> Callable[[], object]:
+    infos = [
+        info for player in league.players for info in player.supporting_contract_info()
+    ]
+
+    def run() -> int:
+        return sum(len(info.to_scalar()) for info in infos)
+
+    return run
+
+
+@benchmark("player_season.ml_data.no_colinearity")
+def season_no_colinearity(league: League) -> Callable[[], object]:
+    seasons = league.seasons
+
+    def run() -> int:
+        return sum(len(season.ml_data().no_colinearity()) for season in seasons)
+
+    return run
+
+
+@benchmark("default_feature_builder")
+def feature_builder(league: League) -> Callable[[], object]:
+    from app.exploration.machine_learning_ii.data_preparation.default import (
+        default_feature_builder,
+    )
+
+    path = league.contracts_path
+    return lambda: default_feature_builder(path)
+
+
+@benchmark("xgb_hybrid_model.fit", rounds=3)
+def hybrid_fit(league: League) -> Callable[[], object]:
+    from app.exploration.machine_learning_ii.training.hybrid_models import (
+        build_hybrid_model,
+    )
+
+    X, y = league.hybrid_training_frame
+    # fit pops the validation and label columns, so every round gets a copy
+    return lambda: build_hybrid_model(None).fit(X.copy(), y)
+
+
+@benchmark("xgb_hybrid_model.predict")
+def hybrid_predict(league: League) -> Callable[[], object]:
+    from app.exploration.machine_learning_ii.training.hybrid_models import (
+        build_hybrid_model,
+    )
+
+    X, y = league.hybrid_training_frame
+    model = build_hybrid_model(None).fit(X.copy(), y)
+    return lambda: model.predict(X.copy())
+
+
+@benchmark("name_match_finder.get_player_id")
+def name_match(league: League) -> Callable[[], object]:
+    finder = league.name_finder()
+    players = league.players[:NAME_LOOKUPS]
+    lookups = [
+        (player.name, season.season_id, season.season_id - int(player.birth_date[:4]))
+        for player in players
+        for season in player.seasons[:1]
+    ]
+
+    def run() -> int:
+        # start cold every round, otherwise everything after the first is cached
+        finder.data = {}
+        return sum(
+            finder.get_player_id(name, year, age, assume_match_exists=True) or 0
+            for name, year, age in lookups
+        )
+
+    return run
+
+
+@benchmark("payrolls.get_salary_objects")
+def payroll_parse(league: League) -> Callable[[], object]:
+    from app.fill_data.payrolls import get_salary_objects
+
+    directory = str(league.payroll_dir)
+    files = sorted(os.listdir(directory))
+    finder = league.name_finder()
+    # names resolve from the cache, so this is the csv parse and object building
+    finder.data = {player.name: player.id for player in league.players}
+
+    def run() -> int:
+        return sum(
+            1
+            for file in files
+            for _ in get_salary_objects(file, finder, directory=directory)
+        )
+
+    return run
+
+
+@benchmark("draft_prospect.from_beautiful_soup")
+def prospect_from_soup(league: League) -> Callable[[], object]:
+    from bs4 import BeautifulSoup
+
+    from app.data.league.prospect import DraftProspect
+
+    soups = [BeautifulSoup(path.read_text(), "lxml") for path in league.prospect_pages]
+    return lambda: [
+        DraftProspect.from_beautiful_soup(PROSPECT_UPLOADED, soup, year=LAST_SEASON)
+        for soup in soups
+    ]
+
+
+@benchmark("draft_prospect.from_html")
+def prospect_from_html(league: League) -> Callable[[], object]:
+    from app.data.league.prospect import DraftProspect
+
+    # what the scraper does with a fetched page, html parse included
+    pages = [path.read_text() for path in league.prospect_pages]
+    return lambda: [
+        DraftProspect.from_html(PROSPECT_UPLOADED, page, year=LAST_SEASON)
+        for page in pages
+    ]
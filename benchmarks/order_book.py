@@ -0,0 +1,99 @@
+"""
+matching latency for the in-memory exchange, no database involved.
+
+    python -m benchmarks.order_book --orders 200000 --wal /tmp/exchange.wal
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter, perf_counter_ns
+
+import numpy as np
+
+from app.data.users import SHARES_PER_PLAYER, MatchingEngine, Side
+
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+def make_engine(
+    n_users: int, n_players: int, wal_path: Path | None = None
+) -> MatchingEngine:
+    # everyone can afford anything and owns a slice of every player
+    cash = {user_id: 10**12 for user_id in range(1, n_users + 1)}
+    shares = {
+        (user_id, player_id): SHARES_PER_PLAYER
+        for user_id in cash
+        for player_id in range(1, n_players + 1)
+    }
+    return MatchingEngine(cash, shares, wal_path=wal_path)
+
+
+def run(
+    n_orders: int,
+    n_users: int = 1_000,
+    n_players: int = 50,
+    cancel_rate: float = 0.1,
+    wal_path: Path | None = None,
+    seed: int = 0,
+) -> dict[str, float]:
+    """random limit orders around a fixed mid, a slice of them cancelled later"""
+    rng = random.Random(seed)
+    engine = make_engine(n_users, n_players, wal_path)
+    latencies = np.empty(n_orders, dtype=np.int64)
+    resting: list[int] = []
+    n_fills = 0
+
+    start = perf_counter()
+    for i in range(n_orders):
+        user_id = rng.randint(1, n_users)
+        player_id = rng.randint(1, n_players)
+        side = Side.Buy if rng.random() < 0.5 else Side.Sell
+        price = 10_000 + rng.randint(-50, 50)
+        shares = rng.randint(1, 10)
+
+        if resting and rng.random() < cancel_rate:
+            order_id = resting.pop(rng.randrange(len(resting)))
+            began = perf_counter_ns()
+            if order_id in engine.orders:
+                engine.cancel(order_id)
+        else:
+            began = perf_counter_ns()
+            order, fills = engine.submit(user_id, player_id, side, price, shares)
+            n_fills += len(fills)
+            if order.shares:
+                resting.append(order.id)
+        latencies[i] = perf_counter_ns() - began
+    elapsed = perf_counter() - start
+    engine.close()
+
+    results = {
+        "orders": n_orders,
+        "fills": n_fills,
+        "orders_per_second": n_orders / elapsed,
+    }
+    for percentile, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES)):
+        results[f"p{percentile}_us"] = value / 1_000
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--wal", type=Path, default=None)
+    args = parser.parse_args()
+
+    for label, wal_path in [
+        ("no wal", None),
+        ("wal", args.wal or Path(tempfile.mkstemp(suffix=".wal")[1])),
+    ]:
+        results = run(args.orders, args.users, args.players, wal_path=wal_path)
+        print(
+            f"{label:>6}: "
+            + ", ".join(f"{key}={value:,.1f}" for key, value in results.items())
+        )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+import benchmarks.hot_paths  # noqa: F401
+from app.data.league.season_caps import reset_season_caps
+from benchmarks.fixtures import League
+from benchmarks.harness import (
+    BENCHMARKS,
+    BenchmarkResult,
+    compare,
+    load_context,
+    load_results,
+    run,
+    save_results,
+)
+
+
+@pytest.fixture
+def league(tmp_path: Path) -> Generator[League, None, None]:
+    yield League(40, seed=1, workdir=tmp_path)
+    # the league swaps in synthetic caps for the whole process
+    reset_season_caps()
+
+
+def result(name: str, median: float) -> BenchmarkResult:
+    return BenchmarkResult(name, 1, median, median, median, median, 0.0)
+
+
+def test_every_hot_path_runs_on_synthetic_data(league: League, tmp_path: Path) -> None:
+    results = run(league, rounds=1)
+
+    assert [r.name for r in results] == list(BENCHMARKS)
+    assert all(r.median > 0 for r in results)
+    assert len(league.contracts) > 0
+
+    path = save_results(results, tmp_path / "results.json", scale=league.scale)
+    assert load_results(path) == {r.name: r for r in results}
+
+
+def test_league_is_deterministic(tmp_path: Path) -> None:
+    first, second = League(5, seed=3), League(5, seed=3)
+    try:
+        assert [p.name for p in first.players] == [p.name for p in second.players]
+        assert [s.points for s in first.seasons] == [s.points for s in second.seasons]
+    finally:
+        reset_season_caps()
+
+
+def test_compare_flags_slowdowns_past_the_threshold() -> None:
+    baseline = {"fast": result("fast", 1.0), "slow": result("slow", 1.0)}
+    comparisons, regressions = compare(
+        [result("fast", 1.05), result("slow", 1.5), result("new", 9.0)],
+        baseline,
+        threshold=0.1,
+    )
+
+    assert [c.name for c in comparisons] == ["fast", "slow"]
+    assert [c.name for c in regressions] == ["slow"]
+    assert regressions[0].change == pytest.approx(0.5)
+
+
+def test_compare_refuses_a_baseline_at_another_scale(tmp_path: Path) -> None:
+    path = save_results([result("fast", 1.0)], tmp_path / "baseline.json", scale=100)
+
+    with pytest.raises(Exception, match="scale 100, this run is at scale 1000"):
+        compare(
+            [result("fast", 1.0)],
+            load_results(path),
+            context={"scale": 1000},
+            baseline_context=load_context(path),
+        )
+    comparisons, _ = compare(
+        [result("fast", 1.0)],
+        load_results(path),
+        context={"scale": 100},
+        baseline_context=load_context(path),
+    )
+    assert [c.name for c in comparisons] == ["fast"]
@@ -5,7 +5,7 @@ import inspect
 from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, NoReturn
+from typing import Any, ContextManager, NoReturn
 
 import pytest
 from sqlalchemy.orm import Session
@@ -13,8 +13,16 @@ from sqlalchemy.orm.session import Session
 from starlette.testclient import TestClient
 
 from app.base import Base
-from tests.connection import get_test_session
+from app.data import instrumentation
+from app.data.instrumentation import QueryStats
+from tests.connection import (
+    create_test_schema,
+    get_test_session,
+    get_transactional_session,
+)
+from tests.data.seasons import SEASON_DATA
 from tests.dataclasses import TestCase
+from tests.utils import bulk_insert
 
 
 @pytest.fixture
@@ -22,14 +30,64 @@ def client() -> TestClient:  # @IgnoreException
     pytest.skip("API client not implemented yet")
 
 
-@pytest.fixture
-def session() -> Generator[Session, None, None]:  # @IgnoreException
-    """Provide a clean session for each test."""
+@pytest.fixture(scope="session")
+def database() -> None:  # @IgnoreException
+    """Create the schema and seed shared reference data once per run."""
+    create_test_schema()
     with get_test_session() as session:
+        bulk_insert(session, SEASON_DATA)
+        session.commit()
+
+
+@pytest.fixture
+def session(database: None) -> Generator[Session, None, None]:  # @IgnoreException
+    """Provide a session whose writes are rolled back after each test."""
+    with get_transactional_session() as session:
         # yield the session for the test
         yield session
 
 
+@pytest.fixture
+def assert_max_queries() -> (
+    Callable[..., ContextManager[QueryStats]]
+):  # @IgnoreException
+    """`with assert_max_queries(5): ...` fails the test past 5 statements"""
+    return instrumentation.assert_max_queries
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--sql-report",
+        action="store",
+        type=int,
+        default=0,
+        metavar="N",
+        help="report tests that repeat one statement shape N or more times",
+    )
+
+
+@pytest.fixture(autouse=True)
+def sql_report(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    threshold = request.config.getoption("--sql-report")
+    if not threshold:
+        yield
+        return
+    with instrumentation.track_queries() as stats:
+        yield
+    if stats.repeated(threshold):
+        SQL_REPORTS[request.node.nodeid] = stats.report(threshold)
+
+
+SQL_REPORTS: dict[str, str] = {}
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if SQL_REPORTS:
+        terminalreporter.section("repeated SQL")
+        for nodeid, report in SQL_REPORTS.items():
+            terminalreporter.write_line(f"{nodeid}\n{report}")
+
+
 def parametrize(cases: Iterable[TestCase] = ()) -> Callable[..., Any]:
     cases = list(cases)
 
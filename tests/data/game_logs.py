@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pandas import DataFrame
+
+DAL, HOU = 1610612742, 1610612745
+
+TEAM_LOG = DataFrame(
+    [
+        {"GAME_ID": "0022400061", "GAME_DATE": "2024-10-24", "TEAM_ID": DAL,
+         "MATCHUP": "DAL vs. HOU", "WL": "W", "PTS": 110},
+        {"GAME_ID": "0022400061", "GAME_DATE": "2024-10-24", "TEAM_ID": HOU,
+         "MATCHUP": "HOU @ DAL", "WL": "L", "PTS": 102},
+    ]
+)  # fmt: skip
+
+PLAYER_LOG = DataFrame(
+    [
+        {"PLAYER_ID": player_id, "TEAM_ID": team_id, "MATCHUP": matchup,
+         "GAME_ID": "0022400061", "GAME_DATE": "2024-10-24", "MIN": minutes,
+         "PTS": 12, "FGM": 5, "FGA": 11, "FG3M": 2, "FG3A": 6, "FTM": 0, "FTA": 0,
+         "OREB": 1, "DREB": 4, "REB": 5, "AST": 3, "STL": 1, "BLK": 0, "TOV": 2,
+         "PF": 2, "PLUS_MINUS": None}
+        for player_id, team_id, matchup, minutes in (
+            (202691, DAL, "DAL vs. HOU", 31),  # Klay Thompson
+            (1641708, HOU, "HOU @ DAL", 35),  # Amen Thompson
+            (1, HOU, "HOU @ DAL", 4),  # not tracked, dropped
+        )
+    ]
+)  # fmt: skip
@@ -1,1816 +1,8 @@
 from __future__ import annotations
 
-SEASON_DATA = [
-    {
-        "model": "Season",
-        "values": {
-            "id": 1985,
-            "max_salary_cap": 3600000,
-            "inflation_adjusted_cap": 9793069,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1986,
-            "max_salary_cap": 4233000,
-            "inflation_adjusted_cap": 11298280,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1987,
-            "max_salary_cap": 4945000,
-            "inflation_adjusted_cap": 12734751,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1988,
-            "max_salary_cap": 6164000,
-            "inflation_adjusted_cap": 15248702,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1989,
-            "max_salary_cap": 7232000,
-            "inflation_adjusted_cap": 17069461,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1990,
-            "max_salary_cap": 9802000,
-            "inflation_adjusted_cap": 21950887,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1991,
-            "max_salary_cap": 11871000,
-            "inflation_adjusted_cap": 25499592,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1992,
-            "max_salary_cap": 12500000,
-            "inflation_adjusted_cap": 26061180,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1993,
-            "max_salary_cap": 14000000,
-            "inflation_adjusted_cap": 28354756,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1994,
-            "max_salary_cap": 15175000,
-            "inflation_adjusted_cap": 29954782,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1995,
-            "max_salary_cap": 15964000,
-            "inflation_adjusted_cap": 30651995,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1996,
-            "max_salary_cap": 23000000,
-            "inflation_adjusted_cap": 42906004,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1997,
-            "max_salary_cap": 24363000,
-            "inflation_adjusted_cap": 44402880,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1998,
-            "max_salary_cap": 26900000,
-            "inflation_adjusted_cap": 48285994,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1999,
-            "max_salary_cap": 30000000,
-            "inflation_adjusted_cap": 52688773,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2001,
-            "max_salary_cap": 35500000,
-            "inflation_adjusted_cap": 58657395,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2002,
-            "max_salary_cap": 42500000,
-            "inflation_adjusted_cap": 69132284,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2003,
-            "max_salary_cap": 40271000,
-            "inflation_adjusted_cap": 64048956,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2004,
-            "max_salary_cap": 43840000,
-            "inflation_adjusted_cap": 67907202,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2005,
-            "max_salary_cap": 43870000,
-            "inflation_adjusted_cap": 65719039,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2006,
-            "max_salary_cap": 49500000,
-            "inflation_adjusted_cap": 71839551,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2007,
-            "max_salary_cap": 53135000,
-            "inflation_adjusted_cap": 74973988,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2008,
-            "max_salary_cap": 55630000,
-            "inflation_adjusted_cap": 75594893,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2009,
-            "max_salary_cap": 58680000,
-            "inflation_adjusted_cap": 80023973,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2010,
-            "max_salary_cap": 57700000,
-            "inflation_adjusted_cap": 77414680,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2011,
-            "max_salary_cap": 58044000,
-            "inflation_adjusted_cap": 75491545,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2012,
-            "max_salary_cap": 58044000,
-            "inflation_adjusted_cap": 73970553,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2013,
-            "max_salary_cap": 58044000,
-            "inflation_adjusted_cap": 72903264,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2014,
-            "max_salary_cap": 58679000,
-            "inflation_adjusted_cap": 72519787,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2015,
-            "max_salary_cap": 63065000,
-            "inflation_adjusted_cap": 77841847,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2016,
-            "max_salary_cap": 70000000,
-            "inflation_adjusted_cap": 85323721,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2017,
-            "max_salary_cap": 94143000,
-            "inflation_adjusted_cap": 112368348,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2018,
-            "max_salary_cap": 99093000,
-            "inflation_adjusted_cap": 115455294,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2019,
-            "max_salary_cap": 101869000,
-            "inflation_adjusted_cap": 116573245,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2020,
-            "max_salary_cap": 109140000,
-            "inflation_adjusted_cap": 123384194,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2021,
-            "max_salary_cap": 109140000,
-            "inflation_adjusted_cap": 117838496,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2022,
-            "max_salary_cap": 112414000,
-            "inflation_adjusted_cap": 112414000,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2023,
-            "max_salary_cap": 123655000,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2024,
-            "max_salary_cap": 136021000,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2025,
-            "max_salary_cap": 140588000,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2026,
-            "max_salary_cap": 154647000,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1950,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1955,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1957,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1954,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1959,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1964,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1969,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1974,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1971,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1977,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1956,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1983,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1984,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1958,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1973,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1953,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1979,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1980,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1970,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1975,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1982,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1963,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1967,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2000,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1948,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1965,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1949,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1960,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1951,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1972,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1976,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1966,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1981,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1978,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1968,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1961,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1952,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 1962,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2054,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2055,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2056,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2057,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2058,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2059,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2060,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2061,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2062,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2063,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2064,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2065,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2066,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2067,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2068,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2069,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2070,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2071,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2072,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2073,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2074,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2075,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2076,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2077,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2078,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2079,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2080,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2081,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2082,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2083,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2084,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2085,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2086,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2087,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2088,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2089,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2090,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2091,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2092,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2093,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2094,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2095,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2096,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2097,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2098,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": None,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2042,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 710613355,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2043,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 781675686,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2044,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 859844349,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2045,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 945829987,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2046,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 1040414309,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2047,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 1144457195,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2048,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 1258904515,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2027,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 170111920,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2028,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 187123354,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2029,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 205835955,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2030,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 226419842,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2031,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 249062146,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2032,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 273968712,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2033,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 301365969,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2034,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 331502990,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2049,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 1384796727,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2050,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 1523278336,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2051,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 1675608299,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2052,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 1843171471,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2053,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 2027491194,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2035,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 364653755,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2036,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 401119643,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2037,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 441232171,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2038,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 485356008,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2039,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 533892290,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2040,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 587282268,
-        },
-    },
-    {
-        "model": "Season",
-        "values": {
-            "id": 2041,
-            "max_salary_cap": None,
-            "inflation_adjusted_cap": None,
-            "luxury_tax_threshold": None,
-            "first_apron": None,
-            "second_apron": None,
-            "expected_cap": 646011318,
-        },
-    },
-]
+from pathlib import Path
+
+from app.data.to_python_syntax import load_seed_data
+
+# written by app/data/to_python_syntax.py, one parquet file per model
+SEASON_DATA = load_seed_data(Path(__file__).parent / "parquet" / "seasons")
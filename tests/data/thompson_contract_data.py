@@ -1,3907 +1,8 @@
 from __future__ import annotations
 
-THOMPSON_CONTRACT_DATA = [
-    {
-        "model": "Team",
-        "values": {
-            "id": 18,
-            "city": "Houston",
-            "name": "Houston Rockets",
-            "nickname": "Rockets",
-            "abbreviation": "HOU",
-            "conference": "Western",
-            "division": "Southwest",
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 1641708,
-            "name": "Amen Thompson",
-            "first_name": "Amen",
-            "last_name": "Thompson",
-            "height_inches": 79,
-            "weight_pounds": 200,
-            "birth_date": "2003-01-30T00:00:00",
-            "country": "USA",
-            "school": "Overtime Elite",
-            "position": "Guard-Forward",
-            "draft_year": 2023,
-            "draft_round": 1,
-            "draft_number": 4,
-            "roster_status": 1,
-            "is_gleague_player": 1,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 13231,
-            "player_id": 1641708,
-            "team_id": 18,
-            "value": 102994,
-            "start_year": 2025,
-            "duration": 1,
-            "option_1": "Team",
-            "option_2": "Team",
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 13516,
-            "player_id": 1641708,
-            "team_id": 18,
-            "value": 40008489,
-            "start_year": 2024,
-            "duration": 4,
-            "option_1": "Team",
-            "option_2": "Team",
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15257,
-            "season_id": 2024,
-            "team_id": 18,
-            "player_id": 1641708,
-            "cap_hit_percent": 6.48,
-            "salary": 8809320,
-            "apron_salary": 8809320,
-            "luxury_tax": 8809320,
-            "cash_total": 8809320,
-            "cash_garunteed": 8809320,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15276,
-            "season_id": 2025,
-            "team_id": 18,
-            "player_id": 1641708,
-            "cap_hit_percent": 6.58,
-            "salary": 9249960,
-            "apron_salary": 9249960,
-            "luxury_tax": 9186167,
-            "cash_total": 9249960,
-            "cash_garunteed": 9249960,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15295,
-            "season_id": 2026,
-            "team_id": 18,
-            "player_id": 1641708,
-            "cap_hit_percent": 6.27,
-            "salary": 9690600,
-            "apron_salary": 9690600,
-            "luxury_tax": 9690600,
-            "cash_total": 9690600,
-            "cash_garunteed": 9690600,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15311,
-            "season_id": 2027,
-            "team_id": 18,
-            "player_id": 1641708,
-            "cap_hit_percent": 7.38,
-            "salary": 12258609,
-            "apron_salary": 12258609,
-            "luxury_tax": 12258609,
-            "cash_total": 12258609,
-            "cash_garunteed": 12258609,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6699,
-            "player_id": 1641708,
-            "team_id": 18,
-            "season_id": 2024,
-            "age": 21.0,
-            "games_played": 62,
-            "wins": 30,
-            "losses": 32,
-            "win_pct": 0.484,
-            "minutes_pg": 1389.0,
-            "offensive_rating": 111.4,
-            "defensive_rating": 109.3,
-            "net_rating": 2.1,
-            "estimated_offensive_rating": 110.9,
-            "estimated_defensive_rating": 109.3,
-            "estimated_net_rating": 1.5,
-            "assist_percentage": 0.165,
-            "assist_to_turnover": 1.81,
-            "assist_ratio": 21.4,
-            "offensive_rebound_pct": 0.095,
-            "defensive_rebound_pct": 0.184,
-            "rebound_pct": 0.137,
-            "turnover_pct": 11.8,
-            "effective_fg_pct": 0.545,
-            "true_shooting_pct": 0.576,
-            "usage_pct": 0.173,
-            "pace": 102.77,
-            "pace_per_40": 85.64,
-            "estimated_pace": 102.96,
-            "possessions": 2965,
-            "pie": 0.121,
-            "field_goals_made": 239,
-            "field_goals_attempted": 446,
-            "field_goal_pct": 0.536,
-            "field_goals_made_pg": 3.9,
-            "field_goals_attempted_pg": 7.2,
-            "points": 592,
-            "points_pg": 9.548387096774194,
-            "rebounds": 409,
-            "rebounds_pg": 6.596774193548387,
-            "offensive_rebounds": 148,
-            "defensive_rebounds": 261,
-            "assists": 163,
-            "assists_pg": 2.629032258064516,
-            "turnovers": 90,
-            "turnovers_pg": 1.4516129032258065,
-            "steals": 78,
-            "steals_pg": 1.2580645161290323,
-            "blocks": 38,
-            "blocks_pg": 0.6129032258064516,
-            "personal_fouls": 141,
-            "personal_fouls_pg": 2.274193548387097,
-            "three_pointers_made": 8,
-            "three_pointers_attempted": 58,
-            "three_point_pct": 0.138,
-            "three_pointers_made_pg": 0.12903225806451613,
-            "three_pointers_attempted_pg": 0.9354838709677419,
-            "two_pointers_made": 231,
-            "two_pointers_attempted": 388,
-            "two_point_pct": 0.595360824742268,
-            "two_pointers_made_pg": 3.725806451612903,
-            "two_pointers_attempted_pg": 6.258064516129032,
-            "free_throws_made": 106,
-            "free_throws_attempted": 155,
-            "free_throw_pct": 0.684,
-            "free_throws_made_pg": 1.7096774193548387,
-            "free_throws_attempted_pg": 2.5,
-            "plus_minus": 45,
-            "plus_minus_pg": 0.7258064516129032,
-            "double_doubles": 13,
-            "triple_doubles": 1,
-            "pts_off_tov": 98,
-            "pts_2nd_chance": 123,
-            "pts_fb": 146,
-            "pts_paint": 446,
-            "opp_pts_off_tov": 453,
-            "opp_pts_2nd_chance": 366,
-            "opp_pts_fb": 384,
-            "opp_pts_paint": 1430,
-            "pct_fgm": 0.194,
-            "pct_fga": 0.165,
-            "pct_fg3m": 0.024,
-            "pct_fg3a": 0.056,
-            "pct_ftm": 0.21,
-            "pct_fta": 0.229,
-            "pct_oreb": 0.368,
-            "pct_dreb": 0.27,
-            "pct_reb": 0.299,
-            "pct_ast": 0.235,
-            "pct_tov": 0.239,
-            "pct_stl": 0.284,
-            "pct_blk": 0.253,
-            "pct_blka": 0.2,
-            "pct_pf": 0.235,
-            "pct_pfd": 0.242,
-            "pct_pts": 0.179,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 7213,
-            "player_id": 1641708,
-            "team_id": 18,
-            "season_id": 2025,
-            "age": 22.0,
-            "games_played": 69,
-            "wins": 43,
-            "losses": 26,
-            "win_pct": 0.623,
-            "minutes_pg": 2225.0,
-            "offensive_rating": 114.2,
-            "defensive_rating": 107.9,
-            "net_rating": 6.3,
-            "estimated_offensive_rating": 112.7,
-            "estimated_defensive_rating": 106.9,
-            "estimated_net_rating": 5.8,
-            "assist_percentage": 0.167,
-            "assist_to_turnover": 1.92,
-            "assist_ratio": 21.9,
-            "offensive_rebound_pct": 0.078,
-            "defensive_rebound_pct": 0.159,
-            "rebound_pct": 0.118,
-            "turnover_pct": 11.4,
-            "effective_fg_pct": 0.575,
-            "true_shooting_pct": 0.602,
-            "usage_pct": 0.172,
-            "pace": 100.0,
-            "pace_per_40": 83.34,
-            "estimated_pace": 101.1,
-            "possessions": 4626,
-            "pie": 0.129,
-            "field_goals_made": 388,
-            "field_goals_attempted": 697,
-            "field_goal_pct": 0.557,
-            "field_goals_made_pg": 5.6,
-            "field_goals_attempted_pg": 10.1,
-            "points": 970,
-            "points_pg": 14.057971014492754,
-            "rebounds": 564,
-            "rebounds_pg": 8.173913043478262,
-            "offensive_rebounds": 192,
-            "defensive_rebounds": 372,
-            "assists": 265,
-            "assists_pg": 3.8405797101449277,
-            "turnovers": 138,
-            "turnovers_pg": 2.0,
-            "steals": 97,
-            "steals_pg": 1.4057971014492754,
-            "blocks": 89,
-            "blocks_pg": 1.289855072463768,
-            "personal_fouls": 167,
-            "personal_fouls_pg": 2.420289855072464,
-            "three_pointers_made": 25,
-            "three_pointers_attempted": 91,
-            "three_point_pct": 0.275,
-            "three_pointers_made_pg": 0.36231884057971014,
-            "three_pointers_attempted_pg": 1.318840579710145,
-            "two_pointers_made": 363,
-            "two_pointers_attempted": 606,
-            "two_point_pct": 0.599009900990099,
-            "two_pointers_made_pg": 5.260869565217392,
-            "two_pointers_attempted_pg": 8.782608695652174,
-            "free_throws_made": 169,
-            "free_throws_attempted": 247,
-            "free_throw_pct": 0.684,
-            "free_throws_made_pg": 2.449275362318841,
-            "free_throws_attempted_pg": 3.579710144927536,
-            "plus_minus": 268,
-            "plus_minus_pg": 3.8840579710144927,
-            "double_doubles": 21,
-            "triple_doubles": 3,
-            "pts_off_tov": 177,
-            "pts_2nd_chance": 152,
-            "pts_fb": 197,
-            "pts_paint": 674,
-            "opp_pts_off_tov": 701,
-            "opp_pts_2nd_chance": 651,
-            "opp_pts_fb": 601,
-            "opp_pts_paint": 2270,
-            "pct_fgm": 0.196,
-            "pct_fga": 0.163,
-            "pct_fg3m": 0.045,
-            "pct_fg3a": 0.058,
-            "pct_ftm": 0.217,
-            "pct_fta": 0.234,
-            "pct_oreb": 0.284,
-            "pct_dreb": 0.244,
-            "pct_reb": 0.256,
-            "pct_ast": 0.241,
-            "pct_tov": 0.225,
-            "pct_stl": 0.241,
-            "pct_blk": 0.346,
-            "pct_blka": 0.171,
-            "pct_pf": 0.191,
-            "pct_pfd": 0.199,
-            "pct_pts": 0.184,
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 6,
-            "city": "Detroit",
-            "name": "Detroit Pistons",
-            "nickname": "Pistons",
-            "abbreviation": "DET",
-            "conference": "Eastern",
-            "division": "Central",
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 1641709,
-            "name": "Ausar Thompson",
-            "first_name": "Ausar",
-            "last_name": "Thompson",
-            "height_inches": 79,
-            "weight_pounds": 205,
-            "birth_date": "2003-01-30T00:00:00",
-            "country": "USA",
-            "school": "Overtime Elite",
-            "position": "Guard-Forward",
-            "draft_year": 2023,
-            "draft_round": 1,
-            "draft_number": 5,
-            "roster_status": 1,
-            "is_gleague_player": 0,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 13518,
-            "player_id": 1641709,
-            "team_id": 6,
-            "value": 36246405,
-            "start_year": 2024,
-            "duration": 4,
-            "option_1": "Team",
-            "option_2": "Team",
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14717,
-            "season_id": 2024,
-            "team_id": 6,
-            "player_id": 1641709,
-            "cap_hit_percent": 5.86,
-            "salary": 7977480,
-            "apron_salary": 7977480,
-            "luxury_tax": 7977480,
-            "cash_total": 7977480,
-            "cash_garunteed": 7977480,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14737,
-            "season_id": 2025,
-            "team_id": 6,
-            "player_id": 1641709,
-            "cap_hit_percent": 5.96,
-            "salary": 8376000,
-            "apron_salary": 8376000,
-            "luxury_tax": 8376000,
-            "cash_total": 8376000,
-            "cash_garunteed": 8376000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14756,
-            "season_id": 2026,
-            "team_id": 6,
-            "player_id": 1641709,
-            "cap_hit_percent": 5.67,
-            "salary": 8775000,
-            "apron_salary": 8775000,
-            "luxury_tax": 8775000,
-            "cash_total": 8775000,
-            "cash_garunteed": 8775000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14772,
-            "season_id": 2027,
-            "team_id": 6,
-            "player_id": 1641709,
-            "cap_hit_percent": 6.7,
-            "salary": 11117925,
-            "apron_salary": 11117925,
-            "luxury_tax": 11117925,
-            "cash_total": 11117925,
-            "cash_garunteed": 11117925,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6700,
-            "player_id": 1641709,
-            "team_id": 6,
-            "season_id": 2024,
-            "age": 21.0,
-            "games_played": 63,
-            "wins": 10,
-            "losses": 53,
-            "win_pct": 0.159,
-            "minutes_pg": 1583.0,
-            "offensive_rating": 107.7,
-            "defensive_rating": 113.1,
-            "net_rating": -5.3,
-            "estimated_offensive_rating": 107.1,
-            "estimated_defensive_rating": 112.5,
-            "estimated_net_rating": -5.4,
-            "assist_percentage": 0.108,
-            "assist_to_turnover": 1.43,
-            "assist_ratio": 16.3,
-            "offensive_rebound_pct": 0.077,
-            "defensive_rebound_pct": 0.173,
-            "rebound_pct": 0.124,
-            "turnover_pct": 11.4,
-            "effective_fg_pct": 0.505,
-            "true_shooting_pct": 0.522,
-            "usage_pct": 0.161,
-            "pace": 101.67,
-            "pace_per_40": 84.72,
-            "estimated_pace": 102.23,
-            "possessions": 3329,
-            "pie": 0.084,
-            "field_goals_made": 232,
-            "field_goals_attempted": 480,
-            "field_goal_pct": 0.483,
-            "field_goals_made_pg": 3.7,
-            "field_goals_attempted_pg": 7.6,
-            "points": 556,
-            "points_pg": 8.825396825396826,
-            "rebounds": 402,
-            "rebounds_pg": 6.380952380952381,
-            "offensive_rebounds": 129,
-            "defensive_rebounds": 273,
-            "assists": 120,
-            "assists_pg": 1.9047619047619047,
-            "turnovers": 84,
-            "turnovers_pg": 1.3333333333333333,
-            "steals": 68,
-            "steals_pg": 1.0793650793650793,
-            "blocks": 59,
-            "blocks_pg": 0.9365079365079365,
-            "personal_fouls": 175,
-            "personal_fouls_pg": 2.7777777777777777,
-            "three_pointers_made": 21,
-            "three_pointers_attempted": 113,
-            "three_point_pct": 0.186,
-            "three_pointers_made_pg": 0.3333333333333333,
-            "three_pointers_attempted_pg": 1.7936507936507937,
-            "two_pointers_made": 211,
-            "two_pointers_attempted": 367,
-            "two_point_pct": 0.5749318801089919,
-            "two_pointers_made_pg": 3.3492063492063493,
-            "two_pointers_attempted_pg": 5.825396825396825,
-            "free_throws_made": 71,
-            "free_throws_attempted": 119,
-            "free_throw_pct": 0.597,
-            "free_throws_made_pg": 1.126984126984127,
-            "free_throws_attempted_pg": 1.8888888888888888,
-            "plus_minus": -231,
-            "plus_minus_pg": -3.6666666666666665,
-            "double_doubles": 2,
-            "triple_doubles": 0,
-            "pts_off_tov": 87,
-            "pts_2nd_chance": 90,
-            "pts_fb": 106,
-            "pts_paint": 392,
-            "opp_pts_off_tov": 617,
-            "opp_pts_2nd_chance": 436,
-            "opp_pts_fb": 484,
-            "opp_pts_paint": 1658,
-            "pct_fgm": 0.173,
-            "pct_fga": 0.164,
-            "pct_fg3m": 0.064,
-            "pct_fg3a": 0.111,
-            "pct_ftm": 0.122,
-            "pct_fta": 0.162,
-            "pct_oreb": 0.323,
-            "pct_dreb": 0.252,
-            "pct_reb": 0.271,
-            "pct_ast": 0.144,
-            "pct_tov": 0.167,
-            "pct_stl": 0.318,
-            "pct_blk": 0.331,
-            "pct_blka": 0.181,
-            "pct_pf": 0.247,
-            "pct_pfd": 0.198,
-            "pct_pts": 0.155,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 7214,
-            "player_id": 1641709,
-            "team_id": 6,
-            "season_id": 2025,
-            "age": 22.0,
-            "games_played": 59,
-            "wins": 34,
-            "losses": 25,
-            "win_pct": 0.576,
-            "minutes_pg": 1328.0,
-            "offensive_rating": 113.1,
-            "defensive_rating": 109.2,
-            "net_rating": 4.0,
-            "estimated_offensive_rating": 112.6,
-            "estimated_defensive_rating": 107.9,
-            "estimated_net_rating": 4.6,
-            "assist_percentage": 0.139,
-            "assist_to_turnover": 1.68,
-            "assist_ratio": 18.2,
-            "offensive_rebound_pct": 0.081,
-            "defensive_rebound_pct": 0.139,
-            "rebound_pct": 0.11,
-            "turnover_pct": 10.8,
-            "effective_fg_pct": 0.547,
-            "true_shooting_pct": 0.568,
-            "usage_pct": 0.185,
-            "pace": 102.76,
-            "pace_per_40": 85.64,
-            "estimated_pace": 103.65,
-            "possessions": 2822,
-            "pie": 0.104,
-            "field_goals_made": 246,
-            "field_goals_attempted": 460,
-            "field_goal_pct": 0.535,
-            "field_goals_made_pg": 4.2,
-            "field_goals_attempted_pg": 7.8,
-            "points": 594,
-            "points_pg": 10.067796610169491,
-            "rebounds": 303,
-            "rebounds_pg": 5.135593220338983,
-            "offensive_rebounds": 111,
-            "defensive_rebounds": 192,
-            "assists": 134,
-            "assists_pg": 2.2711864406779663,
-            "turnovers": 80,
-            "turnovers_pg": 1.3559322033898304,
-            "steals": 98,
-            "steals_pg": 1.6610169491525424,
-            "blocks": 40,
-            "blocks_pg": 0.6779661016949152,
-            "personal_fouls": 164,
-            "personal_fouls_pg": 2.7796610169491527,
-            "three_pointers_made": 11,
-            "three_pointers_attempted": 49,
-            "three_point_pct": 0.224,
-            "three_pointers_made_pg": 0.1864406779661017,
-            "three_pointers_attempted_pg": 0.8305084745762712,
-            "two_pointers_made": 235,
-            "two_pointers_attempted": 411,
-            "two_point_pct": 0.5717761557177615,
-            "two_pointers_made_pg": 3.983050847457627,
-            "two_pointers_attempted_pg": 6.966101694915254,
-            "free_throws_made": 91,
-            "free_throws_attempted": 142,
-            "free_throw_pct": 0.641,
-            "free_throws_made_pg": 1.5423728813559323,
-            "free_throws_attempted_pg": 2.406779661016949,
-            "plus_minus": 67,
-            "plus_minus_pg": 1.1355932203389831,
-            "double_doubles": 3,
-            "triple_doubles": 0,
-            "pts_off_tov": 137,
-            "pts_2nd_chance": 92,
-            "pts_fb": 126,
-            "pts_paint": 462,
-            "opp_pts_off_tov": 477,
-            "opp_pts_2nd_chance": 401,
-            "opp_pts_fb": 393,
-            "opp_pts_paint": 1262,
-            "pct_fgm": 0.204,
-            "pct_fga": 0.184,
-            "pct_fg3m": 0.038,
-            "pct_fg3a": 0.058,
-            "pct_ftm": 0.186,
-            "pct_fta": 0.223,
-            "pct_oreb": 0.324,
-            "pct_dreb": 0.21,
-            "pct_reb": 0.241,
-            "pct_ast": 0.181,
-            "pct_tov": 0.199,
-            "pct_stl": 0.386,
-            "pct_blk": 0.274,
-            "pct_blka": 0.269,
-            "pct_pf": 0.291,
-            "pct_pfd": 0.243,
-            "pct_pts": 0.186,
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 78326,
-            "name": "David Thompson",
-            "first_name": "David",
-            "last_name": "Thompson",
-            "height_inches": 76,
-            "weight_pounds": 195,
-            "birth_date": "1954-07-13T00:00:00",
-            "country": "USA",
-            "school": "North Carolina State",
-            "position": "Guard",
-            "draft_year": 1975,
-            "draft_round": 1,
-            "draft_number": 1,
-            "roster_status": 0,
-            "is_gleague_player": 0,
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 17,
-            "city": "Golden State",
-            "name": "Golden State Warriors",
-            "nickname": "Warriors",
-            "abbreviation": "GSW",
-            "conference": "Western",
-            "division": "Pacific",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 15,
-            "city": "Dallas",
-            "name": "Dallas Mavericks",
-            "nickname": "Mavericks",
-            "abbreviation": "DAL",
-            "conference": "Western",
-            "division": "Southwest",
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 202691,
-            "name": "Klay Thompson",
-            "first_name": "Klay",
-            "last_name": "Thompson",
-            "height_inches": 77,
-            "weight_pounds": 220,
-            "birth_date": "1990-02-08T00:00:00",
-            "country": "USA",
-            "school": "Washington State",
-            "position": "Guard",
-            "draft_year": 2011,
-            "draft_round": 1,
-            "draft_number": 11,
-            "roster_status": 1,
-            "is_gleague_player": 0,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 9647,
-            "player_id": 202691,
-            "team_id": 17,
-            "value": 68979450,
-            "start_year": 2016,
-            "duration": 4,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 11163,
-            "player_id": 202691,
-            "team_id": 17,
-            "value": 189903600,
-            "start_year": 2020,
-            "duration": 5,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 12803,
-            "player_id": 202691,
-            "team_id": 17,
-            "value": 50000000,
-            "start_year": 2025,
-            "duration": 3,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 13311,
-            "player_id": 202691,
-            "team_id": 15,
-            "value": 51497,
-            "start_year": 2025,
-            "duration": 1,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 14827,
-            "player_id": 202691,
-            "team_id": 17,
-            "value": 9742480,
-            "start_year": 2012,
-            "duration": 4,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14197,
-            "season_id": 2025,
-            "team_id": 15,
-            "player_id": 202691,
-            "cap_hit_percent": 11.29,
-            "salary": 15873016,
-            "apron_salary": 15873016,
-            "luxury_tax": 15873016,
-            "cash_total": 15873016,
-            "cash_garunteed": 15873016,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14214,
-            "season_id": 2026,
-            "team_id": 15,
-            "player_id": 202691,
-            "cap_hit_percent": 10.78,
-            "salary": 16666667,
-            "apron_salary": 16666667,
-            "luxury_tax": 16666667,
-            "cash_total": 16666667,
-            "cash_garunteed": 16666667,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14233,
-            "season_id": 2027,
-            "team_id": 15,
-            "player_id": 202691,
-            "cap_hit_percent": 10.52,
-            "salary": 17460317,
-            "apron_salary": 17460317,
-            "luxury_tax": 17460317,
-            "cash_total": 17460317,
-            "cash_garunteed": 17460317,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14796,
-            "season_id": 2012,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 3.66,
-            "salary": 2126520,
-            "apron_salary": 2126520,
-            "luxury_tax": 2126520,
-            "cash_total": 1711589,
-            "cash_garunteed": 1711589,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14812,
-            "season_id": 2013,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 3.83,
-            "salary": 2222160,
-            "apron_salary": 2222160,
-            "luxury_tax": 2222160,
-            "cash_total": 2222160,
-            "cash_garunteed": 2222160,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14825,
-            "season_id": 2014,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 3.95,
-            "salary": 2317920,
-            "apron_salary": 2317920,
-            "luxury_tax": 2317920,
-            "cash_total": 2317920,
-            "cash_garunteed": 2317920,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14839,
-            "season_id": 2015,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 4.88,
-            "salary": 3075880,
-            "apron_salary": 3075880,
-            "luxury_tax": 3075880,
-            "cash_total": 3075880,
-            "cash_garunteed": 3075880,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14848,
-            "season_id": 2016,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 22.14,
-            "salary": 15501000,
-            "apron_salary": 15501000,
-            "luxury_tax": 15501000,
-            "cash_total": 15501000,
-            "cash_garunteed": 15501000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14864,
-            "season_id": 2017,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 17.7,
-            "salary": 16663575,
-            "apron_salary": 16663575,
-            "luxury_tax": 16663575,
-            "cash_total": 16663575,
-            "cash_garunteed": 16663575,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14880,
-            "season_id": 2018,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 17.99,
-            "salary": 17826150,
-            "apron_salary": 17826150,
-            "luxury_tax": 17826150,
-            "cash_total": 17826150,
-            "cash_garunteed": 17826150,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14896,
-            "season_id": 2019,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 18.64,
-            "salary": 18988725,
-            "apron_salary": 18988725,
-            "luxury_tax": 18988725,
-            "cash_total": 18988725,
-            "cash_garunteed": 18988725,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14912,
-            "season_id": 2020,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 30.0,
-            "salary": 32742000,
-            "apron_salary": 32742000,
-            "luxury_tax": 32742000,
-            "cash_total": 30695625,
-            "cash_garunteed": 32742000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14925,
-            "season_id": 2021,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 32.4,
-            "salary": 35361360,
-            "apron_salary": 35361360,
-            "luxury_tax": 35361360,
-            "cash_total": 35361360,
-            "cash_garunteed": 35361360,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14942,
-            "season_id": 2022,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 33.79,
-            "salary": 37980720,
-            "apron_salary": 37980720,
-            "luxury_tax": 37980720,
-            "cash_total": 37980720,
-            "cash_garunteed": 37980720,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14959,
-            "season_id": 2023,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 32.83,
-            "salary": 40600080,
-            "apron_salary": 40600080,
-            "luxury_tax": 40600080,
-            "cash_total": 40600080,
-            "cash_garunteed": 40600080,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 14976,
-            "season_id": 2024,
-            "team_id": 17,
-            "player_id": 202691,
-            "cap_hit_percent": 31.77,
-            "salary": 43219440,
-            "apron_salary": 43219440,
-            "luxury_tax": 43219440,
-            "cash_total": 43219440,
-            "cash_garunteed": 43219440,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 757,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2012,
-            "age": 22.0,
-            "games_played": 66,
-            "wins": 23,
-            "losses": 43,
-            "win_pct": 0.348,
-            "minutes_pg": 1608.0,
-            "offensive_rating": 102.8,
-            "defensive_rating": 107.2,
-            "net_rating": -4.4,
-            "estimated_offensive_rating": 103.0,
-            "estimated_defensive_rating": 107.0,
-            "estimated_net_rating": -4.0,
-            "assist_percentage": 0.142,
-            "assist_to_turnover": 1.29,
-            "assist_ratio": 13.4,
-            "offensive_rebound_pct": 0.015,
-            "defensive_rebound_pct": 0.086,
-            "rebound_pct": 0.051,
-            "turnover_pct": 10.4,
-            "effective_fg_pct": 0.52,
-            "true_shooting_pct": 0.545,
-            "usage_pct": 0.243,
-            "pace": 94.33,
-            "pace_per_40": 78.61,
-            "estimated_pace": 94.32,
-            "possessions": 3164,
-            "pie": 0.087,
-            "field_goals_made": 318,
-            "field_goals_attempted": 718,
-            "field_goal_pct": 0.443,
-            "field_goals_made_pg": 4.8,
-            "field_goals_attempted_pg": 10.9,
-            "points": 826,
-            "points_pg": 12.515151515151516,
-            "rebounds": 161,
-            "rebounds_pg": 2.4393939393939394,
-            "offensive_rebounds": 24,
-            "defensive_rebounds": 137,
-            "assists": 133,
-            "assists_pg": 2.015151515151515,
-            "turnovers": 103,
-            "turnovers_pg": 1.5606060606060606,
-            "steals": 49,
-            "steals_pg": 0.7424242424242424,
-            "blocks": 20,
-            "blocks_pg": 0.30303030303030304,
-            "personal_fouls": 155,
-            "personal_fouls_pg": 2.3484848484848486,
-            "three_pointers_made": 111,
-            "three_pointers_attempted": 268,
-            "three_point_pct": 0.414,
-            "three_pointers_made_pg": 1.6818181818181819,
-            "three_pointers_attempted_pg": 4.0606060606060606,
-            "two_pointers_made": 207,
-            "two_pointers_attempted": 450,
-            "two_point_pct": 0.46,
-            "two_pointers_made_pg": 3.1363636363636362,
-            "two_pointers_attempted_pg": 6.818181818181818,
-            "free_throws_made": 79,
-            "free_throws_attempted": 91,
-            "free_throw_pct": 0.868,
-            "free_throws_made_pg": 1.196969696969697,
-            "free_throws_attempted_pg": 1.378787878787879,
-            "plus_minus": -131,
-            "plus_minus_pg": -1.9848484848484849,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 160,
-            "pts_2nd_chance": 83,
-            "pts_fb": 96,
-            "pts_paint": 188,
-            "opp_pts_off_tov": 505,
-            "opp_pts_2nd_chance": 500,
-            "opp_pts_fb": 460,
-            "opp_pts_paint": 1456,
-            "pct_fgm": 0.253,
-            "pct_fga": 0.261,
-            "pct_fg3m": 0.392,
-            "pct_fg3a": 0.376,
-            "pct_ftm": 0.174,
-            "pct_fta": 0.15,
-            "pct_oreb": 0.079,
-            "pct_dreb": 0.142,
-            "pct_reb": 0.127,
-            "pct_ast": 0.178,
-            "pct_tov": 0.235,
-            "pct_stl": 0.185,
-            "pct_blk": 0.11,
-            "pct_blka": 0.185,
-            "pct_pf": 0.207,
-            "pct_pfd": 0.15,
-            "pct_pts": 0.254,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 1209,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2013,
-            "age": 23.0,
-            "games_played": 82,
-            "wins": 47,
-            "losses": 35,
-            "win_pct": 0.573,
-            "minutes_pg": 2936.0,
-            "offensive_rating": 106.0,
-            "defensive_rating": 104.2,
-            "net_rating": 1.8,
-            "estimated_offensive_rating": 105.4,
-            "estimated_defensive_rating": 103.6,
-            "estimated_net_rating": 1.8,
-            "assist_percentage": 0.099,
-            "assist_to_turnover": 1.17,
-            "assist_ratio": 11.3,
-            "offensive_rebound_pct": 0.011,
-            "defensive_rebound_pct": 0.089,
-            "rebound_pct": 0.051,
-            "turnover_pct": 9.7,
-            "effective_fg_pct": 0.509,
-            "true_shooting_pct": 0.533,
-            "usage_pct": 0.216,
-            "pace": 96.3,
-            "pace_per_40": 80.25,
-            "estimated_pace": 96.9,
-            "possessions": 5891,
-            "pie": 0.076,
-            "field_goals_made": 508,
-            "field_goals_attempted": 1205,
-            "field_goal_pct": 0.422,
-            "field_goals_made_pg": 6.2,
-            "field_goals_attempted_pg": 14.7,
-            "points": 1359,
-            "points_pg": 16.573170731707318,
-            "rebounds": 306,
-            "rebounds_pg": 3.731707317073171,
-            "offensive_rebounds": 32,
-            "defensive_rebounds": 274,
-            "assists": 183,
-            "assists_pg": 2.231707317073171,
-            "turnovers": 157,
-            "turnovers_pg": 1.9146341463414633,
-            "steals": 86,
-            "steals_pg": 1.048780487804878,
-            "blocks": 45,
-            "blocks_pg": 0.5487804878048781,
-            "personal_fouls": 237,
-            "personal_fouls_pg": 2.8902439024390243,
-            "three_pointers_made": 211,
-            "three_pointers_attempted": 526,
-            "three_point_pct": 0.401,
-            "three_pointers_made_pg": 2.573170731707317,
-            "three_pointers_attempted_pg": 6.414634146341464,
-            "two_pointers_made": 297,
-            "two_pointers_attempted": 679,
-            "two_point_pct": 0.4374079528718704,
-            "two_pointers_made_pg": 3.6219512195121952,
-            "two_pointers_attempted_pg": 8.28048780487805,
-            "free_throws_made": 132,
-            "free_throws_attempted": 157,
-            "free_throw_pct": 0.841,
-            "free_throws_made_pg": 1.6097560975609757,
-            "free_throws_attempted_pg": 1.9146341463414633,
-            "plus_minus": 110,
-            "plus_minus_pg": 1.3414634146341464,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 226,
-            "pts_2nd_chance": 115,
-            "pts_fb": 260,
-            "pts_paint": 264,
-            "opp_pts_off_tov": 1038,
-            "opp_pts_2nd_chance": 861,
-            "opp_pts_fb": 832,
-            "opp_pts_paint": 2550,
-            "pct_fgm": 0.215,
-            "pct_fga": 0.235,
-            "pct_fg3m": 0.389,
-            "pct_fg3a": 0.402,
-            "pct_ftm": 0.135,
-            "pct_fta": 0.127,
-            "pct_oreb": 0.049,
-            "pct_dreb": 0.131,
-            "pct_reb": 0.112,
-            "pct_ast": 0.128,
-            "pct_tov": 0.175,
-            "pct_stl": 0.205,
-            "pct_blk": 0.176,
-            "pct_blka": 0.129,
-            "pct_pf": 0.183,
-            "pct_pfd": 0.135,
-            "pct_pts": 0.218,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 1684,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2014,
-            "age": 24.0,
-            "games_played": 81,
-            "wins": 51,
-            "losses": 30,
-            "win_pct": 0.63,
-            "minutes_pg": 2868.0,
-            "offensive_rating": 109.4,
-            "defensive_rating": 100.3,
-            "net_rating": 9.1,
-            "estimated_offensive_rating": 109.0,
-            "estimated_defensive_rating": 99.5,
-            "estimated_net_rating": 9.5,
-            "assist_percentage": 0.097,
-            "assist_to_turnover": 1.34,
-            "assist_ratio": 10.9,
-            "offensive_rebound_pct": 0.014,
-            "defensive_rebound_pct": 0.07,
-            "rebound_pct": 0.043,
-            "turnover_pct": 8.1,
-            "effective_fg_pct": 0.533,
-            "true_shooting_pct": 0.555,
-            "usage_pct": 0.224,
-            "pace": 97.77,
-            "pace_per_40": 81.48,
-            "estimated_pace": 98.31,
-            "possessions": 5842,
-            "pie": 0.084,
-            "field_goals_made": 559,
-            "field_goals_attempted": 1259,
-            "field_goal_pct": 0.444,
-            "field_goals_made_pg": 6.9,
-            "field_goals_attempted_pg": 15.5,
-            "points": 1488,
-            "points_pg": 18.37037037037037,
-            "rebounds": 249,
-            "rebounds_pg": 3.074074074074074,
-            "offensive_rebounds": 38,
-            "defensive_rebounds": 211,
-            "assists": 181,
-            "assists_pg": 2.234567901234568,
-            "turnovers": 135,
-            "turnovers_pg": 1.6666666666666667,
-            "steals": 74,
-            "steals_pg": 0.9135802469135802,
-            "blocks": 37,
-            "blocks_pg": 0.4567901234567901,
-            "personal_fouls": 234,
-            "personal_fouls_pg": 2.888888888888889,
-            "three_pointers_made": 223,
-            "three_pointers_attempted": 535,
-            "three_point_pct": 0.417,
-            "three_pointers_made_pg": 2.753086419753086,
-            "three_pointers_attempted_pg": 6.604938271604938,
-            "two_pointers_made": 336,
-            "two_pointers_attempted": 724,
-            "two_point_pct": 0.46408839779005523,
-            "two_pointers_made_pg": 4.148148148148148,
-            "two_pointers_attempted_pg": 8.938271604938272,
-            "free_throws_made": 147,
-            "free_throws_attempted": 185,
-            "free_throw_pct": 0.795,
-            "free_throws_made_pg": 1.8148148148148149,
-            "free_throws_attempted_pg": 2.2839506172839505,
-            "plus_minus": 534,
-            "plus_minus_pg": 6.592592592592593,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 236,
-            "pts_2nd_chance": 160,
-            "pts_fb": 230,
-            "pts_paint": 350,
-            "opp_pts_off_tov": 993,
-            "opp_pts_2nd_chance": 787,
-            "opp_pts_fb": 767,
-            "opp_pts_paint": 2402,
-            "pct_fgm": 0.23,
-            "pct_fga": 0.247,
-            "pct_fg3m": 0.383,
-            "pct_fg3a": 0.367,
-            "pct_ftm": 0.155,
-            "pct_fta": 0.15,
-            "pct_oreb": 0.058,
-            "pct_dreb": 0.101,
-            "pct_reb": 0.091,
-            "pct_ast": 0.124,
-            "pct_tov": 0.154,
-            "pct_stl": 0.162,
-            "pct_blk": 0.129,
-            "pct_blka": 0.2,
-            "pct_pf": 0.184,
-            "pct_pfd": 0.152,
-            "pct_pts": 0.233,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 2163,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2015,
-            "age": 25.0,
-            "games_played": 77,
-            "wins": 64,
-            "losses": 13,
-            "win_pct": 0.831,
-            "minutes_pg": 2455.0,
-            "offensive_rating": 114.1,
-            "defensive_rating": 98.9,
-            "net_rating": 15.2,
-            "estimated_offensive_rating": 113.5,
-            "estimated_defensive_rating": 97.7,
-            "estimated_net_rating": 15.8,
-            "assist_percentage": 0.137,
-            "assist_to_turnover": 1.49,
-            "assist_ratio": 12.5,
-            "offensive_rebound_pct": 0.011,
-            "defensive_rebound_pct": 0.082,
-            "rebound_pct": 0.049,
-            "turnover_pct": 8.4,
-            "effective_fg_pct": 0.555,
-            "true_shooting_pct": 0.591,
-            "usage_pct": 0.272,
-            "pace": 100.37,
-            "pace_per_40": 83.64,
-            "estimated_pace": 101.3,
-            "possessions": 5131,
-            "pie": 0.126,
-            "field_goals_made": 602,
-            "field_goals_attempted": 1299,
-            "field_goal_pct": 0.463,
-            "field_goals_made_pg": 7.8,
-            "field_goals_attempted_pg": 16.9,
-            "points": 1668,
-            "points_pg": 21.662337662337663,
-            "rebounds": 247,
-            "rebounds_pg": 3.207792207792208,
-            "offensive_rebounds": 27,
-            "defensive_rebounds": 220,
-            "assists": 222,
-            "assists_pg": 2.883116883116883,
-            "turnovers": 149,
-            "turnovers_pg": 1.9350649350649352,
-            "steals": 87,
-            "steals_pg": 1.12987012987013,
-            "blocks": 60,
-            "blocks_pg": 0.7792207792207793,
-            "personal_fouls": 122,
-            "personal_fouls_pg": 1.5844155844155845,
-            "three_pointers_made": 239,
-            "three_pointers_attempted": 545,
-            "three_point_pct": 0.439,
-            "three_pointers_made_pg": 3.103896103896104,
-            "three_pointers_attempted_pg": 7.077922077922078,
-            "two_pointers_made": 363,
-            "two_pointers_attempted": 754,
-            "two_point_pct": 0.48143236074270557,
-            "two_pointers_made_pg": 4.714285714285714,
-            "two_pointers_attempted_pg": 9.792207792207792,
-            "free_throws_made": 225,
-            "free_throws_attempted": 256,
-            "free_throw_pct": 0.879,
-            "free_throws_made_pg": 2.9220779220779223,
-            "free_throws_attempted_pg": 3.324675324675325,
-            "plus_minus": 776,
-            "plus_minus_pg": 10.077922077922079,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 249,
-            "pts_2nd_chance": 111,
-            "pts_fb": 312,
-            "pts_paint": 454,
-            "opp_pts_off_tov": 771,
-            "opp_pts_2nd_chance": 699,
-            "opp_pts_fb": 685,
-            "opp_pts_paint": 2076,
-            "pct_fgm": 0.271,
-            "pct_fga": 0.288,
-            "pct_fg3m": 0.38,
-            "pct_fg3a": 0.355,
-            "pct_ftm": 0.284,
-            "pct_fta": 0.256,
-            "pct_oreb": 0.053,
-            "pct_dreb": 0.122,
-            "pct_reb": 0.107,
-            "pct_ast": 0.152,
-            "pct_tov": 0.206,
-            "pct_stl": 0.183,
-            "pct_blk": 0.189,
-            "pct_blka": 0.284,
-            "pct_pf": 0.124,
-            "pct_pfd": 0.212,
-            "pct_pts": 0.285,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 2633,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2016,
-            "age": 26.0,
-            "games_played": 80,
-            "wins": 71,
-            "losses": 9,
-            "win_pct": 0.888,
-            "minutes_pg": 2666.0,
-            "offensive_rating": 116.0,
-            "defensive_rating": 101.3,
-            "net_rating": 14.6,
-            "estimated_offensive_rating": 115.4,
-            "estimated_defensive_rating": 99.7,
-            "estimated_net_rating": 15.7,
-            "assist_percentage": 0.094,
-            "assist_to_turnover": 1.2,
-            "assist_ratio": 9.3,
-            "offensive_rebound_pct": 0.014,
-            "defensive_rebound_pct": 0.09,
-            "rebound_pct": 0.055,
-            "turnover_pct": 7.7,
-            "effective_fg_pct": 0.569,
-            "true_shooting_pct": 0.597,
-            "usage_pct": 0.26,
-            "pace": 101.35,
-            "pace_per_40": 84.46,
-            "estimated_pace": 102.43,
-            "possessions": 5636,
-            "pie": 0.114,
-            "field_goals_made": 651,
-            "field_goals_attempted": 1386,
-            "field_goal_pct": 0.47,
-            "field_goals_made_pg": 8.1,
-            "field_goals_attempted_pg": 17.3,
-            "points": 1771,
-            "points_pg": 22.1375,
-            "rebounds": 306,
-            "rebounds_pg": 3.825,
-            "offensive_rebounds": 35,
-            "defensive_rebounds": 271,
-            "assists": 166,
-            "assists_pg": 2.075,
-            "turnovers": 138,
-            "turnovers_pg": 1.725,
-            "steals": 60,
-            "steals_pg": 0.75,
-            "blocks": 49,
-            "blocks_pg": 0.6125,
-            "personal_fouls": 152,
-            "personal_fouls_pg": 1.9,
-            "three_pointers_made": 276,
-            "three_pointers_attempted": 650,
-            "three_point_pct": 0.425,
-            "three_pointers_made_pg": 3.45,
-            "three_pointers_attempted_pg": 8.125,
-            "two_pointers_made": 375,
-            "two_pointers_attempted": 736,
-            "two_point_pct": 0.5095108695652174,
-            "two_pointers_made_pg": 4.6875,
-            "two_pointers_attempted_pg": 9.2,
-            "free_throws_made": 193,
-            "free_throws_attempted": 221,
-            "free_throw_pct": 0.873,
-            "free_throws_made_pg": 2.4125,
-            "free_throws_attempted_pg": 2.7625,
-            "plus_minus": 837,
-            "plus_minus_pg": 10.4625,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 244,
-            "pts_2nd_chance": 158,
-            "pts_fb": 324,
-            "pts_paint": 496,
-            "opp_pts_off_tov": 932,
-            "opp_pts_2nd_chance": 751,
-            "opp_pts_fb": 779,
-            "opp_pts_paint": 2504,
-            "pct_fgm": 0.27,
-            "pct_fga": 0.289,
-            "pct_fg3m": 0.341,
-            "pct_fg3a": 0.347,
-            "pct_ftm": 0.213,
-            "pct_fta": 0.188,
-            "pct_oreb": 0.072,
-            "pct_dreb": 0.132,
-            "pct_reb": 0.12,
-            "pct_ast": 0.099,
-            "pct_tov": 0.164,
-            "pct_stl": 0.131,
-            "pct_blk": 0.143,
-            "pct_blka": 0.206,
-            "pct_pf": 0.137,
-            "pct_pfd": 0.152,
-            "pct_pts": 0.271,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 3112,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2017,
-            "age": 27.0,
-            "games_played": 78,
-            "wins": 66,
-            "losses": 12,
-            "win_pct": 0.846,
-            "minutes_pg": 2649.0,
-            "offensive_rating": 116.5,
-            "defensive_rating": 102.4,
-            "net_rating": 14.1,
-            "estimated_offensive_rating": 115.6,
-            "estimated_defensive_rating": 100.9,
-            "estimated_net_rating": 14.7,
-            "assist_percentage": 0.09,
-            "assist_to_turnover": 1.25,
-            "assist_ratio": 9.1,
-            "offensive_rebound_pct": 0.02,
-            "defensive_rebound_pct": 0.081,
-            "rebound_pct": 0.053,
-            "turnover_pct": 7.3,
-            "effective_fg_pct": 0.565,
-            "true_shooting_pct": 0.592,
-            "usage_pct": 0.258,
-            "pace": 101.02,
-            "pace_per_40": 84.18,
-            "estimated_pace": 102.17,
-            "possessions": 5582,
-            "pie": 0.109,
-            "field_goals_made": 644,
-            "field_goals_attempted": 1376,
-            "field_goal_pct": 0.468,
-            "field_goals_made_pg": 8.3,
-            "field_goals_attempted_pg": 17.6,
-            "points": 1742,
-            "points_pg": 22.333333333333332,
-            "rebounds": 285,
-            "rebounds_pg": 3.6538461538461537,
-            "offensive_rebounds": 49,
-            "defensive_rebounds": 236,
-            "assists": 160,
-            "assists_pg": 2.051282051282051,
-            "turnovers": 128,
-            "turnovers_pg": 1.641025641025641,
-            "steals": 66,
-            "steals_pg": 0.8461538461538461,
-            "blocks": 40,
-            "blocks_pg": 0.5128205128205128,
-            "personal_fouls": 139,
-            "personal_fouls_pg": 1.7820512820512822,
-            "three_pointers_made": 268,
-            "three_pointers_attempted": 647,
-            "three_point_pct": 0.414,
-            "three_pointers_made_pg": 3.4358974358974357,
-            "three_pointers_attempted_pg": 8.294871794871796,
-            "two_pointers_made": 376,
-            "two_pointers_attempted": 729,
-            "two_point_pct": 0.5157750342935528,
-            "two_pointers_made_pg": 4.82051282051282,
-            "two_pointers_attempted_pg": 9.346153846153847,
-            "free_throws_made": 186,
-            "free_throws_attempted": 218,
-            "free_throw_pct": 0.853,
-            "free_throws_made_pg": 2.3846153846153846,
-            "free_throws_attempted_pg": 2.7948717948717947,
-            "plus_minus": 800,
-            "plus_minus_pg": 10.256410256410257,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 313,
-            "pts_2nd_chance": 178,
-            "pts_fb": 329,
-            "pts_paint": 418,
-            "opp_pts_off_tov": 829,
-            "opp_pts_2nd_chance": 789,
-            "opp_pts_fb": 778,
-            "opp_pts_paint": 2502,
-            "pct_fgm": 0.266,
-            "pct_fga": 0.287,
-            "pct_fg3m": 0.383,
-            "pct_fg3a": 0.367,
-            "pct_ftm": 0.192,
-            "pct_fta": 0.182,
-            "pct_oreb": 0.101,
-            "pct_dreb": 0.122,
-            "pct_reb": 0.118,
-            "pct_ast": 0.091,
-            "pct_tov": 0.162,
-            "pct_stl": 0.123,
-            "pct_blk": 0.112,
-            "pct_blka": 0.204,
-            "pct_pf": 0.129,
-            "pct_pfd": 0.15,
-            "pct_pts": 0.268,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 3645,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2018,
-            "age": 28.0,
-            "games_played": 73,
-            "wins": 55,
-            "losses": 18,
-            "win_pct": 0.753,
-            "minutes_pg": 2504.0,
-            "offensive_rating": 112.6,
-            "defensive_rating": 105.6,
-            "net_rating": 7.1,
-            "estimated_offensive_rating": 113.5,
-            "estimated_defensive_rating": 103.7,
-            "estimated_net_rating": 9.8,
-            "assist_percentage": 0.108,
-            "assist_to_turnover": 1.45,
-            "assist_ratio": 12.1,
-            "offensive_rebound_pct": 0.014,
-            "defensive_rebound_pct": 0.089,
-            "rebound_pct": 0.055,
-            "turnover_pct": 8.3,
-            "effective_fg_pct": 0.586,
-            "true_shooting_pct": 0.599,
-            "usage_pct": 0.232,
-            "pace": 101.38,
-            "pace_per_40": 84.48,
-            "estimated_pace": 101.91,
-            "possessions": 5300,
-            "pie": 0.103,
-            "field_goals_made": 575,
-            "field_goals_attempted": 1177,
-            "field_goal_pct": 0.489,
-            "field_goals_made_pg": 7.9,
-            "field_goals_attempted_pg": 16.1,
-            "points": 1461,
-            "points_pg": 20.013698630136986,
-            "rebounds": 277,
-            "rebounds_pg": 3.7945205479452055,
-            "offensive_rebounds": 31,
-            "defensive_rebounds": 246,
-            "assists": 185,
-            "assists_pg": 2.5342465753424657,
-            "turnovers": 128,
-            "turnovers_pg": 1.7534246575342465,
-            "steals": 55,
-            "steals_pg": 0.7534246575342466,
-            "blocks": 34,
-            "blocks_pg": 0.4657534246575342,
-            "personal_fouls": 117,
-            "personal_fouls_pg": 1.6027397260273972,
-            "three_pointers_made": 229,
-            "three_pointers_attempted": 520,
-            "three_point_pct": 0.44,
-            "three_pointers_made_pg": 3.136986301369863,
-            "three_pointers_attempted_pg": 7.123287671232877,
-            "two_pointers_made": 346,
-            "two_pointers_attempted": 657,
-            "two_point_pct": 0.5266362252663622,
-            "two_pointers_made_pg": 4.739726027397261,
-            "two_pointers_attempted_pg": 9.0,
-            "free_throws_made": 82,
-            "free_throws_attempted": 98,
-            "free_throw_pct": 0.837,
-            "free_throws_made_pg": 1.1232876712328768,
-            "free_throws_attempted_pg": 1.3424657534246576,
-            "plus_minus": 397,
-            "plus_minus_pg": 5.438356164383562,
-            "double_doubles": 2,
-            "triple_doubles": 0,
-            "pts_off_tov": 177,
-            "pts_2nd_chance": 93,
-            "pts_fb": 277,
-            "pts_paint": 300,
-            "opp_pts_off_tov": 948,
-            "opp_pts_2nd_chance": 720,
-            "opp_pts_fb": 757,
-            "opp_pts_paint": 2416,
-            "pct_fgm": 0.252,
-            "pct_fga": 0.265,
-            "pct_fg3m": 0.374,
-            "pct_fg3a": 0.342,
-            "pct_ftm": 0.103,
-            "pct_fta": 0.101,
-            "pct_oreb": 0.073,
-            "pct_dreb": 0.132,
-            "pct_reb": 0.121,
-            "pct_ast": 0.112,
-            "pct_tov": 0.155,
-            "pct_stl": 0.131,
-            "pct_blk": 0.09,
-            "pct_blka": 0.16,
-            "pct_pf": 0.116,
-            "pct_pfd": 0.131,
-            "pct_pts": 0.245,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 4165,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2019,
-            "age": 29.0,
-            "games_played": 78,
-            "wins": 55,
-            "losses": 23,
-            "win_pct": 0.705,
-            "minutes_pg": 2652.0,
-            "offensive_rating": 115.0,
-            "defensive_rating": 108.5,
-            "net_rating": 6.5,
-            "estimated_offensive_rating": 114.7,
-            "estimated_defensive_rating": 107.1,
-            "estimated_net_rating": 7.6,
-            "assist_percentage": 0.103,
-            "assist_to_turnover": 1.62,
-            "assist_ratio": 10.5,
-            "offensive_rebound_pct": 0.015,
-            "defensive_rebound_pct": 0.089,
-            "rebound_pct": 0.055,
-            "turnover_pct": 6.5,
-            "effective_fg_pct": 0.553,
-            "true_shooting_pct": 0.571,
-            "usage_pct": 0.254,
-            "pace": 102.39,
-            "pace_per_40": 85.32,
-            "estimated_pace": 103.23,
-            "possessions": 5648,
-            "pie": 0.103,
-            "field_goals_made": 655,
-            "field_goals_attempted": 1402,
-            "field_goal_pct": 0.467,
-            "field_goals_made_pg": 8.4,
-            "field_goals_attempted_pg": 18.0,
-            "points": 1680,
-            "points_pg": 21.53846153846154,
-            "rebounds": 299,
-            "rebounds_pg": 3.8333333333333335,
-            "offensive_rebounds": 37,
-            "defensive_rebounds": 262,
-            "assists": 186,
-            "assists_pg": 2.3846153846153846,
-            "turnovers": 115,
-            "turnovers_pg": 1.4743589743589745,
-            "steals": 84,
-            "steals_pg": 1.0769230769230769,
-            "blocks": 47,
-            "blocks_pg": 0.6025641025641025,
-            "personal_fouls": 157,
-            "personal_fouls_pg": 2.0128205128205128,
-            "three_pointers_made": 241,
-            "three_pointers_attempted": 599,
-            "three_point_pct": 0.402,
-            "three_pointers_made_pg": 3.08974358974359,
-            "three_pointers_attempted_pg": 7.67948717948718,
-            "two_pointers_made": 414,
-            "two_pointers_attempted": 803,
-            "two_point_pct": 0.5155666251556662,
-            "two_pointers_made_pg": 5.3076923076923075,
-            "two_pointers_attempted_pg": 10.294871794871796,
-            "free_throws_made": 129,
-            "free_throws_attempted": 158,
-            "free_throw_pct": 0.816,
-            "free_throws_made_pg": 1.6538461538461537,
-            "free_throws_attempted_pg": 2.0256410256410255,
-            "plus_minus": 349,
-            "plus_minus_pg": 4.4743589743589745,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 221,
-            "pts_2nd_chance": 112,
-            "pts_fb": 276,
-            "pts_paint": 422,
-            "opp_pts_off_tov": 973,
-            "opp_pts_2nd_chance": 762,
-            "opp_pts_fb": 832,
-            "opp_pts_paint": 2628,
-            "pct_fgm": 0.267,
-            "pct_fga": 0.287,
-            "pct_fg3m": 0.331,
-            "pct_fg3a": 0.324,
-            "pct_ftm": 0.15,
-            "pct_fta": 0.149,
-            "pct_oreb": 0.079,
-            "pct_dreb": 0.133,
-            "pct_reb": 0.123,
-            "pct_ast": 0.109,
-            "pct_tov": 0.147,
-            "pct_stl": 0.198,
-            "pct_blk": 0.135,
-            "pct_blka": 0.194,
-            "pct_pf": 0.135,
-            "pct_pfd": 0.159,
-            "pct_pts": 0.259,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 5756,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2022,
-            "age": 32.0,
-            "games_played": 32,
-            "wins": 17,
-            "losses": 15,
-            "win_pct": 0.531,
-            "minutes_pg": 941.0,
-            "offensive_rating": 111.4,
-            "defensive_rating": 108.0,
-            "net_rating": 3.3,
-            "estimated_offensive_rating": 111.4,
-            "estimated_defensive_rating": 107.2,
-            "estimated_net_rating": 4.3,
-            "assist_percentage": 0.153,
-            "assist_to_turnover": 2.05,
-            "assist_ratio": 12.1,
-            "offensive_rebound_pct": 0.015,
-            "defensive_rebound_pct": 0.106,
-            "rebound_pct": 0.062,
-            "turnover_pct": 5.9,
-            "effective_fg_pct": 0.529,
-            "true_shooting_pct": 0.547,
-            "usage_pct": 0.284,
-            "pace": 101.53,
-            "pace_per_40": 84.6,
-            "estimated_pace": 101.92,
-            "possessions": 1990,
-            "pie": 0.114,
-            "field_goals_made": 246,
-            "field_goals_attempted": 573,
-            "field_goal_pct": 0.429,
-            "field_goals_made_pg": 7.7,
-            "field_goals_attempted_pg": 17.9,
-            "points": 652,
-            "points_pg": 20.375,
-            "rebounds": 125,
-            "rebounds_pg": 3.90625,
-            "offensive_rebounds": 15,
-            "defensive_rebounds": 110,
-            "assists": 88,
-            "assists_pg": 2.75,
-            "turnovers": 43,
-            "turnovers_pg": 1.34375,
-            "steals": 16,
-            "steals_pg": 0.5,
-            "blocks": 17,
-            "blocks_pg": 0.53125,
-            "personal_fouls": 54,
-            "personal_fouls_pg": 1.6875,
-            "three_pointers_made": 114,
-            "three_pointers_attempted": 296,
-            "three_point_pct": 0.385,
-            "three_pointers_made_pg": 3.5625,
-            "three_pointers_attempted_pg": 9.25,
-            "two_pointers_made": 132,
-            "two_pointers_attempted": 277,
-            "two_point_pct": 0.47653429602888087,
-            "two_pointers_made_pg": 4.125,
-            "two_pointers_attempted_pg": 8.65625,
-            "free_throws_made": 46,
-            "free_throws_attempted": 51,
-            "free_throw_pct": 0.902,
-            "free_throws_made_pg": 1.4375,
-            "free_throws_attempted_pg": 1.59375,
-            "plus_minus": 66,
-            "plus_minus_pg": 2.0625,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 99,
-            "pts_2nd_chance": 77,
-            "pts_fb": 96,
-            "pts_paint": 140,
-            "opp_pts_off_tov": 330,
-            "opp_pts_2nd_chance": 252,
-            "opp_pts_fb": 275,
-            "opp_pts_paint": 910,
-            "pct_fgm": 0.299,
-            "pct_fga": 0.328,
-            "pct_fg3m": 0.41,
-            "pct_fg3a": 0.393,
-            "pct_ftm": 0.156,
-            "pct_fta": 0.137,
-            "pct_oreb": 0.076,
-            "pct_dreb": 0.156,
-            "pct_reb": 0.139,
-            "pct_ast": 0.161,
-            "pct_tov": 0.158,
-            "pct_stl": 0.103,
-            "pct_blk": 0.207,
-            "pct_blka": 0.167,
-            "pct_pf": 0.133,
-            "pct_pfd": 0.117,
-            "pct_pts": 0.294,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6292,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2023,
-            "age": 33.0,
-            "games_played": 69,
-            "wins": 38,
-            "losses": 31,
-            "win_pct": 0.551,
-            "minutes_pg": 2279.0,
-            "offensive_rating": 115.4,
-            "defensive_rating": 112.6,
-            "net_rating": 2.9,
-            "estimated_offensive_rating": 114.7,
-            "estimated_defensive_rating": 111.4,
-            "estimated_net_rating": 3.2,
-            "assist_percentage": 0.105,
-            "assist_to_turnover": 1.33,
-            "assist_ratio": 10.2,
-            "offensive_rebound_pct": 0.017,
-            "defensive_rebound_pct": 0.101,
-            "rebound_pct": 0.06,
-            "turnover_pct": 7.7,
-            "effective_fg_pct": 0.556,
-            "true_shooting_pct": 0.576,
-            "usage_pct": 0.256,
-            "pace": 103.95,
-            "pace_per_40": 86.63,
-            "estimated_pace": 104.86,
-            "possessions": 4945,
-            "pie": 0.1,
-            "field_goals_made": 546,
-            "field_goals_attempted": 1252,
-            "field_goal_pct": 0.436,
-            "field_goals_made_pg": 7.9,
-            "field_goals_attempted_pg": 18.1,
-            "points": 1509,
-            "points_pg": 21.869565217391305,
-            "rebounds": 286,
-            "rebounds_pg": 4.144927536231884,
-            "offensive_rebounds": 39,
-            "defensive_rebounds": 247,
-            "assists": 163,
-            "assists_pg": 2.36231884057971,
-            "turnovers": 123,
-            "turnovers_pg": 1.7826086956521738,
-            "steals": 49,
-            "steals_pg": 0.7101449275362319,
-            "blocks": 29,
-            "blocks_pg": 0.42028985507246375,
-            "personal_fouls": 130,
-            "personal_fouls_pg": 1.8840579710144927,
-            "three_pointers_made": 301,
-            "three_pointers_attempted": 731,
-            "three_point_pct": 0.412,
-            "three_pointers_made_pg": 4.36231884057971,
-            "three_pointers_attempted_pg": 10.594202898550725,
-            "two_pointers_made": 245,
-            "two_pointers_attempted": 521,
-            "two_point_pct": 0.47024952015355087,
-            "two_pointers_made_pg": 3.550724637681159,
-            "two_pointers_attempted_pg": 7.550724637681159,
-            "free_throws_made": 116,
-            "free_throws_attempted": 132,
-            "free_throw_pct": 0.879,
-            "free_throws_made_pg": 1.681159420289855,
-            "free_throws_attempted_pg": 1.9130434782608696,
-            "plus_minus": 163,
-            "plus_minus_pg": 2.36231884057971,
-            "double_doubles": 2,
-            "triple_doubles": 0,
-            "pts_off_tov": 229,
-            "pts_2nd_chance": 150,
-            "pts_fb": 240,
-            "pts_paint": 280,
-            "opp_pts_off_tov": 861,
-            "opp_pts_2nd_chance": 627,
-            "opp_pts_fb": 730,
-            "opp_pts_paint": 2354,
-            "pct_fgm": 0.259,
-            "pct_fga": 0.288,
-            "pct_fg3m": 0.382,
-            "pct_fg3a": 0.359,
-            "pct_ftm": 0.163,
-            "pct_fta": 0.146,
-            "pct_oreb": 0.076,
-            "pct_dreb": 0.151,
-            "pct_reb": 0.133,
-            "pct_ast": 0.109,
-            "pct_tov": 0.167,
-            "pct_stl": 0.151,
-            "pct_blk": 0.151,
-            "pct_blka": 0.178,
-            "pct_pf": 0.129,
-            "pct_pfd": 0.111,
-            "pct_pts": 0.264,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6844,
-            "player_id": 202691,
-            "team_id": 17,
-            "season_id": 2024,
-            "age": 34.0,
-            "games_played": 77,
-            "wins": 41,
-            "losses": 36,
-            "win_pct": 0.532,
-            "minutes_pg": 2284.0,
-            "offensive_rating": 115.8,
-            "defensive_rating": 116.1,
-            "net_rating": -0.3,
-            "estimated_offensive_rating": 114.8,
-            "estimated_defensive_rating": 115.5,
-            "estimated_net_rating": -0.7,
-            "assist_percentage": 0.11,
-            "assist_to_turnover": 1.5,
-            "assist_ratio": 11.9,
-            "offensive_rebound_pct": 0.015,
-            "defensive_rebound_pct": 0.093,
-            "rebound_pct": 0.054,
-            "turnover_pct": 7.9,
-            "effective_fg_pct": 0.551,
-            "true_shooting_pct": 0.576,
-            "usage_pct": 0.234,
-            "pace": 101.9,
-            "pace_per_40": 84.91,
-            "estimated_pace": 102.58,
-            "possessions": 4858,
-            "pie": 0.09,
-            "field_goals_made": 490,
-            "field_goals_attempted": 1133,
-            "field_goal_pct": 0.432,
-            "field_goals_made_pg": 6.4,
-            "field_goals_attempted_pg": 14.7,
-            "points": 1375,
-            "points_pg": 17.857142857142858,
-            "rebounds": 254,
-            "rebounds_pg": 3.2987012987012987,
-            "offensive_rebounds": 35,
-            "defensive_rebounds": 219,
-            "assists": 176,
-            "assists_pg": 2.2857142857142856,
-            "turnovers": 117,
-            "turnovers_pg": 1.5194805194805194,
-            "steals": 50,
-            "steals_pg": 0.6493506493506493,
-            "blocks": 35,
-            "blocks_pg": 0.45454545454545453,
-            "personal_fouls": 127,
-            "personal_fouls_pg": 1.6493506493506493,
-            "three_pointers_made": 268,
-            "three_pointers_attempted": 692,
-            "three_point_pct": 0.387,
-            "three_pointers_made_pg": 3.4805194805194803,
-            "three_pointers_attempted_pg": 8.987012987012987,
-            "two_pointers_made": 222,
-            "two_pointers_attempted": 441,
-            "two_point_pct": 0.5034013605442177,
-            "two_pointers_made_pg": 2.883116883116883,
-            "two_pointers_attempted_pg": 5.7272727272727275,
-            "free_throws_made": 127,
-            "free_throws_attempted": 137,
-            "free_throw_pct": 0.927,
-            "free_throws_made_pg": 1.6493506493506493,
-            "free_throws_attempted_pg": 1.7792207792207793,
-            "plus_minus": 7,
-            "plus_minus_pg": 0.09090909090909091,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 184,
-            "pts_2nd_chance": 165,
-            "pts_fb": 170,
-            "pts_paint": 238,
-            "opp_pts_off_tov": 808,
-            "opp_pts_2nd_chance": 636,
-            "opp_pts_fb": 702,
-            "opp_pts_paint": 2470,
-            "pct_fgm": 0.235,
-            "pct_fga": 0.26,
-            "pct_fg3m": 0.369,
-            "pct_fg3a": 0.369,
-            "pct_ftm": 0.174,
-            "pct_fta": 0.148,
-            "pct_oreb": 0.064,
-            "pct_dreb": 0.138,
-            "pct_reb": 0.119,
-            "pct_ast": 0.124,
-            "pct_tov": 0.171,
-            "pct_stl": 0.161,
-            "pct_blk": 0.172,
-            "pct_blka": 0.116,
-            "pct_pf": 0.141,
-            "pct_pfd": 0.11,
-            "pct_pts": 0.244,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 7403,
-            "player_id": 202691,
-            "team_id": 15,
-            "season_id": 2025,
-            "age": 35.0,
-            "games_played": 72,
-            "wins": 33,
-            "losses": 39,
-            "win_pct": 0.458,
-            "minutes_pg": 1965.0,
-            "offensive_rating": 112.8,
-            "defensive_rating": 115.2,
-            "net_rating": -2.4,
-            "estimated_offensive_rating": 112.8,
-            "estimated_defensive_rating": 114.3,
-            "estimated_net_rating": -1.5,
-            "assist_percentage": 0.104,
-            "assist_to_turnover": 1.65,
-            "assist_ratio": 12.7,
-            "offensive_rebound_pct": 0.022,
-            "defensive_rebound_pct": 0.097,
-            "rebound_pct": 0.06,
-            "turnover_pct": 7.7,
-            "effective_fg_pct": 0.535,
-            "true_shooting_pct": 0.552,
-            "usage_pct": 0.214,
-            "pace": 100.53,
-            "pace_per_40": 83.77,
-            "estimated_pace": 100.94,
-            "possessions": 4123,
-            "pie": 0.083,
-            "field_goals_made": 361,
-            "field_goals_attempted": 877,
-            "field_goal_pct": 0.412,
-            "field_goals_made_pg": 5.0,
-            "field_goals_attempted_pg": 12.2,
-            "points": 1005,
-            "points_pg": 13.958333333333334,
-            "rebounds": 246,
-            "rebounds_pg": 3.4166666666666665,
-            "offensive_rebounds": 44,
-            "defensive_rebounds": 202,
-            "assists": 145,
-            "assists_pg": 2.013888888888889,
-            "turnovers": 88,
-            "turnovers_pg": 1.2222222222222223,
-            "steals": 50,
-            "steals_pg": 0.6944444444444444,
-            "blocks": 30,
-            "blocks_pg": 0.4166666666666667,
-            "personal_fouls": 81,
-            "personal_fouls_pg": 1.125,
-            "three_pointers_made": 216,
-            "three_pointers_attempted": 553,
-            "three_point_pct": 0.391,
-            "three_pointers_made_pg": 3.0,
-            "three_pointers_attempted_pg": 7.680555555555555,
-            "two_pointers_made": 145,
-            "two_pointers_attempted": 324,
-            "two_point_pct": 0.44753086419753085,
-            "two_pointers_made_pg": 2.013888888888889,
-            "two_pointers_attempted_pg": 4.5,
-            "free_throws_made": 67,
-            "free_throws_attempted": 74,
-            "free_throw_pct": 0.905,
-            "free_throws_made_pg": 0.9305555555555556,
-            "free_throws_attempted_pg": 1.0277777777777777,
-            "plus_minus": -79,
-            "plus_minus_pg": -1.0972222222222223,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 141,
-            "pts_2nd_chance": 109,
-            "pts_fb": 134,
-            "pts_paint": 154,
-            "opp_pts_off_tov": 688,
-            "opp_pts_2nd_chance": 647,
-            "opp_pts_fb": 654,
-            "opp_pts_paint": 2196,
-            "pct_fgm": 0.206,
-            "pct_fga": 0.238,
-            "pct_fg3m": 0.401,
-            "pct_fg3a": 0.371,
-            "pct_ftm": 0.111,
-            "pct_fta": 0.095,
-            "pct_oreb": 0.102,
-            "pct_dreb": 0.15,
-            "pct_reb": 0.138,
-            "pct_ast": 0.132,
-            "pct_tov": 0.167,
-            "pct_stl": 0.163,
-            "pct_blk": 0.124,
-            "pct_blka": 0.111,
-            "pct_pf": 0.115,
-            "pct_pfd": 0.076,
-            "pct_pts": 0.216,
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 5,
-            "city": "Cleveland",
-            "name": "Cleveland Cavaliers",
-            "nickname": "Cavaliers",
-            "abbreviation": "CLE",
-            "conference": "Eastern",
-            "division": "Central",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 1,
-            "city": "Boston",
-            "name": "Boston Celtics",
-            "nickname": "Celtics",
-            "abbreviation": "BOS",
-            "conference": "Eastern",
-            "division": "Atlantic",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 4,
-            "city": "Chicago",
-            "name": "Chicago Bulls",
-            "nickname": "Bulls",
-            "abbreviation": "CHI",
-            "conference": "Eastern",
-            "division": "Central",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 20,
-            "city": "Los Angeles",
-            "name": "Los Angeles Lakers",
-            "nickname": "Lakers",
-            "abbreviation": "LAL",
-            "conference": "Western",
-            "division": "Pacific",
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 202684,
-            "name": "Tristan Thompson",
-            "first_name": "Tristan",
-            "last_name": "Thompson",
-            "height_inches": 81,
-            "weight_pounds": 254,
-            "birth_date": "1991-03-13T00:00:00",
-            "country": "Canada",
-            "school": "Texas-Austin",
-            "position": "Center-Forward",
-            "draft_year": 2011,
-            "draft_round": 1,
-            "draft_number": 4,
-            "roster_status": 0,
-            "is_gleague_player": 0,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 8022,
-            "player_id": 202684,
-            "team_id": 17,
-            "value": 815615,
-            "start_year": 2018,
-            "duration": 1,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 9084,
-            "player_id": 202684,
-            "team_id": 20,
-            "value": 16700,
-            "start_year": 2023,
-            "duration": 1,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 9640,
-            "player_id": 202684,
-            "team_id": 5,
-            "value": 82000000,
-            "start_year": 2016,
-            "duration": 5,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 10340,
-            "player_id": 202684,
-            "team_id": 4,
-            "value": 1000000,
-            "start_year": 2022,
-            "duration": 1,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 11702,
-            "player_id": 202684,
-            "team_id": 1,
-            "value": 18978900,
-            "start_year": 2021,
-            "duration": 2,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 12929,
-            "player_id": 202684,
-            "team_id": 5,
-            "value": 3303771,
-            "start_year": 2025,
-            "duration": 1,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 13650,
-            "player_id": 202684,
-            "team_id": 5,
-            "value": 3196448,
-            "start_year": 2024,
-            "duration": 1,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 14813,
-            "player_id": 202684,
-            "team_id": 5,
-            "value": 16821270,
-            "start_year": 2012,
-            "duration": 4,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 12786,
-            "season_id": 2021,
-            "team_id": 1,
-            "player_id": 202684,
-            "cap_hit_percent": 8.48,
-            "salary": 9258000,
-            "apron_salary": 9258000,
-            "luxury_tax": 9258000,
-            "cash_total": 9258000,
-            "cash_garunteed": 9258000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13613,
-            "season_id": 2022,
-            "team_id": 4,
-            "player_id": 202684,
-            "cap_hit_percent": 0.89,
-            "salary": 1000000,
-            "apron_salary": 1000000,
-            "luxury_tax": 1000000,
-            "cash_total": 1000000,
-            "cash_garunteed": 1000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13716,
-            "season_id": 2012,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 6.42,
-            "salary": 3726600,
-            "apron_salary": 3726600,
-            "luxury_tax": 3726600,
-            "cash_total": 2999459,
-            "cash_garunteed": 2999459,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13731,
-            "season_id": 2013,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 6.71,
-            "salary": 3894240,
-            "apron_salary": 3894240,
-            "luxury_tax": 3894240,
-            "cash_total": 3894240,
-            "cash_garunteed": 3894240,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13748,
-            "season_id": 2014,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 6.92,
-            "salary": 4062000,
-            "apron_salary": 4062000,
-            "luxury_tax": 4062000,
-            "cash_total": 4062000,
-            "cash_garunteed": 4062000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13762,
-            "season_id": 2015,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 8.15,
-            "salary": 5138430,
-            "apron_salary": 5138430,
-            "luxury_tax": 5138430,
-            "cash_total": 5138430,
-            "cash_garunteed": 5138430,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13775,
-            "season_id": 2016,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 20.37,
-            "salary": 14260870,
-            "apron_salary": 14260870,
-            "luxury_tax": 14260870,
-            "cash_total": 14260870,
-            "cash_garunteed": 14260870,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13790,
-            "season_id": 2017,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 16.28,
-            "salary": 15330435,
-            "apron_salary": 15330435,
-            "luxury_tax": 15330435,
-            "cash_total": 15330435,
-            "cash_garunteed": 15330435,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13805,
-            "season_id": 2018,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 16.55,
-            "salary": 16400000,
-            "apron_salary": 16400000,
-            "luxury_tax": 16400000,
-            "cash_total": 16400000,
-            "cash_garunteed": 16400000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13820,
-            "season_id": 2019,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 17.15,
-            "salary": 17469565,
-            "apron_salary": 17469565,
-            "luxury_tax": 17469565,
-            "cash_total": 17469565,
-            "cash_garunteed": 17469565,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13839,
-            "season_id": 2020,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 16.99,
-            "salary": 18539130,
-            "apron_salary": 18539130,
-            "luxury_tax": 18539130,
-            "cash_total": 17380434,
-            "cash_garunteed": 18539130,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13915,
-            "season_id": 2024,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 1.48,
-            "salary": 2019706,
-            "apron_salary": 2019706,
-            "luxury_tax": 1656474,
-            "cash_total": 3196448,
-            "cash_garunteed": 3196448,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13933,
-            "season_id": 2025,
-            "team_id": 5,
-            "player_id": 202684,
-            "cap_hit_percent": 1.48,
-            "salary": 2087519,
-            "apron_salary": 2087519,
-            "luxury_tax": 2087519,
-            "cash_total": 3303771,
-            "cash_garunteed": 3303771,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 16062,
-            "season_id": 2023,
-            "team_id": 20,
-            "player_id": 202684,
-            "cap_hit_percent": 0.01,
-            "salary": 10552,
-            "apron_salary": 10552,
-            "luxury_tax": 10552,
-            "cash_total": 16700,
-            "cash_garunteed": 16700,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 751,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2012,
-            "age": 21.0,
-            "games_played": 60,
-            "wins": 18,
-            "losses": 42,
-            "win_pct": 0.3,
-            "minutes_pg": 1424.0,
-            "offensive_rating": 97.3,
-            "defensive_rating": 108.5,
-            "net_rating": -11.2,
-            "estimated_offensive_rating": 96.2,
-            "estimated_defensive_rating": 107.8,
-            "estimated_net_rating": -11.6,
-            "assist_percentage": 0.035,
-            "assist_to_turnover": 0.33,
-            "assist_ratio": 4.2,
-            "offensive_rebound_pct": 0.124,
-            "defensive_rebound_pct": 0.146,
-            "rebound_pct": 0.134,
-            "turnover_pct": 12.7,
-            "effective_fg_pct": 0.439,
-            "true_shooting_pct": 0.469,
-            "usage_pct": 0.189,
-            "pace": 92.06,
-            "pace_per_40": 76.71,
-            "estimated_pace": 92.86,
-            "possessions": 2728,
-            "pie": 0.074,
-            "field_goals_made": 194,
-            "field_goals_attempted": 442,
-            "field_goal_pct": 0.439,
-            "field_goals_made_pg": 3.2,
-            "field_goals_attempted_pg": 7.4,
-            "points": 494,
-            "points_pg": 8.233333333333333,
-            "rebounds": 389,
-            "rebounds_pg": 6.483333333333333,
-            "offensive_rebounds": 187,
-            "defensive_rebounds": 202,
-            "assists": 27,
-            "assists_pg": 0.45,
-            "turnovers": 81,
-            "turnovers_pg": 1.35,
-            "steals": 27,
-            "steals_pg": 0.45,
-            "blocks": 62,
-            "blocks_pg": 1.0333333333333334,
-            "personal_fouls": 134,
-            "personal_fouls_pg": 2.2333333333333334,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 2,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.03333333333333333,
-            "two_pointers_made": 194,
-            "two_pointers_attempted": 440,
-            "two_point_pct": 0.4409090909090909,
-            "two_pointers_made_pg": 3.2333333333333334,
-            "two_pointers_attempted_pg": 7.333333333333333,
-            "free_throws_made": 106,
-            "free_throws_attempted": 192,
-            "free_throw_pct": 0.552,
-            "free_throws_made_pg": 1.7666666666666666,
-            "free_throws_attempted_pg": 3.2,
-            "plus_minus": -310,
-            "plus_minus_pg": -5.166666666666667,
-            "double_doubles": 9,
-            "triple_doubles": 0,
-            "pts_off_tov": 83,
-            "pts_2nd_chance": 155,
-            "pts_fb": 32,
-            "pts_paint": 380,
-            "opp_pts_off_tov": 466,
-            "opp_pts_2nd_chance": 414,
-            "opp_pts_fb": 365,
-            "opp_pts_paint": 1328,
-            "pct_fgm": 0.203,
-            "pct_fga": 0.188,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.004,
-            "pct_ftm": 0.189,
-            "pct_fta": 0.242,
-            "pct_oreb": 0.461,
-            "pct_dreb": 0.233,
-            "pct_reb": 0.306,
-            "pct_ast": 0.052,
-            "pct_tov": 0.174,
-            "pct_stl": 0.139,
-            "pct_blk": 0.504,
-            "pct_blka": 0.347,
-            "pct_pf": 0.226,
-            "pct_pfd": 0.217,
-            "pct_pts": 0.186,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 1202,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2013,
-            "age": 22.0,
-            "games_played": 82,
-            "wins": 24,
-            "losses": 58,
-            "win_pct": 0.293,
-            "minutes_pg": 2564.0,
-            "offensive_rating": 103.0,
-            "defensive_rating": 107.6,
-            "net_rating": -4.6,
-            "estimated_offensive_rating": 101.3,
-            "estimated_defensive_rating": 107.0,
-            "estimated_net_rating": -5.7,
-            "assist_percentage": 0.069,
-            "assist_to_turnover": 0.88,
-            "assist_ratio": 9.3,
-            "offensive_rebound_pct": 0.114,
-            "defensive_rebound_pct": 0.196,
-            "rebound_pct": 0.153,
-            "turnover_pct": 10.6,
-            "effective_fg_pct": 0.488,
-            "true_shooting_pct": 0.516,
-            "usage_pct": 0.181,
-            "pace": 93.61,
-            "pace_per_40": 78.01,
-            "estimated_pace": 94.67,
-            "possessions": 4999,
-            "pie": 0.102,
-            "field_goals_made": 390,
-            "field_goals_attempted": 799,
-            "field_goal_pct": 0.488,
-            "field_goals_made_pg": 4.8,
-            "field_goals_attempted_pg": 9.7,
-            "points": 957,
-            "points_pg": 11.670731707317072,
-            "rebounds": 773,
-            "rebounds_pg": 9.426829268292684,
-            "offensive_rebounds": 306,
-            "defensive_rebounds": 467,
-            "assists": 108,
-            "assists_pg": 1.3170731707317074,
-            "turnovers": 123,
-            "turnovers_pg": 1.5,
-            "steals": 60,
-            "steals_pg": 0.7317073170731707,
-            "blocks": 71,
-            "blocks_pg": 0.8658536585365854,
-            "personal_fouls": 234,
-            "personal_fouls_pg": 2.8536585365853657,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 3,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.036585365853658534,
-            "two_pointers_made": 390,
-            "two_pointers_attempted": 796,
-            "two_point_pct": 0.4899497487437186,
-            "two_pointers_made_pg": 4.7560975609756095,
-            "two_pointers_attempted_pg": 9.707317073170731,
-            "free_throws_made": 177,
-            "free_throws_attempted": 291,
-            "free_throw_pct": 0.608,
-            "free_throws_made_pg": 2.158536585365854,
-            "free_throws_attempted_pg": 3.548780487804878,
-            "plus_minus": -234,
-            "plus_minus_pg": -2.8536585365853657,
-            "double_doubles": 31,
-            "triple_doubles": 0,
-            "pts_off_tov": 153,
-            "pts_2nd_chance": 273,
-            "pts_fb": 43,
-            "pts_paint": 696,
-            "opp_pts_off_tov": 778,
-            "opp_pts_2nd_chance": 751,
-            "opp_pts_fb": 733,
-            "opp_pts_paint": 2348,
-            "pct_fgm": 0.199,
-            "pct_fga": 0.178,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.003,
-            "pct_ftm": 0.2,
-            "pct_fta": 0.248,
-            "pct_oreb": 0.473,
-            "pct_dreb": 0.301,
-            "pct_reb": 0.352,
-            "pct_ast": 0.102,
-            "pct_tov": 0.17,
-            "pct_stl": 0.142,
-            "pct_blk": 0.323,
-            "pct_blka": 0.315,
-            "pct_pf": 0.214,
-            "pct_pfd": 0.246,
-            "pct_pts": 0.186,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 1677,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2014,
-            "age": 23.0,
-            "games_played": 82,
-            "wins": 33,
-            "losses": 49,
-            "win_pct": 0.402,
-            "minutes_pg": 2594.0,
-            "offensive_rating": 103.7,
-            "defensive_rating": 108.7,
-            "net_rating": -5.0,
-            "estimated_offensive_rating": 102.1,
-            "estimated_defensive_rating": 107.1,
-            "estimated_net_rating": -4.9,
-            "assist_percentage": 0.044,
-            "assist_to_turnover": 0.67,
-            "assist_ratio": 6.6,
-            "offensive_rebound_pct": 0.099,
-            "defensive_rebound_pct": 0.193,
-            "rebound_pct": 0.144,
-            "turnover_pct": 9.9,
-            "effective_fg_pct": 0.477,
-            "true_shooting_pct": 0.528,
-            "usage_pct": 0.173,
-            "pace": 93.78,
-            "pace_per_40": 78.15,
-            "estimated_pace": 95.2,
-            "possessions": 5080,
-            "pie": 0.098,
-            "field_goals_made": 363,
-            "field_goals_attempted": 761,
-            "field_goal_pct": 0.477,
-            "field_goals_made_pg": 4.4,
-            "field_goals_attempted_pg": 9.3,
-            "points": 961,
-            "points_pg": 11.71951219512195,
-            "rebounds": 754,
-            "rebounds_pg": 9.195121951219512,
-            "offensive_rebounds": 269,
-            "defensive_rebounds": 485,
-            "assists": 72,
-            "assists_pg": 0.8780487804878049,
-            "turnovers": 108,
-            "turnovers_pg": 1.3170731707317074,
-            "steals": 42,
-            "steals_pg": 0.5121951219512195,
-            "blocks": 35,
-            "blocks_pg": 0.4268292682926829,
-            "personal_fouls": 188,
-            "personal_fouls_pg": 2.292682926829268,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 1,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.012195121951219513,
-            "two_pointers_made": 363,
-            "two_pointers_attempted": 760,
-            "two_point_pct": 0.4776315789473684,
-            "two_pointers_made_pg": 4.426829268292683,
-            "two_pointers_attempted_pg": 9.268292682926829,
-            "free_throws_made": 235,
-            "free_throws_attempted": 339,
-            "free_throw_pct": 0.693,
-            "free_throws_made_pg": 2.8658536585365852,
-            "free_throws_attempted_pg": 4.134146341463414,
-            "plus_minus": -228,
-            "plus_minus_pg": -2.7804878048780486,
-            "double_doubles": 36,
-            "triple_doubles": 0,
-            "pts_off_tov": 169,
-            "pts_2nd_chance": 208,
-            "pts_fb": 87,
-            "pts_paint": 630,
-            "opp_pts_off_tov": 814,
-            "opp_pts_2nd_chance": 666,
-            "opp_pts_fb": 694,
-            "opp_pts_paint": 2162,
-            "pct_fgm": 0.182,
-            "pct_fga": 0.167,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.001,
-            "pct_ftm": 0.259,
-            "pct_fta": 0.28,
-            "pct_oreb": 0.409,
-            "pct_dreb": 0.287,
-            "pct_reb": 0.321,
-            "pct_ast": 0.063,
-            "pct_tov": 0.149,
-            "pct_stl": 0.109,
-            "pct_blk": 0.178,
-            "pct_blka": 0.318,
-            "pct_pf": 0.188,
-            "pct_pfd": 0.255,
-            "pct_pts": 0.182,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 2157,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2015,
-            "age": 24.0,
-            "games_played": 82,
-            "wins": 53,
-            "losses": 29,
-            "win_pct": 0.646,
-            "minutes_pg": 2194.0,
-            "offensive_rating": 110.5,
-            "defensive_rating": 104.5,
-            "net_rating": 5.9,
-            "estimated_offensive_rating": 108.8,
-            "estimated_defensive_rating": 104.2,
-            "estimated_net_rating": 4.5,
-            "assist_percentage": 0.028,
-            "assist_to_turnover": 0.47,
-            "assist_ratio": 5.4,
-            "offensive_rebound_pct": 0.124,
-            "defensive_rebound_pct": 0.174,
-            "rebound_pct": 0.149,
-            "turnover_pct": 11.4,
-            "effective_fg_pct": 0.547,
-            "true_shooting_pct": 0.58,
-            "usage_pct": 0.139,
-            "pace": 93.41,
-            "pace_per_40": 77.84,
-            "estimated_pace": 94.28,
-            "possessions": 4253,
-            "pie": 0.097,
-            "field_goals_made": 267,
-            "field_goals_attempted": 488,
-            "field_goal_pct": 0.547,
-            "field_goals_made_pg": 3.3,
-            "field_goals_attempted_pg": 6.0,
-            "points": 693,
-            "points_pg": 8.451219512195122,
-            "rebounds": 657,
-            "rebounds_pg": 8.012195121951219,
-            "offensive_rebounds": 274,
-            "defensive_rebounds": 383,
-            "assists": 39,
-            "assists_pg": 0.47560975609756095,
-            "turnovers": 83,
-            "turnovers_pg": 1.0121951219512195,
-            "steals": 34,
-            "steals_pg": 0.4146341463414634,
-            "blocks": 61,
-            "blocks_pg": 0.7439024390243902,
-            "personal_fouls": 189,
-            "personal_fouls_pg": 2.3048780487804876,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 0,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.0,
-            "two_pointers_made": 267,
-            "two_pointers_attempted": 488,
-            "two_point_pct": 0.5471311475409836,
-            "two_pointers_made_pg": 3.2560975609756095,
-            "two_pointers_attempted_pg": 5.951219512195122,
-            "free_throws_made": 159,
-            "free_throws_attempted": 248,
-            "free_throw_pct": 0.641,
-            "free_throws_made_pg": 1.9390243902439024,
-            "free_throws_attempted_pg": 3.024390243902439,
-            "plus_minus": 218,
-            "plus_minus_pg": 2.658536585365854,
-            "double_doubles": 14,
-            "triple_doubles": 0,
-            "pts_off_tov": 99,
-            "pts_2nd_chance": 180,
-            "pts_fb": 63,
-            "pts_paint": 508,
-            "opp_pts_off_tov": 703,
-            "opp_pts_2nd_chance": 581,
-            "opp_pts_fb": 493,
-            "opp_pts_paint": 1934,
-            "pct_fgm": 0.159,
-            "pct_fga": 0.13,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.0,
-            "pct_ftm": 0.18,
-            "pct_fta": 0.212,
-            "pct_oreb": 0.502,
-            "pct_dreb": 0.269,
-            "pct_reb": 0.334,
-            "pct_ast": 0.042,
-            "pct_tov": 0.138,
-            "pct_stl": 0.106,
-            "pct_blk": 0.337,
-            "pct_blka": 0.248,
-            "pct_pf": 0.214,
-            "pct_pfd": 0.229,
-            "pct_pts": 0.148,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 2627,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2016,
-            "age": 25.0,
-            "games_played": 82,
-            "wins": 57,
-            "losses": 25,
-            "win_pct": 0.695,
-            "minutes_pg": 2269.0,
-            "offensive_rating": 111.0,
-            "defensive_rating": 102.2,
-            "net_rating": 8.7,
-            "estimated_offensive_rating": 109.6,
-            "estimated_defensive_rating": 101.7,
-            "estimated_net_rating": 7.8,
-            "assist_percentage": 0.04,
-            "assist_to_turnover": 1.02,
-            "assist_ratio": 9.5,
-            "offensive_rebound_pct": 0.116,
-            "defensive_rebound_pct": 0.209,
-            "rebound_pct": 0.162,
-            "turnover_pct": 9.4,
-            "effective_fg_pct": 0.588,
-            "true_shooting_pct": 0.611,
-            "usage_pct": 0.114,
-            "pace": 94.81,
-            "pace_per_40": 79.01,
-            "estimated_pace": 95.64,
-            "possessions": 4466,
-            "pie": 0.106,
-            "field_goals_made": 247,
-            "field_goals_attempted": 420,
-            "field_goal_pct": 0.588,
-            "field_goals_made_pg": 3.0,
-            "field_goals_attempted_pg": 5.1,
-            "points": 643,
-            "points_pg": 7.841463414634147,
-            "rebounds": 738,
-            "rebounds_pg": 9.0,
-            "offensive_rebounds": 268,
-            "defensive_rebounds": 470,
-            "assists": 62,
-            "assists_pg": 0.7560975609756098,
-            "turnovers": 61,
-            "turnovers_pg": 0.7439024390243902,
-            "steals": 38,
-            "steals_pg": 0.4634146341463415,
-            "blocks": 51,
-            "blocks_pg": 0.6219512195121951,
-            "personal_fouls": 202,
-            "personal_fouls_pg": 2.4634146341463414,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 0,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.0,
-            "two_pointers_made": 247,
-            "two_pointers_attempted": 420,
-            "two_point_pct": 0.5880952380952381,
-            "two_pointers_made_pg": 3.0121951219512195,
-            "two_pointers_attempted_pg": 5.121951219512195,
-            "free_throws_made": 149,
-            "free_throws_attempted": 242,
-            "free_throw_pct": 0.616,
-            "free_throws_made_pg": 1.8170731707317074,
-            "free_throws_attempted_pg": 2.951219512195122,
-            "plus_minus": 357,
-            "plus_minus_pg": 4.353658536585366,
-            "double_doubles": 23,
-            "triple_doubles": 0,
-            "pts_off_tov": 91,
-            "pts_2nd_chance": 213,
-            "pts_fb": 42,
-            "pts_paint": 484,
-            "opp_pts_off_tov": 702,
-            "opp_pts_2nd_chance": 498,
-            "opp_pts_fb": 469,
-            "opp_pts_paint": 1934,
-            "pct_fgm": 0.136,
-            "pct_fga": 0.105,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.0,
-            "pct_ftm": 0.183,
-            "pct_fta": 0.225,
-            "pct_oreb": 0.492,
-            "pct_dreb": 0.293,
-            "pct_reb": 0.343,
-            "pct_ast": 0.06,
-            "pct_tov": 0.101,
-            "pct_stl": 0.121,
-            "pct_blk": 0.29,
-            "pct_blka": 0.189,
-            "pct_pf": 0.207,
-            "pct_pfd": 0.222,
-            "pct_pts": 0.13,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 3107,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2017,
-            "age": 26.0,
-            "games_played": 78,
-            "wins": 50,
-            "losses": 28,
-            "win_pct": 0.641,
-            "minutes_pg": 2336.0,
-            "offensive_rating": 112.3,
-            "defensive_rating": 109.0,
-            "net_rating": 3.3,
-            "estimated_offensive_rating": 110.6,
-            "estimated_defensive_rating": 107.7,
-            "estimated_net_rating": 2.9,
-            "assist_percentage": 0.046,
-            "assist_to_turnover": 1.2,
-            "assist_ratio": 11.4,
-            "offensive_rebound_pct": 0.12,
-            "defensive_rebound_pct": 0.177,
-            "rebound_pct": 0.148,
-            "turnover_pct": 9.5,
-            "effective_fg_pct": 0.6,
-            "true_shooting_pct": 0.594,
-            "usage_pct": 0.112,
-            "pace": 96.92,
-            "pace_per_40": 80.77,
-            "estimated_pace": 98.28,
-            "possessions": 4708,
-            "pie": 0.089,
-            "field_goals_made": 262,
-            "field_goals_attempted": 437,
-            "field_goal_pct": 0.6,
-            "field_goals_made_pg": 3.4,
-            "field_goals_attempted_pg": 5.6,
-            "points": 630,
-            "points_pg": 8.076923076923077,
-            "rebounds": 715,
-            "rebounds_pg": 9.166666666666666,
-            "offensive_rebounds": 286,
-            "defensive_rebounds": 429,
-            "assists": 77,
-            "assists_pg": 0.9871794871794872,
-            "turnovers": 64,
-            "turnovers_pg": 0.8205128205128205,
-            "steals": 39,
-            "steals_pg": 0.5,
-            "blocks": 84,
-            "blocks_pg": 1.0769230769230769,
-            "personal_fouls": 176,
-            "personal_fouls_pg": 2.2564102564102564,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 3,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.038461538461538464,
-            "two_pointers_made": 262,
-            "two_pointers_attempted": 434,
-            "two_point_pct": 0.6036866359447005,
-            "two_pointers_made_pg": 3.358974358974359,
-            "two_pointers_attempted_pg": 5.564102564102564,
-            "free_throws_made": 106,
-            "free_throws_attempted": 213,
-            "free_throw_pct": 0.498,
-            "free_throws_made_pg": 1.358974358974359,
-            "free_throws_attempted_pg": 2.730769230769231,
-            "plus_minus": 133,
-            "plus_minus_pg": 1.705128205128205,
-            "double_doubles": 19,
-            "triple_doubles": 0,
-            "pts_off_tov": 76,
-            "pts_2nd_chance": 155,
-            "pts_fb": 61,
-            "pts_paint": 510,
-            "opp_pts_off_tov": 800,
-            "opp_pts_2nd_chance": 637,
-            "opp_pts_fb": 721,
-            "opp_pts_paint": 2204,
-            "pct_fgm": 0.135,
-            "pct_fga": 0.104,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.002,
-            "pct_ftm": 0.131,
-            "pct_fta": 0.196,
-            "pct_oreb": 0.539,
-            "pct_dreb": 0.256,
-            "pct_reb": 0.324,
-            "pct_ast": 0.074,
-            "pct_tov": 0.099,
-            "pct_stl": 0.118,
-            "pct_blk": 0.424,
-            "pct_blka": 0.201,
-            "pct_pf": 0.226,
-            "pct_pfd": 0.203,
-            "pct_pts": 0.119,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 3641,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2018,
-            "age": 27.0,
-            "games_played": 53,
-            "wins": 27,
-            "losses": 26,
-            "win_pct": 0.509,
-            "minutes_pg": 1072.0,
-            "offensive_rating": 107.7,
-            "defensive_rating": 113.2,
-            "net_rating": -5.5,
-            "estimated_offensive_rating": 107.0,
-            "estimated_defensive_rating": 112.1,
-            "estimated_net_rating": -5.1,
-            "assist_percentage": 0.043,
-            "assist_to_turnover": 0.92,
-            "assist_ratio": 9.8,
-            "offensive_rebound_pct": 0.113,
-            "defensive_rebound_pct": 0.21,
-            "rebound_pct": 0.161,
-            "turnover_pct": 10.7,
-            "effective_fg_pct": 0.562,
-            "true_shooting_pct": 0.569,
-            "usage_pct": 0.121,
-            "pace": 99.74,
-            "pace_per_40": 83.12,
-            "estimated_pace": 100.54,
-            "possessions": 2221,
-            "pie": 0.085,
-            "field_goals_made": 132,
-            "field_goals_attempted": 235,
-            "field_goal_pct": 0.562,
-            "field_goals_made_pg": 2.5,
-            "field_goals_attempted_pg": 4.4,
-            "points": 307,
-            "points_pg": 5.7924528301886795,
-            "rebounds": 352,
-            "rebounds_pg": 6.6415094339622645,
-            "offensive_rebounds": 126,
-            "defensive_rebounds": 226,
-            "assists": 33,
-            "assists_pg": 0.6226415094339622,
-            "turnovers": 36,
-            "turnovers_pg": 0.6792452830188679,
-            "steals": 16,
-            "steals_pg": 0.3018867924528302,
-            "blocks": 17,
-            "blocks_pg": 0.32075471698113206,
-            "personal_fouls": 102,
-            "personal_fouls_pg": 1.9245283018867925,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 0,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.0,
-            "two_pointers_made": 132,
-            "two_pointers_attempted": 235,
-            "two_point_pct": 0.5617021276595745,
-            "two_pointers_made_pg": 2.490566037735849,
-            "two_pointers_attempted_pg": 4.433962264150943,
-            "free_throws_made": 43,
-            "free_throws_attempted": 79,
-            "free_throw_pct": 0.544,
-            "free_throws_made_pg": 0.8113207547169812,
-            "free_throws_attempted_pg": 1.490566037735849,
-            "plus_minus": -138,
-            "plus_minus_pg": -2.6037735849056602,
-            "double_doubles": 3,
-            "triple_doubles": 0,
-            "pts_off_tov": 24,
-            "pts_2nd_chance": 79,
-            "pts_fb": 31,
-            "pts_paint": 254,
-            "opp_pts_off_tov": 409,
-            "opp_pts_2nd_chance": 233,
-            "opp_pts_fb": 306,
-            "opp_pts_paint": 1070,
-            "pct_fgm": 0.147,
-            "pct_fga": 0.121,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.0,
-            "pct_ftm": 0.118,
-            "pct_fta": 0.162,
-            "pct_oreb": 0.541,
-            "pct_dreb": 0.287,
-            "pct_reb": 0.345,
-            "pct_ast": 0.071,
-            "pct_tov": 0.114,
-            "pct_stl": 0.116,
-            "pct_blk": 0.246,
-            "pct_blka": 0.215,
-            "pct_pf": 0.256,
-            "pct_pfd": 0.205,
-            "pct_pts": 0.128,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 4159,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2019,
-            "age": 28.0,
-            "games_played": 43,
-            "wins": 8,
-            "losses": 35,
-            "win_pct": 0.186,
-            "minutes_pg": 1198.0,
-            "offensive_rating": 106.5,
-            "defensive_rating": 118.8,
-            "net_rating": -12.3,
-            "estimated_offensive_rating": 105.1,
-            "estimated_defensive_rating": 117.4,
-            "estimated_net_rating": -12.3,
-            "assist_percentage": 0.11,
-            "assist_to_turnover": 1.46,
-            "assist_ratio": 15.0,
-            "offensive_rebound_pct": 0.137,
-            "defensive_rebound_pct": 0.237,
-            "rebound_pct": 0.184,
-            "turnover_pct": 10.3,
-            "effective_fg_pct": 0.529,
-            "true_shooting_pct": 0.551,
-            "usage_pct": 0.175,
-            "pace": 97.05,
-            "pace_per_40": 80.87,
-            "estimated_pace": 98.29,
-            "possessions": 2420,
-            "pie": 0.121,
-            "field_goals_made": 201,
-            "field_goals_attempted": 380,
-            "field_goal_pct": 0.529,
-            "field_goals_made_pg": 4.7,
-            "field_goals_attempted_pg": 8.8,
-            "points": 470,
-            "points_pg": 10.930232558139535,
-            "rebounds": 438,
-            "rebounds_pg": 10.186046511627907,
-            "offensive_rebounds": 173,
-            "defensive_rebounds": 265,
-            "assists": 86,
-            "assists_pg": 2.0,
-            "turnovers": 59,
-            "turnovers_pg": 1.372093023255814,
-            "steals": 28,
-            "steals_pg": 0.6511627906976745,
-            "blocks": 16,
-            "blocks_pg": 0.37209302325581395,
-            "personal_fouls": 89,
-            "personal_fouls_pg": 2.0697674418604652,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 0,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.0,
-            "two_pointers_made": 201,
-            "two_pointers_attempted": 380,
-            "two_point_pct": 0.5289473684210526,
-            "two_pointers_made_pg": 4.674418604651163,
-            "two_pointers_attempted_pg": 8.837209302325581,
-            "free_throws_made": 68,
-            "free_throws_attempted": 106,
-            "free_throw_pct": 0.642,
-            "free_throws_made_pg": 1.5813953488372092,
-            "free_throws_attempted_pg": 2.4651162790697674,
-            "plus_minus": -302,
-            "plus_minus_pg": -7.023255813953488,
-            "double_doubles": 19,
-            "triple_doubles": 0,
-            "pts_off_tov": 64,
-            "pts_2nd_chance": 158,
-            "pts_fb": 21,
-            "pts_paint": 378,
-            "opp_pts_off_tov": 428,
-            "opp_pts_2nd_chance": 331,
-            "opp_pts_fb": 327,
-            "opp_pts_paint": 1278,
-            "pct_fgm": 0.205,
-            "pct_fga": 0.173,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.0,
-            "pct_ftm": 0.17,
-            "pct_fta": 0.21,
-            "pct_oreb": 0.597,
-            "pct_dreb": 0.339,
-            "pct_reb": 0.409,
-            "pct_ast": 0.186,
-            "pct_tov": 0.181,
-            "pct_stl": 0.183,
-            "pct_blk": 0.291,
-            "pct_blka": 0.248,
-            "pct_pf": 0.184,
-            "pct_pfd": 0.256,
-            "pct_pts": 0.182,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 4689,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2020,
-            "age": 29.0,
-            "games_played": 57,
-            "wins": 19,
-            "losses": 38,
-            "win_pct": 0.333,
-            "minutes_pg": 1722.0,
-            "offensive_rating": 105.0,
-            "defensive_rating": 115.2,
-            "net_rating": -10.1,
-            "estimated_offensive_rating": 103.0,
-            "estimated_defensive_rating": 114.4,
-            "estimated_net_rating": -11.5,
-            "assist_percentage": 0.106,
-            "assist_to_turnover": 1.17,
-            "assist_ratio": 14.0,
-            "offensive_rebound_pct": 0.126,
-            "defensive_rebound_pct": 0.207,
-            "rebound_pct": 0.165,
-            "turnover_pct": 12.0,
-            "effective_fg_pct": 0.52,
-            "true_shooting_pct": 0.54,
-            "usage_pct": 0.181,
-            "pace": 99.12,
-            "pace_per_40": 82.6,
-            "estimated_pace": 100.45,
-            "possessions": 3547,
-            "pie": 0.108,
-            "field_goals_made": 288,
-            "field_goals_attempted": 562,
-            "field_goal_pct": 0.512,
-            "field_goals_made_pg": 5.1,
-            "field_goals_attempted_pg": 9.9,
-            "points": 684,
-            "points_pg": 12.0,
-            "rebounds": 577,
-            "rebounds_pg": 10.12280701754386,
-            "offensive_rebounds": 226,
-            "defensive_rebounds": 351,
-            "assists": 120,
-            "assists_pg": 2.1052631578947367,
-            "turnovers": 103,
-            "turnovers_pg": 1.8070175438596492,
-            "steals": 33,
-            "steals_pg": 0.5789473684210527,
-            "blocks": 50,
-            "blocks_pg": 0.8771929824561403,
-            "personal_fouls": 124,
-            "personal_fouls_pg": 2.175438596491228,
-            "three_pointers_made": 9,
-            "three_pointers_attempted": 23,
-            "three_point_pct": 0.391,
-            "three_pointers_made_pg": 0.15789473684210525,
-            "three_pointers_attempted_pg": 0.40350877192982454,
-            "two_pointers_made": 279,
-            "two_pointers_attempted": 539,
-            "two_point_pct": 0.5176252319109462,
-            "two_pointers_made_pg": 4.894736842105263,
-            "two_pointers_attempted_pg": 9.456140350877194,
-            "free_throws_made": 99,
-            "free_throws_attempted": 161,
-            "free_throw_pct": 0.615,
-            "free_throws_made_pg": 1.736842105263158,
-            "free_throws_attempted_pg": 2.824561403508772,
-            "plus_minus": -378,
-            "plus_minus_pg": -6.631578947368421,
-            "double_doubles": 25,
-            "triple_doubles": 0,
-            "pts_off_tov": 77,
-            "pts_2nd_chance": 173,
-            "pts_fb": 38,
-            "pts_paint": 540,
-            "opp_pts_off_tov": 792,
-            "opp_pts_2nd_chance": 419,
-            "opp_pts_fb": 601,
-            "opp_pts_paint": 2034,
-            "pct_fgm": 0.203,
-            "pct_fga": 0.18,
-            "pct_fg3m": 0.025,
-            "pct_fg3a": 0.022,
-            "pct_ftm": 0.189,
-            "pct_fta": 0.238,
-            "pct_oreb": 0.554,
-            "pct_dreb": 0.294,
-            "pct_reb": 0.36,
-            "pct_ast": 0.156,
-            "pct_tov": 0.172,
-            "pct_stl": 0.15,
-            "pct_blk": 0.515,
-            "pct_blka": 0.273,
-            "pct_pf": 0.209,
-            "pct_pfd": 0.249,
-            "pct_pts": 0.184,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 5182,
-            "player_id": 202684,
-            "team_id": 1,
-            "season_id": 2021,
-            "age": 30.0,
-            "games_played": 54,
-            "wins": 27,
-            "losses": 27,
-            "win_pct": 0.5,
-            "minutes_pg": 1287.0,
-            "offensive_rating": 111.9,
-            "defensive_rating": 110.9,
-            "net_rating": 1.0,
-            "estimated_offensive_rating": 110.6,
-            "estimated_defensive_rating": 110.4,
-            "estimated_net_rating": 0.2,
-            "assist_percentage": 0.073,
-            "assist_to_turnover": 1.08,
-            "assist_ratio": 13.2,
-            "offensive_rebound_pct": 0.124,
-            "defensive_rebound_pct": 0.212,
-            "rebound_pct": 0.167,
-            "turnover_pct": 12.2,
-            "effective_fg_pct": 0.518,
-            "true_shooting_pct": 0.54,
-            "usage_pct": 0.144,
-            "pace": 99.66,
-            "pace_per_40": 83.05,
-            "estimated_pace": 100.45,
-            "possessions": 2670,
-            "pie": 0.093,
-            "field_goals_made": 169,
-            "field_goals_attempted": 326,
-            "field_goal_pct": 0.518,
-            "field_goals_made_pg": 3.1,
-            "field_goals_attempted_pg": 6.0,
-            "points": 409,
-            "points_pg": 7.574074074074074,
-            "rebounds": 439,
-            "rebounds_pg": 8.12962962962963,
-            "offensive_rebounds": 169,
-            "defensive_rebounds": 270,
-            "assists": 67,
-            "assists_pg": 1.2407407407407407,
-            "turnovers": 62,
-            "turnovers_pg": 1.1481481481481481,
-            "steals": 24,
-            "steals_pg": 0.4444444444444444,
-            "blocks": 33,
-            "blocks_pg": 0.6111111111111112,
-            "personal_fouls": 119,
-            "personal_fouls_pg": 2.2037037037037037,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 3,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.05555555555555555,
-            "two_pointers_made": 169,
-            "two_pointers_attempted": 323,
-            "two_point_pct": 0.5232198142414861,
-            "two_pointers_made_pg": 3.1296296296296298,
-            "two_pointers_attempted_pg": 5.981481481481482,
-            "free_throws_made": 71,
-            "free_throws_attempted": 120,
-            "free_throw_pct": 0.592,
-            "free_throws_made_pg": 1.3148148148148149,
-            "free_throws_attempted_pg": 2.2222222222222223,
-            "plus_minus": 24,
-            "plus_minus_pg": 0.4444444444444444,
-            "double_doubles": 5,
-            "triple_doubles": 0,
-            "pts_off_tov": 50,
-            "pts_2nd_chance": 132,
-            "pts_fb": 14,
-            "pts_paint": 332,
-            "opp_pts_off_tov": 395,
-            "opp_pts_2nd_chance": 307,
-            "opp_pts_fb": 355,
-            "opp_pts_paint": 1192,
-            "pct_fgm": 0.155,
-            "pct_fga": 0.137,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.003,
-            "pct_ftm": 0.149,
-            "pct_fta": 0.198,
-            "pct_oreb": 0.56,
-            "pct_dreb": 0.295,
-            "pct_reb": 0.361,
-            "pct_ast": 0.118,
-            "pct_tov": 0.174,
-            "pct_stl": 0.128,
-            "pct_blk": 0.26,
-            "pct_blka": 0.244,
-            "pct_pf": 0.228,
-            "pct_pfd": 0.213,
-            "pct_pts": 0.137,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 5751,
-            "player_id": 202684,
-            "team_id": 4,
-            "season_id": 2022,
-            "age": 31.0,
-            "games_played": 57,
-            "wins": 20,
-            "losses": 37,
-            "win_pct": 0.351,
-            "minutes_pg": 896.0,
-            "offensive_rating": 112.1,
-            "defensive_rating": 115.7,
-            "net_rating": -3.6,
-            "estimated_offensive_rating": 109.7,
-            "estimated_defensive_rating": 115.5,
-            "estimated_net_rating": -5.8,
-            "assist_percentage": 0.054,
-            "assist_to_turnover": 0.76,
-            "assist_ratio": 8.5,
-            "offensive_rebound_pct": 0.125,
-            "defensive_rebound_pct": 0.196,
-            "rebound_pct": 0.159,
-            "turnover_pct": 11.3,
-            "effective_fg_pct": 0.53,
-            "true_shooting_pct": 0.541,
-            "usage_pct": 0.168,
-            "pace": 99.54,
-            "pace_per_40": 82.95,
-            "estimated_pace": 100.71,
-            "possessions": 1859,
-            "pie": 0.086,
-            "field_goals_made": 141,
-            "field_goals_attempted": 267,
-            "field_goal_pct": 0.528,
-            "field_goals_made_pg": 2.5,
-            "field_goals_attempted_pg": 4.7,
-            "points": 344,
-            "points_pg": 6.035087719298246,
-            "rebounds": 288,
-            "rebounds_pg": 5.052631578947368,
-            "offensive_rebounds": 120,
-            "defensive_rebounds": 168,
-            "assists": 34,
-            "assists_pg": 0.5964912280701754,
-            "turnovers": 45,
-            "turnovers_pg": 0.7894736842105263,
-            "steals": 23,
-            "steals_pg": 0.40350877192982454,
-            "blocks": 21,
-            "blocks_pg": 0.3684210526315789,
-            "personal_fouls": 98,
-            "personal_fouls_pg": 1.719298245614035,
-            "three_pointers_made": 1,
-            "three_pointers_attempted": 3,
-            "three_point_pct": 0.333,
-            "three_pointers_made_pg": 0.017543859649122806,
-            "three_pointers_attempted_pg": 0.05263157894736842,
-            "two_pointers_made": 140,
-            "two_pointers_attempted": 264,
-            "two_point_pct": 0.5303030303030303,
-            "two_pointers_made_pg": 2.456140350877193,
-            "two_pointers_attempted_pg": 4.631578947368421,
-            "free_throws_made": 61,
-            "free_throws_attempted": 116,
-            "free_throw_pct": 0.526,
-            "free_throws_made_pg": 1.0701754385964912,
-            "free_throws_attempted_pg": 2.0350877192982457,
-            "plus_minus": -65,
-            "plus_minus_pg": -1.1403508771929824,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 31,
-            "pts_2nd_chance": 94,
-            "pts_fb": 21,
-            "pts_paint": 276,
-            "opp_pts_off_tov": 302,
-            "opp_pts_2nd_chance": 244,
-            "opp_pts_fb": 232,
-            "opp_pts_paint": 998,
-            "pct_fgm": 0.182,
-            "pct_fga": 0.16,
-            "pct_fg3m": 0.005,
-            "pct_fg3a": 0.005,
-            "pct_ftm": 0.177,
-            "pct_fta": 0.248,
-            "pct_oreb": 0.566,
-            "pct_dreb": 0.282,
-            "pct_reb": 0.357,
-            "pct_ast": 0.086,
-            "pct_tov": 0.193,
-            "pct_stl": 0.168,
-            "pct_blk": 0.313,
-            "pct_blka": 0.296,
-            "pct_pf": 0.278,
-            "pct_pfd": 0.281,
-            "pct_pts": 0.165,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6841,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2024,
-            "age": 33.0,
-            "games_played": 49,
-            "wins": 28,
-            "losses": 21,
-            "win_pct": 0.571,
-            "minutes_pg": 549.0,
-            "offensive_rating": 113.3,
-            "defensive_rating": 113.8,
-            "net_rating": -0.5,
-            "estimated_offensive_rating": 113.0,
-            "estimated_defensive_rating": 113.7,
-            "estimated_net_rating": -0.6,
-            "assist_percentage": 0.134,
-            "assist_to_turnover": 1.76,
-            "assist_ratio": 22.9,
-            "offensive_rebound_pct": 0.13,
-            "defensive_rebound_pct": 0.179,
-            "rebound_pct": 0.155,
-            "turnover_pct": 13.0,
-            "effective_fg_pct": 0.613,
-            "true_shooting_pct": 0.567,
-            "usage_pct": 0.132,
-            "pace": 97.98,
-            "pace_per_40": 81.65,
-            "estimated_pace": 98.16,
-            "possessions": 1117,
-            "pie": 0.091,
-            "field_goals_made": 73,
-            "field_goals_attempted": 119,
-            "field_goal_pct": 0.613,
-            "field_goals_made_pg": 1.5,
-            "field_goals_attempted_pg": 2.4,
-            "points": 161,
-            "points_pg": 3.2857142857142856,
-            "rebounds": 174,
-            "rebounds_pg": 3.5510204081632653,
-            "offensive_rebounds": 73,
-            "defensive_rebounds": 101,
-            "assists": 51,
-            "assists_pg": 1.0408163265306123,
-            "turnovers": 29,
-            "turnovers_pg": 0.5918367346938775,
-            "steals": 12,
-            "steals_pg": 0.24489795918367346,
-            "blocks": 14,
-            "blocks_pg": 0.2857142857142857,
-            "personal_fouls": 59,
-            "personal_fouls_pg": 1.2040816326530612,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 1,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.02040816326530612,
-            "two_pointers_made": 73,
-            "two_pointers_attempted": 118,
-            "two_point_pct": 0.6186440677966102,
-            "two_pointers_made_pg": 1.489795918367347,
-            "two_pointers_attempted_pg": 2.4081632653061225,
-            "free_throws_made": 15,
-            "free_throws_attempted": 52,
-            "free_throw_pct": 0.288,
-            "free_throws_made_pg": 0.30612244897959184,
-            "free_throws_attempted_pg": 1.0612244897959184,
-            "plus_minus": -13,
-            "plus_minus_pg": -0.2653061224489796,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 6,
-            "pts_2nd_chance": 67,
-            "pts_fb": 4,
-            "pts_paint": 146,
-            "opp_pts_off_tov": 200,
-            "opp_pts_2nd_chance": 136,
-            "opp_pts_fb": 181,
-            "opp_pts_paint": 510,
-            "pct_fgm": 0.161,
-            "pct_fga": 0.123,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.002,
-            "pct_ftm": 0.081,
-            "pct_fta": 0.183,
-            "pct_oreb": 0.537,
-            "pct_dreb": 0.26,
-            "pct_reb": 0.331,
-            "pct_ast": 0.173,
-            "pct_tov": 0.175,
-            "pct_stl": 0.176,
-            "pct_blk": 0.359,
-            "pct_blka": 0.244,
-            "pct_pf": 0.254,
-            "pct_pfd": 0.233,
-            "pct_pts": 0.127,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 7399,
-            "player_id": 202684,
-            "team_id": 5,
-            "season_id": 2025,
-            "age": 34.0,
-            "games_played": 40,
-            "wins": 31,
-            "losses": 9,
-            "win_pct": 0.775,
-            "minutes_pg": 328.0,
-            "offensive_rating": 97.2,
-            "defensive_rating": 109.8,
-            "net_rating": -12.5,
-            "estimated_offensive_rating": 98.4,
-            "estimated_defensive_rating": 109.0,
-            "estimated_net_rating": -10.5,
-            "assist_percentage": 0.109,
-            "assist_to_turnover": 1.71,
-            "assist_ratio": 19.5,
-            "offensive_rebound_pct": 0.084,
-            "defensive_rebound_pct": 0.271,
-            "rebound_pct": 0.177,
-            "turnover_pct": 11.4,
-            "effective_fg_pct": 0.437,
-            "true_shooting_pct": 0.41,
-            "usage_pct": 0.123,
-            "pace": 100.56,
-            "pace_per_40": 83.8,
-            "estimated_pace": 100.3,
-            "possessions": 688,
-            "pie": 0.083,
-            "field_goals_made": 31,
-            "field_goals_attempted": 71,
-            "field_goal_pct": 0.437,
-            "field_goals_made_pg": 0.8,
-            "field_goals_attempted_pg": 1.8,
-            "points": 69,
-            "points_pg": 1.725,
-            "rebounds": 134,
-            "rebounds_pg": 3.35,
-            "offensive_rebounds": 32,
-            "defensive_rebounds": 102,
-            "assists": 24,
-            "assists_pg": 0.6,
-            "turnovers": 14,
-            "turnovers_pg": 0.35,
-            "steals": 2,
-            "steals_pg": 0.05,
-            "blocks": 11,
-            "blocks_pg": 0.275,
-            "personal_fouls": 36,
-            "personal_fouls_pg": 0.9,
-            "three_pointers_made": 0,
-            "three_pointers_attempted": 3,
-            "three_point_pct": 0.0,
-            "three_pointers_made_pg": 0.0,
-            "three_pointers_attempted_pg": 0.075,
-            "two_pointers_made": 31,
-            "two_pointers_attempted": 68,
-            "two_point_pct": 0.45588235294117646,
-            "two_pointers_made_pg": 0.775,
-            "two_pointers_attempted_pg": 1.7,
-            "free_throws_made": 7,
-            "free_throws_attempted": 30,
-            "free_throw_pct": 0.233,
-            "free_throws_made_pg": 0.175,
-            "free_throws_attempted_pg": 0.75,
-            "plus_minus": -85,
-            "plus_minus_pg": -2.125,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 1,
-            "pts_2nd_chance": 18,
-            "pts_fb": 0,
-            "pts_paint": 62,
-            "opp_pts_off_tov": 120,
-            "opp_pts_2nd_chance": 102,
-            "opp_pts_fb": 106,
-            "opp_pts_paint": 318,
-            "pct_fgm": 0.123,
-            "pct_fga": 0.117,
-            "pct_fg3m": 0.0,
-            "pct_fg3a": 0.011,
-            "pct_ftm": 0.096,
-            "pct_fta": 0.261,
-            "pct_oreb": 0.352,
-            "pct_dreb": 0.405,
-            "pct_reb": 0.391,
-            "pct_ast": 0.155,
-            "pct_tov": 0.123,
-            "pct_stl": 0.053,
-            "pct_blk": 0.355,
-            "pct_blka": 0.146,
-            "pct_pf": 0.31,
-            "pct_pfd": 0.216,
-            "pct_pts": 0.103,
-        },
-    },
-]
+from pathlib import Path
+
+from app.data.to_python_syntax import load_seed_data
+
+# written by app/data/to_python_syntax.py, one parquet file per model
+THOMPSON_CONTRACT_DATA = load_seed_data(Path(__file__).parent / "parquet" / "thompson")
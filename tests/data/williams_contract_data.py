@@ -1,2847 +1,8 @@
 from __future__ import annotations
 
-WILLIAMS_CONTRACT_DATA = [
-    {
-        "model": "Team",
-        "values": {
-            "id": 4,
-            "city": "Chicago",
-            "name": "Chicago Bulls",
-            "nickname": "Bulls",
-            "abbreviation": "CHI",
-            "conference": "Eastern",
-            "division": "Central",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 6,
-            "city": "Detroit",
-            "name": "Detroit Pistons",
-            "nickname": "Pistons",
-            "abbreviation": "DET",
-            "conference": "Eastern",
-            "division": "Central",
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 1630172,
-            "name": "Patrick Williams",
-            "first_name": "Patrick",
-            "last_name": "Williams",
-            "height_inches": 78,
-            "weight_pounds": 235,
-            "birth_date": "2001-08-26T00:00:00",
-            "country": "USA",
-            "school": "Florida State",
-            "position": "Forward",
-            "draft_year": 2020,
-            "draft_round": 1,
-            "draft_number": 4,
-            "roster_status": 1,
-            "is_gleague_player": 0,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 11682,
-            "player_id": 1630172,
-            "team_id": 4,
-            "value": 32101641,
-            "start_year": 2021,
-            "duration": 4,
-            "option_1": "Player",
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 12785,
-            "player_id": 1630172,
-            "team_id": 4,
-            "value": 90000000,
-            "start_year": 2025,
-            "duration": 5,
-            "option_1": "Player",
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 14523,
-            "player_id": 1630172,
-            "team_id": 6,
-            "value": 1272870,
-            "start_year": 2026,
-            "duration": 1,
-            "option_1": "Player",
-            "option_2": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13590,
-            "season_id": 2021,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 6.48,
-            "salary": 7068360,
-            "apron_salary": 7068360,
-            "luxury_tax": 7068360,
-            "cash_total": 7068360,
-            "cash_garunteed": 7068360,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13607,
-            "season_id": 2022,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 6.6,
-            "salary": 7422000,
-            "apron_salary": 7422000,
-            "luxury_tax": 7422000,
-            "cash_total": 7422000,
-            "cash_garunteed": 7422000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13623,
-            "season_id": 2023,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 6.29,
-            "salary": 7775400,
-            "apron_salary": 7775400,
-            "luxury_tax": 7775400,
-            "cash_total": 7775400,
-            "cash_garunteed": 7775400,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13640,
-            "season_id": 2024,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 7.23,
-            "salary": 9835881,
-            "apron_salary": 9835881,
-            "luxury_tax": 9835881,
-            "cash_total": 9835881,
-            "cash_garunteed": 9835881,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13655,
-            "season_id": 2025,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 12.8,
-            "salary": 18000000,
-            "apron_salary": 18000000,
-            "luxury_tax": 18000000,
-            "cash_total": 18000000,
-            "cash_garunteed": 18000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13675,
-            "season_id": 2026,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 11.64,
-            "salary": 18000000,
-            "apron_salary": 18000000,
-            "luxury_tax": 18000000,
-            "cash_total": 18000000,
-            "cash_garunteed": 18000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13691,
-            "season_id": 2027,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 10.84,
-            "salary": 18000000,
-            "apron_salary": 18000000,
-            "luxury_tax": 18000000,
-            "cash_total": 18000000,
-            "cash_garunteed": 18000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13699,
-            "season_id": 2028,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 10.33,
-            "salary": 18000000,
-            "apron_salary": None,
-            "luxury_tax": None,
-            "cash_total": None,
-            "cash_garunteed": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13704,
-            "season_id": 2029,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 9.84,
-            "salary": 18000000,
-            "apron_salary": None,
-            "luxury_tax": None,
-            "cash_total": None,
-            "cash_garunteed": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13707,
-            "season_id": 2030,
-            "team_id": 4,
-            "player_id": 1630172,
-            "cap_hit_percent": 14.05,
-            "salary": 27000000,
-            "apron_salary": None,
-            "luxury_tax": None,
-            "cash_total": None,
-            "cash_garunteed": None,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 5213,
-            "player_id": 1630172,
-            "team_id": 4,
-            "season_id": 2021,
-            "age": 19.0,
-            "games_played": 71,
-            "wins": 30,
-            "losses": 41,
-            "win_pct": 0.423,
-            "minutes_pg": 1983.0,
-            "offensive_rating": 106.3,
-            "defensive_rating": 113.5,
-            "net_rating": -7.1,
-            "estimated_offensive_rating": 106.2,
-            "estimated_defensive_rating": 112.8,
-            "estimated_net_rating": -6.7,
-            "assist_percentage": 0.068,
-            "assist_to_turnover": 1.01,
-            "assist_ratio": 12.7,
-            "offensive_rebound_pct": 0.033,
-            "defensive_rebound_pct": 0.131,
-            "rebound_pct": 0.082,
-            "turnover_pct": 12.6,
-            "effective_fg_pct": 0.534,
-            "true_shooting_pct": 0.562,
-            "usage_pct": 0.146,
-            "pace": 100.41,
-            "pace_per_40": 83.68,
-            "estimated_pace": 100.79,
-            "possessions": 4151,
-            "pie": 0.071,
-            "field_goals_made": 255,
-            "field_goals_attempted": 528,
-            "field_goal_pct": 0.483,
-            "field_goals_made_pg": 3.6,
-            "field_goals_attempted_pg": 7.4,
-            "points": 655,
-            "points_pg": 9.225352112676056,
-            "rebounds": 327,
-            "rebounds_pg": 4.605633802816901,
-            "offensive_rebounds": 66,
-            "defensive_rebounds": 261,
-            "assists": 99,
-            "assists_pg": 1.3943661971830985,
-            "turnovers": 98,
-            "turnovers_pg": 1.380281690140845,
-            "steals": 64,
-            "steals_pg": 0.9014084507042254,
-            "blocks": 46,
-            "blocks_pg": 0.647887323943662,
-            "personal_fouls": 126,
-            "personal_fouls_pg": 1.7746478873239437,
-            "three_pointers_made": 54,
-            "three_pointers_attempted": 138,
-            "three_point_pct": 0.391,
-            "three_pointers_made_pg": 0.7605633802816901,
-            "three_pointers_attempted_pg": 1.943661971830986,
-            "two_pointers_made": 201,
-            "two_pointers_attempted": 390,
-            "two_point_pct": 0.5153846153846153,
-            "two_pointers_made_pg": 2.8309859154929575,
-            "two_pointers_attempted_pg": 5.492957746478873,
-            "free_throws_made": 91,
-            "free_throws_attempted": 125,
-            "free_throw_pct": 0.728,
-            "free_throws_made_pg": 1.2816901408450705,
-            "free_throws_attempted_pg": 1.7605633802816902,
-            "plus_minus": -292,
-            "plus_minus_pg": -4.112676056338028,
-            "double_doubles": 3,
-            "triple_doubles": 0,
-            "pts_off_tov": 88,
-            "pts_2nd_chance": 86,
-            "pts_fb": 63,
-            "pts_paint": 306,
-            "opp_pts_off_tov": 768,
-            "opp_pts_2nd_chance": 506,
-            "opp_pts_fb": 537,
-            "opp_pts_paint": 2116,
-            "pct_fgm": 0.149,
-            "pct_fga": 0.146,
-            "pct_fg3m": 0.113,
-            "pct_fg3a": 0.108,
-            "pct_ftm": 0.179,
-            "pct_fta": 0.193,
-            "pct_oreb": 0.161,
-            "pct_dreb": 0.18,
-            "pct_reb": 0.176,
-            "pct_ast": 0.091,
-            "pct_tov": 0.149,
-            "pct_stl": 0.26,
-            "pct_blk": 0.238,
-            "pct_blka": 0.217,
-            "pct_pf": 0.164,
-            "pct_pfd": 0.161,
-            "pct_pts": 0.148,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 5780,
-            "player_id": 1630172,
-            "team_id": 4,
-            "season_id": 2022,
-            "age": 20.0,
-            "games_played": 17,
-            "wins": 9,
-            "losses": 8,
-            "win_pct": 0.529,
-            "minutes_pg": 422.0,
-            "offensive_rating": 107.8,
-            "defensive_rating": 113.3,
-            "net_rating": -5.5,
-            "estimated_offensive_rating": 106.7,
-            "estimated_defensive_rating": 113.2,
-            "estimated_net_rating": -6.5,
-            "assist_percentage": 0.051,
-            "assist_to_turnover": 0.94,
-            "assist_ratio": 10.0,
-            "offensive_rebound_pct": 0.04,
-            "defensive_rebound_pct": 0.132,
-            "rebound_pct": 0.084,
-            "turnover_pct": 10.7,
-            "effective_fg_pct": 0.603,
-            "true_shooting_pct": 0.637,
-            "usage_pct": 0.139,
-            "pace": 99.51,
-            "pace_per_40": 82.92,
-            "estimated_pace": 100.05,
-            "possessions": 872,
-            "pie": 0.078,
-            "field_goals_made": 54,
-            "field_goals_attempted": 102,
-            "field_goal_pct": 0.529,
-            "field_goals_made_pg": 3.2,
-            "field_goals_attempted_pg": 6.0,
-            "points": 153,
-            "points_pg": 9.0,
-            "rebounds": 69,
-            "rebounds_pg": 4.0588235294117645,
-            "offensive_rebounds": 17,
-            "defensive_rebounds": 52,
-            "assists": 15,
-            "assists_pg": 0.8823529411764706,
-            "turnovers": 16,
-            "turnovers_pg": 0.9411764705882353,
-            "steals": 9,
-            "steals_pg": 0.5294117647058824,
-            "blocks": 9,
-            "blocks_pg": 0.5294117647058824,
-            "personal_fouls": 28,
-            "personal_fouls_pg": 1.6470588235294117,
-            "three_pointers_made": 15,
-            "three_pointers_attempted": 29,
-            "three_point_pct": 0.517,
-            "three_pointers_made_pg": 0.8823529411764706,
-            "three_pointers_attempted_pg": 1.7058823529411764,
-            "two_pointers_made": 39,
-            "two_pointers_attempted": 73,
-            "two_point_pct": 0.5342465753424658,
-            "two_pointers_made_pg": 2.2941176470588234,
-            "two_pointers_attempted_pg": 4.294117647058823,
-            "free_throws_made": 30,
-            "free_throws_attempted": 41,
-            "free_throw_pct": 0.732,
-            "free_throws_made_pg": 1.7647058823529411,
-            "free_throws_attempted_pg": 2.411764705882353,
-            "plus_minus": -56,
-            "plus_minus_pg": -3.2941176470588234,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 6,
-            "pts_2nd_chance": 9,
-            "pts_fb": 18,
-            "pts_paint": 56,
-            "opp_pts_off_tov": 141,
-            "opp_pts_2nd_chance": 108,
-            "opp_pts_fb": 123,
-            "opp_pts_paint": 464,
-            "pct_fgm": 0.154,
-            "pct_fga": 0.134,
-            "pct_fg3m": 0.195,
-            "pct_fg3a": 0.123,
-            "pct_ftm": 0.184,
-            "pct_fta": 0.203,
-            "pct_oreb": 0.213,
-            "pct_dreb": 0.19,
-            "pct_reb": 0.195,
-            "pct_ast": 0.073,
-            "pct_tov": 0.142,
-            "pct_stl": 0.141,
-            "pct_blk": 0.273,
-            "pct_blka": 0.156,
-            "pct_pf": 0.179,
-            "pct_pfd": 0.183,
-            "pct_pts": 0.163,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6316,
-            "player_id": 1630172,
-            "team_id": 4,
-            "season_id": 2023,
-            "age": 21.0,
-            "games_played": 82,
-            "wins": 40,
-            "losses": 42,
-            "win_pct": 0.488,
-            "minutes_pg": 2323.0,
-            "offensive_rating": 110.7,
-            "defensive_rating": 113.2,
-            "net_rating": -2.4,
-            "estimated_offensive_rating": 111.4,
-            "estimated_defensive_rating": 112.0,
-            "estimated_net_rating": -0.6,
-            "assist_percentage": 0.059,
-            "assist_to_turnover": 0.99,
-            "assist_ratio": 10.8,
-            "offensive_rebound_pct": 0.036,
-            "defensive_rebound_pct": 0.107,
-            "rebound_pct": 0.072,
-            "turnover_pct": 10.9,
-            "effective_fg_pct": 0.549,
-            "true_shooting_pct": 0.576,
-            "usage_pct": 0.156,
-            "pace": 100.05,
-            "pace_per_40": 83.37,
-            "estimated_pace": 100.3,
-            "possessions": 4831,
-            "pie": 0.069,
-            "field_goals_made": 314,
-            "field_goals_attempted": 677,
-            "field_goal_pct": 0.464,
-            "field_goals_made_pg": 3.8,
-            "field_goals_attempted_pg": 8.3,
-            "points": 833,
-            "points_pg": 10.158536585365853,
-            "rebounds": 327,
-            "rebounds_pg": 3.9878048780487805,
-            "offensive_rebounds": 78,
-            "defensive_rebounds": 249,
-            "assists": 100,
-            "assists_pg": 1.2195121951219512,
-            "turnovers": 101,
-            "turnovers_pg": 1.2317073170731707,
-            "steals": 72,
-            "steals_pg": 0.8780487804878049,
-            "blocks": 70,
-            "blocks_pg": 0.8536585365853658,
-            "personal_fouls": 147,
-            "personal_fouls_pg": 1.7926829268292683,
-            "three_pointers_made": 115,
-            "three_pointers_attempted": 277,
-            "three_point_pct": 0.415,
-            "three_pointers_made_pg": 1.4024390243902438,
-            "three_pointers_attempted_pg": 3.3780487804878048,
-            "two_pointers_made": 199,
-            "two_pointers_attempted": 400,
-            "two_point_pct": 0.4975,
-            "two_pointers_made_pg": 2.426829268292683,
-            "two_pointers_attempted_pg": 4.878048780487805,
-            "free_throws_made": 90,
-            "free_throws_attempted": 105,
-            "free_throw_pct": 0.857,
-            "free_throws_made_pg": 1.0975609756097562,
-            "free_throws_attempted_pg": 1.2804878048780488,
-            "plus_minus": -142,
-            "plus_minus_pg": -1.7317073170731707,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 106,
-            "pts_2nd_chance": 77,
-            "pts_fb": 85,
-            "pts_paint": 290,
-            "opp_pts_off_tov": 755,
-            "opp_pts_2nd_chance": 591,
-            "opp_pts_fb": 667,
-            "opp_pts_paint": 2334,
-            "pct_fgm": 0.155,
-            "pct_fga": 0.164,
-            "pct_fg3m": 0.215,
-            "pct_fg3a": 0.199,
-            "pct_ftm": 0.117,
-            "pct_fta": 0.111,
-            "pct_oreb": 0.206,
-            "pct_dreb": 0.154,
-            "pct_reb": 0.164,
-            "pct_ast": 0.085,
-            "pct_tov": 0.157,
-            "pct_stl": 0.199,
-            "pct_blk": 0.32,
-            "pct_blka": 0.175,
-            "pct_pf": 0.162,
-            "pct_pfd": 0.123,
-            "pct_pts": 0.156,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6867,
-            "player_id": 1630172,
-            "team_id": 4,
-            "season_id": 2024,
-            "age": 22.0,
-            "games_played": 43,
-            "wins": 19,
-            "losses": 24,
-            "win_pct": 0.442,
-            "minutes_pg": 1174.0,
-            "offensive_rating": 114.3,
-            "defensive_rating": 115.5,
-            "net_rating": -1.2,
-            "estimated_offensive_rating": 114.1,
-            "estimated_defensive_rating": 113.9,
-            "estimated_net_rating": 0.1,
-            "assist_percentage": 0.077,
-            "assist_to_turnover": 1.16,
-            "assist_ratio": 12.9,
-            "offensive_rebound_pct": 0.039,
-            "defensive_rebound_pct": 0.105,
-            "rebound_pct": 0.071,
-            "turnover_pct": 11.1,
-            "effective_fg_pct": 0.525,
-            "true_shooting_pct": 0.553,
-            "usage_pct": 0.163,
-            "pace": 97.59,
-            "pace_per_40": 81.32,
-            "estimated_pace": 98.33,
-            "possessions": 2393,
-            "pie": 0.066,
-            "field_goals_made": 159,
-            "field_goals_attempted": 359,
-            "field_goal_pct": 0.443,
-            "field_goals_made_pg": 3.7,
-            "field_goals_attempted_pg": 8.3,
-            "points": 429,
-            "points_pg": 9.976744186046512,
-            "rebounds": 166,
-            "rebounds_pg": 3.86046511627907,
-            "offensive_rebounds": 46,
-            "defensive_rebounds": 120,
-            "assists": 66,
-            "assists_pg": 1.5348837209302326,
-            "turnovers": 57,
-            "turnovers_pg": 1.3255813953488371,
-            "steals": 40,
-            "steals_pg": 0.9302325581395349,
-            "blocks": 33,
-            "blocks_pg": 0.7674418604651163,
-            "personal_fouls": 87,
-            "personal_fouls_pg": 2.0232558139534884,
-            "three_pointers_made": 59,
-            "three_pointers_attempted": 148,
-            "three_point_pct": 0.399,
-            "three_pointers_made_pg": 1.372093023255814,
-            "three_pointers_attempted_pg": 3.441860465116279,
-            "two_pointers_made": 100,
-            "two_pointers_attempted": 211,
-            "two_point_pct": 0.47393364928909953,
-            "two_pointers_made_pg": 2.3255813953488373,
-            "two_pointers_attempted_pg": 4.906976744186046,
-            "free_throws_made": 52,
-            "free_throws_attempted": 66,
-            "free_throw_pct": 0.788,
-            "free_throws_made_pg": 1.2093023255813953,
-            "free_throws_attempted_pg": 1.5348837209302326,
-            "plus_minus": -14,
-            "plus_minus_pg": -0.32558139534883723,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 68,
-            "pts_2nd_chance": 54,
-            "pts_fb": 49,
-            "pts_paint": 150,
-            "opp_pts_off_tov": 381,
-            "opp_pts_2nd_chance": 314,
-            "opp_pts_fb": 362,
-            "opp_pts_paint": 1140,
-            "pct_fgm": 0.156,
-            "pct_fga": 0.167,
-            "pct_fg3m": 0.197,
-            "pct_fg3a": 0.189,
-            "pct_ftm": 0.129,
-            "pct_fta": 0.131,
-            "pct_oreb": 0.165,
-            "pct_dreb": 0.152,
-            "pct_reb": 0.155,
-            "pct_ast": 0.114,
-            "pct_tov": 0.19,
-            "pct_stl": 0.223,
-            "pct_blk": 0.297,
-            "pct_blka": 0.204,
-            "pct_pf": 0.189,
-            "pct_pfd": 0.122,
-            "pct_pts": 0.157,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 7427,
-            "player_id": 1630172,
-            "team_id": 4,
-            "season_id": 2025,
-            "age": 23.0,
-            "games_played": 63,
-            "wins": 31,
-            "losses": 32,
-            "win_pct": 0.492,
-            "minutes_pg": 1576.0,
-            "offensive_rating": 108.7,
-            "defensive_rating": 113.5,
-            "net_rating": -4.8,
-            "estimated_offensive_rating": 108.9,
-            "estimated_defensive_rating": 112.5,
-            "estimated_net_rating": -3.6,
-            "assist_percentage": 0.106,
-            "assist_to_turnover": 1.44,
-            "assist_ratio": 16.3,
-            "offensive_rebound_pct": 0.025,
-            "defensive_rebound_pct": 0.113,
-            "rebound_pct": 0.07,
-            "turnover_pct": 11.3,
-            "effective_fg_pct": 0.49,
-            "true_shooting_pct": 0.512,
-            "usage_pct": 0.165,
-            "pace": 105.94,
-            "pace_per_40": 88.28,
-            "estimated_pace": 106.31,
-            "possessions": 3473,
-            "pie": 0.062,
-            "field_goals_made": 205,
-            "field_goals_attempted": 516,
-            "field_goal_pct": 0.397,
-            "field_goals_made_pg": 3.3,
-            "field_goals_attempted_pg": 8.2,
-            "points": 566,
-            "points_pg": 8.984126984126984,
-            "rebounds": 237,
-            "rebounds_pg": 3.761904761904762,
-            "offensive_rebounds": 43,
-            "defensive_rebounds": 194,
-            "assists": 124,
-            "assists_pg": 1.9682539682539681,
-            "turnovers": 86,
-            "turnovers_pg": 1.3650793650793651,
-            "steals": 48,
-            "steals_pg": 0.7619047619047619,
-            "blocks": 32,
-            "blocks_pg": 0.5079365079365079,
-            "personal_fouls": 88,
-            "personal_fouls_pg": 1.3968253968253967,
-            "three_pointers_made": 96,
-            "three_pointers_attempted": 272,
-            "three_point_pct": 0.353,
-            "three_pointers_made_pg": 1.5238095238095237,
-            "three_pointers_attempted_pg": 4.317460317460317,
-            "two_pointers_made": 109,
-            "two_pointers_attempted": 244,
-            "two_point_pct": 0.44672131147540983,
-            "two_pointers_made_pg": 1.7301587301587302,
-            "two_pointers_attempted_pg": 3.873015873015873,
-            "free_throws_made": 60,
-            "free_throws_attempted": 83,
-            "free_throw_pct": 0.723,
-            "free_throws_made_pg": 0.9523809523809523,
-            "free_throws_attempted_pg": 1.3174603174603174,
-            "plus_minus": -182,
-            "plus_minus_pg": -2.888888888888889,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 66,
-            "pts_2nd_chance": 66,
-            "pts_fb": 48,
-            "pts_paint": 192,
-            "opp_pts_off_tov": 631,
-            "opp_pts_2nd_chance": 490,
-            "opp_pts_fb": 476,
-            "opp_pts_paint": 1826,
-            "pct_fgm": 0.149,
-            "pct_fga": 0.172,
-            "pct_fg3m": 0.194,
-            "pct_fg3a": 0.2,
-            "pct_ftm": 0.114,
-            "pct_fta": 0.129,
-            "pct_oreb": 0.138,
-            "pct_dreb": 0.165,
-            "pct_reb": 0.159,
-            "pct_ast": 0.133,
-            "pct_tov": 0.173,
-            "pct_stl": 0.181,
-            "pct_blk": 0.232,
-            "pct_blka": 0.22,
-            "pct_pf": 0.159,
-            "pct_pfd": 0.123,
-            "pct_pts": 0.15,
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 12,
-            "city": "Philadelphia",
-            "name": "Philadelphia 76ers",
-            "nickname": "76ers",
-            "abbreviation": "PHI",
-            "conference": "Eastern",
-            "division": "Atlantic",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 0,
-            "city": "Atlanta",
-            "name": "Atlanta Hawks",
-            "nickname": "Hawks",
-            "abbreviation": "ATL",
-            "conference": "Eastern",
-            "division": "Southeast",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 13,
-            "city": "Toronto",
-            "name": "Toronto Raptors",
-            "nickname": "Raptors",
-            "abbreviation": "TOR",
-            "conference": "Eastern",
-            "division": "Atlantic",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 20,
-            "city": "Los Angeles",
-            "name": "Los Angeles Lakers",
-            "nickname": "Lakers",
-            "abbreviation": "LAL",
-            "conference": "Western",
-            "division": "Pacific",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 18,
-            "city": "Houston",
-            "name": "Houston Rockets",
-            "nickname": "Rockets",
-            "abbreviation": "HOU",
-            "conference": "Western",
-            "division": "Southwest",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 19,
-            "city": "Los Angeles",
-            "name": "Los Angeles Clippers",
-            "nickname": "Clippers",
-            "abbreviation": "LAC",
-            "conference": "Western",
-            "division": "Pacific",
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 101150,
-            "name": "Lou Williams",
-            "first_name": "Lou",
-            "last_name": "Williams",
-            "height_inches": 74,
-            "weight_pounds": 175,
-            "birth_date": "1986-10-27T00:00:00",
-            "country": "USA",
-            "school": "South Gwinnett HS (GA)",
-            "position": "Guard",
-            "draft_year": 2005,
-            "draft_round": 2,
-            "draft_number": 45,
-            "roster_status": 0,
-            "is_gleague_player": 1,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 8252,
-            "player_id": 101150,
-            "team_id": 19,
-            "value": 24000000,
-            "start_year": 2019,
-            "duration": 3,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 9682,
-            "player_id": 101150,
-            "team_id": 20,
-            "value": 21000000,
-            "start_year": 2016,
-            "duration": 3,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 10159,
-            "player_id": 101150,
-            "team_id": 0,
-            "value": 5000000,
-            "start_year": 2022,
-            "duration": 1,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 15124,
-            "player_id": 101150,
-            "team_id": 0,
-            "value": 15675000,
-            "start_year": 2013,
-            "duration": 3,
-            "option_1": None,
-            "option_2": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 12383,
-            "season_id": 2013,
-            "team_id": 0,
-            "player_id": 101150,
-            "cap_hit_percent": 8.61,
-            "salary": 5000000,
-            "apron_salary": 5000000,
-            "luxury_tax": 5000000,
-            "cash_total": 5000000,
-            "cash_garunteed": 5000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 12398,
-            "season_id": 2014,
-            "team_id": 0,
-            "player_id": 101150,
-            "cap_hit_percent": 8.9,
-            "salary": 5225000,
-            "apron_salary": 5225000,
-            "luxury_tax": 5225000,
-            "cash_total": 5225000,
-            "cash_garunteed": 5225000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 12507,
-            "season_id": 2021,
-            "team_id": 0,
-            "player_id": 101150,
-            "cap_hit_percent": 7.33,
-            "salary": 8000000,
-            "apron_salary": 8000000,
-            "luxury_tax": 8000000,
-            "cash_total": 2904110,
-            "cash_garunteed": 8000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 12529,
-            "season_id": 2022,
-            "team_id": 0,
-            "player_id": 101150,
-            "cap_hit_percent": 4.45,
-            "salary": 5000000,
-            "apron_salary": 5000000,
-            "luxury_tax": 5000000,
-            "cash_total": 5000000,
-            "cash_garunteed": 5000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15139,
-            "season_id": 2017,
-            "team_id": 18,
-            "player_id": 101150,
-            "cap_hit_percent": 7.44,
-            "salary": 7000000,
-            "apron_salary": 7000000,
-            "luxury_tax": 7000000,
-            "cash_total": 2058824,
-            "cash_garunteed": 7000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15704,
-            "season_id": 2018,
-            "team_id": 19,
-            "player_id": 101150,
-            "cap_hit_percent": 7.06,
-            "salary": 7000000,
-            "apron_salary": None,
-            "luxury_tax": None,
-            "cash_total": None,
-            "cash_garunteed": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15717,
-            "season_id": 2019,
-            "team_id": 19,
-            "player_id": 101150,
-            "cap_hit_percent": 7.85,
-            "salary": 8000000,
-            "apron_salary": None,
-            "luxury_tax": None,
-            "cash_total": None,
-            "cash_garunteed": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15735,
-            "season_id": 2020,
-            "team_id": 19,
-            "player_id": 101150,
-            "cap_hit_percent": 7.33,
-            "salary": 8000000,
-            "apron_salary": None,
-            "luxury_tax": None,
-            "cash_total": None,
-            "cash_garunteed": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 15935,
-            "season_id": 2016,
-            "team_id": 20,
-            "player_id": 101150,
-            "cap_hit_percent": 10.0,
-            "salary": 7000000,
-            "apron_salary": 7000000,
-            "luxury_tax": 7000000,
-            "cash_total": 7000000,
-            "cash_garunteed": 7000000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 18274,
-            "season_id": 2012,
-            "team_id": 12,
-            "player_id": 101150,
-            "cap_hit_percent": 8.92,
-            "salary": 5176000,
-            "apron_salary": 5176000,
-            "luxury_tax": 5176000,
-            "cash_total": 4166049,
-            "cash_garunteed": 4166049,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 19656,
-            "season_id": 2015,
-            "team_id": 13,
-            "player_id": 101150,
-            "cap_hit_percent": 8.64,
-            "salary": 5450000,
-            "apron_salary": 5450000,
-            "luxury_tax": 5450000,
-            "cash_total": 5450000,
-            "cash_garunteed": 5450000,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 186,
-            "player_id": 101150,
-            "team_id": 12,
-            "season_id": 2011,
-            "age": 24.0,
-            "games_played": 75,
-            "wins": 39,
-            "losses": 36,
-            "win_pct": 0.52,
-            "minutes_pg": 1747.0,
-            "offensive_rating": 103.7,
-            "defensive_rating": 101.5,
-            "net_rating": 2.2,
-            "estimated_offensive_rating": 104.0,
-            "estimated_defensive_rating": 101.9,
-            "estimated_net_rating": 2.1,
-            "assist_percentage": 0.248,
-            "assist_to_turnover": 2.47,
-            "assist_ratio": 19.4,
-            "offensive_rebound_pct": 0.019,
-            "defensive_rebound_pct": 0.066,
-            "rebound_pct": 0.043,
-            "turnover_pct": 7.8,
-            "effective_fg_pct": 0.462,
-            "true_shooting_pct": 0.54,
-            "usage_pct": 0.27,
-            "pace": 94.69,
-            "pace_per_40": 78.91,
-            "estimated_pace": 94.36,
-            "possessions": 3455,
-            "pie": 0.122,
-            "field_goals_made": 323,
-            "field_goals_attempted": 795,
-            "field_goal_pct": 0.406,
-            "field_goals_made_pg": 4.3,
-            "field_goals_attempted_pg": 10.6,
-            "points": 1027,
-            "points_pg": 13.693333333333333,
-            "rebounds": 149,
-            "rebounds_pg": 1.9866666666666666,
-            "offensive_rebounds": 32,
-            "defensive_rebounds": 117,
-            "assists": 252,
-            "assists_pg": 3.36,
-            "turnovers": 102,
-            "turnovers_pg": 1.36,
-            "steals": 47,
-            "steals_pg": 0.6266666666666667,
-            "blocks": 17,
-            "blocks_pg": 0.22666666666666666,
-            "personal_fouls": 128,
-            "personal_fouls_pg": 1.7066666666666668,
-            "three_pointers_made": 88,
-            "three_pointers_attempted": 253,
-            "three_point_pct": 0.348,
-            "three_pointers_made_pg": 1.1733333333333333,
-            "three_pointers_attempted_pg": 3.3733333333333335,
-            "two_pointers_made": 235,
-            "two_pointers_attempted": 542,
-            "two_point_pct": 0.43357933579335795,
-            "two_pointers_made_pg": 3.1333333333333333,
-            "two_pointers_attempted_pg": 7.226666666666667,
-            "free_throws_made": 293,
-            "free_throws_attempted": 356,
-            "free_throw_pct": 0.823,
-            "free_throws_made_pg": 3.9066666666666667,
-            "free_throws_attempted_pg": 4.746666666666667,
-            "plus_minus": 93,
-            "plus_minus_pg": 1.24,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 172,
-            "pts_2nd_chance": 68,
-            "pts_fb": 153,
-            "pts_paint": 266,
-            "opp_pts_off_tov": 500,
-            "opp_pts_2nd_chance": 449,
-            "opp_pts_fb": 476,
-            "opp_pts_paint": 1442,
-            "pct_fgm": 0.241,
-            "pct_fga": 0.27,
-            "pct_fg3m": 0.503,
-            "pct_fg3a": 0.482,
-            "pct_ftm": 0.4,
-            "pct_fta": 0.38,
-            "pct_oreb": 0.089,
-            "pct_dreb": 0.104,
-            "pct_reb": 0.1,
-            "pct_ast": 0.329,
-            "pct_tov": 0.228,
-            "pct_stl": 0.182,
-            "pct_blk": 0.116,
-            "pct_blka": 0.327,
-            "pct_pf": 0.165,
-            "pct_pfd": 0.34,
-            "pct_pts": 0.287,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 563,
-            "player_id": 101150,
-            "team_id": 12,
-            "season_id": 2012,
-            "age": 25.0,
-            "games_played": 64,
-            "wins": 34,
-            "losses": 30,
-            "win_pct": 0.531,
-            "minutes_pg": 1682.0,
-            "offensive_rating": 103.3,
-            "defensive_rating": 96.8,
-            "net_rating": 6.5,
-            "estimated_offensive_rating": 103.9,
-            "estimated_defensive_rating": 97.5,
-            "estimated_net_rating": 6.4,
-            "assist_percentage": 0.221,
-            "assist_to_turnover": 3.11,
-            "assist_ratio": 18.4,
-            "offensive_rebound_pct": 0.018,
-            "defensive_rebound_pct": 0.073,
-            "rebound_pct": 0.046,
-            "turnover_pct": 5.9,
-            "effective_fg_pct": 0.46,
-            "true_shooting_pct": 0.525,
-            "usage_pct": 0.265,
-            "pace": 93.05,
-            "pace_per_40": 77.54,
-            "estimated_pace": 92.41,
-            "possessions": 3269,
-            "pie": 0.129,
-            "field_goals_made": 318,
-            "field_goals_attempted": 782,
-            "field_goal_pct": 0.407,
-            "field_goals_made_pg": 5.0,
-            "field_goals_attempted_pg": 12.2,
-            "points": 956,
-            "points_pg": 14.9375,
-            "rebounds": 155,
-            "rebounds_pg": 2.421875,
-            "offensive_rebounds": 30,
-            "defensive_rebounds": 125,
-            "assists": 221,
-            "assists_pg": 3.453125,
-            "turnovers": 71,
-            "turnovers_pg": 1.109375,
-            "steals": 53,
-            "steals_pg": 0.828125,
-            "blocks": 18,
-            "blocks_pg": 0.28125,
-            "personal_fouls": 90,
-            "personal_fouls_pg": 1.40625,
-            "three_pointers_made": 83,
-            "three_pointers_attempted": 229,
-            "three_point_pct": 0.362,
-            "three_pointers_made_pg": 1.296875,
-            "three_pointers_attempted_pg": 3.578125,
-            "two_pointers_made": 235,
-            "two_pointers_attempted": 553,
-            "two_point_pct": 0.42495479204339964,
-            "two_pointers_made_pg": 3.671875,
-            "two_pointers_attempted_pg": 8.640625,
-            "free_throws_made": 237,
-            "free_throws_attempted": 292,
-            "free_throw_pct": 0.812,
-            "free_throws_made_pg": 3.703125,
-            "free_throws_attempted_pg": 4.5625,
-            "plus_minus": 229,
-            "plus_minus_pg": 3.578125,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 137,
-            "pts_2nd_chance": 83,
-            "pts_fb": 145,
-            "pts_paint": 242,
-            "opp_pts_off_tov": 407,
-            "opp_pts_2nd_chance": 429,
-            "opp_pts_fb": 305,
-            "opp_pts_paint": 1288,
-            "pct_fgm": 0.241,
-            "pct_fga": 0.27,
-            "pct_fg3m": 0.454,
-            "pct_fg3a": 0.434,
-            "pct_ftm": 0.424,
-            "pct_fta": 0.386,
-            "pct_oreb": 0.085,
-            "pct_dreb": 0.111,
-            "pct_reb": 0.105,
-            "pct_ast": 0.299,
-            "pct_tov": 0.193,
-            "pct_stl": 0.199,
-            "pct_blk": 0.104,
-            "pct_blka": 0.263,
-            "pct_pf": 0.138,
-            "pct_pfd": 0.342,
-            "pct_pts": 0.283,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 1036,
-            "player_id": 101150,
-            "team_id": 0,
-            "season_id": 2013,
-            "age": 26.0,
-            "games_played": 39,
-            "wins": 22,
-            "losses": 17,
-            "win_pct": 0.564,
-            "minutes_pg": 1119.0,
-            "offensive_rating": 102.2,
-            "defensive_rating": 102.4,
-            "net_rating": -0.2,
-            "estimated_offensive_rating": 102.1,
-            "estimated_defensive_rating": 102.1,
-            "estimated_net_rating": 0.0,
-            "assist_percentage": 0.218,
-            "assist_to_turnover": 1.88,
-            "assist_ratio": 19.6,
-            "offensive_rebound_pct": 0.007,
-            "defensive_rebound_pct": 0.065,
-            "rebound_pct": 0.036,
-            "turnover_pct": 10.4,
-            "effective_fg_pct": 0.503,
-            "true_shooting_pct": 0.555,
-            "usage_pct": 0.232,
-            "pace": 93.04,
-            "pace_per_40": 77.53,
-            "estimated_pace": 93.18,
-            "possessions": 2174,
-            "pie": 0.111,
-            "field_goals_made": 187,
-            "field_goals_attempted": 443,
-            "field_goal_pct": 0.422,
-            "field_goals_made_pg": 4.8,
-            "field_goals_attempted_pg": 11.4,
-            "points": 551,
-            "points_pg": 14.128205128205128,
-            "rebounds": 80,
-            "rebounds_pg": 2.051282051282051,
-            "offensive_rebounds": 8,
-            "defensive_rebounds": 72,
-            "assists": 139,
-            "assists_pg": 3.5641025641025643,
-            "turnovers": 74,
-            "turnovers_pg": 1.8974358974358974,
-            "steals": 44,
-            "steals_pg": 1.1282051282051282,
-            "blocks": 10,
-            "blocks_pg": 0.2564102564102564,
-            "personal_fouls": 55,
-            "personal_fouls_pg": 1.4102564102564104,
-            "three_pointers_made": 72,
-            "three_pointers_attempted": 196,
-            "three_point_pct": 0.367,
-            "three_pointers_made_pg": 1.8461538461538463,
-            "three_pointers_attempted_pg": 5.0256410256410255,
-            "two_pointers_made": 115,
-            "two_pointers_attempted": 247,
-            "two_point_pct": 0.46558704453441296,
-            "two_pointers_made_pg": 2.948717948717949,
-            "two_pointers_attempted_pg": 6.333333333333333,
-            "free_throws_made": 105,
-            "free_throws_attempted": 121,
-            "free_throw_pct": 0.868,
-            "free_throws_made_pg": 2.6923076923076925,
-            "free_throws_attempted_pg": 3.1025641025641026,
-            "plus_minus": 5,
-            "plus_minus_pg": 0.1282051282051282,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 124,
-            "pts_2nd_chance": 38,
-            "pts_fb": 116,
-            "pts_paint": 152,
-            "opp_pts_off_tov": 380,
-            "opp_pts_2nd_chance": 316,
-            "opp_pts_fb": 287,
-            "opp_pts_paint": 938,
-            "pct_fgm": 0.227,
-            "pct_fga": 0.239,
-            "pct_fg3m": 0.35,
-            "pct_fg3a": 0.354,
-            "pct_ftm": 0.288,
-            "pct_fta": 0.246,
-            "pct_oreb": 0.033,
-            "pct_dreb": 0.103,
-            "pct_reb": 0.085,
-            "pct_ast": 0.265,
-            "pct_tov": 0.216,
-            "pct_stl": 0.233,
-            "pct_blk": 0.093,
-            "pct_blka": 0.202,
-            "pct_pf": 0.134,
-            "pct_pfd": 0.221,
-            "pct_pts": 0.248,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 1513,
-            "player_id": 101150,
-            "team_id": 0,
-            "season_id": 2014,
-            "age": 27.0,
-            "games_played": 60,
-            "wins": 26,
-            "losses": 34,
-            "win_pct": 0.433,
-            "minutes_pg": 1445.0,
-            "offensive_rating": 103.8,
-            "defensive_rating": 109.9,
-            "net_rating": -6.1,
-            "estimated_offensive_rating": 104.4,
-            "estimated_defensive_rating": 109.5,
-            "estimated_net_rating": -5.1,
-            "assist_percentage": 0.234,
-            "assist_to_turnover": 2.28,
-            "assist_ratio": 24.1,
-            "offensive_rebound_pct": 0.007,
-            "defensive_rebound_pct": 0.08,
-            "rebound_pct": 0.045,
-            "turnover_pct": 10.6,
-            "effective_fg_pct": 0.48,
-            "true_shooting_pct": 0.547,
-            "usage_pct": 0.205,
-            "pace": 97.12,
-            "pace_per_40": 80.93,
-            "estimated_pace": 97.06,
-            "possessions": 2928,
-            "pie": 0.096,
-            "field_goals_made": 197,
-            "field_goals_attempted": 493,
-            "field_goal_pct": 0.4,
-            "field_goals_made_pg": 3.3,
-            "field_goals_attempted_pg": 8.2,
-            "points": 625,
-            "points_pg": 10.416666666666666,
-            "rebounds": 124,
-            "rebounds_pg": 2.066666666666667,
-            "offensive_rebounds": 10,
-            "defensive_rebounds": 114,
-            "assists": 210,
-            "assists_pg": 3.5,
-            "turnovers": 92,
-            "turnovers_pg": 1.5333333333333334,
-            "steals": 45,
-            "steals_pg": 0.75,
-            "blocks": 4,
-            "blocks_pg": 0.06666666666666667,
-            "personal_fouls": 65,
-            "personal_fouls_pg": 1.0833333333333333,
-            "three_pointers_made": 79,
-            "three_pointers_attempted": 231,
-            "three_point_pct": 0.342,
-            "three_pointers_made_pg": 1.3166666666666667,
-            "three_pointers_attempted_pg": 3.85,
-            "two_pointers_made": 118,
-            "two_pointers_attempted": 262,
-            "two_point_pct": 0.45038167938931295,
-            "two_pointers_made_pg": 1.9666666666666666,
-            "two_pointers_attempted_pg": 4.366666666666666,
-            "free_throws_made": 152,
-            "free_throws_attempted": 179,
-            "free_throw_pct": 0.849,
-            "free_throws_made_pg": 2.533333333333333,
-            "free_throws_attempted_pg": 2.9833333333333334,
-            "plus_minus": -167,
-            "plus_minus_pg": -2.783333333333333,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 109,
-            "pts_2nd_chance": 44,
-            "pts_fb": 77,
-            "pts_paint": 158,
-            "opp_pts_off_tov": 560,
-            "opp_pts_2nd_chance": 422,
-            "opp_pts_fb": 379,
-            "opp_pts_paint": 1286,
-            "pct_fgm": 0.18,
-            "pct_fga": 0.207,
-            "pct_fg3m": 0.288,
-            "pct_fg3a": 0.303,
-            "pct_ftm": 0.264,
-            "pct_fta": 0.251,
-            "pct_oreb": 0.042,
-            "pct_dreb": 0.127,
-            "pct_reb": 0.11,
-            "pct_ast": 0.295,
-            "pct_tov": 0.203,
-            "pct_stl": 0.197,
-            "pct_blk": 0.036,
-            "pct_blka": 0.153,
-            "pct_pf": 0.112,
-            "pct_pfd": 0.24,
-            "pct_pts": 0.206,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 1954,
-            "player_id": 101150,
-            "team_id": 13,
-            "season_id": 2015,
-            "age": 28.0,
-            "games_played": 80,
-            "wins": 48,
-            "losses": 32,
-            "win_pct": 0.6,
-            "minutes_pg": 2016.0,
-            "offensive_rating": 111.9,
-            "defensive_rating": 105.3,
-            "net_rating": 6.6,
-            "estimated_offensive_rating": 111.4,
-            "estimated_defensive_rating": 104.6,
-            "estimated_net_rating": 6.8,
-            "assist_percentage": 0.136,
-            "assist_to_turnover": 1.62,
-            "assist_ratio": 12.1,
-            "offensive_rebound_pct": 0.012,
-            "defensive_rebound_pct": 0.064,
-            "rebound_pct": 0.038,
-            "turnover_pct": 7.5,
-            "effective_fg_pct": 0.486,
-            "true_shooting_pct": 0.564,
-            "usage_pct": 0.257,
-            "pace": 95.84,
-            "pace_per_40": 79.87,
-            "estimated_pace": 96.39,
-            "possessions": 4039,
-            "pie": 0.117,
-            "field_goals_made": 375,
-            "field_goals_attempted": 928,
-            "field_goal_pct": 0.404,
-            "field_goals_made_pg": 4.7,
-            "field_goals_attempted_pg": 11.6,
-            "points": 1242,
-            "points_pg": 15.525,
-            "rebounds": 151,
-            "rebounds_pg": 1.8875,
-            "offensive_rebounds": 24,
-            "defensive_rebounds": 127,
-            "assists": 164,
-            "assists_pg": 2.05,
-            "turnovers": 101,
-            "turnovers_pg": 1.2625,
-            "steals": 88,
-            "steals_pg": 1.1,
-            "blocks": 10,
-            "blocks_pg": 0.125,
-            "personal_fouls": 103,
-            "personal_fouls_pg": 1.2875,
-            "three_pointers_made": 152,
-            "three_pointers_attempted": 447,
-            "three_point_pct": 0.34,
-            "three_pointers_made_pg": 1.9,
-            "three_pointers_attempted_pg": 5.5875,
-            "two_pointers_made": 223,
-            "two_pointers_attempted": 481,
-            "two_point_pct": 0.46361746361746364,
-            "two_pointers_made_pg": 2.7875,
-            "two_pointers_attempted_pg": 6.0125,
-            "free_throws_made": 340,
-            "free_throws_attempted": 395,
-            "free_throw_pct": 0.861,
-            "free_throws_made_pg": 4.25,
-            "free_throws_attempted_pg": 4.9375,
-            "plus_minus": 298,
-            "plus_minus_pg": 3.725,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 189,
-            "pts_2nd_chance": 75,
-            "pts_fb": 229,
-            "pts_paint": 228,
-            "opp_pts_off_tov": 574,
-            "opp_pts_2nd_chance": 574,
-            "opp_pts_fb": 495,
-            "opp_pts_paint": 1828,
-            "pct_fgm": 0.237,
-            "pct_fga": 0.265,
-            "pct_fg3m": 0.363,
-            "pct_fg3a": 0.371,
-            "pct_ftm": 0.364,
-            "pct_fta": 0.336,
-            "pct_oreb": 0.053,
-            "pct_dreb": 0.102,
-            "pct_reb": 0.089,
-            "pct_ast": 0.194,
-            "pct_tov": 0.202,
-            "pct_stl": 0.272,
-            "pct_blk": 0.062,
-            "pct_blka": 0.208,
-            "pct_pf": 0.115,
-            "pct_pfd": 0.272,
-            "pct_pts": 0.275,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 2438,
-            "player_id": 101150,
-            "team_id": 20,
-            "season_id": 2016,
-            "age": 29.0,
-            "games_played": 67,
-            "wins": 14,
-            "losses": 53,
-            "win_pct": 0.209,
-            "minutes_pg": 1907.0,
-            "offensive_rating": 100.9,
-            "defensive_rating": 111.0,
-            "net_rating": -10.2,
-            "estimated_offensive_rating": 99.6,
-            "estimated_defensive_rating": 110.4,
-            "estimated_net_rating": -10.8,
-            "assist_percentage": 0.149,
-            "assist_to_turnover": 1.56,
-            "assist_ratio": 14.6,
-            "offensive_rebound_pct": 0.015,
-            "defensive_rebound_pct": 0.072,
-            "rebound_pct": 0.043,
-            "turnover_pct": 9.4,
-            "effective_fg_pct": 0.488,
-            "true_shooting_pct": 0.584,
-            "usage_pct": 0.221,
-            "pace": 98.26,
-            "pace_per_40": 81.88,
-            "estimated_pace": 99.14,
-            "possessions": 3902,
-            "pie": 0.104,
-            "field_goals_made": 283,
-            "field_goals_attempted": 693,
-            "field_goal_pct": 0.408,
-            "field_goals_made_pg": 4.2,
-            "field_goals_attempted_pg": 10.3,
-            "points": 1028,
-            "points_pg": 15.343283582089553,
-            "rebounds": 169,
-            "rebounds_pg": 2.5223880597014925,
-            "offensive_rebounds": 31,
-            "defensive_rebounds": 138,
-            "assists": 167,
-            "assists_pg": 2.4925373134328357,
-            "turnovers": 107,
-            "turnovers_pg": 1.5970149253731343,
-            "steals": 62,
-            "steals_pg": 0.9253731343283582,
-            "blocks": 19,
-            "blocks_pg": 0.2835820895522388,
-            "personal_fouls": 107,
-            "personal_fouls_pg": 1.5970149253731343,
-            "three_pointers_made": 110,
-            "three_pointers_attempted": 320,
-            "three_point_pct": 0.344,
-            "three_pointers_made_pg": 1.6417910447761195,
-            "three_pointers_attempted_pg": 4.776119402985074,
-            "two_pointers_made": 173,
-            "two_pointers_attempted": 373,
-            "two_point_pct": 0.46380697050938335,
-            "two_pointers_made_pg": 2.582089552238806,
-            "two_pointers_attempted_pg": 5.567164179104478,
-            "free_throws_made": 352,
-            "free_throws_attempted": 424,
-            "free_throw_pct": 0.83,
-            "free_throws_made_pg": 5.253731343283582,
-            "free_throws_attempted_pg": 6.3283582089552235,
-            "plus_minus": -399,
-            "plus_minus_pg": -5.955223880597015,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 137,
-            "pts_2nd_chance": 95,
-            "pts_fb": 154,
-            "pts_paint": 202,
-            "opp_pts_off_tov": 657,
-            "opp_pts_2nd_chance": 602,
-            "opp_pts_fb": 651,
-            "opp_pts_paint": 1930,
-            "pct_fgm": 0.202,
-            "pct_fga": 0.207,
-            "pct_fg3m": 0.361,
-            "pct_fg3a": 0.329,
-            "pct_ftm": 0.426,
-            "pct_fta": 0.395,
-            "pct_oreb": 0.077,
-            "pct_dreb": 0.107,
-            "pct_reb": 0.1,
-            "pct_ast": 0.239,
-            "pct_tov": 0.198,
-            "pct_stl": 0.219,
-            "pct_blk": 0.106,
-            "pct_blka": 0.169,
-            "pct_pf": 0.126,
-            "pct_pfd": 0.326,
-            "pct_pts": 0.261,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 2882,
-            "player_id": 101150,
-            "team_id": 18,
-            "season_id": 2017,
-            "age": 30.0,
-            "games_played": 81,
-            "wins": 34,
-            "losses": 47,
-            "win_pct": 0.42,
-            "minutes_pg": 1993.0,
-            "offensive_rating": 110.1,
-            "defensive_rating": 109.1,
-            "net_rating": 0.9,
-            "estimated_offensive_rating": 108.6,
-            "estimated_defensive_rating": 109.0,
-            "estimated_net_rating": -0.4,
-            "assist_percentage": 0.193,
-            "assist_to_turnover": 1.49,
-            "assist_ratio": 15.1,
-            "offensive_rebound_pct": 0.012,
-            "defensive_rebound_pct": 0.084,
-            "rebound_pct": 0.048,
-            "turnover_pct": 10.1,
-            "effective_fg_pct": 0.511,
-            "true_shooting_pct": 0.593,
-            "usage_pct": 0.277,
-            "pace": 102.49,
-            "pace_per_40": 85.41,
-            "estimated_pace": 103.22,
-            "possessions": 4260,
-            "pie": 0.133,
-            "field_goals_made": 428,
-            "field_goals_attempted": 998,
-            "field_goal_pct": 0.429,
-            "field_goals_made_pg": 5.3,
-            "field_goals_attempted_pg": 12.3,
-            "points": 1421,
-            "points_pg": 17.54320987654321,
-            "rebounds": 202,
-            "rebounds_pg": 2.493827160493827,
-            "offensive_rebounds": 26,
-            "defensive_rebounds": 176,
-            "assists": 239,
-            "assists_pg": 2.950617283950617,
-            "turnovers": 160,
-            "turnovers_pg": 1.9753086419753085,
-            "steals": 80,
-            "steals_pg": 0.9876543209876543,
-            "blocks": 20,
-            "blocks_pg": 0.24691358024691357,
-            "personal_fouls": 92,
-            "personal_fouls_pg": 1.1358024691358024,
-            "three_pointers_made": 163,
-            "three_pointers_attempted": 446,
-            "three_point_pct": 0.365,
-            "three_pointers_made_pg": 2.0123456790123457,
-            "three_pointers_attempted_pg": 5.506172839506172,
-            "two_pointers_made": 265,
-            "two_pointers_attempted": 552,
-            "two_point_pct": 0.48007246376811596,
-            "two_pointers_made_pg": 3.271604938271605,
-            "two_pointers_attempted_pg": 6.814814814814815,
-            "free_throws_made": 402,
-            "free_throws_attempted": 457,
-            "free_throw_pct": 0.88,
-            "free_throws_made_pg": 4.962962962962963,
-            "free_throws_attempted_pg": 5.6419753086419755,
-            "plus_minus": 48,
-            "plus_minus_pg": 0.5925925925925926,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 177,
-            "pts_2nd_chance": 82,
-            "pts_fb": 225,
-            "pts_paint": 424,
-            "opp_pts_off_tov": 731,
-            "opp_pts_2nd_chance": 629,
-            "opp_pts_fb": 598,
-            "opp_pts_paint": 2060,
-            "pct_fgm": 0.257,
-            "pct_fga": 0.273,
-            "pct_fg3m": 0.384,
-            "pct_fg3a": 0.361,
-            "pct_ftm": 0.431,
-            "pct_fta": 0.39,
-            "pct_oreb": 0.054,
-            "pct_dreb": 0.13,
-            "pct_reb": 0.11,
-            "pct_ast": 0.276,
-            "pct_tov": 0.254,
-            "pct_stl": 0.224,
-            "pct_blk": 0.113,
-            "pct_blka": 0.25,
-            "pct_pf": 0.108,
-            "pct_pfd": 0.312,
-            "pct_pts": 0.303,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 3411,
-            "player_id": 101150,
-            "team_id": 19,
-            "season_id": 2018,
-            "age": 31.0,
-            "games_played": 79,
-            "wins": 42,
-            "losses": 37,
-            "win_pct": 0.532,
-            "minutes_pg": 2589.0,
-            "offensive_rating": 111.8,
-            "defensive_rating": 110.2,
-            "net_rating": 1.6,
-            "estimated_offensive_rating": 110.6,
-            "estimated_defensive_rating": 110.0,
-            "estimated_net_rating": 0.6,
-            "assist_percentage": 0.254,
-            "assist_to_turnover": 1.78,
-            "assist_ratio": 19.0,
-            "offensive_rebound_pct": 0.015,
-            "defensive_rebound_pct": 0.059,
-            "rebound_pct": 0.038,
-            "turnover_pct": 10.7,
-            "effective_fg_pct": 0.505,
-            "true_shooting_pct": 0.574,
-            "usage_pct": 0.285,
-            "pace": 101.77,
-            "pace_per_40": 84.81,
-            "estimated_pace": 102.43,
-            "possessions": 5504,
-            "pie": 0.127,
-            "field_goals_made": 582,
-            "field_goals_attempted": 1337,
-            "field_goal_pct": 0.435,
-            "field_goals_made_pg": 7.4,
-            "field_goals_attempted_pg": 16.9,
-            "points": 1782,
-            "points_pg": 22.556962025316455,
-            "rebounds": 198,
-            "rebounds_pg": 2.5063291139240507,
-            "offensive_rebounds": 40,
-            "defensive_rebounds": 158,
-            "assists": 417,
-            "assists_pg": 5.2784810126582276,
-            "turnovers": 234,
-            "turnovers_pg": 2.962025316455696,
-            "steals": 85,
-            "steals_pg": 1.0759493670886076,
-            "blocks": 19,
-            "blocks_pg": 0.24050632911392406,
-            "personal_fouls": 106,
-            "personal_fouls_pg": 1.3417721518987342,
-            "three_pointers_made": 186,
-            "three_pointers_attempted": 518,
-            "three_point_pct": 0.359,
-            "three_pointers_made_pg": 2.3544303797468356,
-            "three_pointers_attempted_pg": 6.556962025316456,
-            "two_pointers_made": 396,
-            "two_pointers_attempted": 819,
-            "two_point_pct": 0.4835164835164835,
-            "two_pointers_made_pg": 5.012658227848101,
-            "two_pointers_attempted_pg": 10.367088607594937,
-            "free_throws_made": 432,
-            "free_throws_attempted": 491,
-            "free_throw_pct": 0.88,
-            "free_throws_made_pg": 5.468354430379747,
-            "free_throws_attempted_pg": 6.215189873417722,
-            "plus_minus": 120,
-            "plus_minus_pg": 1.518987341772152,
-            "double_doubles": 7,
-            "triple_doubles": 0,
-            "pts_off_tov": 217,
-            "pts_2nd_chance": 111,
-            "pts_fb": 204,
-            "pts_paint": 556,
-            "opp_pts_off_tov": 959,
-            "opp_pts_2nd_chance": 774,
-            "opp_pts_fb": 847,
-            "opp_pts_paint": 2540,
-            "pct_fgm": 0.262,
-            "pct_fga": 0.289,
-            "pct_fg3m": 0.36,
-            "pct_fg3a": 0.358,
-            "pct_ftm": 0.363,
-            "pct_fta": 0.315,
-            "pct_oreb": 0.072,
-            "pct_dreb": 0.089,
-            "pct_reb": 0.085,
-            "pct_ast": 0.343,
-            "pct_tov": 0.293,
-            "pct_stl": 0.218,
-            "pct_blk": 0.075,
-            "pct_blka": 0.272,
-            "pct_pf": 0.093,
-            "pct_pfd": 0.282,
-            "pct_pts": 0.29,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 3898,
-            "player_id": 101150,
-            "team_id": 19,
-            "season_id": 2019,
-            "age": 32.0,
-            "games_played": 75,
-            "wins": 47,
-            "losses": 28,
-            "win_pct": 0.627,
-            "minutes_pg": 1993.0,
-            "offensive_rating": 113.1,
-            "defensive_rating": 109.2,
-            "net_rating": 3.9,
-            "estimated_offensive_rating": 112.2,
-            "estimated_defensive_rating": 109.6,
-            "estimated_net_rating": 2.6,
-            "assist_percentage": 0.318,
-            "assist_to_turnover": 2.22,
-            "assist_ratio": 20.9,
-            "offensive_rebound_pct": 0.019,
-            "defensive_rebound_pct": 0.081,
-            "rebound_pct": 0.051,
-            "turnover_pct": 9.4,
-            "effective_fg_pct": 0.471,
-            "true_shooting_pct": 0.554,
-            "usage_pct": 0.308,
-            "pace": 105.69,
-            "pace_per_40": 88.08,
-            "estimated_pace": 105.93,
-            "possessions": 4399,
-            "pie": 0.147,
-            "field_goals_made": 484,
-            "field_goals_attempted": 1138,
-            "field_goal_pct": 0.425,
-            "field_goals_made_pg": 6.5,
-            "field_goals_attempted_pg": 15.2,
-            "points": 1498,
-            "points_pg": 19.973333333333333,
-            "rebounds": 222,
-            "rebounds_pg": 2.96,
-            "offensive_rebounds": 40,
-            "defensive_rebounds": 182,
-            "assists": 402,
-            "assists_pg": 5.36,
-            "turnovers": 181,
-            "turnovers_pg": 2.4133333333333336,
-            "steals": 57,
-            "steals_pg": 0.76,
-            "blocks": 11,
-            "blocks_pg": 0.14666666666666667,
-            "personal_fouls": 80,
-            "personal_fouls_pg": 1.0666666666666667,
-            "three_pointers_made": 105,
-            "three_pointers_attempted": 291,
-            "three_point_pct": 0.361,
-            "three_pointers_made_pg": 1.4,
-            "three_pointers_attempted_pg": 3.88,
-            "two_pointers_made": 379,
-            "two_pointers_attempted": 847,
-            "two_point_pct": 0.4474616292798111,
-            "two_pointers_made_pg": 5.053333333333334,
-            "two_pointers_attempted_pg": 11.293333333333333,
-            "free_throws_made": 425,
-            "free_throws_attempted": 485,
-            "free_throw_pct": 0.876,
-            "free_throws_made_pg": 5.666666666666667,
-            "free_throws_attempted_pg": 6.466666666666667,
-            "plus_minus": 196,
-            "plus_minus_pg": 2.6133333333333333,
-            "double_doubles": 7,
-            "triple_doubles": 1,
-            "pts_off_tov": 155,
-            "pts_2nd_chance": 73,
-            "pts_fb": 189,
-            "pts_paint": 530,
-            "opp_pts_off_tov": 709,
-            "opp_pts_2nd_chance": 654,
-            "opp_pts_fb": 598,
-            "opp_pts_paint": 2100,
-            "pct_fgm": 0.277,
-            "pct_fga": 0.31,
-            "pct_fg3m": 0.264,
-            "pct_fg3a": 0.274,
-            "pct_ftm": 0.392,
-            "pct_fta": 0.355,
-            "pct_oreb": 0.099,
-            "pct_dreb": 0.125,
-            "pct_reb": 0.119,
-            "pct_ast": 0.402,
-            "pct_tov": 0.323,
-            "pct_stl": 0.198,
-            "pct_blk": 0.051,
-            "pct_blka": 0.269,
-            "pct_pf": 0.078,
-            "pct_pfd": 0.321,
-            "pct_pts": 0.301,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 4378,
-            "player_id": 101150,
-            "team_id": 19,
-            "season_id": 2020,
-            "age": 33.0,
-            "games_played": 65,
-            "wins": 44,
-            "losses": 21,
-            "win_pct": 0.677,
-            "minutes_pg": 1864.0,
-            "offensive_rating": 111.5,
-            "defensive_rating": 107.4,
-            "net_rating": 4.0,
-            "estimated_offensive_rating": 109.9,
-            "estimated_defensive_rating": 107.6,
-            "estimated_net_rating": 2.4,
-            "assist_percentage": 0.294,
-            "assist_to_turnover": 2.01,
-            "assist_ratio": 22.5,
-            "offensive_rebound_pct": 0.016,
-            "defensive_rebound_pct": 0.081,
-            "rebound_pct": 0.049,
-            "turnover_pct": 11.2,
-            "effective_fg_pct": 0.477,
-            "true_shooting_pct": 0.546,
-            "usage_pct": 0.271,
-            "pace": 105.0,
-            "pace_per_40": 87.5,
-            "estimated_pace": 105.68,
-            "possessions": 4095,
-            "pie": 0.124,
-            "field_goals_made": 391,
-            "field_goals_attempted": 936,
-            "field_goal_pct": 0.418,
-            "field_goals_made_pg": 6.0,
-            "field_goals_attempted_pg": 14.4,
-            "points": 1185,
-            "points_pg": 18.23076923076923,
-            "rebounds": 201,
-            "rebounds_pg": 3.0923076923076924,
-            "offensive_rebounds": 31,
-            "defensive_rebounds": 170,
-            "assists": 365,
-            "assists_pg": 5.615384615384615,
-            "turnovers": 182,
-            "turnovers_pg": 2.8,
-            "steals": 43,
-            "steals_pg": 0.6615384615384615,
-            "blocks": 12,
-            "blocks_pg": 0.18461538461538463,
-            "personal_fouls": 80,
-            "personal_fouls_pg": 1.2307692307692308,
-            "three_pointers_made": 111,
-            "three_pointers_attempted": 315,
-            "three_point_pct": 0.352,
-            "three_pointers_made_pg": 1.7076923076923076,
-            "three_pointers_attempted_pg": 4.846153846153846,
-            "two_pointers_made": 280,
-            "two_pointers_attempted": 621,
-            "two_point_pct": 0.45088566827697263,
-            "two_pointers_made_pg": 4.3076923076923075,
-            "two_pointers_attempted_pg": 9.553846153846154,
-            "free_throws_made": 292,
-            "free_throws_attempted": 339,
-            "free_throw_pct": 0.861,
-            "free_throws_made_pg": 4.492307692307692,
-            "free_throws_attempted_pg": 5.2153846153846155,
-            "plus_minus": 203,
-            "plus_minus_pg": 3.123076923076923,
-            "double_doubles": 2,
-            "triple_doubles": 0,
-            "pts_off_tov": 173,
-            "pts_2nd_chance": 87,
-            "pts_fb": 159,
-            "pts_paint": 368,
-            "opp_pts_off_tov": 643,
-            "opp_pts_2nd_chance": 534,
-            "opp_pts_fb": 556,
-            "opp_pts_paint": 1806,
-            "pct_fgm": 0.239,
-            "pct_fga": 0.267,
-            "pct_fg3m": 0.255,
-            "pct_fg3a": 0.252,
-            "pct_ftm": 0.338,
-            "pct_fta": 0.307,
-            "pct_oreb": 0.073,
-            "pct_dreb": 0.12,
-            "pct_reb": 0.109,
-            "pct_ast": 0.403,
-            "pct_tov": 0.312,
-            "pct_stl": 0.172,
-            "pct_blk": 0.067,
-            "pct_blka": 0.24,
-            "pct_pf": 0.095,
-            "pct_pfd": 0.289,
-            "pct_pts": 0.26,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 4893,
-            "player_id": 101150,
-            "team_id": 0,
-            "season_id": 2021,
-            "age": 34.0,
-            "games_played": 66,
-            "wins": 44,
-            "losses": 22,
-            "win_pct": 0.667,
-            "minutes_pg": 1423.0,
-            "offensive_rating": 112.3,
-            "defensive_rating": 110.6,
-            "net_rating": 1.8,
-            "estimated_offensive_rating": 112.8,
-            "estimated_defensive_rating": 111.1,
-            "estimated_net_rating": 1.6,
-            "assist_percentage": 0.233,
-            "assist_to_turnover": 2.08,
-            "assist_ratio": 21.4,
-            "offensive_rebound_pct": 0.015,
-            "defensive_rebound_pct": 0.08,
-            "rebound_pct": 0.048,
-            "turnover_pct": 10.3,
-            "effective_fg_pct": 0.464,
-            "true_shooting_pct": 0.519,
-            "usage_pct": 0.244,
-            "pace": 101.69,
-            "pace_per_40": 84.74,
-            "estimated_pace": 101.23,
-            "possessions": 3025,
-            "pie": 0.096,
-            "field_goals_made": 265,
-            "field_goals_attempted": 646,
-            "field_goal_pct": 0.41,
-            "field_goals_made_pg": 4.0,
-            "field_goals_attempted_pg": 9.8,
-            "points": 749,
-            "points_pg": 11.348484848484848,
-            "rebounds": 138,
-            "rebounds_pg": 2.090909090909091,
-            "offensive_rebounds": 21,
-            "defensive_rebounds": 117,
-            "assists": 225,
-            "assists_pg": 3.409090909090909,
-            "turnovers": 108,
-            "turnovers_pg": 1.6363636363636365,
-            "steals": 47,
-            "steals_pg": 0.7121212121212122,
-            "blocks": 6,
-            "blocks_pg": 0.09090909090909091,
-            "personal_fouls": 62,
-            "personal_fouls_pg": 0.9393939393939394,
-            "three_pointers_made": 69,
-            "three_pointers_attempted": 173,
-            "three_point_pct": 0.399,
-            "three_pointers_made_pg": 1.0454545454545454,
-            "three_pointers_attempted_pg": 2.621212121212121,
-            "two_pointers_made": 196,
-            "two_pointers_attempted": 473,
-            "two_point_pct": 0.4143763213530655,
-            "two_pointers_made_pg": 2.9696969696969697,
-            "two_pointers_attempted_pg": 7.166666666666667,
-            "free_throws_made": 150,
-            "free_throws_attempted": 173,
-            "free_throw_pct": 0.867,
-            "free_throws_made_pg": 2.272727272727273,
-            "free_throws_attempted_pg": 2.621212121212121,
-            "plus_minus": 77,
-            "plus_minus_pg": 1.1666666666666667,
-            "double_doubles": 2,
-            "triple_doubles": 0,
-            "pts_off_tov": 107,
-            "pts_2nd_chance": 50,
-            "pts_fb": 57,
-            "pts_paint": 262,
-            "opp_pts_off_tov": 455,
-            "opp_pts_2nd_chance": 393,
-            "opp_pts_fb": 380,
-            "opp_pts_paint": 1464,
-            "pct_fgm": 0.215,
-            "pct_fga": 0.247,
-            "pct_fg3m": 0.194,
-            "pct_fg3a": 0.194,
-            "pct_ftm": 0.257,
-            "pct_fta": 0.247,
-            "pct_oreb": 0.073,
-            "pct_dreb": 0.115,
-            "pct_reb": 0.106,
-            "pct_ast": 0.331,
-            "pct_tov": 0.287,
-            "pct_stl": 0.224,
-            "pct_blk": 0.051,
-            "pct_blka": 0.274,
-            "pct_pf": 0.104,
-            "pct_pfd": 0.238,
-            "pct_pts": 0.22,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 5480,
-            "player_id": 101150,
-            "team_id": 0,
-            "season_id": 2022,
-            "age": 35.0,
-            "games_played": 56,
-            "wins": 33,
-            "losses": 23,
-            "win_pct": 0.589,
-            "minutes_pg": 799.0,
-            "offensive_rating": 110.4,
-            "defensive_rating": 109.5,
-            "net_rating": 0.8,
-            "estimated_offensive_rating": 112.3,
-            "estimated_defensive_rating": 110.3,
-            "estimated_net_rating": 2.0,
-            "assist_percentage": 0.196,
-            "assist_to_turnover": 2.44,
-            "assist_ratio": 20.9,
-            "offensive_rebound_pct": 0.02,
-            "defensive_rebound_pct": 0.084,
-            "rebound_pct": 0.052,
-            "turnover_pct": 8.5,
-            "effective_fg_pct": 0.448,
-            "true_shooting_pct": 0.5,
-            "usage_pct": 0.215,
-            "pace": 99.65,
-            "pace_per_40": 83.04,
-            "estimated_pace": 98.41,
-            "possessions": 1659,
-            "pie": 0.083,
-            "field_goals_made": 125,
-            "field_goals_attempted": 320,
-            "field_goal_pct": 0.391,
-            "field_goals_made_pg": 2.2,
-            "field_goals_attempted_pg": 5.7,
-            "points": 354,
-            "points_pg": 6.321428571428571,
-            "rebounds": 87,
-            "rebounds_pg": 1.5535714285714286,
-            "offensive_rebounds": 16,
-            "defensive_rebounds": 71,
-            "assists": 105,
-            "assists_pg": 1.875,
-            "turnovers": 43,
-            "turnovers_pg": 0.7678571428571429,
-            "steals": 28,
-            "steals_pg": 0.5,
-            "blocks": 3,
-            "blocks_pg": 0.05357142857142857,
-            "personal_fouls": 48,
-            "personal_fouls_pg": 0.8571428571428571,
-            "three_pointers_made": 37,
-            "three_pointers_attempted": 102,
-            "three_point_pct": 0.363,
-            "three_pointers_made_pg": 0.6607142857142857,
-            "three_pointers_attempted_pg": 1.8214285714285714,
-            "two_pointers_made": 88,
-            "two_pointers_attempted": 218,
-            "two_point_pct": 0.4036697247706422,
-            "two_pointers_made_pg": 1.5714285714285714,
-            "two_pointers_attempted_pg": 3.892857142857143,
-            "free_throws_made": 67,
-            "free_throws_attempted": 78,
-            "free_throw_pct": 0.859,
-            "free_throws_made_pg": 1.1964285714285714,
-            "free_throws_attempted_pg": 1.3928571428571428,
-            "plus_minus": 15,
-            "plus_minus_pg": 0.26785714285714285,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 26,
-            "pts_2nd_chance": 25,
-            "pts_fb": 22,
-            "pts_paint": 98,
-            "opp_pts_off_tov": 211,
-            "opp_pts_2nd_chance": 221,
-            "opp_pts_fb": 183,
-            "opp_pts_paint": 786,
-            "pct_fgm": 0.189,
-            "pct_fga": 0.221,
-            "pct_fg3m": 0.18,
-            "pct_fg3a": 0.18,
-            "pct_ftm": 0.219,
-            "pct_fta": 0.213,
-            "pct_oreb": 0.101,
-            "pct_dreb": 0.126,
-            "pct_reb": 0.12,
-            "pct_ast": 0.272,
-            "pct_tov": 0.239,
-            "pct_stl": 0.219,
-            "pct_blk": 0.039,
-            "pct_blka": 0.207,
-            "pct_pf": 0.143,
-            "pct_pfd": 0.199,
-            "pct_pts": 0.193,
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 42,
-            "name": "Monty Williams",
-            "first_name": "Monty",
-            "last_name": "Williams",
-            "height_inches": 80,
-            "weight_pounds": 225,
-            "birth_date": "1971-10-08T00:00:00",
-            "country": "USA",
-            "school": "Notre Dame",
-            "position": "Forward",
-            "draft_year": 1994,
-            "draft_round": 1,
-            "draft_number": 24,
-            "roster_status": 0,
-            "is_gleague_player": 0,
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 21,
-            "city": "Memphis",
-            "name": "Memphis Grizzlies",
-            "nickname": "Grizzlies",
-            "abbreviation": "MEM",
-            "conference": "Western",
-            "division": "Southwest",
-        },
-    },
-    {
-        "model": "Team",
-        "values": {
-            "id": 2,
-            "city": "Brooklyn",
-            "name": "Brooklyn Nets",
-            "nickname": "Nets",
-            "abbreviation": "BKN",
-            "conference": "Eastern",
-            "division": "Atlantic",
-        },
-    },
-    {
-        "model": "Player",
-        "values": {
-            "id": 1630533,
-            "name": "Ziaire Williams",
-            "first_name": "Ziaire",
-            "last_name": "Williams",
-            "height_inches": 81,
-            "weight_pounds": 185,
-            "birth_date": "2001-09-12T00:00:00",
-            "country": "USA",
-            "school": "Stanford",
-            "position": "Forward",
-            "draft_year": 2021,
-            "draft_round": 1,
-            "draft_number": 10,
-            "roster_status": 1,
-            "is_gleague_player": 1,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 10088,
-            "player_id": 1630533,
-            "team_id": 21,
-            "value": 19907925,
-            "start_year": 2022,
-            "duration": 4,
-            "option_1": "Team",
-            "option_2": None,
-        },
-    },
-    {
-        "model": "Contract",
-        "values": {
-            "id": 14297,
-            "player_id": 1630533,
-            "team_id": 2,
-            "value": 12500000,
-            "start_year": 2026,
-            "duration": 2,
-            "option_1": "Team",
-            "option_2": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13108,
-            "season_id": 2025,
-            "team_id": 2,
-            "player_id": 1630533,
-            "cap_hit_percent": 4.36,
-            "salary": 6133005,
-            "apron_salary": 6133005,
-            "luxury_tax": 6133005,
-            "cash_total": 6133005,
-            "cash_garunteed": 6133005,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13126,
-            "season_id": 2026,
-            "team_id": 2,
-            "player_id": 1630533,
-            "cap_hit_percent": 4.04,
-            "salary": 6250000,
-            "apron_salary": 6250000,
-            "luxury_tax": 6250000,
-            "cash_total": 6250000,
-            "cash_garunteed": 6250000,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 13144,
-            "season_id": 2027,
-            "team_id": 2,
-            "player_id": 1630533,
-            "cap_hit_percent": 3.77,
-            "salary": 6250000,
-            "apron_salary": 6250000,
-            "luxury_tax": 6250000,
-            "cash_total": 6250000,
-            "cash_garunteed": None,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 16309,
-            "season_id": 2022,
-            "team_id": 21,
-            "player_id": 1630533,
-            "cap_hit_percent": 3.89,
-            "salary": 4373040,
-            "apron_salary": 4373040,
-            "luxury_tax": 4373040,
-            "cash_total": 4373040,
-            "cash_garunteed": 4373040,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 16324,
-            "season_id": 2023,
-            "team_id": 21,
-            "player_id": 1630533,
-            "cap_hit_percent": 3.71,
-            "salary": 4591680,
-            "apron_salary": 4591680,
-            "luxury_tax": 4591680,
-            "cash_total": 4591680,
-            "cash_garunteed": 4591680,
-        },
-    },
-    {
-        "model": "TeamPlayerSalary",
-        "values": {
-            "id": 16340,
-            "season_id": 2024,
-            "team_id": 21,
-            "player_id": 1630533,
-            "cap_hit_percent": 3.54,
-            "salary": 4810200,
-            "apron_salary": 4810200,
-            "luxury_tax": 4810200,
-            "cash_total": 4810200,
-            "cash_garunteed": 4810200,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 5612,
-            "player_id": 1630533,
-            "team_id": 21,
-            "season_id": 2022,
-            "age": 20.0,
-            "games_played": 62,
-            "wins": 41,
-            "losses": 21,
-            "win_pct": 0.661,
-            "minutes_pg": 1346.0,
-            "offensive_rating": 112.9,
-            "defensive_rating": 108.8,
-            "net_rating": 4.2,
-            "estimated_offensive_rating": 111.2,
-            "estimated_defensive_rating": 107.5,
-            "estimated_net_rating": 3.6,
-            "assist_percentage": 0.062,
-            "assist_to_turnover": 1.59,
-            "assist_ratio": 11.8,
-            "offensive_rebound_pct": 0.017,
-            "defensive_rebound_pct": 0.071,
-            "rebound_pct": 0.044,
-            "turnover_pct": 7.4,
-            "effective_fg_pct": 0.54,
-            "true_shooting_pct": 0.559,
-            "usage_pct": 0.144,
-            "pace": 103.22,
-            "pace_per_40": 86.02,
-            "estimated_pace": 104.65,
-            "possessions": 2896,
-            "pie": 0.055,
-            "field_goals_made": 191,
-            "field_goals_attempted": 424,
-            "field_goal_pct": 0.45,
-            "field_goals_made_pg": 3.1,
-            "field_goals_attempted_pg": 6.8,
-            "points": 501,
-            "points_pg": 8.080645161290322,
-            "rebounds": 129,
-            "rebounds_pg": 2.0806451612903225,
-            "offensive_rebounds": 26,
-            "defensive_rebounds": 103,
-            "assists": 65,
-            "assists_pg": 1.0483870967741935,
-            "turnovers": 41,
-            "turnovers_pg": 0.6612903225806451,
-            "steals": 35,
-            "steals_pg": 0.5645161290322581,
-            "blocks": 12,
-            "blocks_pg": 0.1935483870967742,
-            "personal_fouls": 113,
-            "personal_fouls_pg": 1.8225806451612903,
-            "three_pointers_made": 76,
-            "three_pointers_attempted": 242,
-            "three_point_pct": 0.314,
-            "three_pointers_made_pg": 1.2258064516129032,
-            "three_pointers_attempted_pg": 3.903225806451613,
-            "two_pointers_made": 115,
-            "two_pointers_attempted": 182,
-            "two_point_pct": 0.6318681318681318,
-            "two_pointers_made_pg": 1.8548387096774193,
-            "two_pointers_attempted_pg": 2.935483870967742,
-            "free_throws_made": 43,
-            "free_throws_attempted": 55,
-            "free_throw_pct": 0.782,
-            "free_throws_made_pg": 0.6935483870967742,
-            "free_throws_attempted_pg": 0.8870967741935484,
-            "plus_minus": 122,
-            "plus_minus_pg": 1.967741935483871,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 92,
-            "pts_2nd_chance": 81,
-            "pts_fb": 136,
-            "pts_paint": 182,
-            "opp_pts_off_tov": 416,
-            "opp_pts_2nd_chance": 370,
-            "opp_pts_fb": 392,
-            "opp_pts_paint": 1462,
-            "pct_fgm": 0.154,
-            "pct_fga": 0.16,
-            "pct_fg3m": 0.227,
-            "pct_fg3a": 0.267,
-            "pct_ftm": 0.093,
-            "pct_fta": 0.086,
-            "pct_oreb": 0.069,
-            "pct_dreb": 0.101,
-            "pct_reb": 0.093,
-            "pct_ast": 0.083,
-            "pct_tov": 0.106,
-            "pct_stl": 0.144,
-            "pct_blk": 0.064,
-            "pct_blka": 0.1,
-            "pct_pf": 0.214,
-            "pct_pfd": 0.095,
-            "pct_pts": 0.153,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6193,
-            "player_id": 1630533,
-            "team_id": 21,
-            "season_id": 2023,
-            "age": 21.0,
-            "games_played": 37,
-            "wins": 21,
-            "losses": 16,
-            "win_pct": 0.568,
-            "minutes_pg": 561.0,
-            "offensive_rating": 106.9,
-            "defensive_rating": 112.2,
-            "net_rating": -5.2,
-            "estimated_offensive_rating": 106.6,
-            "estimated_defensive_rating": 110.1,
-            "estimated_net_rating": -3.6,
-            "assist_percentage": 0.086,
-            "assist_to_turnover": 0.95,
-            "assist_ratio": 12.6,
-            "offensive_rebound_pct": 0.028,
-            "defensive_rebound_pct": 0.105,
-            "rebound_pct": 0.067,
-            "turnover_pct": 13.4,
-            "effective_fg_pct": 0.492,
-            "true_shooting_pct": 0.511,
-            "usage_pct": 0.178,
-            "pace": 102.8,
-            "pace_per_40": 85.67,
-            "estimated_pace": 103.94,
-            "possessions": 1195,
-            "pie": 0.052,
-            "field_goals_made": 84,
-            "field_goals_attempted": 196,
-            "field_goal_pct": 0.429,
-            "field_goals_made_pg": 2.3,
-            "field_goals_attempted_pg": 5.3,
-            "points": 210,
-            "points_pg": 5.675675675675675,
-            "rebounds": 79,
-            "rebounds_pg": 2.135135135135135,
-            "offensive_rebounds": 16,
-            "defensive_rebounds": 63,
-            "assists": 35,
-            "assists_pg": 0.9459459459459459,
-            "turnovers": 37,
-            "turnovers_pg": 1.0,
-            "steals": 14,
-            "steals_pg": 0.3783783783783784,
-            "blocks": 6,
-            "blocks_pg": 0.16216216216216217,
-            "personal_fouls": 58,
-            "personal_fouls_pg": 1.5675675675675675,
-            "three_pointers_made": 25,
-            "three_pointers_attempted": 97,
-            "three_point_pct": 0.258,
-            "three_pointers_made_pg": 0.6756756756756757,
-            "three_pointers_attempted_pg": 2.6216216216216215,
-            "two_pointers_made": 59,
-            "two_pointers_attempted": 99,
-            "two_point_pct": 0.5959595959595959,
-            "two_pointers_made_pg": 1.5945945945945945,
-            "two_pointers_attempted_pg": 2.675675675675676,
-            "free_throws_made": 17,
-            "free_throws_attempted": 22,
-            "free_throw_pct": 0.773,
-            "free_throws_made_pg": 0.4594594594594595,
-            "free_throws_attempted_pg": 0.5945945945945946,
-            "plus_minus": -76,
-            "plus_minus_pg": -2.054054054054054,
-            "double_doubles": 0,
-            "triple_doubles": 0,
-            "pts_off_tov": 39,
-            "pts_2nd_chance": 12,
-            "pts_fb": 48,
-            "pts_paint": 104,
-            "opp_pts_off_tov": 194,
-            "opp_pts_2nd_chance": 187,
-            "opp_pts_fb": 168,
-            "opp_pts_paint": 546,
-            "pct_fgm": 0.171,
-            "pct_fga": 0.189,
-            "pct_fg3m": 0.229,
-            "pct_fg3a": 0.261,
-            "pct_ftm": 0.09,
-            "pct_fta": 0.086,
-            "pct_oreb": 0.122,
-            "pct_dreb": 0.163,
-            "pct_reb": 0.153,
-            "pct_ast": 0.112,
-            "pct_tov": 0.207,
-            "pct_stl": 0.156,
-            "pct_blk": 0.092,
-            "pct_blka": 0.083,
-            "pct_pf": 0.241,
-            "pct_pfd": 0.154,
-            "pct_pts": 0.164,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6751,
-            "player_id": 1630533,
-            "team_id": 21,
-            "season_id": 2024,
-            "age": 22.0,
-            "games_played": 51,
-            "wins": 20,
-            "losses": 31,
-            "win_pct": 0.392,
-            "minutes_pg": 1038.0,
-            "offensive_rating": 102.5,
-            "defensive_rating": 112.4,
-            "net_rating": -9.9,
-            "estimated_offensive_rating": 101.1,
-            "estimated_defensive_rating": 112.6,
-            "estimated_net_rating": -11.6,
-            "assist_percentage": 0.118,
-            "assist_to_turnover": 1.14,
-            "assist_ratio": 13.6,
-            "offensive_rebound_pct": 0.031,
-            "defensive_rebound_pct": 0.138,
-            "rebound_pct": 0.082,
-            "turnover_pct": 12.0,
-            "effective_fg_pct": 0.474,
-            "true_shooting_pct": 0.511,
-            "usage_pct": 0.192,
-            "pace": 100.4,
-            "pace_per_40": 83.67,
-            "estimated_pace": 101.02,
-            "possessions": 2156,
-            "pie": 0.074,
-            "field_goals_made": 150,
-            "field_goals_attempted": 378,
-            "field_goal_pct": 0.397,
-            "field_goals_made_pg": 2.9,
-            "field_goals_attempted_pg": 7.4,
-            "points": 420,
-            "points_pg": 8.235294117647058,
-            "rebounds": 180,
-            "rebounds_pg": 3.5294117647058822,
-            "offensive_rebounds": 35,
-            "defensive_rebounds": 145,
-            "assists": 75,
-            "assists_pg": 1.4705882352941178,
-            "turnovers": 66,
-            "turnovers_pg": 1.2941176470588236,
-            "steals": 36,
-            "steals_pg": 0.7058823529411765,
-            "blocks": 9,
-            "blocks_pg": 0.17647058823529413,
-            "personal_fouls": 85,
-            "personal_fouls_pg": 1.6666666666666667,
-            "three_pointers_made": 58,
-            "three_pointers_attempted": 189,
-            "three_point_pct": 0.307,
-            "three_pointers_made_pg": 1.1372549019607843,
-            "three_pointers_attempted_pg": 3.7058823529411766,
-            "two_pointers_made": 92,
-            "two_pointers_attempted": 189,
-            "two_point_pct": 0.48677248677248675,
-            "two_pointers_made_pg": 1.803921568627451,
-            "two_pointers_attempted_pg": 3.7058823529411766,
-            "free_throws_made": 62,
-            "free_throws_attempted": 75,
-            "free_throw_pct": 0.827,
-            "free_throws_made_pg": 1.2156862745098038,
-            "free_throws_attempted_pg": 1.4705882352941178,
-            "plus_minus": -247,
-            "plus_minus_pg": -4.8431372549019605,
-            "double_doubles": 1,
-            "triple_doubles": 0,
-            "pts_off_tov": 57,
-            "pts_2nd_chance": 70,
-            "pts_fb": 52,
-            "pts_paint": 154,
-            "opp_pts_off_tov": 400,
-            "opp_pts_2nd_chance": 325,
-            "opp_pts_fb": 335,
-            "opp_pts_paint": 1086,
-            "pct_fgm": 0.191,
-            "pct_fga": 0.201,
-            "pct_fg3m": 0.213,
-            "pct_fg3a": 0.232,
-            "pct_ftm": 0.17,
-            "pct_fta": 0.158,
-            "pct_oreb": 0.151,
-            "pct_dreb": 0.215,
-            "pct_reb": 0.198,
-            "pct_ast": 0.146,
-            "pct_tov": 0.201,
-            "pct_stl": 0.197,
-            "pct_blk": 0.072,
-            "pct_blka": 0.191,
-            "pct_pf": 0.212,
-            "pct_pfd": 0.169,
-            "pct_pts": 0.19,
-        },
-    },
-    {
-        "model": "PlayerSeason",
-        "values": {
-            "id": 6975,
-            "player_id": 1630533,
-            "team_id": 2,
-            "season_id": 2025,
-            "age": 23.0,
-            "games_played": 63,
-            "wins": 22,
-            "losses": 41,
-            "win_pct": 0.349,
-            "minutes_pg": 1541.0,
-            "offensive_rating": 106.5,
-            "defensive_rating": 116.2,
-            "net_rating": -9.7,
-            "estimated_offensive_rating": 105.5,
-            "estimated_defensive_rating": 114.8,
-            "estimated_net_rating": -9.3,
-            "assist_percentage": 0.086,
-            "assist_to_turnover": 1.25,
-            "assist_ratio": 11.6,
-            "offensive_rebound_pct": 0.037,
-            "defensive_rebound_pct": 0.154,
-            "rebound_pct": 0.093,
-            "turnover_pct": 9.3,
-            "effective_fg_pct": 0.511,
-            "true_shooting_pct": 0.55,
-            "usage_pct": 0.179,
-            "pace": 97.77,
-            "pace_per_40": 81.47,
-            "estimated_pace": 98.8,
-            "possessions": 3128,
-            "pie": 0.081,
-            "field_goals_made": 214,
-            "field_goals_attempted": 520,
-            "field_goal_pct": 0.412,
-            "field_goals_made_pg": 3.4,
-            "field_goals_attempted_pg": 8.3,
-            "points": 632,
-            "points_pg": 10.031746031746032,
-            "rebounds": 287,
-            "rebounds_pg": 4.555555555555555,
-            "offensive_rebounds": 61,
-            "defensive_rebounds": 226,
-            "assists": 84,
-            "assists_pg": 1.3333333333333333,
-            "turnovers": 67,
-            "turnovers_pg": 1.0634920634920635,
-            "steals": 62,
-            "steals_pg": 0.9841269841269841,
-            "blocks": 28,
-            "blocks_pg": 0.4444444444444444,
-            "personal_fouls": 149,
-            "personal_fouls_pg": 2.365079365079365,
-            "three_pointers_made": 103,
-            "three_pointers_attempted": 302,
-            "three_point_pct": 0.341,
-            "three_pointers_made_pg": 1.6349206349206349,
-            "three_pointers_attempted_pg": 4.7936507936507935,
-            "two_pointers_made": 111,
-            "two_pointers_attempted": 218,
-            "two_point_pct": 0.5091743119266054,
-            "two_pointers_made_pg": 1.7619047619047619,
-            "two_pointers_attempted_pg": 3.4603174603174605,
-            "free_throws_made": 101,
-            "free_throws_attempted": 123,
-            "free_throw_pct": 0.821,
-            "free_throws_made_pg": 1.6031746031746033,
-            "free_throws_attempted_pg": 1.9523809523809523,
-            "plus_minus": -330,
-            "plus_minus_pg": -5.238095238095238,
-            "double_doubles": 2,
-            "triple_doubles": 0,
-            "pts_off_tov": 119,
-            "pts_2nd_chance": 81,
-            "pts_fb": 139,
-            "pts_paint": 212,
-            "opp_pts_off_tov": 592,
-            "opp_pts_2nd_chance": 415,
-            "opp_pts_fb": 544,
-            "opp_pts_paint": 1610,
-            "pct_fgm": 0.18,
-            "pct_fga": 0.19,
-            "pct_fg3m": 0.247,
-            "pct_fg3a": 0.243,
-            "pct_ftm": 0.189,
-            "pct_fta": 0.182,
-            "pct_oreb": 0.181,
-            "pct_dreb": 0.238,
-            "pct_reb": 0.223,
-            "pct_ast": 0.107,
-            "pct_tov": 0.148,
-            "pct_stl": 0.244,
-            "pct_blk": 0.184,
-            "pct_blka": 0.22,
-            "pct_pf": 0.229,
-            "pct_pfd": 0.188,
-            "pct_pts": 0.19,
-        },
-    },
-]
+from pathlib import Path
+
+from app.data.to_python_syntax import load_seed_data
+
+# written by app/data/to_python_syntax.py, one parquet file per model
+WILLIAMS_CONTRACT_DATA = load_seed_data(Path(__file__).parent / "parquet" / "williams")
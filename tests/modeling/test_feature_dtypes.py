@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from app.exploration.machine_learning_ii.data_preparation.default import (
+    build_categorical_preprocessor,
+)
+from app.exploration.machine_learning_ii.data_preparation.dtypes import (
+    optimize_feature_dtypes,
+)
+from app.exploration.machine_learning_ii.training.hybrid_models import (
+    build_hybrid_model,
+)
+
+
+def features(n: int = 200, seed: int = 0) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    return DataFrame(
+        {
+            "points_pg": rng.uniform(0, 30, n),
+            "games_played": rng.integers(0, 83, n),
+            "draft_round": rng.choice([1.0, 2.0, np.nan], n),
+            "min_eligibility": rng.uniform(0.01, 0.05, n),
+            "max_eligibility": rng.uniform(0.25, 0.35, n),
+            "relative_dollars": rng.uniform(0, 0.3, n),
+            "locale": rng.choice(["USA", "Europe", None], n),
+            "prev_team_id": rng.integers(0, 5, n).astype(float).astype(str),
+            "any_prev_buyout": rng.random(n) < 0.1,
+        }
+    )
+
+
+def test_optimized_dtypes_keep_the_values() -> None:
+    df = features()
+    optimized = optimize_feature_dtypes(df)
+
+    assert optimized.dtypes.to_dict() == {
+        "points_pg": np.float32,
+        "games_played": pd.Int8Dtype(),
+        "draft_round": pd.Int8Dtype(),
+        "min_eligibility": np.float64,
+        "max_eligibility": np.float64,
+        "relative_dollars": np.float64,
+        "locale": "category",
+        "prev_team_id": "category",
+        "any_prev_buyout": np.bool_,
+    }
+    assert optimized.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum()
+    assert_frame_equal(
+        optimized.astype(object).where(optimized.notna(), None),
+        df.astype(
+            {"points_pg": np.float32, "draft_round": object, "games_played": object}
+        )
+        .astype(object)
+        .where(df.notna(), None),
+        check_dtype=False,
+    )
+
+
+def test_categories_are_fixed_at_fit() -> None:
+    train = optimize_feature_dtypes(features())
+    train["contract_type"] = np.arange(len(train)) % 4
+    preprocessor = build_categorical_preprocessor(
+        train, ["points_pg", "games_played"]
+    ).fit(train)
+
+    test = train.head(3).copy()
+    test["locale"] = ["Asia", "USA", None]
+    transformed = preprocessor.transform(test)
+
+    assert list(transformed.columns) == preprocessor.get_feature_names_out()
+    assert list(transformed["locale"].cat.categories) == ["Europe", "USA"]
+    assert transformed["locale"].isna().tolist() == [True, False, True]
+    # the label is both a feature and the column the hybrid model pops
+    assert transformed["contract_type"].dtype == np.int64
+    assert transformed["contract_type_category"].dtype == "category"
+
+
+def test_hybrid_model_fits_categoricals() -> None:
+    df = optimize_feature_dtypes(features(400))
+    target = df.pop("relative_dollars")
+    df["validation"] = np.arange(len(df)) % 5 == 0
+    df["contract_type"] = (target * 10).astype(int).clip(0, 3)
+    numeric = ["points_pg", "games_played", "draft_round"]
+    numeric += ["min_eligibility", "max_eligibility"]
+    preprocessor = build_categorical_preprocessor(df, numeric).fit(df)
+
+    model = build_hybrid_model(None).fit(preprocessor.transform(df), target)
+    predictions = model.predict(preprocessor.transform(df))
+
+    assert predictions.shape == (len(df),)
+    assert np.isfinite(predictions).all()
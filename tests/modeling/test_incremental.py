@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+from sklearn.pipeline import Pipeline
+from sqlalchemy.orm import Session
+
+from app.crud.read.contract_supporting_info import export_contracts_for_ml
+from app.data.league import (
+    Award,
+    Contract,
+    Player,
+    PlayerSeason,
+    Team,
+    TeamPlayerBuyout,
+    TeamPlayerSalary,
+)
+from app.data.synthetic import copy_league, generate_league
+from app.exploration.machine_learning_ii.data_preparation.default import (
+    build_categorical_preprocessor,
+    default_feature_builder,
+    incremental_feature_builder,
+)
+from app.exploration.machine_learning_ii.data_preparation.dtypes import (
+    optimize_feature_dtypes,
+)
+from app.exploration.machine_learning_ii.training.hybrid_models import (
+    build_hybrid_model,
+)
+from app.exploration.machine_learning_ii.training.incremental import (
+    load_pipeline,
+    pipeline_inputs,
+    save_pipeline,
+    update_pipeline,
+)
+from tests.modeling.test_feature_dtypes import features
+
+
+@pytest.fixture
+def contracts_path(session: Session, tmp_path: Path) -> str:
+    copy_league(
+        session,
+        generate_league(60, seed=3),
+        models=[
+            Team,
+            Player,
+            PlayerSeason,
+            Contract,
+            TeamPlayerSalary,
+            TeamPlayerBuyout,
+            Award,
+        ],
+    )
+    session.flush()
+    path = str(tmp_path / "contracts-for-ml")
+    export_contracts_for_ml(session, path)
+    return path
+
+
+def test_incremental_features_match_the_full_build(contracts_path: str) -> None:
+    everything = default_feature_builder(contracts_path)
+    player_id, season = everything.index[len(everything) // 2]
+
+    rows = incremental_feature_builder([(player_id, season)], contracts_path)
+
+    # the changed row and the later seasons whose lags read it
+    player = everything.xs(player_id, level="player_id", drop_level=False)
+    assert rows.index.tolist() == player[player["season"] >= season].index.tolist()
+    assert_frame_equal(
+        rows,
+        everything.loc[rows.index],
+        check_dtype=False,
+        check_categorical=False,
+    )
+
+
+def hybrid_pipeline(df: DataFrame) -> Pipeline:
+    """fit the way PreparedData does, with a validation split"""
+    X, y = pipeline_inputs(df)
+    X["validation"] = np.arange(len(X)) % 5 == 0
+    numeric = df.drop(columns="relative_dollars").select_dtypes("number").columns
+    preprocessor = build_categorical_preprocessor(X, list(numeric))
+    return Pipeline(
+        [("preprocessor", preprocessor), ("model", build_hybrid_model(None))]
+    ).fit(X, y)
+
+
+def test_update_keeps_boosting_the_saved_model(tmp_path: Path) -> None:
+    df = optimize_feature_dtypes(features(400))
+    df["contract_type"] = np.array(["rookie", "minimum", "between", "maximum"])[
+        np.arange(len(df)) % 4
+    ]
+    path = save_pipeline(hybrid_pipeline(df), tmp_path / "model.joblib")
+    model = load_pipeline(path).named_steps["model"]
+    rounds = (
+        model.classifier.num_boosted_rounds(),
+        model.regressor.num_boosted_rounds(),
+    )
+
+    pipeline = update_pipeline(load_pipeline(path), df.tail(40), num_boost_round=5)
+
+    model = pipeline.named_steps["model"]
+    assert (
+        model.classifier.num_boosted_rounds(),
+        model.regressor.num_boosted_rounds(),
+    ) == (rounds[0] + 5, rounds[1] + 5)
+    predictions = pipeline.predict(pipeline_inputs(df)[0])
+    assert np.isfinite(predictions).all()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+from app.exploration.machine_learning_ii.plot_jobs import PlotJob, run_plot_jobs
+from app.exploration.machine_learning_ii.plotting_utils import thin_scatter
+
+
+def write_process(data: DataFrame, path: Path) -> None:
+    """stands in for a figure, records which process drew it and on what"""
+    path.write_text(f"{os.getpid()} {matplotlib.get_backend()} {len(data)}")
+
+
+def jobs(directory: Path, sizes: list[int]) -> list[PlotJob]:
+    return [
+        PlotJob(
+            write_process,
+            DataFrame({"x": np.arange(size)}),
+            (directory / f"{index}.txt",),
+            {"path": directory / f"{index}.txt"},
+        )
+        for index, size in enumerate(sizes)
+    ]
+
+
+def test_unchanged_figures_are_skipped(tmp_path: Path) -> None:
+    cache = tmp_path / "cache.json"
+
+    first = run_plot_jobs(jobs(tmp_path, [3, 4, 5]), workers=1, cache_path=cache)
+    assert len(first.rendered) == 3 and first.skipped == []
+
+    again = run_plot_jobs(jobs(tmp_path, [3, 4, 5]), workers=1, cache_path=cache)
+    assert again.rendered == [] and len(again.skipped) == 3
+
+    # new data and a deleted output are drawn again, nothing else is
+    (tmp_path / "2.txt").unlink()
+    changed = run_plot_jobs(jobs(tmp_path, [3, 9, 5]), workers=1, cache_path=cache)
+    assert changed.rendered == [str(tmp_path / "1.txt"), str(tmp_path / "2.txt")]
+    assert (tmp_path / "1.txt").read_text().endswith(" 9")
+
+    forced = run_plot_jobs(
+        jobs(tmp_path, [3, 9, 5]), workers=1, cache_path=cache, force=True
+    )
+    assert len(forced.rendered) == 3
+
+
+def test_jobs_render_in_agg_worker_processes(tmp_path: Path) -> None:
+    run = run_plot_jobs(
+        jobs(tmp_path, [1, 2, 3, 4]), workers=2, cache_path=tmp_path / "cache.json"
+    )
+
+    assert sorted(run.rendered) == [str(tmp_path / f"{i}.txt") for i in range(4)]
+    for index in range(4):
+        pid, backend, _ = (tmp_path / f"{index}.txt").read_text().split()
+        assert int(pid) != os.getpid()
+        assert backend.lower() == "agg"
+
+
+def test_two_jobs_cannot_write_the_same_file(tmp_path: Path) -> None:
+    first, second = jobs(tmp_path, [1, 2])
+    clash = PlotJob(write_process, second.data, first.outputs, first.options)
+
+    with pytest.raises(Exception, match="more than one job"):
+        run_plot_jobs([first, clash], cache_path=tmp_path / "cache.json")
+
+
+def test_large_scatters_are_thinned() -> None:
+    rng = np.random.default_rng(0)
+    df = DataFrame({"x": rng.normal(size=20_000), "y": rng.normal(size=20_000)})
+
+    thinned, alpha = thin_scatter(df, "x", "y", max_points=1_000)
+
+    assert len(thinned) == len(alpha) == 1_000
+    assert thinned.index.equals(thin_scatter(df, "x", "y", max_points=1_000)[0].index)
+    # the crowded middle is fainter than the edges
+    middle = (thinned["x"].abs() < 0.5) & (thinned["y"].abs() < 0.5)
+    assert alpha[middle].mean() < alpha[~middle].mean() <= 1
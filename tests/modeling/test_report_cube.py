@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from matplotlib import cbook
+from pandas import DataFrame
+
+from app.exploration.machine_learning_ii.report_cube import (
+    box_stats,
+    build_report_cube,
+)
+
+
+def contracts(rows: int = 600) -> DataFrame:
+    rng = np.random.default_rng(1)
+    df = DataFrame(
+        {
+            "season": rng.integers(2015, 2020, rows),
+            "position": rng.choice(["Guard", "Forward", "Center"], rows),
+            "contract_type": rng.choice(["rookie", "maximum", None], rows),
+            "country": rng.choice(["USA", "France", "Australia"], rows),
+            "relative_dollars": rng.gamma(2.0, 0.05, rows),
+        }
+    )
+    df.loc[::17, "relative_dollars"] = np.nan
+    return df
+
+
+def test_slices_match_a_groupby() -> None:
+    df = contracts()
+    cube = build_report_cube(df)
+
+    cells = cube.slice(["position", "season"])["relative_dollars"]
+
+    grouped = df.groupby(["position", "season"])["relative_dollars"]
+    assert cells.index.equals(grouped.mean().index)
+    assert (cells["count"] == grouped.count()).all()
+    np.testing.assert_allclose(cells["mean"], grouped.mean())
+    for column, q in (("q1", 0.25), ("median", 0.5), ("q3", 0.75)):
+        np.testing.assert_allclose(cells[column], grouped.quantile(q))
+
+
+def test_missing_categories_and_derived_locale_are_dimensions() -> None:
+    df = contracts()
+    cube = build_report_cube(df)
+
+    by_type = cube.slice(["contract_type"])
+    assert by_type.index.tolist() == ["None", "maximum", "rookie"]
+    assert (
+        by_type[("relative_dollars", "count")].sum() == df["relative_dollars"].count()
+    )
+    assert cube.slice(["locale"]).index.tolist() == ["Europe", "Oceania", "USA"]
+    assert cube.slice()[("relative_dollars", "count")].tolist() == [
+        df["relative_dollars"].count()
+    ]
+    with pytest.raises(Exception, match="Not a cube dimension"):
+        cube.slice(["team"])
+
+
+def test_boxes_match_matplotlib() -> None:
+    df = contracts()
+    df.loc[df.index[:3], "relative_dollars"] = 5.0  # outliers past the whiskers
+
+    boxes = box_stats(build_report_cube(df).slice(["season"]))
+
+    for box, (season, values) in zip(boxes, df.groupby("season")["relative_dollars"]):
+        expected = cbook.boxplot_stats(values.dropna().to_numpy())[0]
+        assert box["label"] == str(season)
+        for stat in ("med", "q1", "q3", "whislo", "whishi"):
+            assert box[stat] == pytest.approx(expected[stat])
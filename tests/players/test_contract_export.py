@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pandas.testing import assert_frame_equal
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.crud.read.contract_supporting_info import (
+    REFRESH_OVERLAP,
+    SOURCE_MODELS,
+    changed_players,
+    contracts_frame,
+    export_contracts_for_ml,
+    get_all_contract_supporting_info,
+    iter_player_chunks,
+    read_refresh_state,
+    refresh_contracts_for_ml,
+    stream_contracts_for_ml,
+)
+from app.crud.read.contracts_for_ml import contracts_for_ml, read_contracts
+from app.data.league import (
+    Award,
+    Contract,
+    Player,
+    PlayerSeason,
+    Team,
+    TeamPlayerBuyout,
+    TeamPlayerSalary,
+)
+from app.data.synthetic import copy_league, generate_league
+
+
+@pytest.fixture
+def league(session: Session) -> None:
+    copy_league(
+        session,
+        generate_league(60, seed=2),
+        models=[
+            Team,
+            Player,
+            PlayerSeason,
+            Contract,
+            TeamPlayerSalary,
+            TeamPlayerBuyout,
+            Award,
+        ],
+    )
+    session.flush()
+
+
+def test_stream_matches_the_full_export(
+    session: Session, league: None, tmp_path: Path
+) -> None:
+    expected = contracts_frame(get_all_contract_supporting_info(session))
+    session.expunge_all()
+
+    path = tmp_path / "contracts-for-ml"
+    rows = stream_contracts_for_ml(session, str(path), chunk_size=7)
+
+    assert rows == len(expected) > 0
+    assert {part.name for part in path.glob("season=*")} == {
+        f"season={season}" for season in expected["season"].unique()
+    }
+    assert len(read_refresh_state(path)[0]) == rows
+    streamed = read_contracts(path)
+    assert_frame_equal(streamed, expected, check_dtype=False)
+
+
+def test_reader_pushes_down_seasons_and_columns(
+    session: Session, league: None, tmp_path: Path
+) -> None:
+    path = tmp_path / "contracts-for-ml"
+    stream_contracts_for_ml(session, str(path), chunk_size=25)
+    everything = contracts_for_ml(path)
+    season = int(everything["season"].mode()[0])
+
+    df = contracts_for_ml(path, seasons=[season], columns=["relative_dollars"])
+
+    assert list(df.columns) == ["relative_dollars"]
+    assert df.index.names == ["player_id", "season"]
+    assert set(df.index.get_level_values("season")) == {season}
+    assert_frame_equal(
+        df, everything.loc[everything["season"] == season, ["relative_dollars"]]
+    )
+    assert "salary" not in everything and (everything["contract_number"] > 1).all()
+
+
+def test_chunks_are_expunged(session: Session, league: None) -> None:
+    sizes = []
+    for players in iter_player_chunks(session, chunk_size=10):
+        sizes.append(len(players))
+        # only this chunk (and the teams its contracts point to) is loaded
+        loaded = [
+            obj for obj in session.identity_map.values() if isinstance(obj, Player)
+        ]
+        assert loaded == players
+
+    assert sizes and max(sizes) == 10
+    assert not any(isinstance(obj, Player) for obj in session.identity_map.values())
+
+
+def test_refresh_rewrites_only_the_changed_seasons(
+    session: Session, league: None, tmp_path: Path
+) -> None:
+    # as if everything was loaded long before the export
+    for model in SOURCE_MODELS:
+        session.execute(update(model).values(updated_at=datetime(2000, 1, 1)))
+    path = tmp_path / "contracts-for-ml"
+    export_contracts_for_ml(session, str(path))
+    session.expunge_all()
+    _, exported_at = read_refresh_state(path)
+    modified = {file: file.stat().st_mtime_ns for file in path.glob("season=*/*")}
+
+    exported = read_contracts(path)
+    player_id, season = exported.index[len(exported) // 2]
+    salary = session.scalars(
+        select(TeamPlayerSalary).where(
+            TeamPlayerSalary.player_id == player_id,
+            TeamPlayerSalary.season_id == season,
+        )
+    ).first()
+    session.execute(
+        update(TeamPlayerSalary)
+        .where(TeamPlayerSalary.id == salary.id)
+        .values(salary=salary.salary * 2)
+    )
+    session.expunge_all()
+    assert changed_players(session, exported_at - REFRESH_OVERLAP) == {player_id}
+
+    refresh = refresh_contracts_for_ml(session, str(path), chunk_size=7)
+
+    assert refresh.players == {player_id}
+    assert (player_id, season) in refresh.changed
+    assert {changed_season for _, changed_season in refresh.changed} == refresh.seasons
+    for file, mtime in modified.items():
+        rewritten = file.parent.name in {f"season={s}" for s in refresh.seasons}
+        assert (file.stat().st_mtime_ns != mtime) == rewritten
+
+    expected_path = tmp_path / "expected"
+    export_contracts_for_ml(session, str(expected_path))
+    assert_frame_equal(read_contracts(path), read_contracts(expected_path))
+    assert read_refresh_state(path)[0].equals(read_refresh_state(expected_path)[0])
+    # nothing changed since, so the next refresh has nothing to do
+    assert refresh_contracts_for_ml(session, str(path)).changed == set()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.data.league import Game
+from app.data.to_python_syntax import export_seed_data, load_seed_data
+from app.data.league.player import PlayerGame
+from app.fill_data.player_games import (
+    copy_player_games,
+    get_player_season_ids,
+    parse_games,
+    parse_player_games,
+    upload_games,
+)
+from tests.conftest import parametrize
+from tests.data.game_logs import PLAYER_LOG, TEAM_LOG
+from tests.data.thompson_contract_data import THOMPSON_CONTRACT_DATA
+from tests.utils import seed_test_data
+
+
+@parametrize()
+def test_copy_player_games_into_season_partition(  # @IgnoreException
+    session: Session,
+) -> None:
+    seed_test_data(session, THOMPSON_CONTRACT_DATA)
+    player_games = parse_player_games(
+        PLAYER_LOG, 2025, get_player_season_ids(session, 2025)
+    )
+    upload_games(session, parse_games(TEAM_LOG, 2025, "Regular Season"))
+    for _ in range(2):  # reloading a season replaces it
+        copy_player_games(session, 2025, player_games)
+    session.commit()
+
+    game = session.execute(select(Game)).scalars().one()
+    assert (game.home_team_score, game.winning_team_id) == (110, 15)
+    assert session.execute(select(func.count(PlayerGame.id))).scalar_one() == 2
+    assert (
+        session.execute(text("SELECT count(*) FROM player_games_2025")).scalar_one()
+        == 2
+    )
+
+
+@parametrize()
+def test_seed_data_round_trips_through_arrow(  # @IgnoreException
+    session: Session, tmp_path: Path
+) -> None:
+    seed_data = THOMPSON_CONTRACT_DATA + [
+        {
+            "model": "Game",
+            "values": {
+                "id": 22400061,
+                "season_id": 2025,
+                "home_team_id": 15,
+                "away_team_id": 18,
+                "home_team_score": 102,
+                "away_team_score": 108,
+                "winning_team_id": 18,
+                # the python-literal encoding, stored as a native date32
+                "date": {"__type__": "date", "year": 2024, "month": 10, "day": 24},
+                "game_type": "Regular",
+            },
+        }
+    ]
+    for format in ("parquet", "arrow"):
+        export_seed_data(seed_data, tmp_path / format, format)  # type: ignore[arg-type]
+        loaded = load_seed_data(tmp_path / format)
+
+        assert len(loaded) == len(seed_data)
+        game = next(row["values"] for row in loaded if row["model"] == "Game")
+        assert game["date"] == date(2024, 10, 24)
+        assert {
+            row["values"]["option_1"] for row in loaded if row["model"] == "Contract"
+        } == {"Team", None}
+
+    seed_test_data(session, loaded)
+    assert session.get(Game, 22400061).date == date(2024, 10, 24)  # type: ignore[union-attr]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from pytest import approx
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.data.league import Player, PlayerSeason, Team
+from app.data.synthetic import copy_league, generate_league
+from app.modeling.payload_types.seasonal import (
+    FIELDS,
+    NO_COLINEARITY,
+    payload_matrix,
+    prefixed,
+)
+
+
+@pytest.fixture
+def seasons(session: Session) -> list[PlayerSeason]:
+    # the reference seasons are already seeded
+    copy_league(
+        session, generate_league(20, seed=7), models=[Team, Player, PlayerSeason]
+    )
+    session.commit()
+    session.expire_all()
+    return list(session.scalars(select(PlayerSeason).order_by(PlayerSeason.id)))
+
+
+def test_matrix_matches_payloads(seasons: list[PlayerSeason]) -> None:
+    # the first pass loads expired rows through the attributes
+    matrix = PlayerSeason.no_colinearity_matrix(seasons)
+    dicts = [season.ml_data().no_colinearity() for season in seasons]
+
+    assert matrix.shape == (len(seasons), len(NO_COLINEARITY))
+    assert list(dicts[0]) == list(NO_COLINEARITY)
+    assert matrix == approx(np.array([list(row.values()) for row in dicts]))
+    assert PlayerSeason.ml_matrix(seasons) == approx(
+        payload_matrix(season.ml_data() for season in seasons)
+    )
+    assert PlayerSeason.ml_matrix([]).shape == (0, len(FIELDS))
+
+
+def test_per_game_columns(seasons: list[PlayerSeason]) -> None:
+    season = seasons[0]
+    scalar = season.ml_data().no_colinearity()
+
+    assert scalar["pts_paint_pg"] == approx(season.pts_paint / season.games_played)
+    assert scalar["plus_minus_pg"] == season.plus_minus_pg
+
+    season.games_played = 0
+    assert season.ml_data().no_colinearity()["possessions_pg"] == 0.0
+    assert PlayerSeason.no_colinearity_matrix([season])[
+        0, NO_COLINEARITY.index("possessions_pg")
+    ] == approx(0.0)
+
+
+def test_missing_values_raise(seasons: list[PlayerSeason]) -> None:
+    seasons[0].pie = None  # type: ignore[assignment]
+
+    with pytest.raises(Exception, match="pie is missing"):
+        seasons[0].ml_data()
+    with pytest.raises(Exception, match="pie is missing"):
+        PlayerSeason.ml_matrix(seasons)
+
+
+def test_prefixed_keys_are_shared() -> None:
+    assert prefixed("previous_season_") is prefixed("previous_season_")
+    assert prefixed("previous_season_")[0] == "previous_season_games_played"
@@ -1,13 +1,31 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from typing import ContextManager
 
-from sqlalchemy import select
+import pytest
+from pytest import approx
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.crud.read.career_stats import (
+    get_career_averages,
+    get_career_percentiles,
+    get_career_relative_dollars,
+)
+from app.crud.read.earnings import get_all_earnings
 from app.crud.read.player import get_player_by_name
 from app.data.league import TeamPlayerSalary
 from app.data.league.player import Player
+from app.data.league.player.earnings import player_earnings, refresh_player_earnings
+from app.data.instrumentation import QueryStats
+from app.data.league.season import Season
+from app.data.league.season_caps import (
+    get_season_caps,
+    relative_dollars,
+    reset_season_caps,
+)
+from app.data.to_python_syntax import get_player_dicts, sqlalchemy_to_dicts
 from tests.conftest import parametrize
 from tests.data.thompson_contract_data import THOMPSON_CONTRACT_DATA
 from tests.players.cases import (
@@ -65,3 +83,143 @@ def test_get_relative_earnings_for_player(  # @IgnoreException
         round(sum(s.relative_dollars for s in salaries), 2)
         == case.expected_relative_dollars
     )
+
+
+@parametrize(GET_RELATIVE_SALARY_TEST_CASES)
+def test_get_vectorized_relative_earnings_for_player(  # @IgnoreException
+    session: Session, case: GetRelativeEarningsTestCase
+) -> None:
+    seed_test_data(session, case.seed_data)
+    player = get_player_by_name(session, case.name)
+    relative = relative_dollars(
+        [s.salary for s in player.salaries],
+        [s.season_id for s in player.salaries],
+        session,
+    )
+    assert round(relative.sum(), 2) == case.expected_relative_dollars
+
+
+def test_season_caps_follow_the_seasons_table(
+    session: Session,
+) -> None:  # @IgnoreException
+    session.add(Season(id=2150, expected_cap=100_000_000))
+    session.flush()
+    assert get_season_caps(session).cap(2150) == 100_000_000
+
+    # the session keeps what it read until the table changes under it
+    session.add(Season(id=2151, expected_cap=110_000_000))
+    session.flush()
+    with pytest.raises(Exception, match="No cap data for season 2151"):
+        get_season_caps(session).cap(2151)
+    reset_season_caps(session)
+    assert get_season_caps(session).cap(2151) == 110_000_000
+
+    # detached and transient objects read the cap off their season, as before
+    assert get_season_caps(None) is None
+    salary = TeamPlayerSalary(
+        season_id=2150, salary=25_000_000, season=Season(id=2150, expected_cap=10**8)
+    )
+    assert salary.relative_dollars == 0.25
+    with pytest.raises(Exception, match="there isn't one"):
+        relative_dollars([25_000_000], [2150], None)
+
+
+@parametrize(GET_RELATIVE_SALARY_TEST_CASES)
+def test_get_player_earnings_view(  # @IgnoreException
+    session: Session, case: GetRelativeEarningsTestCase
+) -> None:
+    seed_test_data(session, case.seed_data)
+    refresh_player_earnings(session)
+    player = get_player_by_name(session, case.name)
+    expected = sum(
+        (tps.relative_dollars if tps else 0) + (tpb.relative_dollars if tpb else 0)
+        for ps, tps, tpb in session.execute(get_all_earnings()).tuples()
+        if ps.player_id == player.id
+    )
+    relative = session.execute(
+        select(func.sum(player_earnings.c.relative_dollars)).where(
+            player_earnings.c.player_id == player.id
+        )
+    ).scalar_one()
+    assert round(relative, 2) == round(expected, 2)
+
+
+@parametrize(GET_RELATIVE_SALARY_TEST_CASES)
+def test_get_career_stats_in_bulk(  # @IgnoreException
+    session: Session, case: GetRelativeEarningsTestCase
+) -> None:
+    seed_test_data(session, case.seed_data)
+    players = session.execute(select(Player)).scalars().all()
+    player_ids = [p.id for p in players]
+    relative_dollars = get_career_relative_dollars(session, player_ids)
+    averages = get_career_averages(session, player_ids)
+    percentiles = get_career_percentiles(session, player_ids, 0.75)
+
+    for player in players:
+        assert relative_dollars.loc[player.id, "career_relative_dollars"] == approx(
+            player.career_relative_dollars
+        )
+        assert averages.loc[player.id].to_dict() == approx(
+            player.career_averages().to_scalar()
+        )
+        assert percentiles.loc[player.id].to_dict() == approx(
+            player.career_percentile(0.75).to_scalar()
+        )
+
+        played = [s for s in player.seasons if s.games_played]
+        if played:
+            games = sum(s.games_played for s in played)
+            made = sum(s.field_goals_made or 0 for s in played)
+            attempted = sum(s.field_goals_attempted or 0 for s in played)
+            field_goal_pct = made / attempted if attempted else 0.0
+            minutes = sum(s.minutes_per_game or 0 for s in played)
+            assert averages.loc[player.id, "field_goal_pct"] == approx(field_goal_pct)
+            assert percentiles.loc[player.id, "field_goal_pct"] == approx(
+                field_goal_pct
+            )
+            assert averages.loc[player.id, "minutes_pg"] == approx(minutes / games)
+
+
+@parametrize(GET_SALARY_YEARS_TEST_CASES)
+def test_get_player_dicts_in_bulk(  # @IgnoreException
+    session: Session,
+    case: GetSalaryYearsTestCase,
+    assert_max_queries: Callable[..., ContextManager[QueryStats]],
+) -> None:
+    seed_test_data(session, case.seed_data)
+    player_ids = [
+        row["values"]["id"] for row in case.seed_data if row["model"] == "Player"
+    ]
+
+    # one per model, not one per player and relationship
+    with assert_max_queries(5, repeated_threshold=2):
+        exported = get_player_dicts(session, player_ids)
+
+    # same rows the per-object sqlalchemy_to_dicts walk produces
+    players = session.scalars(select(Player).where(Player.id.in_(player_ids))).all()
+    teams = {s.team for p in players for s in p.seasons} | {
+        c.team for p in players for c in p.contracts
+    }
+    expected = sqlalchemy_to_dicts(
+        [
+            *teams,
+            *players,
+            *(c for p in players for c in p.contracts),
+            *(s for p in players for s in p.salaries),
+            *(s for p in players for s in p.seasons),
+        ]
+    )
+    assert sorted(map(repr, exported)) == sorted(map(repr, expected))
+
+
+@parametrize()
+def test_flag_lazy_loads_as_repeated_queries(  # @IgnoreException
+    session: Session, assert_max_queries: Callable[..., ContextManager[QueryStats]]
+) -> None:
+    seed_test_data(session, THOMPSON_CONTRACT_DATA)
+    players = session.scalars(select(Player)).all()
+
+    with pytest.raises(AssertionError, match="possible N\\+1: 5x"):
+        with assert_max_queries(100, repeated_threshold=3):
+            for player in players:
+                player.seasons  # one lazy load per player
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import date
+
+from pytest import approx
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.crud.update.dividends import replay_season_dividends, settle_dividends
+from app.data.league import TeamPlayerSalary
+from app.data.league.salary_rules import GAMES_PER_SEASON
+from app.data.users import SHARES_PER_PLAYER, Holding, User
+from app.fill_data.player_games import (
+    copy_player_games,
+    get_player_season_ids,
+    parse_games,
+    parse_player_games,
+    upload_games,
+)
+from tests.conftest import parametrize
+from tests.data.game_logs import PLAYER_LOG, TEAM_LOG
+from tests.data.thompson_contract_data import THOMPSON_CONTRACT_DATA
+from tests.utils import seed_test_data
+
+KLAY_THOMPSON = 202691
+
+
+@parametrize()
+def test_settle_dividends_once_per_game(session: Session) -> None:  # @IgnoreException
+    seed_test_data(session, THOMPSON_CONTRACT_DATA)
+    upload_games(session, parse_games(TEAM_LOG, 2025, "Regular Season"))
+    copy_player_games(
+        session,
+        2025,
+        parse_player_games(PLAYER_LOG, 2025, get_player_season_ids(session, 2025)),
+    )
+    user = User(name="holder", cash=0.0)
+    user.holdings.append(
+        Holding(player_id=KLAY_THOMPSON, shares=SHARES_PER_PLAYER // 100)  # 1%
+    )
+    session.add(user)
+    session.commit()
+
+    salary = session.execute(
+        select(TeamPlayerSalary.salary).where(
+            TeamPlayerSalary.player_id == KLAY_THOMPSON,
+            TeamPlayerSalary.season_id == 2025,
+        )
+    ).scalar_one()
+    expected = salary / GAMES_PER_SEASON / 100
+
+    assert settle_dividends(session, date(2024, 10, 24)) == approx(expected)
+    assert settle_dividends(session, date(2024, 10, 24)) == 0
+    assert replay_season_dividends(session, 2025) == approx(expected)
+    session.refresh(user)
+    assert user.cash == approx(expected)
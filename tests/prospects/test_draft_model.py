@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pytest
+from pandas import DataFrame
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.crud.read.prospects import (
+    get_big_board_features,
+    get_draft_training_rows,
+    get_last_scrape,
+)
+from app.data.league import Player, PlayerSeason, Team, TeamPlayerSalary
+from app.data.league.player.earnings import refresh_player_earnings
+from app.data.league.prospect import DraftProspect
+from app.data.synthetic import LAST_SEASON, copy_league, generate_league
+from app.exploration.machine_learning_ii.data_preparation.draft import (
+    draft_feature_builder,
+)
+from app.exploration.machine_learning_ii.training.draft_models import (
+    DraftModel,
+    DraftSplit,
+    draft_pipeline,
+)
+
+DRAFTS = range(2012, 2023)
+BOARD_DAY = datetime(LAST_SEASON, 6, 1)
+
+
+def prospect(
+    rng: np.random.Generator, uploaded: datetime, **values: Any
+) -> DraftProspect:
+    games = int(rng.integers(10, 40))
+    return DraftProspect(
+        uploaded=uploaded,
+        primary_position=["PG", "SG", "SF", "PF", "C"][rng.integers(5)],
+        height=float(rng.uniform(72, 86)),
+        wingspan=float(rng.uniform(72, 92)),
+        weight=int(rng.integers(170, 260)),
+        age_at_draft=float(rng.uniform(18, 23)),
+        games=games,
+        minutes_per_game=float(rng.uniform(15, 36)),
+        fga=float(rng.uniform(5, 18)),
+        fta=float(rng.uniform(1, 8)),
+        tpa=float(rng.uniform(0, 8)),
+        points=float(rng.uniform(5, 25)),
+        p36_steals=float(rng.uniform(0, 3)),
+        p36_blocks=float(rng.uniform(0, 3)),
+        p36_assists=float(rng.uniform(0, 8)),
+        p36_turnovers=float(rng.uniform(0, 4)),
+        espn_big_board_rank=None if rng.random() < 0.3 else int(rng.integers(1, 100)),
+        **values,
+    )
+
+
+@pytest.fixture
+def prospects(session: Session) -> None:
+    copy_league(
+        session,
+        generate_league(200, seed=1),
+        models=[Team, Player, PlayerSeason, TeamPlayerSalary],
+    )
+    rng = np.random.default_rng(0)
+    player_ids = session.scalars(select(Player.id).order_by(Player.id)).all()
+    for index, player_id in enumerate(player_ids):
+        draft = DRAFTS[index % len(DRAFTS)]
+        slug = f"prospect-{player_id}"
+        # an early season snapshot and the one the model should use
+        for uploaded in (datetime(draft - 1, 12, 1), datetime(draft, 6, 20)):
+            session.add(
+                prospect(
+                    rng,
+                    uploaded,
+                    name=slug,
+                    tankathon_slug=slug,
+                    player_id=player_id,
+                    tankathon_big_board_rank=int(rng.integers(1, 100)),
+                )
+            )
+    for rank in range(1, 31):
+        session.add(
+            prospect(
+                rng,
+                BOARD_DAY,
+                name=f"board {rank}",
+                tankathon_slug=f"board-{rank}",
+                player_id=player_ids[rank],
+                tankathon_big_board_rank=rank,
+            )
+        )
+    session.flush()
+    refresh_player_earnings(session, concurrently=False)
+
+
+def training_rows(session: Session) -> DataFrame:
+    stmt = get_draft_training_rows(LAST_SEASON)
+    return DataFrame(session.execute(stmt).mappings().all())
+
+
+def test_training_rows_are_the_last_snapshot_per_draft(
+    session: Session, prospects: None
+) -> None:
+    rows = training_rows(session)
+    players = session.scalar(select(Player.id).order_by(Player.id.desc()).limit(1))
+
+    assert len(rows) == rows["tankathon_slug"].nunique() <= players
+    assert set(rows["draft_year"]) <= set(DRAFTS)
+    assert (rows["relative_dollars"] >= 0).all()
+    assert rows["relative_dollars"].gt(0).any()
+    # the December snapshots lose to the June ones
+    assert rows["tankathon_big_board_rank"].notna().all()
+
+
+def test_feature_builder(session: Session, prospects: None) -> None:
+    features = draft_feature_builder(training_rows(session))
+
+    assert {"tankathon_slug", "name", "player_id", "primary_position"}.isdisjoint(
+        features.columns
+    )
+    assert set(features.dtypes) == {np.dtype(float)}
+    assert features["position_ordinal"].between(1, 5).all()
+    assert features["espn_big_board_rank_missing"].isin([0.0, 1.0]).all()
+    assert features["espn_big_board_rank_log"].notna().all()
+
+
+def test_pipeline_scores_the_board(session: Session, prospects: None) -> None:
+    features = draft_feature_builder(training_rows(session))
+    results = draft_pipeline(
+        features=features, test_year=DRAFTS[-1], n_trials=3, n_jobs=2
+    )
+
+    assert results["study"] is not None
+    assert len(results["study"].trials) == 3
+    assert np.isfinite(results["test_mae"])
+    model: DraftModel = results["model"]
+    assert {column for _, column in results["feature_importance"]} == set(model.columns)
+
+    board = DataFrame(session.execute(get_big_board_features(BOARD_DAY)).mappings())
+    scored = model.score_board(board)
+    assert len(scored) == 30
+    assert set(scored["draft_year"]) == {LAST_SEASON}
+    assert (scored["relative_dollars"] > -1).all()
+    assert scored["relative_dollars"].is_monotonic_decreasing
+
+    # after the last scrape the board is still that scrape's
+    scraped = session.scalar(get_last_scrape())
+    later = DataFrame(
+        session.execute(get_big_board_features(datetime(LAST_SEASON, 9, 1))).mappings()
+    )
+    assert scraped == BOARD_DAY
+    assert model.score_board(later)["id"].tolist() == scored["id"].tolist()
+    assert model.score_board(DataFrame([])).empty
+
+
+def test_split_by_draft(session: Session, prospects: None) -> None:
+    split = DraftSplit(draft_feature_builder(training_rows(session)), DRAFTS[-1])
+
+    assert split.dmatrices["test"].num_row() == len(split.y["test"]) > 0
+    assert split.dmatrices["validation"].num_row() == len(split.y["validation"]) > 0
+    assert split.dtrain_validation.num_row() == (
+        split.dmatrices["train"].num_row() + split.dmatrices["validation"].num_row()
+    )
+    assert "draft_year" not in split.columns
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.data.league import Player, Team
+from app.data.league.prospect import DraftProspect
+from app.data.synthetic import copy_league, generate_league
+from app.fill_data.prospects import (
+    Checkpoint,
+    RateLimiter,
+    ingest_prospects,
+    past_draft_checkpoint,
+)
+
+UPLOADED = datetime(2024, 6, 22, 19)
+SLUGS = [f"prospect-{number}" for number in range(7)]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+        self.lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self.lock:
+            self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def players(session: Session) -> None:
+    # prospects need a player to point at
+    copy_league(session, generate_league(3, seed=0), models=[Team, Player])
+    session.flush()
+
+
+def fake_fetch(
+    failing: frozenset[str] = frozenset(),
+) -> Callable[[datetime, str], DraftProspect]:
+    def fetch(dt: datetime, slug: str) -> DraftProspect:
+        if slug in failing:
+            raise Exception(f"{slug} timed out")
+        return DraftProspect(
+            uploaded=dt,
+            name=slug.replace("-", " ").title(),
+            tankathon_slug=slug,
+            player_id=1,
+        )
+
+    return fetch
+
+
+def no_wait() -> RateLimiter:
+    return RateLimiter(60_000, jitter=False, sleep=lambda _: None)
+
+
+def stored(session: Session) -> list[str]:
+    return sorted(
+        session.scalars(
+            select(DraftProspect.tankathon_slug).where(
+                DraftProspect.uploaded == UPLOADED
+            )
+        )
+    )
+
+
+def test_rate_limiter_spaces_requests() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(30, jitter=False, clock=clock, sleep=clock.sleep)
+
+    threads = [threading.Thread(target=limiter.wait) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # the first goes straight away, the rest queue up 2 seconds apart
+    assert sorted(clock.sleeps) == [2.0, 4.0, 6.0]
+
+
+def test_ingest_resumes_from_checkpoint(
+    session: Session, players: None, tmp_path: Path
+) -> None:
+    checkpoint = Checkpoint(tmp_path / "draft.txt")
+
+    first = ingest_prospects(
+        session,
+        UPLOADED,
+        SLUGS,
+        checkpoint=checkpoint,
+        batch_size=3,
+        workers=3,
+        limiter=no_wait(),
+        fetch=fake_fetch(failing=frozenset({"prospect-4"})),
+    )
+
+    assert first.inserted == 6
+    assert list(first.failed) == ["prospect-4"]
+    assert stored(session) == sorted(set(SLUGS) - {"prospect-4"})
+    assert Checkpoint(checkpoint.path).done == set(stored(session))
+
+    # a fresh run only fetches what the first one missed
+    fetched: list[str] = []
+
+    def fetch(dt: datetime, slug: str) -> DraftProspect:
+        fetched.append(slug)
+        return fake_fetch()(dt, slug)
+
+    second = ingest_prospects(
+        session,
+        UPLOADED,
+        SLUGS,
+        checkpoint=Checkpoint(checkpoint.path),
+        limiter=no_wait(),
+        fetch=fetch,
+    )
+
+    assert fetched == ["prospect-4"]
+    assert (second.inserted, second.skipped, second.failed) == (1, 6, {})
+    assert stored(session) == sorted(SLUGS)
+
+
+def test_ingest_skips_rows_missing_from_checkpoint(
+    session: Session, players: None, tmp_path: Path
+) -> None:
+    # committed, but the job stopped before the checkpoint was written
+    session.add(fake_fetch()(UPLOADED, "prospect-0"))
+    session.commit()
+    checkpoint = Checkpoint(tmp_path / "draft.txt")
+
+    result = ingest_prospects(
+        session,
+        UPLOADED,
+        SLUGS[:2],
+        checkpoint=checkpoint,
+        limiter=no_wait(),
+        fetch=fake_fetch(),
+    )
+
+    assert (result.inserted, result.skipped) == (1, 1)
+    assert checkpoint.done == {"prospect-0", "prospect-1"}
+
+
+def test_full_rescrape_ignores_the_checkpoint(
+    session: Session, players: None, tmp_path: Path
+) -> None:
+    # an earlier run's checkpoint, its rows since deleted
+    Checkpoint.for_job("past-draft-2024", tmp_path).add(SLUGS[:2])
+
+    missing_only = past_draft_checkpoint(2024, directory=tmp_path)
+    assert missing_only.done == set(SLUGS[:2])
+
+    checkpoint = past_draft_checkpoint(
+        2024, collect_only_missing=False, directory=tmp_path
+    )
+    assert not checkpoint.done and not checkpoint.path.exists()
+
+    result = ingest_prospects(
+        session,
+        UPLOADED,
+        SLUGS[:2],
+        checkpoint=checkpoint,
+        limiter=no_wait(),
+        fetch=fake_fetch(),
+    )
+
+    assert (result.inserted, result.skipped) == (2, 0)
+    assert stored(session) == SLUGS[:2]
+    assert Checkpoint(checkpoint.path).done == set(SLUGS[:2])
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import numpy as np
+from bs4 import BeautifulSoup
+from pytest import approx
+
+from app.data.league.prospect import DraftProspect, ProspectPage
+from benchmarks.fixtures import prospect_page_html, stats_block
+
+UPLOADED = datetime(2025, 6, 22, 19)
+COLUMNS = [column.key for column in DraftProspect.__table__.columns]
+
+PAGE = (
+    "<html><body><h1> Cooper <span>Flagg</span></h1>"
+    '<div class="player-info">'
+    '<div class="label">Team</div><div class="data">Duke</div>'
+    '<div class="label">Year</div><div class="data">Freshman</div>'
+    '<div class="label">Position</div><div class="data">SF/PF</div>'
+    '<div class="label">Height</div><div class="data">6\'9" (7\'0" wingspan)</div>'
+    '<div class="label">Weight</div><div class="data">205 lbs</div>'
+    '<div class="label">Birthdate</div><div class="data">Dec 21, 2006</div>'
+    '<div class="label">Age at Draft</div><div class="data">18.5 yrs</div>'
+    '<div class="label">Big Board</div><div class="data">1st</div>'
+    "</div>"
+    + stats_block(
+        "2024-25 PER GAME AVERAGES",
+        {"G": "37", "MP": "30.7", "FGM-FGA": "6.8-14.2", "FG%": "48.1%"}
+        | {"3PM-3PA": "1.3-3.4", "3P%": "38.5%", "FTM-FTA": "4.2-5.2"}
+        | {"FT%": "84.0%", "REB": "7.5", "AST": "4.2", "BLK": "1.4"}
+        | {"STL": "1.4", "TO": "2.1", "PF": "1.6", "PTS": "19.2"},
+    )
+    # only this season's averages are read
+    + stats_block("2023-24 PER GAME AVERAGES", {"G": "1"})
+    + stats_block("SCOUTING REPORT", {"Motor": "A+"})
+    + stats_block(
+        "ADVANCED STATS II<span> HOVER FOR DESCRIPTION</span>"
+        "<span> TAP LABEL FOR DESCRIPTION</span>",
+        {"PER": "30.4", "BPM": "15.7"},
+    )
+    + "</body></html>"
+)
+
+
+def test_page_fields() -> None:
+    prospect = DraftProspect.from_html(
+        UPLOADED, PAGE, tankathon_slug="cooper-flagg", year=2025
+    )
+
+    assert prospect.name == "CooperFlagg"
+    assert (prospect.team, prospect.year) == ("Duke", 1)
+    assert (prospect.primary_position, prospect.secondary_position) == ("SF", "PF")
+    assert (prospect.height, prospect.wingspan, prospect.weight) == (81, 84, 205)
+    assert prospect.birthdate == date(2006, 12, 21)
+    assert prospect.tankathon_big_board_rank == 1
+    assert (prospect.games, prospect.fgm, prospect.fga) == (37, 6.8, 14.2)
+    assert prospect.points == approx(19.2)
+    # the advanced tables are optional, missing labels are left empty
+    assert (prospect.bpm, prospect.ows_per_40) == (approx(15.7), None)
+    assert prospect.p36_points is None
+
+
+def test_soup_and_lxml_agree() -> None:
+    rng = np.random.default_rng(0)
+    page = prospect_page_html(rng, "Cooper Flagg", 2025, ["ace-bailey"])
+
+    from_soup = DraftProspect.from_beautiful_soup(
+        UPLOADED, BeautifulSoup(page, "lxml"), year=2025
+    )
+    from_html = DraftProspect.from_html(UPLOADED, page, year=2025)
+
+    assert from_html.true_shooting_pct is not None
+    assert from_html.p36_points is not None
+    for column in COLUMNS:
+        assert getattr(from_soup, column) == getattr(from_html, column), column
+
+
+def test_tables_in_one_pass() -> None:
+    page = ProspectPage.from_html(PAGE)
+
+    assert page.bio is not None and page.bio["Weight"] == "205 lbs"
+    assert page.tables["SCOUTING REPORT"] == {"Motor": "A+"}
+    assert page.tables == ProspectPage.from_soup(BeautifulSoup(PAGE, "lxml")).tables
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.crud.read.prospects import (
+    get_big_board,
+    get_last_scrape,
+    get_latest_prospects,
+    get_prospect_history,
+)
+from app.data.league import Player, Team
+from app.data.league.prospect import DraftProspect
+from app.data.synthetic import copy_league, generate_league
+from app.fill_data.prospects import record_snapshots
+
+JANUARY = datetime(2025, 1, 15)
+MARCH = datetime(2025, 3, 15)
+DRAFT_DAY = datetime(2025, 6, 22, 19)
+
+
+@pytest.fixture(autouse=True)
+def players(session: Session) -> None:
+    copy_league(session, generate_league(3, seed=0), models=[Team, Player])
+    session.flush()
+
+
+def scrape(dt: datetime, ranks: dict[str, int], points: float = 20.0) -> list:
+    return [
+        DraftProspect(
+            uploaded=dt,
+            name=slug.title(),
+            tankathon_slug=slug,
+            player_id=1,
+            tankathon_big_board_rank=rank,
+            points=points,
+        )
+        for slug, rank in ranks.items()
+    ]
+
+
+def test_unchanged_prospects_are_not_stored_again(session: Session) -> None:
+    assert record_snapshots(session, JANUARY, scrape(JANUARY, {"a": 1, "b": 2})) == 2
+    session.flush()
+    # b moves up, a is the same
+    assert record_snapshots(session, MARCH, scrape(MARCH, {"a": 1, "b": 1})) == 1
+    session.flush()
+    assert (
+        record_snapshots(session, DRAFT_DAY, scrape(DRAFT_DAY, {"a": 1, "b": 1})) == 0
+    )
+    session.flush()
+
+    assert session.scalar(select(func.count()).select_from(DraftProspect)) == 3
+    history = session.scalars(get_prospect_history("a")).all()
+    assert [(row.uploaded, row.last_seen) for row in history] == [(JANUARY, DRAFT_DAY)]
+    history = session.scalars(get_prospect_history("b")).all()
+    assert [(row.uploaded, row.last_seen) for row in history] == [
+        (MARCH, DRAFT_DAY),
+        (JANUARY, JANUARY),
+    ]
+
+
+def test_big_board_as_of(session: Session) -> None:
+    record_snapshots(session, JANUARY, scrape(JANUARY, {"a": 1, "b": 2, "c": 3}))
+    session.flush()
+    # c dropped off the board
+    record_snapshots(session, MARCH, scrape(MARCH, {"a": 2, "b": 1}))
+    session.flush()
+
+    def board(as_of: datetime) -> list[tuple[str, int]]:
+        return [
+            (prospect.tankathon_slug, prospect.tankathon_big_board_rank)
+            for prospect in session.scalars(get_big_board(as_of))
+        ]
+
+    assert board(JANUARY) == [("a", 1), ("b", 2), ("c", 3)]
+    assert board(MARCH) == [("b", 1), ("a", 2)]
+    assert board(datetime(2024, 12, 1)) == []
+
+
+def test_big_board_between_scrapes(session: Session) -> None:
+    record_snapshots(session, JANUARY, scrape(JANUARY, {"a": 1, "b": 2}))
+    session.flush()
+    # b changed at the March scrape, a didn't
+    record_snapshots(session, MARCH, scrape(MARCH, {"a": 1, "b": 3}))
+    session.flush()
+
+    def board(as_of: datetime) -> list[tuple[str, int]]:
+        return [
+            (prospect.tankathon_slug, prospect.tankathon_big_board_rank)
+            for prospect in session.scalars(get_big_board(as_of))
+        ]
+
+    # February is still January's board, b's old snapshot included
+    assert board(datetime(2025, 2, 15)) == [("a", 1), ("b", 2)]
+    # and anything after the last scrape is that scrape's board
+    assert board(datetime(2025, 5, 1)) == [("a", 1), ("b", 3)]
+    assert session.scalar(get_last_scrape()) == MARCH
+
+
+def test_latest_view(session: Session) -> None:
+    record_snapshots(session, JANUARY, scrape(JANUARY, {"a": 1, "b": 2}))
+    session.flush()
+    record_snapshots(session, MARCH, scrape(MARCH, {"a": 1}, points=25.0))
+    session.flush()
+
+    latest = session.scalars(get_latest_prospects()).all()
+
+    assert [(row.tankathon_slug, row.uploaded, row.points) for row in latest] == [
+        ("a", MARCH, 25.0),
+        ("b", JANUARY, 20.0),
+    ]
+    assert all(isinstance(row, DraftProspect) for row in latest)
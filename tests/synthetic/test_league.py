@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.data.league import (
+    Award,
+    Contract,
+    Player,
+    PlayerSeason,
+    Season,
+    Team,
+    TeamPlayerSalary,
+)
+from app.data.synthetic import collect_league, copy_league, generate_league
+from app.data.synthetic import write_league_parquet
+from app.data.to_python_syntax import load_seed_data
+from tests.connection import engine, get_transactional_session
+
+
+def test_same_seed_same_league() -> None:
+    first = collect_league(generate_league(60, seed=4, chunk_size=25))
+    second = collect_league(generate_league(60, seed=4, chunk_size=25))
+    other = collect_league(generate_league(60, seed=5, chunk_size=25))
+
+    assert first.keys() == second.keys()
+    assert all(first[model].equals(second[model]) for model in first)
+    assert not first[PlayerSeason].equals(other[PlayerSeason])
+
+
+def test_rows_reference_each_other() -> None:
+    league = collect_league(generate_league(200, seed=1, chunk_size=64))
+    player_ids = set(league[Player]["id"].to_pylist())
+    team_ids = set(league[Team]["id"].to_pylist())
+    season_ids = set(league[Season]["id"].to_pylist())
+
+    assert len(player_ids) == 200
+    for model in (Contract, TeamPlayerSalary, PlayerSeason):
+        assert set(league[model]["player_id"].to_pylist()) <= player_ids
+        assert set(league[model]["team_id"].to_pylist()) <= team_ids
+    assert set(league[PlayerSeason]["season_id"].to_pylist()) <= season_ids
+    # awards are handed out across chunks, one MVP a season
+    mvps = [
+        row
+        for row in league[Award].to_pylist()
+        if row["name"] == "Most Valuable Player"
+    ]
+    seasons_played = set(league[PlayerSeason]["season_id"].to_pylist())
+    assert sorted(row["season_id"] for row in mvps) == sorted(seasons_played)
+
+    seasons = league[PlayerSeason].to_pandas()
+    points = (
+        2 * seasons["two_pointers_made"]
+        + 3 * seasons["three_pointers_made"]
+        + seasons["free_throws_made"]
+    )
+    assert (points == seasons["points"]).all()
+    assert (seasons["wins"] + seasons["losses"] == seasons["games_played"]).all()
+
+
+def test_copy_into_postgres(session: Session) -> None:
+    counts = copy_league(
+        session,
+        generate_league(50, seed=2, chunk_size=20),
+        # the reference seasons are already seeded
+        models=[
+            Team,
+            Player,
+            Contract,
+            TeamPlayerSalary,
+            PlayerSeason,
+            Award,
+        ],
+    )
+    session.commit()
+
+    assert counts["players"] == 50
+    for model in (Player, Contract, TeamPlayerSalary, PlayerSeason, Award):
+        stored = session.execute(select(func.count()).select_from(model)).scalar()
+        assert stored == counts[model.__tablename__]
+
+    player = session.get(Player, 1)
+    assert player is not None
+    assert player.seasons
+    # the sequences moved past the copied ids
+    session.add(
+        Team(
+            city="x",
+            name="x",
+            nickname="x",
+            abbreviation="NEW",
+            conference="x",
+            division="x",
+        )
+    )
+    session.flush()
+
+
+def test_copy_refuses_tables_with_rows(session: Session) -> None:
+    copy_league(session, generate_league(3, seed=0), models=[Team])
+
+    with pytest.raises(Exception, match="teams already has rows"):
+        copy_league(session, generate_league(3, seed=0), models=[Team])
+
+
+def test_sequences_are_put_back_after_the_rollback() -> None:
+    def team_sequence() -> tuple[int, bool]:
+        with engine.connect() as connection:
+            sequence = connection.execute(
+                text("SELECT pg_get_serial_sequence('teams', 'id')")
+            ).scalar_one()
+            return connection.execute(
+                text(f"SELECT last_value, is_called FROM {sequence}")
+            ).one()
+
+    with get_transactional_session() as session:
+        copy_league(session, generate_league(3, seed=0), models=[Team])
+        session.flush()
+        assert team_sequence() == (31, False)
+
+    # teams is empty again, so the next insert gets id 1
+    assert team_sequence() == (1, False)
+
+
+def test_parquet_reads_back_as_seed_data(tmp_path: Path) -> None:
+    league = collect_league(generate_league(30, seed=3, chunk_size=10))
+    paths = write_league_parquet(generate_league(30, seed=3, chunk_size=10), tmp_path)
+
+    assert {path.stem for path in paths} == {model.__name__ for model in league}
+    rows = load_seed_data(tmp_path)
+    assert len(rows) == sum(table.num_rows for table in league.values())
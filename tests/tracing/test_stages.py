@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import pstats
+from pathlib import Path
+
+from app.utils.tracing import stage, trace, traced
+
+
+@traced()
+def allocate(megabytes: int) -> int:
+    block = bytearray(megabytes * 1024 * 1024)
+    return len(block)
+
+
+def test_stages_are_recorded_with_their_parents(tmp_path: Path) -> None:
+    with trace("pipeline", profile_stages=[]) as run:
+        with stage("outer"):
+            with stage("inner"):
+                sum(range(100_000))
+            allocate(64)
+
+    by_name = {timing.name: timing for timing in run.stages}
+    assert [timing.name for timing in run.stages] == ["outer", "inner", "allocate"]
+    assert by_name["outer"].parent is None
+    assert by_name["inner"].parent == "outer"
+    assert by_name["allocate"].parent == "outer"
+    assert by_name["outer"].wall_seconds >= by_name["inner"].wall_seconds
+    assert by_name["allocate"].peak_rss_mb >= 64
+    # an inner stage's peak counts towards the stage around it
+    assert by_name["outer"].peak_rss_mb >= by_name["allocate"].peak_rss_mb
+
+    written = json.loads(run.write(tmp_path / "trace.json").read_text())
+    assert written["name"] == "pipeline"
+    assert written["wall_seconds"] >= by_name["outer"].wall_seconds
+    assert [timing["name"] for timing in written["stages"]] == [
+        "outer",
+        "inner",
+        "allocate",
+    ]
+    assert set(written["stages"][0]) >= {"wall_seconds", "cpu_seconds", "peak_rss_mb"}
+
+
+def test_stages_outside_a_trace_do_nothing() -> None:
+    with stage("untraced") as timing:
+        assert timing is None
+    assert allocate(1) == 1024 * 1024
+
+
+def test_profile_named_stage(tmp_path: Path) -> None:
+    with trace("pipeline", profile_stages=["allocate"], profile_dir=tmp_path) as run:
+        with stage("search"):
+            sum(range(1000))
+        allocate(1)
+
+    search, allocated = run.stages
+    assert search.profile is None
+    assert allocated.profile == str(tmp_path / "pipeline.allocate.prof")
+    functions = {name for _, _, name in pstats.Stats(allocated.profile).stats}
+    assert "allocate" in functions
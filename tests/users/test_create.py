@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pytest import approx
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.crud.create.trades import flush_fills
+from app.data.users import SHARES_PER_PLAYER, Holding, MatchingEngine, Side, Trade, User
+from tests.conftest import parametrize
+from tests.data.thompson_contract_data import THOMPSON_CONTRACT_DATA
+from tests.utils import seed_test_data
+
+KLAY_THOMPSON = 202691
+BUYER, SELLER, OTHER_SELLER = 1, 2, 3
+
+
+def make_engine() -> MatchingEngine:
+    return MatchingEngine(
+        cash={BUYER: 1_000_000, SELLER: 0, OTHER_SELLER: 0},
+        shares={(SELLER, KLAY_THOMPSON): 100, (OTHER_SELLER, KLAY_THOMPSON): 100},
+    )
+
+
+@parametrize()
+def test_match_by_price_then_time() -> None:  # @IgnoreException
+    engine = make_engine()
+    first, _ = engine.submit(SELLER, KLAY_THOMPSON, Side.Sell, 1_000, 10)
+    second, _ = engine.submit(OTHER_SELLER, KLAY_THOMPSON, Side.Sell, 1_000, 10)
+    cheaper, _ = engine.submit(OTHER_SELLER, KLAY_THOMPSON, Side.Sell, 990, 5)
+
+    order, fills = engine.submit(BUYER, KLAY_THOMPSON, Side.Buy, 1_000, 20)
+
+    assert [(f.sell_order_id, f.price, f.shares) for f in fills] == [
+        (cheaper.id, 990, 5),
+        (first.id, 1_000, 10),
+        (second.id, 1_000, 5),
+    ]
+    assert order.shares == 0
+    assert engine.book(KLAY_THOMPSON).depth() == ([], [(1_000, 5)])
+    # the buyer reserved 1000 a share, the 990 fill gives 10 cents a share back
+    cost = 990 * 5 + 1_000 * 15
+    assert engine.cash[BUYER] == 1_000_000 - cost
+    assert engine.reserved_cash[BUYER] == 0
+    assert engine.shares[BUYER, KLAY_THOMPSON] == 20
+
+
+@parametrize()
+def test_reject_orders_without_funds() -> None:  # @IgnoreException
+    engine = make_engine()
+    engine.submit(SELLER, KLAY_THOMPSON, Side.Sell, 1_000, 60)
+    with pytest.raises(Exception):
+        engine.submit(SELLER, KLAY_THOMPSON, Side.Sell, 1_000, 60)
+    with pytest.raises(Exception):
+        engine.submit(BUYER, KLAY_THOMPSON, Side.Buy, 1_000_000, 2)
+
+    resting = next(iter(engine.orders))
+    engine.cancel(resting)
+    engine.submit(SELLER, KLAY_THOMPSON, Side.Sell, 1_000, 100)
+
+
+@parametrize()
+def test_flush_and_recover_from_wal(
+    session: Session, tmp_path: Path
+) -> None:  # @IgnoreException
+    seed_test_data(session, THOMPSON_CONTRACT_DATA)
+    buyer, seller = User(name="buyer", cash=100.0), User(name="seller")
+    seller.holdings.append(Holding(player_id=KLAY_THOMPSON, shares=SHARES_PER_PLAYER))
+    session.add_all([buyer, seller])
+    session.commit()
+
+    wal_path = tmp_path / "exchange.wal"
+    engine = MatchingEngine.from_session(session, wal_path)
+    ask, _ = engine.submit(seller.id, KLAY_THOMPSON, Side.Sell, 150, 40)
+    engine.submit(buyer.id, KLAY_THOMPSON, Side.Buy, 150, 30)
+    assert flush_fills(session, engine) == 1
+    resting, _ = engine.submit(buyer.id, KLAY_THOMPSON, Side.Buy, 140, 10)
+    engine.close()
+
+    session.refresh(buyer)
+    session.refresh(seller)
+    assert buyer.cash == approx(55.0)
+    assert seller.cash == approx(45.0)
+    assert [(h.player_id, h.shares) for h in buyer.holdings] == [(KLAY_THOMPSON, 30)]
+
+    recovered = MatchingEngine.recover(session, wal_path)
+    book = recovered.book(KLAY_THOMPSON)
+    assert book.depth() == ([(140, 10)], [(150, 10)])
+    assert recovered.pending_fills == []
+    assert list(recovered.orders) == [ask.id, resting.id]
+
+    # nothing already in postgres is written (or paid) twice
+    assert flush_fills(session, recovered) == 0
+    _, fills = recovered.submit(buyer.id, KLAY_THOMPSON, Side.Buy, 150, 10)
+    assert [f.sequence for f in fills] == [2]
+    assert flush_fills(session, recovered) == 1
+    recovered.close()
+    assert session.execute(select(func.count()).select_from(Trade)).scalar_one() == 2
+
+
+@parametrize()
+def test_checkpoint_compacts_the_wal(
+    session: Session, tmp_path: Path
+) -> None:  # @IgnoreException
+    seed_test_data(session, THOMPSON_CONTRACT_DATA)
+    buyer, seller = User(name="buyer", cash=100.0), User(name="seller")
+    seller.holdings.append(Holding(player_id=KLAY_THOMPSON, shares=SHARES_PER_PLAYER))
+    session.add_all([buyer, seller])
+    session.commit()
+
+    wal_path = tmp_path / "exchange.wal"
+    engine = MatchingEngine.from_session(session, wal_path)
+    ask, _ = engine.submit(seller.id, KLAY_THOMPSON, Side.Sell, 150, 40)
+    engine.submit(buyer.id, KLAY_THOMPSON, Side.Buy, 150, 30)
+    cancelled, _ = engine.submit(buyer.id, KLAY_THOMPSON, Side.Buy, 120, 10)
+    engine.cancel(cancelled.id)
+    bid, _ = engine.submit(buyer.id, KLAY_THOMPSON, Side.Buy, 140, 10)
+
+    with pytest.raises(Exception, match="flush_fills first"):
+        engine.checkpoint()
+    flush_fills(session, engine)
+    engine.checkpoint()
+    assert engine.wal_records == 2
+    assert len(wal_path.read_text().splitlines()) == 3
+    engine.close()
+
+    # a new engine won't write over the log, recover picks it up
+    with pytest.raises(Exception, match="use MatchingEngine.recover"):
+        MatchingEngine.from_session(session, wal_path)
+    recovered = MatchingEngine.recover(session, wal_path)
+    assert recovered.book(KLAY_THOMPSON).depth() == ([(140, 10)], [(150, 10)])
+    assert list(recovered.orders) == [ask.id, bid.id]
+    assert recovered.reserved_cash[buyer.id] == 140 * 10
+    order, fills = recovered.submit(buyer.id, KLAY_THOMPSON, Side.Buy, 150, 10)
+    assert order.id == bid.id + 1
+    assert [fill.sequence for fill in fills] == [2]
+    assert flush_fills(session, recovered) == 1
+    recovered.close()
@@ -1,11 +1,14 @@
+from collections import defaultdict
 from collections.abc import Iterable
 from typing import Any
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.clsregistry import ClsRegistryToken
 
 from app.base import Base
 from app.data.league import *
+from app.data.users import *
 
 
 def get_model_class(model_name: str) -> type[Base]:
@@ -24,13 +27,28 @@ def delete_all_tables(session: Session) -> None:
     session.commit()
 
 
-def seed_test_data(session: Session, data: Iterable[dict[str, Any]], /) -> None:
-    delete_all_tables(session)
-    from tests.data.seasons import SEASON_DATA
-
-    data = SEASON_DATA + list(data)
+def bulk_insert(session: Session, data: Iterable[dict[str, Any]], /) -> None:
+    """one multi-row INSERT per model (and set of columns), parent tables first"""
+    groups: defaultdict[tuple[type[Base], tuple[str, ...]], list[dict[str, Any]]]
+    groups = defaultdict(list)
     for row in data:
-        model_class = get_model_class(row["model"])
-        session.add(model_class(**row["values"]))
+        model = get_model_class(row["model"])
+        groups[model, tuple(sorted(row["values"]))].append(row["values"])
+
+    table_order = {table: i for i, table in enumerate(Base.metadata.sorted_tables)}
+    for (model, _), rows in sorted(
+        groups.items(), key=lambda group: table_order[group[0][0].__table__]
+    ):
+        # executemany, sent as batched multi-row VALUES ("insertmanyvalues") with
+        # one cached compile, unlike .values(rows) which recompiles every call
+        session.execute(insert(model), rows)
 
+
+def seed_test_data(session: Session, data: Iterable[dict[str, Any]], /) -> None:
+    """
+    seed a test's rows on top of the shared reference data (SEASON_DATA).
+    The `session` fixture rolls everything back afterwards, so there's nothing to
+    delete first.
+    """
+    bulk_insert(session, data)
     session.commit()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import nullcontext
+
+import pytest
+from celery.canvas import Signature
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+import workers.etl
+from app.data.league import Season, Team
+from workers.celery_app import app
+from workers.etl import (
+    build_etl_graph,
+    in_order,
+    player_earnings_task,
+    seasons_task,
+    teams_task,
+)
+
+
+@pytest.fixture
+def eager(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    # tasks share the test's session, so their writes are rolled back with it
+    monkeypatch.setattr(workers.etl, "session_scope", lambda: nullcontext(session))
+    app.conf.task_always_eager = True
+    yield
+    app.conf.task_always_eager = False
+
+
+def task_names(signature: Signature) -> list[str]:
+    """every task in the order it's allowed to start"""
+    # chains, groups and chords all have .tasks, chords also have a .body
+    if hasattr(signature, "tasks"):
+        names = [name for task in signature.tasks for name in task_names(task)]
+        if hasattr(signature, "body"):
+            names += task_names(signature.body)
+        return names
+    return [signature.task]
+
+
+def test_build_etl_graph_chunks() -> None:  # @IgnoreException
+    graph = build_etl_graph(
+        player_ids=[1, 2, 3],
+        player_chunk_size=2,
+        payroll_file_names=["ATL-2024-0.csv", "ATL-2024-1.csv"],
+        player_seasons=[2025],
+        contract_paths=[],
+        award_names=["Most Valuable Player"],
+        team_seasons=[2024, 2025],
+        draft_years=[],
+    )
+    seasons, teams, players, leaves = graph.tasks
+
+    assert (seasons.task, teams.task) == ("etl.seasons", "etl.teams")
+    assert [(task.task, task.args) for task in players.tasks] == [
+        ("etl.players", ([1, 2],)),
+        ("etl.players", ([3],)),
+    ]
+    # every leaf has to finish before the features are exported
+    assert leaves.body.task == "etl.contract_features"
+    salaries_and_stats, awards, team_seasons = leaves.tasks
+    assert awards.task == "etl.award_page"
+    assert [task.args for task in team_seasons.tasks] == [(2024,), (2025,)]
+    # salaries decide whose seasons get fetched
+    assert task_names(salaries_and_stats) == [
+        "etl.payroll_file",
+        "etl.payroll_file",
+        "etl.player_seasons",
+        "etl.player_earnings",
+    ]
+
+
+def test_run_etl_stages_eagerly(
+    session: Session, eager: None
+) -> None:  # @IgnoreException
+    graph = in_order(seasons_task.si(), teams_task.si(), player_earnings_task.si())
+
+    counts = []
+    for _ in range(2):  # reruns only fill in what's missing
+        graph.apply_async().get()
+        counts.append(
+            (
+                session.execute(select(func.count()).select_from(Season)).scalar_one(),
+                session.execute(select(func.count()).select_from(Team)).scalar_one(),
+            )
+        )
+    assert counts[0] == counts[1]
+    assert counts[0][1] == 30
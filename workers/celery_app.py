@@ -0,0 +1,23 @@
+import os
+
+from celery import Celery
+
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+
+app = Celery(
+    "athlete_market", broker=REDIS_URL, backend=REDIS_URL, include=["workers.etl"]
+)
+
+app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    # a chunk is only acked once it's done, so a killed worker's chunk is redone
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # chunks are slow scrapes/api calls, don't let one worker hoard them
+    worker_prefetch_multiplier=1,
+    # CELERY_ALWAYS_EAGER=1 runs the whole graph in-process, no redis needed
+    task_always_eager=os.environ.get("CELERY_ALWAYS_EAGER") == "1",
+    task_eager_propagates=True,
+)
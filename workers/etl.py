@@ -0,0 +1,190 @@
+"""
+the fill_data scripts as a celery task graph.
+
+    seasons -> teams -> players -> payrolls -> player seasons -> player earnings
+                                                              -> contracts
+                                -> awards (per page)
+                                -> team seasons (per season)
+                                -> prospects (per draft)
+            ... -> contract feature export
+
+Every chunk (a team-year payroll file, a season of stats, an award page) is its
+own task, retried with backoff. The uploads skip rows that already exist, so a
+retried or re-run chunk only fills in what's missing.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+
+from celery import chain, group
+from celery.canvas import Signature
+
+from app.crud.read.contract_supporting_info import export_contracts_for_ml
+from app.data.connection import get_session
+from app.data.league.player.earnings import refresh_player_earnings
+from app.fill_data.awards import ALL_NBA_PAGES, AWARD_PAGES, upload_award_page
+from app.fill_data.contracts import CONTRACTS_DIR, upload_contract_file
+from app.fill_data.payrolls import payroll_files, upload_payroll_file
+from app.fill_data.player_seasons import upload_season_player_seasons
+from app.fill_data.players import get_all_player_ids, upload_players
+from app.fill_data.prospects import upload_previous_draft
+from app.fill_data.seasons import upload_seasons
+from app.fill_data.team_seasons import upload_season_team_seasons
+from app.fill_data.teams import upload_teams
+from workers.celery_app import app
+
+# swapped for the test database in tests
+session_scope = get_session
+
+RETRY_OPTIONS = {
+    "autoretry_for": (Exception,),
+    "max_retries": 5,
+    "retry_backoff": 30,  # seconds, doubled every retry
+    "retry_backoff_max": 600,
+    "retry_jitter": True,
+}
+
+
+@app.task(name="etl.seasons", **RETRY_OPTIONS)
+def seasons_task() -> None:
+    with session_scope() as session:
+        upload_seasons(session)
+
+
+@app.task(name="etl.teams", **RETRY_OPTIONS)
+def teams_task() -> None:
+    with session_scope() as session:
+        upload_teams(session)
+
+
+@app.task(name="etl.players", rate_limit="1/m", **RETRY_OPTIONS)
+def players_task(player_ids: list[int]) -> None:
+    with session_scope() as session:
+        upload_players(session, player_ids)
+
+
+@app.task(name="etl.payroll_file", **RETRY_OPTIONS)
+def payroll_file_task(file: str) -> None:
+    with session_scope() as session:
+        upload_payroll_file(session, file)
+
+
+@app.task(name="etl.player_seasons", rate_limit="6/m", **RETRY_OPTIONS)
+def player_seasons_task(season: int) -> None:
+    with session_scope() as session:
+        upload_season_player_seasons(session, season)
+
+
+@app.task(name="etl.player_earnings", **RETRY_OPTIONS)
+def player_earnings_task() -> None:
+    with session_scope() as session:
+        refresh_player_earnings(session)
+
+
+@app.task(name="etl.contract_file", **RETRY_OPTIONS)
+def contract_file_task(path: str) -> None:
+    with session_scope() as session:
+        upload_contract_file(session, path)
+
+
+@app.task(name="etl.award_page", rate_limit="6/m", **RETRY_OPTIONS)
+def award_page_task(award_name: str) -> None:
+    with session_scope() as session:
+        upload_award_page(session, award_name)
+
+
+@app.task(name="etl.team_seasons", rate_limit="30/m", **RETRY_OPTIONS)
+def team_seasons_task(season: int) -> None:
+    with session_scope() as session:
+        upload_season_team_seasons(session, season)
+
+
+@app.task(name="etl.previous_draft", rate_limit="1/m", **RETRY_OPTIONS)
+def previous_draft_task(year: int) -> None:
+    upload_previous_draft(year, collect_only_missing=True)
+
+
+@app.task(name="etl.contract_features", **RETRY_OPTIONS)
+def contract_features_task() -> None:
+    with session_scope() as session:
+        export_contracts_for_ml(session)
+
+
+def chunked(items: list[int], size: int) -> Iterable[list[int]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def fan_out(signatures: Iterable[Signature]) -> Signature | None:
+    """a group of independent chunks, None if there's nothing to run"""
+    signatures = list(signatures)
+    if not signatures:
+        return None
+    return signatures[0] if len(signatures) == 1 else group(signatures)
+
+
+def in_order(*stages: Signature | None) -> Signature:
+    """chain the stages that have work, each waits for the one before it"""
+    return chain(*(stage for stage in stages if stage is not None))
+
+
+def build_etl_graph(
+    *,
+    player_ids: list[int] | None = None,
+    player_chunk_size: int = 100,
+    payroll_file_names: list[str] | None = None,
+    player_seasons: Iterable[int] = range(2004, 2027),
+    contract_paths: list[str] | None = None,
+    award_names: list[str] | None = None,
+    team_seasons: Iterable[int] = range(2000, 2026),
+    draft_years: Iterable[int] = range(2020, 2026),
+) -> Signature:
+    """
+    the full dependency graph, every chunk list defaults to everything the
+    scripts would upload. Tasks are immutable (.si), nothing is passed down.
+    """
+    if player_ids is None:
+        player_ids = get_all_player_ids()
+    if payroll_file_names is None:
+        payroll_file_names = payroll_files()
+    if contract_paths is None:
+        contract_paths = sorted(
+            os.path.join(CONTRACTS_DIR, file) for file in os.listdir(CONTRACTS_DIR)
+        )
+    if award_names is None:
+        award_names = [*AWARD_PAGES, *ALL_NBA_PAGES]
+
+    # salaries decide whose seasons get fetched (player_seasons.player_ids_to_get)
+    salaries_and_stats = in_order(
+        fan_out(payroll_file_task.si(file) for file in payroll_file_names),
+        fan_out(player_seasons_task.si(season) for season in player_seasons),
+        player_earnings_task.si(),
+        fan_out(contract_file_task.si(path) for path in contract_paths),
+    )
+    leaves = [
+        salaries_and_stats,
+        fan_out(award_page_task.si(name) for name in award_names),
+        fan_out(team_seasons_task.si(season) for season in team_seasons),
+        fan_out(previous_draft_task.si(year) for year in draft_years),
+    ]
+
+    return in_order(
+        seasons_task.si(),
+        teams_task.si(),
+        fan_out(
+            players_task.si(chunk) for chunk in chunked(player_ids, player_chunk_size)
+        ),
+        group([leaf for leaf in leaves if leaf is not None]),
+        contract_features_task.si(),
+    )
+
+
+def run_etl(**kwargs: object) -> object:
+    """kick off the whole graph, returns the AsyncResult of the final export"""
+    return build_etl_graph(**kwargs).apply_async()  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    run_etl()